@@ -0,0 +1,49 @@
+"""user041_add_import_job_table
+
+Revision ID: user041_import_job
+Revises: user029_token_version
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "user041_import_job"
+down_revision: Union[str, None] = "user029_token_version"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "import_job",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("kind", sa.String(length=50), nullable=False),
+        sa.Column("params", sa.JSON(), nullable=False),
+        sa.Column("status", sa.String(length=20), server_default="queued", nullable=False),
+        sa.Column("checkpoint", sa.JSON(), nullable=True),
+        sa.Column("progress_done", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("progress_total", sa.Integer(), nullable=True),
+        sa.Column("progress_at_start", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("result", sa.JSON(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("requests_per_second", sa.Float(), nullable=True),
+        sa.Column("max_concurrent_requests", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_import_job_status"), "import_job", ["status"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_import_job_status"), table_name="import_job")
+    op.drop_table("import_job")
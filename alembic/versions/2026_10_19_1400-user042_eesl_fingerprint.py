@@ -0,0 +1,36 @@
+"""user042_add_eesl_fingerprint_table
+
+Revision ID: user042_eesl_fingerprint
+Revises: user041_import_job
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "user042_eesl_fingerprint"
+down_revision: Union[str, None] = "user041_import_job"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "eesl_fingerprint",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("entity", sa.String(length=20), nullable=False),
+        sa.Column("eesl_id", sa.Integer(), nullable=False),
+        sa.Column("fingerprint", sa.String(length=64), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("entity", "eesl_id", name="idx_unique_eesl_fingerprint"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("eesl_fingerprint")
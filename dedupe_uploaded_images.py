@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Script to move downloaded images into the content-addressed image store.
+
+Every image under the uploads directory is added to the store; identical files (the same logo
+saved for several tournaments or titles) become hard links to one stored copy, so their URLs
+keep working while the disk used by the duplicates is freed.
+"""
+
+import asyncio
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.core.config import settings
+from src.helpers.image_store import ImageStore
+
+IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".gif", ".webp", ".bmp"}
+
+
+def _image_files(uploads_dir: Path, store_dir: Path) -> list[Path]:
+    return [
+        path
+        for path in uploads_dir.rglob("*")
+        if path.is_file()
+        and path.suffix.lower() in IMAGE_SUFFIXES
+        and store_dir not in path.parents
+    ]
+
+
+async def dedupe_uploaded_images(uploads_dir: Path, dry_run: bool = True) -> None:
+    """Add all uploaded images to the store, reporting the disk freed by duplicates."""
+    store = ImageStore(uploads_dir / "images")
+    files = _image_files(uploads_dir, store.root)
+
+    # Files that are already links of one another count once.
+    inodes_by_hash: dict[str, dict[tuple[int, int], int]] = defaultdict(dict)
+    for path in files:
+        stat = path.stat()
+        inodes_by_hash[store.content_hash(path)][(stat.st_dev, stat.st_ino)] = stat.st_size
+
+    duplicates = sum(len(inodes) - 1 for inodes in inodes_by_hash.values())
+    reclaimable = sum(sum(sorted(inodes.values())[1:]) for inodes in inodes_by_hash.values())
+
+    print(f"{len(files)} images, {len(inodes_by_hash)} distinct")
+    if dry_run:
+        print(f"[DRY RUN] Would free {duplicates} duplicate copies ({reclaimable / 2**20:.1f} MiB)")
+        return
+
+    error_count = 0
+    for path in files:
+        try:
+            await store.adopt(path)
+        except Exception as e:
+            print(f"ERROR storing {path}: {e}")
+            error_count += 1
+    pruned = await store.prune()
+
+    print(f"\n{'=' * 60}")
+    print(
+        f"COMPLETE - freed {duplicates} duplicate copies ({reclaimable / 2**20:.1f} MiB), "
+        f"pruned {pruned} unused stored images, {error_count} errors"
+    )
+    print(f"{'=' * 60}")
+
+
+if __name__ == "__main__":
+    uploads_dir = settings.uploads_path
+
+    if not uploads_dir.exists():
+        print(f"Directory does not exist: {uploads_dir}")
+        sys.exit(1)
+
+    print("Checking for duplicate images in:", uploads_dir)
+    print("=" * 60)
+
+    # First do a dry run
+    asyncio.run(dedupe_uploaded_images(uploads_dir, dry_run=True))
+
+    # Ask user to proceed
+    response = input("\nProceed with deduplication? (yes/no): ").strip().lower()
+    if response in ["yes", "y"]:
+        asyncio.run(dedupe_uploaded_images(uploads_dir, dry_run=False))
+    else:
+        print("Aborted.")
@@ -1,4 +1,5 @@
 from .dependencies import CurrentUser, get_current_active_user, get_current_user, require_roles
+from .principal_cache import Principal
 from .schemas import (
     RoleCreate,
     RoleResponse,
@@ -14,7 +15,9 @@ from .security import (
     create_access_token,
     decode_access_token,
     get_password_hash,
+    get_password_hash_async,
     verify_password,
+    verify_password_async,
 )
 from .views import api_auth_router
 
@@ -26,6 +29,8 @@ __all__ = [
     "get_current_active_user",
     "get_current_user",
     "get_password_hash",
+    "get_password_hash_async",
+    "Principal",
     "require_roles",
     "RoleCreate",
     "RoleResponse",
@@ -37,4 +42,5 @@ __all__ = [
     "UserResponse",
     "UserUpdate",
     "verify_password",
+    "verify_password_async",
 ]
@@ -5,9 +5,9 @@ from typing import Annotated
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 
+from src.auth.principal_cache import Principal, principal_cache
 from src.auth.security import decode_access_token
 from src.core.dependencies import UserService
-from src.core.models import UserDB
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login")
 
@@ -15,18 +15,21 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login")
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
     user_service: UserService,
-) -> UserDB:
+) -> Principal:
     """Dependency to get current authenticated user from JWT token.
 
+    The user's active flag and roles are served from the principal cache, so
+    authenticated requests only hit the database on a cache miss.
+
     Args:
         token: JWT token from OAuth2 scheme.
         user_service: User service instance.
 
     Returns:
-        UserDB: Current authenticated user.
+        Principal: Current authenticated user.
 
     Raises:
-        HTTPException: If token is invalid or user not found.
+        HTTPException: If token is invalid, revoked or user not found.
     """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -44,32 +47,37 @@ async def get_current_user(
 
     try:
         user_id = int(user_id_str)
+        token_version = int(payload.get("tv", 0))
     except (ValueError, TypeError):
         raise credentials_exception
 
-    user = await user_service.get_by_id(user_id)
-    if user is None:
-        raise credentials_exception
+    principal = principal_cache.get(user_id, token_version)
+    if principal is None:
+        user = await user_service.get_by_id_with_roles(user_id)
+        if user is None or user.token_version != token_version:
+            raise credentials_exception
+        principal = Principal.from_user(user)
+        principal_cache.set(principal)
 
-    if not user.is_active:
+    if not principal.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="User account is inactive",
         )
 
-    return user
+    return principal
 
 
 async def get_current_active_user(
-    current_user: Annotated[UserDB, Depends(get_current_user)],
-) -> UserDB:
+    current_user: Annotated[Principal, Depends(get_current_user)],
+) -> Principal:
     """Dependency to get current active user.
 
     Args:
         current_user: Current authenticated user.
 
     Returns:
-        UserDB: Current active user.
+        Principal: Current active user.
 
     Raises:
         HTTPException: If user is not active.
@@ -94,46 +102,34 @@ def require_roles(*required_roles: str):
     Example:
         @router.get("/admin/")
         async def admin_endpoint(
-            user: Annotated[UserDB, Depends(require_roles("admin"))]
+            user: Annotated[Principal, Depends(require_roles("admin"))]
         ):
             ...
     """
 
     async def role_checker(
-        current_user: Annotated[UserDB, Depends(get_current_user)],
-        user_service: UserService,
-    ) -> UserDB:
+        current_user: Annotated[Principal, Depends(get_current_user)],
+    ) -> Principal:
         """Check if user has required roles.
 
         Args:
             current_user: Current authenticated user.
-            user_service: User service instance.
 
         Returns:
-            UserDB: Current user if they have required roles.
+            Principal: Current user if they have required roles.
 
         Raises:
             HTTPException: If user lacks required roles.
         """
-        user = await user_service.get_by_id_with_roles(current_user.id)
-
-        if user is None:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="User not found",
-            )
-
-        user_roles = {role.name for role in user.roles}
-
-        if not any(role in user_roles for role in required_roles):
+        if not current_user.has_any_role(*required_roles):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Access denied. Required roles: {', '.join(required_roles)}",
             )
 
-        return user
+        return current_user
 
     return role_checker
 
 
-CurrentUser = Annotated[UserDB, Depends(get_current_user)]
+CurrentUser = Annotated[Principal, Depends(get_current_user)]
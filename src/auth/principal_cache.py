@@ -0,0 +1,77 @@
+"""Short-lived per-worker cache of authenticated principals.
+
+Resolving a bearer token to a user's active flag and roles would otherwise cost a
+query (two for role checks) on every authenticated request. Entries are keyed by
+user id and token version, expire after a short TTL and are invalidated explicitly
+by the user and role services whenever a user's roles or active flag change.
+Invalidation only reaches the current worker; the TTL bounds staleness elsewhere.
+"""
+
+from dataclasses import dataclass
+from time import monotonic
+
+from src.core.config import settings
+from src.core.models import UserDB
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """Authenticated user as seen by authorization checks."""
+
+    id: int
+    username: str
+    is_active: bool
+    roles: frozenset[str]
+    token_version: int = 0
+
+    @classmethod
+    def from_user(cls, user: UserDB) -> "Principal":
+        """Build a principal from a user loaded with its roles."""
+        return cls(
+            id=user.id,
+            username=user.username,
+            is_active=user.is_active,
+            roles=frozenset(role.name for role in user.roles),
+            token_version=user.token_version,
+        )
+
+    def has_any_role(self, *roles: str) -> bool:
+        return not self.roles.isdisjoint(roles)
+
+
+class PrincipalCache:
+    """TTL cache of principals keyed by (user_id, token_version)."""
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[tuple[int, int], tuple[float, Principal]] = {}
+
+    def get(self, user_id: int, token_version: int) -> Principal | None:
+        entry = self._entries.get((user_id, token_version))
+        if entry is None:
+            return None
+        expires_at, principal = entry
+        if expires_at <= monotonic():
+            self._entries.pop((user_id, token_version), None)
+            return None
+        return principal
+
+    def set(self, principal: Principal) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        key = (principal.id, principal.token_version)
+        self._entries[key] = (monotonic() + self.ttl_seconds, principal)
+
+    def invalidate(self, user_id: int) -> None:
+        """Drop every cached principal of a user, whatever its token version."""
+        for key in [key for key in self._entries if key[0] == user_id]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+principal_cache = PrincipalCache(settings.principal_cache_ttl_seconds)
@@ -1,12 +1,27 @@
 """Security utilities for authentication and authorization."""
 
+import asyncio
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 import bcrypt
 import jwt
 
 from src.core.config import settings
 
+_password_executor: ThreadPoolExecutor | None = None
+
+
+def _get_password_executor() -> ThreadPoolExecutor:
+    """Bounded pool that runs bcrypt off the event loop (bcrypt releases the GIL)."""
+    global _password_executor
+    if _password_executor is None:
+        _password_executor = ThreadPoolExecutor(
+            max_workers=settings.password_hash_max_workers,
+            thread_name_prefix="password-hash",
+        )
+    return _password_executor
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against a hashed password.
@@ -21,19 +36,51 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
 
 
-def get_password_hash(password: str) -> str:
+def get_password_hash(password: str, rounds: int | None = None) -> str:
     """Hash a password.
 
     Args:
         password: Plain text password.
+        rounds: bcrypt work factor, defaults to settings.bcrypt_rounds.
 
     Returns:
         str: Hashed password.
     """
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=rounds or settings.bcrypt_rounds)
     return bcrypt.hashpw(password.encode(), salt).decode()
 
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password in the password hashing thread pool.
+
+    Use from async code so the event loop keeps serving other requests and
+    WebSockets while bcrypt runs.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_password_executor(), verify_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password in the password hashing thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_password_executor(), get_password_hash, password)
+
+
+def password_hash_rounds(hashed_password: str) -> int | None:
+    """Return the bcrypt work factor of a hash, None if it is not a bcrypt hash."""
+    parts = hashed_password.split("$")
+    if len(parts) < 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Whether a hash was made with a different work factor than configured."""
+    return password_hash_rounds(hashed_password) != settings.bcrypt_rounds
+
+
 def create_access_token(data: dict, expires_delta: datetime.timedelta | None = None) -> str:
     """Create a JWT access token.
 
@@ -53,7 +53,7 @@ class AuthRouter:
 
             from src.auth.security import create_access_token
 
-            access_token = create_access_token(data={"sub": str(user.id)})
+            access_token = create_access_token(data={"sub": str(user.id), "tv": user.token_version})
             self.logger.info(f"User {user.username} logged in successfully")
 
             return Token(access_token=access_token, token_type="bearer")
@@ -1,3 +1,6 @@
-from .clock_orchestrator import ClockOrchestrator
+from .clock_leases import ClockLeaseManager
+from .clock_orchestrator import ClockOrchestrator, is_superseded
 
 clock_orchestrator = ClockOrchestrator()
+
+__all__ = ["ClockLeaseManager", "ClockOrchestrator", "clock_orchestrator", "is_superseded"]
@@ -0,0 +1,180 @@
+"""Cross-worker ownership of running clocks via PostgreSQL advisory locks.
+
+Every worker runs its own ClockOrchestrator, and several of them may have the same
+running clock registered (e.g. each worker serving a websocket for the match). A clock
+is only driven by the worker holding its lease: a session-level advisory lock keyed by
+(clock kind, clock id), taken with pg_try_advisory_lock on one dedicated connection per
+worker. Leases are retried periodically, so when the owning worker dies its connection
+closes, PostgreSQL releases its locks, and another worker with the clock registered
+takes it over on its next attempt. Every reconcile interval the orchestrator also
+re-reads which clocks are running, so pauses and restarts made on other workers are
+followed and running clocks unknown to this worker are registered.
+"""
+
+import asyncio
+from typing import Awaitable, Callable
+
+import asyncpg
+
+from src.logging_config import get_logger
+
+from .clock_orchestrator import ClockKey, ClockKind
+
+# First key of the two-int advisory lock space, one per clock kind.
+LEASE_LOCK_CLASSES: dict[ClockKind, int] = {"playclock": 0x504C434B, "gameclock": 0x474C434B}
+
+
+class ClockLeaseManager:
+    """Holds advisory-lock leases for the clocks this worker wants to drive."""
+
+    def __init__(
+        self,
+        dsn: str,
+        retry_interval_seconds: float = 1.0,
+        reconcile_interval_seconds: float = 2.0,
+    ) -> None:
+        self.dsn = dsn
+        self.retry_interval_seconds = retry_interval_seconds
+        self.reconcile_interval_seconds = reconcile_interval_seconds
+        self._wanted: set[ClockKey] = set()
+        self._owned: set[ClockKey] = set()
+        # Wanted leases not yet attempted; their ticks are held rather than dropped.
+        self._pending: set[ClockKey] = set()
+        self._connection: asyncpg.Connection | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        # Called with a newly locked clock; returning False gives the lease back.
+        self.on_acquired: Callable[[ClockKind, int], Awaitable[bool]] | None = None
+        # Called every reconcile_interval_seconds to sync registered clocks with the database.
+        self.on_reconcile: Callable[[], Awaitable[None]] | None = None
+        self.logger = get_logger("ClockLeaseManager", self)
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run_loop())
+        self.logger.info("Clock lease manager started")
+
+    async def stop(self) -> None:
+        """Stop retrying and close the lease connection, releasing every lease."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._close_connection()
+        self._wanted.clear()
+        self.logger.info("Clock lease manager stopped")
+
+    def owns(self, kind: ClockKind, clock_id: int) -> bool:
+        return (kind, clock_id) in self._owned
+
+    def is_pending(self, kind: ClockKind, clock_id: int) -> bool:
+        """Whether the clock's lease was asked for but not attempted yet."""
+        return (kind, clock_id) in self._pending
+
+    def want(self, kind: ClockKind, clock_id: int) -> None:
+        """Ask for the clock's lease; it is acquired in the background."""
+        key = (kind, clock_id)
+        if key not in self._wanted:
+            self._wanted.add(key)
+            if key not in self._owned and self._task is not None:
+                self._pending.add(key)
+            self._wake()
+
+    def release(self, kind: ClockKind, clock_id: int) -> None:
+        """Give up the clock's lease; it is unlocked in the background."""
+        self._wanted.discard((kind, clock_id))
+        self._pending.discard((kind, clock_id))
+        if (kind, clock_id) in self._owned:
+            self._wake()
+
+    def _wake(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_reconcile = loop.time()
+        while True:
+            self._wakeup.clear()
+            if self.on_reconcile is not None and loop.time() >= next_reconcile:
+                next_reconcile = loop.time() + self.reconcile_interval_seconds
+                try:
+                    await self.on_reconcile()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:
+                    self.logger.error("Reconciling running clocks failed: %s", exc, exc_info=True)
+            try:
+                await self._sync()
+            except asyncio.CancelledError:
+                raise
+            except (OSError, asyncpg.PostgresError, asyncpg.InterfaceError) as exc:
+                self.logger.warning("Clock lease connection failed: %s", exc)
+                await self._close_connection()
+            except Exception as exc:
+                self.logger.error("Clock lease sync failed: %s", exc, exc_info=True)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.retry_interval_seconds)
+            except TimeoutError:
+                pass
+
+    async def _sync(self) -> None:
+        """Unlock leases no longer wanted and try to lock wanted ones we do not own."""
+        if not self._wanted and not self._owned:
+            return
+        connection = await self._get_connection()
+
+        for key in list(self._owned - self._wanted):
+            self._owned.discard(key)
+            await connection.fetchval("SELECT pg_advisory_unlock($1, $2)", *self._lock_key(key))
+            self.logger.debug("Released lease for %s %s", *key)
+
+        for key in list(self._wanted - self._owned):
+            locked = await connection.fetchval(
+                "SELECT pg_try_advisory_lock($1, $2)", *self._lock_key(key)
+            )
+            if locked and await self._accept(key):
+                self._owned.add(key)
+                self.logger.info("Acquired lease for %s %s", *key)
+            elif locked:
+                await connection.fetchval("SELECT pg_advisory_unlock($1, $2)", *self._lock_key(key))
+            self._pending.discard(key)
+
+    async def _accept(self, key: ClockKey) -> bool:
+        """Whether to keep a lease just locked (the clock may have been released meanwhile)."""
+        if self.on_acquired is not None:
+            try:
+                if not await self.on_acquired(*key):
+                    return False
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self.logger.error("Taking over %s %s failed: %s", *key, exc, exc_info=True)
+                return False
+        return key in self._wanted
+
+    async def _get_connection(self) -> asyncpg.Connection:
+        if self._connection is None or self._connection.is_closed():
+            self._owned.clear()
+            self._connection = await asyncpg.connect(self.dsn, command_timeout=30)
+        return self._connection
+
+    async def _close_connection(self) -> None:
+        self._owned.clear()
+        self._pending.clear()
+        connection, self._connection = self._connection, None
+        if connection is not None and not connection.is_closed():
+            try:
+                await connection.close(timeout=5)
+            except Exception as exc:
+                self.logger.debug("Error closing clock lease connection: %s", exc)
+
+    @staticmethod
+    def _lock_key(key: ClockKey) -> tuple[int, int]:
+        kind, clock_id = key
+        return LEASE_LOCK_CLASSES[kind], clock_id
@@ -1,10 +1,25 @@
 import asyncio
+import heapq
+import itertools
 import time
-from typing import Awaitable, Callable, Protocol
+from typing import TYPE_CHECKING, Awaitable, Callable, Literal, Protocol
 
-from src.core.enums import ClockDirection
+from src.core.enums import ClockDirection, ClockStatus
 from src.logging_config import get_logger
 
+if TYPE_CHECKING:
+    from .clock_leases import ClockLeaseManager
+
+ClockKind = Literal["playclock", "gameclock"]
+ClockKey = tuple[ClockKind, int]
+# Returns {clock_id: started_at_ms} for every clock the database says is running.
+RunningClocksCallback = Callable[[], Awaitable[dict[int, int | None]]]
+
+# Clocks registered while not started (no started_at_ms) are re-checked this often.
+IDLE_RECHECK_SECONDS = 0.1
+# A due tick whose lease is still being acquired is retried this often.
+LEASE_PENDING_RECHECK_SECONDS = 0.01
+
 
 class ClockStateMachineProtocol(Protocol):
     started_at_ms: int | None
@@ -14,11 +29,49 @@ class ClockStateMachineProtocol(Protocol):
     def get_current_value(self) -> int: ...
 
 
+def is_superseded(
+    status: str | None,
+    started_at_ms: int | None,
+    state_machine: ClockStateMachineProtocol | None,
+) -> bool:
+    """Whether a clock's stored state no longer matches the timeline this worker drives.
+
+    True when the clock was paused/stopped elsewhere, or restarted with a different
+    started_at_ms. Rows without started_at_ms (legacy running clocks) are not compared.
+    """
+    if status != ClockStatus.RUNNING:
+        return True
+    local_started_at_ms = getattr(state_machine, "started_at_ms", None)
+    return (
+        started_at_ms is not None
+        and local_started_at_ms is not None
+        and started_at_ms != local_started_at_ms
+    )
+
+
 class ClockOrchestrator:
-    def __init__(self) -> None:
+    """Single timer task ticking every running clock once per whole second.
+
+    Each clock's next tick is kept in a heap keyed by the wall-clock time of its next
+    whole-second boundary since started_at_ms. The loop sleeps until the earliest
+    deadline and dispatches the callbacks of all due clocks concurrently, each with
+    a timeout, so one slow callback does not delay the other clocks.
+
+    With a ClockLeaseManager attached, clocks stay scheduled on every worker that
+    registered them but callbacks only run on the worker holding the clock's lease.
+    """
+
+    def __init__(self, callback_timeout_seconds: float = 2.0) -> None:
         self.running_playclocks: dict[int, ClockStateMachineProtocol] = {}
         self.running_gameclocks: dict[int, ClockStateMachineProtocol] = {}
-        self._last_updated_second: dict[int, int] = {}  # clock_id -> last second updated
+        self.callback_timeout_seconds = callback_timeout_seconds
+        # (deadline_s, seq, kind, clock_id, started_at_ms, second); entries that no longer
+        # match _next_tick are stale and skipped when popped.
+        self._deadlines: list[tuple[float, int, ClockKind, int, int | None, int]] = []
+        self._next_tick: dict[ClockKey, tuple[int | None, int]] = {}
+        self._seq = itertools.count()
+        self._in_flight: dict[ClockKey, asyncio.Task] = {}
+        self._wakeup: asyncio.Event | None = None
         self._task: asyncio.Task | None = None
         self._is_running = False
         self._is_stopping = False
@@ -26,6 +79,11 @@ class ClockOrchestrator:
         self._gameclock_update_callback: Callable[[int], Awaitable[None]] | None = None
         self._playclock_stop_callback: Callable[[int], Awaitable[None]] | None = None
         self._gameclock_stop_callback: Callable[[int], Awaitable[None]] | None = None
+        self._playclock_resume_callback: Callable[[int], Awaitable[bool]] | None = None
+        self._gameclock_resume_callback: Callable[[int], Awaitable[bool]] | None = None
+        self._playclock_running_callback: RunningClocksCallback | None = None
+        self._gameclock_running_callback: RunningClocksCallback | None = None
+        self._leases: ClockLeaseManager | None = None
         self.logger = get_logger("ClockOrchestrator", self)
         self.logger.debug("Initialized ClockOrchestrator")
 
@@ -37,7 +95,13 @@ class ClockOrchestrator:
 
         self._is_stopping = False
         self._is_running = True
+        self._wakeup = asyncio.Event()
         self._task = asyncio.create_task(self._run_loop())
+        if self._leases is not None:
+            for kind in ("playclock", "gameclock"):
+                for clock_id in self._running(kind):
+                    self._leases.want(kind, clock_id)
+            await self._leases.start()
         self.logger.info("ClockOrchestrator started")
 
     async def stop(self) -> None:
@@ -48,9 +112,16 @@ class ClockOrchestrator:
         self._gameclock_update_callback = None
         self._playclock_stop_callback = None
         self._gameclock_stop_callback = None
+        self._playclock_resume_callback = None
+        self._gameclock_resume_callback = None
+        self._playclock_running_callback = None
+        self._gameclock_running_callback = None
+        if self._leases is not None:
+            await self._leases.stop()
         self.running_playclocks.clear()
         self.running_gameclocks.clear()
-        self._last_updated_second.clear()
+        self._deadlines.clear()
+        self._next_tick.clear()
         if self._task:
             self._task.cancel()
             try:
@@ -60,43 +131,207 @@ class ClockOrchestrator:
             except Exception as exc:
                 self.logger.warning("ClockOrchestrator loop stopped with error: %s", exc)
             self._task = None
+        in_flight = list(self._in_flight.values())
+        self._in_flight.clear()
+        for task in in_flight:
+            task.cancel()
+        await asyncio.gather(*in_flight, return_exceptions=True)
         self._is_stopping = False
         self.logger.info("ClockOrchestrator stopped")
 
     async def _run_loop(self) -> None:
-        """Single loop checking all clocks every 100ms"""
+        """Sleep until the earliest clock deadline, then dispatch every due clock"""
         self.logger.debug("ClockOrchestrator loop started")
         while self._is_running:
-            for clock_id, state_machine in list(self.running_playclocks.items()):
-                if self._should_update(clock_id, state_machine):
-                    await self._update_playclock(clock_id, state_machine)
-
-            for clock_id, state_machine in list(self.running_gameclocks.items()):
-                if self._should_update(clock_id, state_machine):
-                    await self._update_gameclock(clock_id, state_machine)
+            self._dispatch_due(time.time())
 
-            await asyncio.sleep(0.1)
+            self._wakeup.clear()
+            timeout = self._deadlines[0][0] - time.time() if self._deadlines else None
+            if timeout is not None and timeout <= 0:
+                await asyncio.sleep(0)
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except TimeoutError:
+                pass
 
         self.logger.debug("ClockOrchestrator loop stopped")
 
-    def _should_update(self, clock_id: int, state_machine: ClockStateMachineProtocol) -> bool:
-        """Check if clock needs to update at this moment (once per second)"""
-        if not hasattr(state_machine, "started_at_ms") or state_machine.started_at_ms is None:
-            return False
+    def _dispatch_due(self, now: float) -> None:
+        """Pop every due deadline, start its callback and schedule the next tick"""
+        while self._deadlines and self._deadlines[0][0] <= now:
+            _, _, kind, clock_id, started_at_ms, second = heapq.heappop(self._deadlines)
+            key = (kind, clock_id)
+            if self._next_tick.get(key) != (started_at_ms, second):
+                continue
+
+            state_machine = self._running(kind).get(clock_id)
+            if state_machine is None:
+                self._next_tick.pop(key, None)
+                continue
+
+            if getattr(state_machine, "started_at_ms", None) != started_at_ms:
+                # Clock was paused/restarted behind our back; follow its new timeline.
+                self._schedule(kind, clock_id, state_machine, now)
+                continue
+
+            if (
+                started_at_ms is not None
+                and self._leases is not None
+                and self._leases.is_pending(kind, clock_id)
+            ):
+                # Lease not decided yet (e.g. clock just started): hold this tick, don't drop it.
+                self._next_tick[key] = (started_at_ms, second)
+                heapq.heappush(
+                    self._deadlines,
+                    (
+                        now + LEASE_PENDING_RECHECK_SECONDS,
+                        next(self._seq),
+                        kind,
+                        clock_id,
+                        started_at_ms,
+                        second,
+                    ),
+                )
+                continue
+
+            self._schedule(kind, clock_id, state_machine, now, after_second=second)
+            if started_at_ms is None:
+                continue
+            if self._leases is not None and not self._leases.owns(kind, clock_id):
+                continue
+
+            previous = self._in_flight.get(key)
+            if previous is not None and not previous.done():
+                self.logger.warning(
+                    "Skipping %s %s tick %s: previous callback still running",
+                    kind,
+                    clock_id,
+                    second,
+                )
+                continue
+
+            update = self._update_playclock if kind == "playclock" else self._update_gameclock
+            task = asyncio.create_task(self._run_callback(key, update(clock_id, state_machine)))
+            self._in_flight[key] = task
+
+    async def _run_callback(self, key: ClockKey, update: Awaitable[None]) -> None:
+        try:
+            await update
+        except TimeoutError:
+            self.logger.warning(
+                "%s %s callback timed out after %ss", *key, self.callback_timeout_seconds
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            self.logger.error("%s %s callback failed: %s", *key, exc, exc_info=True)
+        finally:
+            if self._in_flight.get(key) is asyncio.current_task():
+                del self._in_flight[key]
+
+    def _schedule(
+        self,
+        kind: ClockKind,
+        clock_id: int,
+        state_machine: ClockStateMachineProtocol,
+        now: float,
+        after_second: int = -1,
+    ) -> None:
+        """Push the clock's next whole-second boundary (since started_at_ms) onto the heap"""
+        started_at_ms = getattr(state_machine, "started_at_ms", None)
+        if started_at_ms is None:
+            second = after_second
+            deadline = now + IDLE_RECHECK_SECONDS
+        else:
+            started_at = started_at_ms / 1000.0
+            # Tick the current second right away unless it has already been dispatched.
+            second = max(int(now - started_at), after_second + 1, 0)
+            deadline = started_at + second
+        self._next_tick[(kind, clock_id)] = (started_at_ms, second)
+        heapq.heappush(
+            self._deadlines, (deadline, next(self._seq), kind, clock_id, started_at_ms, second)
+        )
+
+    def _register(
+        self, kind: ClockKind, clock_id: int, state_machine: ClockStateMachineProtocol
+    ) -> None:
+        self._running(kind)[clock_id] = state_machine
+        if self._leases is not None:
+            self._leases.want(kind, clock_id)
+        previous = self._next_tick.get((kind, clock_id))
+        started_at_ms = getattr(state_machine, "started_at_ms", None)
+        if previous is not None and previous[0] == started_at_ms:
+            return  # same timeline already scheduled
+        self._schedule(kind, clock_id, state_machine, time.time())
+        if self._wakeup is not None:
+            self._wakeup.set()
 
-        # Use time.time() to match state_machine.started_at_ms which uses time.time() * 1000
-        now_ms = time.time() * 1000
-        elapsed_ms = now_ms - state_machine.started_at_ms
-        elapsed_sec = elapsed_ms / 1000.0
-        current_second = int(elapsed_sec)
+    def _unregister(self, kind: ClockKind, clock_id: int) -> None:
+        self._running(kind).pop(clock_id, None)
+        self._next_tick.pop((kind, clock_id), None)
+        if self._leases is not None:
+            self._leases.release(kind, clock_id)
+
+    async def _on_lease_acquired(self, kind: ClockKind, clock_id: int) -> bool:
+        """Reload a clock from the database before driving it; drop it if it stopped."""
+        if clock_id not in self._running(kind):
+            return False
+        return await self._resume(kind, clock_id)
 
-        # Only update if we haven't updated for this second yet
-        last_second = self._last_updated_second.get(clock_id, -1)
-        if current_second > last_second:
-            self._last_updated_second[clock_id] = current_second
+    async def _resume(self, kind: ClockKind, clock_id: int) -> bool:
+        """Re-register a clock from its database state, or unregister it if not running."""
+        resume = (
+            self._playclock_resume_callback
+            if kind == "playclock"
+            else self._gameclock_resume_callback
+        )
+        if resume is None or await resume(clock_id):
             return True
+        self.logger.info("%s %s is no longer running; dropping it", kind, clock_id)
+        self._unregister(kind, clock_id)
         return False
 
+    async def _reconcile_with_database(self) -> None:
+        """Follow clock changes made on other workers.
+
+        Running clocks this worker lacks are registered (so it can take them over), and
+        registered clocks that were paused, stopped or restarted elsewhere are reloaded,
+        so an owner never keeps driving a stale timeline.
+        """
+        for kind, load_running in (
+            ("playclock", self._playclock_running_callback),
+            ("gameclock", self._gameclock_running_callback),
+        ):
+            if load_running is None:
+                continue
+            running = await load_running()
+            registered = self._running(kind)
+            changed = [
+                clock_id
+                for clock_id, state_machine in registered.items()
+                if clock_id not in running
+                or is_superseded(ClockStatus.RUNNING, running[clock_id], state_machine)
+            ]
+            missing = [clock_id for clock_id in running if clock_id not in registered]
+            for clock_id in changed + missing:
+                await self._resume(kind, clock_id)
+
+    def set_lease_manager(self, lease_manager: "ClockLeaseManager | None") -> None:
+        """Only drive clocks whose cross-worker lease this worker holds"""
+        self._leases = lease_manager
+        if lease_manager is not None:
+            lease_manager.on_acquired = self._on_lease_acquired
+            lease_manager.on_reconcile = self._reconcile_with_database
+        self.logger.debug("Set clock lease manager")
+
+    def _running(self, kind: ClockKind) -> dict[int, ClockStateMachineProtocol]:
+        return self.running_playclocks if kind == "playclock" else self.running_gameclocks
+
+    async def _bounded(self, update: Awaitable[None]) -> None:
+        """Bound a per-second update callback; stop callbacks persist terminal state and are not."""
+        await asyncio.wait_for(update, self.callback_timeout_seconds)
+
     async def _update_playclock(
         self, clock_id: int, state_machine: ClockStateMachineProtocol
     ) -> None:
@@ -110,7 +345,7 @@ class ClockOrchestrator:
             self.unregister_playclock(clock_id)
         else:
             if self._playclock_update_callback:
-                await self._playclock_update_callback(clock_id)
+                await self._bounded(self._playclock_update_callback(clock_id))
 
     async def _update_gameclock(
         self, clock_id: int, state_machine: ClockStateMachineProtocol
@@ -139,28 +374,26 @@ class ClockOrchestrator:
             self.unregister_gameclock(clock_id)
         else:
             if self._gameclock_update_callback:
-                await self._gameclock_update_callback(clock_id)
+                await self._bounded(self._gameclock_update_callback(clock_id))
 
     def register_playclock(self, clock_id: int, state_machine: ClockStateMachineProtocol) -> None:
         """Register a playclock with the orchestrator"""
-        self.running_playclocks[clock_id] = state_machine
+        self._register("playclock", clock_id, state_machine)
         self.logger.debug(f"Registered playclock {clock_id}")
 
     def unregister_playclock(self, clock_id: int) -> None:
         """Unregister a playclock from the orchestrator"""
-        self.running_playclocks.pop(clock_id, None)
-        self._last_updated_second.pop(clock_id, None)
+        self._unregister("playclock", clock_id)
         self.logger.debug(f"Unregistered playclock {clock_id}")
 
     def register_gameclock(self, clock_id: int, state_machine: ClockStateMachineProtocol) -> None:
         """Register a gameclock with the orchestrator"""
-        self.running_gameclocks[clock_id] = state_machine
+        self._register("gameclock", clock_id, state_machine)
         self.logger.debug(f"Registered gameclock {clock_id}")
 
     def unregister_gameclock(self, clock_id: int) -> None:
         """Unregister a gameclock from the orchestrator"""
-        self.running_gameclocks.pop(clock_id, None)
-        self._last_updated_second.pop(clock_id, None)
+        self._unregister("gameclock", clock_id)
         self.logger.debug(f"Unregistered gameclock {clock_id}")
 
     def set_playclock_update_callback(self, callback: Callable[[int], Awaitable[None]]) -> None:
@@ -182,3 +415,23 @@ class ClockOrchestrator:
         """Set callback for gameclock stop (when clock reaches 0)"""
         self._gameclock_stop_callback = callback
         self.logger.debug("Set gameclock stop callback")
+
+    def set_playclock_resume_callback(self, callback: Callable[[int], Awaitable[bool]]) -> None:
+        """Set callback reloading a playclock on lease takeover (returns whether it still runs)"""
+        self._playclock_resume_callback = callback
+        self.logger.debug("Set playclock resume callback")
+
+    def set_gameclock_resume_callback(self, callback: Callable[[int], Awaitable[bool]]) -> None:
+        """Set callback reloading a gameclock on lease takeover (returns whether it still runs)"""
+        self._gameclock_resume_callback = callback
+        self.logger.debug("Set gameclock resume callback")
+
+    def set_playclock_running_callback(self, callback: RunningClocksCallback) -> None:
+        """Set callback listing running playclocks in the database (for reconciliation)"""
+        self._playclock_running_callback = callback
+        self.logger.debug("Set playclock running callback")
+
+    def set_gameclock_running_callback(self, callback: RunningClocksCallback) -> None:
+        """Set callback listing running gameclocks in the database (for reconciliation)"""
+        self._gameclock_running_callback = callback
+        self.logger.debug("Set gameclock running callback")
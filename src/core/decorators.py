@@ -1,6 +1,7 @@
 import asyncio
 import functools
 from collections.abc import Callable
+from contextvars import ContextVar
 from typing import Any, TypeVar
 
 from fastapi import HTTPException
@@ -13,6 +14,38 @@ from src.core.exceptions import (
 
 T = TypeVar("T")
 
+_read_only_context: ContextVar[bool] = ContextVar("read_only_context", default=False)
+
+
+def is_read_only_context() -> bool:
+    """Return True when the current task is executing inside a @read_only method."""
+    return _read_only_context.get()
+
+
+def read_only(method: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Mark an async service method as read-only so its sessions may use a replica.
+
+    While the method runs, Database.get_session_maker() routes new sessions to a
+    healthy read replica (round-robin) and falls back to the primary when none is
+    available. Decorated methods must not write; anything undecorated stays on
+    the primary.
+
+    Example:
+        @read_only
+        async def get_player_career(self, player_id: int): ...
+    """
+
+    @functools.wraps(method)
+    async def wrapper(*args: object, **kwargs: object) -> Any:
+        token = _read_only_context.set(True)
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            _read_only_context.reset(token)
+
+    return wrapper
+
 
 def handle_service_exceptions(
     item_name: str | None = None,
@@ -136,6 +136,11 @@ def get_sport_scoreboard_preset_service():
     return registry.get("sport_scoreboard_preset")
 
 
+def get_import_job_service():
+    registry = get_service_registry()
+    return registry.get("import_job")
+
+
 SportService = Annotated[Any, Depends(get_sport_service)]
 SeasonService = Annotated[Any, Depends(get_season_service)]
 TournamentService = Annotated[Any, Depends(get_tournament_service)]
@@ -161,3 +166,4 @@ UserService = Annotated[Any, Depends(get_user_service)]
 GlobalSettingService = Annotated[Any, Depends(get_global_setting_service)]
 RoleService = Annotated[Any, Depends(get_role_service)]
 SportScoreboardPresetService = Annotated[Any, Depends(get_sport_scoreboard_preset_service)]
+ImportJobService = Annotated[Any, Depends(get_import_job_service)]
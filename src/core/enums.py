@@ -111,3 +111,13 @@ class RussianDay(StrEnum):
     ПЯТ = "пят"
     СУБ = "суб"
     ВОС = "вос"
+
+
+class ImportJobStatus(StrEnum):
+    """Lifecycle of a background EESL import job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
@@ -3,6 +3,7 @@ from typing import Any
 from fastapi import APIRouter, HTTPException
 
 from src.core.service_registry import get_service_registry
+from src.helpers.request_services_helper import get_proxy_stats
 
 router = APIRouter(prefix="/health", tags=["health"])
 
@@ -28,3 +29,9 @@ async def test_db_connection() -> dict[str, str]:
         return {"status": "healthy", "message": "Database connection successful"}
     except Exception as ex:
         raise HTTPException(status_code=503, detail=f"Database connection failed: {ex}") from ex
+
+
+@router.get("/proxies")
+async def get_proxy_status() -> dict[str, Any]:
+    """Scraper proxy tiers and per-proxy health of the worker serving the request."""
+    return {"status": "healthy", **get_proxy_stats()}
@@ -0,0 +1,216 @@
+"""In-process HTTP request metrics with Prometheus text exposition.
+
+Each worker keeps its own MetricsRegistry. When METRICS_DIR is set, every worker
+periodically writes a JSON snapshot of its registry to that directory and the
+/metrics endpoint merges the snapshots of all live workers, so a scrape through
+any gunicorn worker returns totals for the whole server.
+"""
+
+import asyncio
+import json
+import os
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any
+
+from src.logging_config import get_logger
+
+logger = get_logger("metrics")
+
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def _key(*labels: str) -> str:
+    return "\x1f".join(labels)
+
+
+def _labels(key: str) -> list[str]:
+    return key.split("\x1f")
+
+
+class MetricsRegistry:
+    """Per-route latency histograms, status counters and in-flight gauges."""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        # key (method, route) -> [bucket counts..., +Inf count]
+        self.latency_buckets: dict[str, list[int]] = {}
+        self.latency_sum: dict[str, float] = {}
+        # key (method, route, status) -> count
+        self.status_counts: dict[str, int] = {}
+        # method -> requests currently being served (the route is unknown until routed)
+        self.in_flight: dict[str, int] = {}
+
+    def request_started(self, method: str) -> None:
+        self.in_flight[method] = self.in_flight.get(method, 0) + 1
+
+    def request_finished(self, method: str, route: str, status: int, duration: float) -> None:
+        self.in_flight[method] = self.in_flight.get(method, 1) - 1
+
+        key = _key(method, route)
+        counts = self.latency_buckets.get(key)
+        if counts is None:
+            counts = self.latency_buckets[key] = [0] * (len(self.buckets) + 1)
+        counts[bisect_left(self.buckets, duration)] += 1
+        self.latency_sum[key] = self.latency_sum.get(key, 0.0) + duration
+
+        status_key = _key(method, route, str(status))
+        self.status_counts[status_key] = self.status_counts.get(status_key, 0) + 1
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "buckets": list(self.buckets),
+            "latency_buckets": {k: list(v) for k, v in self.latency_buckets.items()},
+            "latency_sum": dict(self.latency_sum),
+            "status_counts": dict(self.status_counts),
+            "in_flight": dict(self.in_flight),
+        }
+
+
+def merge_snapshots(snapshots: list[dict[str, Any]]) -> dict[str, Any]:
+    """Sum snapshots from several workers (bucket layouts must match)."""
+    merged: dict[str, Any] = {
+        "buckets": list(LATENCY_BUCKETS),
+        "latency_buckets": {},
+        "latency_sum": {},
+        "status_counts": {},
+        "in_flight": {},
+    }
+    for snapshot in snapshots:
+        merged["buckets"] = snapshot["buckets"]
+        for key, counts in snapshot["latency_buckets"].items():
+            existing = merged["latency_buckets"].setdefault(key, [0] * len(counts))
+            for index, value in enumerate(counts):
+                existing[index] += value
+        for name in ("latency_sum", "status_counts", "in_flight"):
+            for key, value in snapshot[name].items():
+                merged[name][key] = merged[name].get(key, 0) + value
+    return merged
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(**labels: str) -> str:
+    pairs = (f'{name}="{_escape_label_value(value)}"' for name, value in labels.items())
+    return "{" + ",".join(pairs) + "}"
+
+
+def render_prometheus(snapshot: dict[str, Any]) -> str:
+    """Render a (merged) snapshot in Prometheus text exposition format 0.0.4."""
+    buckets = snapshot["buckets"]
+    lines = [
+        "# HELP http_request_duration_seconds HTTP request latency by route template.",
+        "# TYPE http_request_duration_seconds histogram",
+    ]
+    for key in sorted(snapshot["latency_buckets"]):
+        method, route = _labels(key)
+        counts = snapshot["latency_buckets"][key]
+        cumulative = 0
+        for bound, count in zip([*buckets, None], counts, strict=True):
+            cumulative += count
+            le = "+Inf" if bound is None else repr(float(bound))
+            lines.append(
+                "http_request_duration_seconds_bucket"
+                f"{_format_labels(method=method, route=route, le=le)} {cumulative}"
+            )
+        labels = _format_labels(method=method, route=route)
+        lines.append(f"http_request_duration_seconds_sum{labels} {snapshot['latency_sum'][key]}")
+        lines.append(f"http_request_duration_seconds_count{labels} {cumulative}")
+
+    lines.append("# HELP http_requests_total HTTP responses by route template and status.")
+    lines.append("# TYPE http_requests_total counter")
+    for key in sorted(snapshot["status_counts"]):
+        method, route, status = _labels(key)
+        labels = _format_labels(method=method, route=route, status=status)
+        lines.append(f"http_requests_total{labels} {snapshot['status_counts'][key]}")
+
+    lines.append("# HELP http_requests_in_flight HTTP requests currently being served.")
+    lines.append("# TYPE http_requests_in_flight gauge")
+    for method in sorted(snapshot["in_flight"]):
+        lines.append(
+            f"http_requests_in_flight{_format_labels(method=method)} "
+            f"{snapshot['in_flight'][method]}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def write_snapshot(registry: MetricsRegistry, metrics_dir: Path) -> None:
+    """Atomically write this worker's snapshot to metrics_dir/<pid>.json."""
+    metrics_dir.mkdir(parents=True, exist_ok=True)
+    target = metrics_dir / f"{os.getpid()}.json"
+    tmp = target.with_suffix(".tmp")
+    tmp.write_text(json.dumps(registry.snapshot()))
+    tmp.replace(target)
+
+
+def collect_snapshots(metrics_dir: Path) -> list[dict[str, Any]]:
+    """Read snapshots of all live workers, removing files left by dead ones."""
+    snapshots = []
+    for path in metrics_dir.glob("*.json"):
+        try:
+            pid = int(path.stem)
+        except ValueError:
+            continue
+        if not _pid_alive(pid):
+            path.unlink(missing_ok=True)
+            continue
+        try:
+            snapshots.append(json.loads(path.read_text()))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skipping unreadable metrics snapshot {path}: {e}")
+    return snapshots
+
+
+def render_metrics(registry: MetricsRegistry, metrics_dir: Path | None) -> str:
+    """Render this worker's metrics, combined across workers when metrics_dir is set."""
+    if metrics_dir is None:
+        return render_prometheus(registry.snapshot())
+    write_snapshot(registry, metrics_dir)
+    return render_prometheus(merge_snapshots(collect_snapshots(metrics_dir)))
+
+
+async def write_snapshots_task(
+    registry: MetricsRegistry, metrics_dir: Path, interval_seconds: float = 5.0
+) -> None:
+    """Background task keeping this worker's snapshot file fresh."""
+    logger.info(f"Starting metrics snapshot task, dir={metrics_dir}")
+    while True:
+        try:
+            write_snapshot(registry, metrics_dir)
+            await asyncio.sleep(interval_seconds)
+        except asyncio.CancelledError:
+            (metrics_dir / f"{os.getpid()}.json").unlink(missing_ok=True)
+            logger.info("Metrics snapshot task cancelled")
+            break
+        except Exception as e:
+            logger.error(f"Error writing metrics snapshot: {e}", exc_info=True)
+            await asyncio.sleep(interval_seconds)
+
+
+metrics_registry = MetricsRegistry()
@@ -1,62 +1,173 @@
 import uuid
 from time import perf_counter
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from fastapi import HTTPException
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from src.core.config import settings
+from src.core.metrics import UNMATCHED_ROUTE, metrics_registry
+from src.core.query_stats import log_query_stats_if_excessive, track_queries
 from src.logging_config import get_logger
 
 logger = get_logger("fastapi")
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
-    """Middleware to generate and propagate unique request IDs."""
+def get_route_template(scope: Scope, root_path: str = "") -> str:
+    """Return the templated path of the route that served the request.
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
-        request.state.request_id = request_id
-        response = await call_next(request)
-        response.headers["X-Request-ID"] = request_id
-        return response
+    Uses the matched route (e.g. "/api/matches/id/{item_id}/") rather than the raw
+    path so metrics labels stay low-cardinality. Mounted apps (static files) are
+    reported by their mount path.
+    """
+    route = scope.get("route")
+    template = getattr(route, "path_format", None) or getattr(route, "path", None)
+    if template:
+        return template
+    mount_path = scope.get("root_path", "")
+    if mount_path != root_path:
+        return mount_path[len(root_path) :] or "/"
+    return UNMATCHED_ROUTE
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware to log request/response information with timing and request IDs."""
+class RequestIDMiddleware:
+    """Middleware to generate and propagate unique request IDs.
+
+    Also attributes SQL statements executed while serving the request to its ID and
+    reports them in a Server-Timing header.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get("X-Request-ID", str(uuid.uuid4()))
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        with track_queries(request_id) as query_stats:
+
+            async def send_with_headers(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers["X-Request-ID"] = request_id
+                    headers["Server-Timing"] = query_stats.server_timing()
+                await send(message)
+
+            await self.app(scope, receive, send_with_headers)
+
+        log_query_stats_if_excessive(
+            query_stats,
+            scope["method"],
+            scope["path"],
+            settings.query_stats_max_queries,
+            settings.query_stats_max_repeats,
+        )
+
+
+class LoggingMiddleware:
+    """Middleware to log request/response information with timing and request IDs.
+
+    Every request is also recorded in the metrics registry (latency histogram and
+    status count per route template, in-flight gauge per method).
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        request_id = getattr(request.state, "request_id", "unknown")
         start_time = perf_counter()
-        path = request.url.path
-        method = request.method
+        method = scope["method"]
+        path = scope["path"]
+        root_path = scope.get("root_path", "")
+        status_code = 500
 
-        try:
-            response = await call_next(request)
-            duration_ms = (perf_counter() - start_time) * 1000
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
-            if response.status_code >= 400:
-                logger.warning(
-                    f"Request completed: {method} {path} - "
-                    f"status={response.status_code} "
-                    f"duration={duration_ms:.2f}ms "
-                    f"request_id={request_id}"
-                )
-            else:
-                logger.debug(
-                    f"Request completed: {method} {path} - "
-                    f"status={response.status_code} "
-                    f"duration={duration_ms:.2f}ms "
-                    f"request_id={request_id}"
-                )
-
-            return response
+        metrics_registry.request_started(method)
+        try:
+            await self.app(scope, receive, send_with_status)
         except Exception as e:
             duration_ms = (perf_counter() - start_time) * 1000
             logger.error(
                 f"Request failed: {method} {path} - "
                 f"error={type(e).__name__} "
                 f"duration={duration_ms:.2f}ms "
-                f"request_id={request_id}",
+                f"request_id={self._request_id(scope)}",
                 exc_info=True,
             )
             raise
+        finally:
+            metrics_registry.request_finished(
+                method,
+                get_route_template(scope, root_path),
+                status_code,
+                perf_counter() - start_time,
+            )
+
+        duration_ms = (perf_counter() - start_time) * 1000
+        message = (
+            f"Request completed: {method} {path} - "
+            f"status={status_code} "
+            f"duration={duration_ms:.2f}ms "
+            f"request_id={self._request_id(scope)}"
+        )
+        if status_code >= 400:
+            logger.warning(message)
+        else:
+            logger.debug(message)
+
+    @staticmethod
+    def _request_id(scope: Scope) -> str:
+        return scope.get("state", {}).get("request_id", "unknown")
+
+
+class UploadSizeLimitMiddleware:
+    """Middleware to cap multipart request bodies while they stream in.
+
+    A body declaring a larger Content-Length is refused before it is read; any other is cut off
+    with 413 once the received bytes pass the limit, so an oversized upload is never spooled whole.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_size: int) -> None:
+        self.app = app
+        self.max_body_size = max_body_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        headers = Headers(scope=scope) if scope["type"] == "http" else None
+        if headers is None or not headers.get("content-type", "").startswith("multipart/"):
+            await self.app(scope, receive, send)
+            return
+
+        detail = f"Request body too large. Max size: {self.max_body_size} bytes"
+        content_length = headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > self.max_body_size:
+            logger.warning(f"Refused {scope['path']}: Content-Length {content_length}")
+            await JSONResponse({"detail": detail}, status_code=413)(scope, receive, send)
+            return
+
+        received = 0
+
+        async def receive_capped() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_size:
+                    logger.warning(f"Cut off {scope['path']} after {received} bytes")
+                    raise HTTPException(status_code=413, detail=detail)
+            return message
+
+        await self.app(scope, receive_capped, send)
@@ -4,6 +4,7 @@ __all__ = (
     "BaseServiceDB",
     "handle_service_exceptions",
     "handle_view_exceptions",
+    "read_only",
     "SportDB",
     "SportScoreboardPresetDB",
     "SeasonDB",
@@ -30,14 +31,18 @@ __all__ = (
     "RoleDB",
     "GlobalSettingDB",
     "MatchStatsThrottleDB",
+    "ImportJobDB",
+    "EeslFingerprintDB",
 )
 
-from src.core.decorators import handle_service_exceptions, handle_view_exceptions
+from src.core.decorators import handle_service_exceptions, handle_view_exceptions, read_only
 
 from .base import Base, BaseServiceDB, db
+from .eesl_fingerprint import EeslFingerprintDB
 from .football_event import FootballEventDB
 from .gameclock import GameClockDB
 from .global_setting import GlobalSettingDB
+from .import_job import ImportJobDB
 from .match import MatchDB
 from .match_stats_throttle import MatchStatsThrottleDB
 from .matchdata import MatchDataDB
@@ -1,3 +1,5 @@
+import asyncio
+import itertools
 from typing import Any, Callable
 
 from fastapi import HTTPException
@@ -16,6 +18,7 @@ from sqlalchemy.orm import (
 )
 
 from src.core.config import settings
+from src.core.decorators import is_read_only_context
 from src.core.models.mixins import (
     CRUDMixin,
     QueryMixin,
@@ -23,21 +26,43 @@ from src.core.models.mixins import (
     SearchPaginationMixin,
     SerializationMixin,
 )
+from src.core.query_stats import instrument_engine
 from src.logging_config import get_logger
 
 db_logger_helper = get_logger("db")
 
+REPLICA_LAG_QUERY = """
+SELECT CASE
+    WHEN NOT pg_is_in_recovery() THEN 0
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+END
+"""
+
 
 class Database:
-    def __init__(self, db_url: str, echo: bool = False, test_mode: bool = False):
+    def __init__(
+        self,
+        db_url: str,
+        echo: bool = False,
+        test_mode: bool = False,
+        replica_urls: list[str] | None = None,
+        max_replica_lag_seconds: float = 5.0,
+    ):
         self.logger = get_logger("db", self)
         self.logger.info(f"Initializing Database with URL: {db_url}, Echo: {echo}")
         self.test_mode = test_mode
         self.test_async_session: Any | None = None
-
+        self.max_replica_lag_seconds = max_replica_lag_seconds
+        self.replica_engines: list[AsyncEngine] = []
+        self.replica_sessions: list[Any] = []
+        # None means "not checked yet" or "check failed" - never routed to
+        self.replica_lag_seconds: list[float | None] = []
+        self._replica_cursor = itertools.count()
+
+        pool_size = 3 if "test" in db_url else 5
+        max_overflow = 5 if "test" in db_url else 10
         try:
-            pool_size = 3 if "test" in db_url else 5
-            max_overflow = 5 if "test" in db_url else 10
             self.engine: AsyncEngine = create_async_engine(
                 url=db_url,
                 echo=echo,
@@ -48,20 +73,52 @@ class Database:
             self.async_session: Any = async_sessionmaker(
                 bind=self.engine, class_=AsyncSession, expire_on_commit=False
             )
+            instrument_engine(self.engine)
         except SQLAlchemyError as e:
             self.logger.error(f"Error initializing Database engine: {e}", exc_info=True)
         except Exception as e:
             self.logger.error(f"Unexpected error initializing Database: {e}", exc_info=True)
 
+        for replica_url in replica_urls or []:
+            try:
+                replica_engine = create_async_engine(
+                    url=replica_url,
+                    echo=echo,
+                    pool_size=pool_size,
+                    max_overflow=max_overflow,
+                    pool_pre_ping=True,
+                )
+            except SQLAlchemyError as e:
+                self.logger.error(f"Error initializing replica engine: {e}", exc_info=True)
+                continue
+            instrument_engine(replica_engine)
+            self.replica_engines.append(replica_engine)
+            self.replica_sessions.append(
+                async_sessionmaker(bind=replica_engine, class_=AsyncSession, expire_on_commit=False)
+            )
+            self.replica_lag_seconds.append(None)
+
+        if self.replica_engines:
+            self.logger.info(
+                f"Configured {len(self.replica_engines)} read replica(s), "
+                f"max lag {max_replica_lag_seconds}s"
+            )
+
     def get_session_maker(self) -> Any:
         """Get appropriate session maker for current context.
 
-        Returns test_async_session if available (for test transaction isolation),
-        otherwise returns default async_session.
+        Returns test_async_session if available (for test transaction isolation).
+        Inside a @read_only service method returns a healthy replica session maker
+        (round-robin) when one is configured, otherwise returns default async_session.
         """
         if self.test_async_session is not None:
             return self.test_async_session
 
+        if self.replica_sessions and is_read_only_context():
+            replica_session = self._next_healthy_replica_session()
+            if replica_session is not None:
+                return replica_session
+
         if hasattr(self, "async_session"):
             return self.async_session
 
@@ -70,6 +127,50 @@ class Database:
             "Database may not be properly initialized."
         )
 
+    def _next_healthy_replica_session(self) -> Any | None:
+        replica_count = len(self.replica_sessions)
+        start = next(self._replica_cursor)
+        for offset in range(replica_count):
+            index = (start + offset) % replica_count
+            lag = self.replica_lag_seconds[index]
+            if lag is not None and lag <= self.max_replica_lag_seconds:
+                return self.replica_sessions[index]
+        self.logger.debug("No healthy read replica available, using primary")
+        return None
+
+    async def refresh_replica_lag(self) -> list[float | None]:
+        """Measure replication lag of every replica and store it for routing."""
+        for index, replica_engine in enumerate(self.replica_engines):
+            try:
+                async with replica_engine.connect() as connection:
+                    result = await connection.execute(text(REPLICA_LAG_QUERY))
+                    lag = result.scalar()
+                self.replica_lag_seconds[index] = float(lag) if lag is not None else None
+            except Exception as e:
+                self.logger.warning(f"Replica {index} lag check failed: {e}")
+                self.replica_lag_seconds[index] = None
+
+            lag = self.replica_lag_seconds[index]
+            if lag is not None and lag > self.max_replica_lag_seconds:
+                self.logger.warning(
+                    f"Replica {index} lags {lag:.1f}s behind primary, routing reads to primary"
+                )
+        return list(self.replica_lag_seconds)
+
+    async def monitor_replica_lag(self, interval_seconds: float = 2.0) -> None:
+        """Background loop keeping replica lag measurements fresh."""
+        self.logger.info("Starting replica lag monitor")
+        while True:
+            try:
+                await self.refresh_replica_lag()
+                await asyncio.sleep(interval_seconds)
+            except asyncio.CancelledError:
+                self.logger.info("Replica lag monitor cancelled")
+                break
+            except Exception as e:
+                self.logger.error(f"Error in replica lag monitor: {e}", exc_info=True)
+                await asyncio.sleep(interval_seconds)
+
     async def test_connection(self, test_query: str = "SELECT 1"):
         try:
             async with self.engine.connect() as connection:
@@ -144,10 +245,17 @@ class Database:
     async def close(self):
         self.logger.info(f"Final pool status: {self.get_pool_status()}")
         await self.engine.dispose()
+        for replica_engine in self.replica_engines:
+            await replica_engine.dispose()
         self.logger.info("Database connection closed.")
 
 
-db = Database(db_url=str(settings.db.db_url), echo=settings.db_echo)
+db = Database(
+    db_url=str(settings.db.db_url),
+    echo=settings.db_echo,
+    replica_urls=settings.db_replica_url_list,
+    max_replica_lag_seconds=settings.db_replica_max_lag_seconds,
+)
 
 
 class BaseServiceDB(
@@ -0,0 +1,28 @@
+from datetime import UTC, datetime
+
+from sqlalchemy import DateTime, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.core.models import Base
+
+
+class EeslFingerprintDB(Base):
+    __tablename__ = "eesl_fingerprint"
+    __table_args__ = (
+        UniqueConstraint(
+            "entity",
+            "eesl_id",
+            name="idx_unique_eesl_fingerprint",
+        ),
+        {"extend_existing": True},
+    )
+
+    entity: Mapped[str] = mapped_column(String(20), nullable=False)
+    eesl_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    # sha256 of the parsed EESL data the entity was last imported from.
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+    )
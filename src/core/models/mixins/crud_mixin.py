@@ -1,10 +1,10 @@
 import asyncio
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from fastapi import HTTPException
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import inspect, select, update
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.sql import func
 
@@ -186,32 +186,55 @@ class CRUDMixin:
                 detail="Internal server error",
             ) from ex
 
-    async def update(self, item_id: int, item, **kwargs):
+    async def update(self, item_id: int, item, expected_version: int | None = None, **kwargs):
         self.logger.debug(f"Starting to update element with ID: {item_id}")
+        update_data = item.model_dump(exclude_unset=True, exclude_none=True)
+        return await self.update_returning(item_id, update_data, expected_version=expected_version)
+
+    async def update_returning(
+        self,
+        item_id: int,
+        values: dict[str, Any],
+        expected_version: int | None = None,
+    ):
+        """Apply values with a single ``UPDATE ... RETURNING`` statement.
+
+        Keys that are not mapped columns are ignored. Models with a ``version`` column
+        get ``version = version + 1`` in the same statement; with ``expected_version``
+        the update only applies while the stored version still matches, otherwise a
+        409 is raised. Returns None when no row has ``item_id``.
+        """
+        columns = {attr.key for attr in inspect(self.model).column_attrs} - {"id", "version"}
+        values = {key: value for key, value in values.items() if key in columns}
+        versioned = hasattr(self.model, "version")
+
         async with self.db.get_session_maker()() as session:
             try:
                 is_test_mode = hasattr(self.db, "test_mode") and self.db.test_mode
-                result = await session.execute(select(self.model).where(self.model.id == item_id))
+                if not values and not versioned:
+                    return await session.get(self.model, item_id)
+
+                stmt = update(self.model).where(self.model.id == item_id)
+                if versioned:
+                    values["version"] = func.coalesce(self.model.version, 0) + 1
+                    if expected_version is not None:
+                        stmt = stmt.where(self.model.version == expected_version)
+                result = await session.execute(stmt.values(**values).returning(self.model))
                 updated_item = result.scalars().one_or_none()
 
-                if not updated_item:
+                if updated_item:
+                    if not is_test_mode:
+                        await session.commit()
+                    self.logger.debug(f"Updated element with ID: {item_id}")
+                    return updated_item
+
+                if expected_version is None or not await session.scalar(
+                    select(self.model.id).where(self.model.id == item_id)
+                ):
                     self.logger.warning(
                         f"No element found with ID: {item_id} for model {self.model.__name__}"
                     )
                     return None
-
-                update_data = item.model_dump(exclude_unset=True, exclude_none=True)
-
-                for key, value in update_data.items():
-                    setattr(updated_item, key, value)
-
-                await session.flush()
-                if not is_test_mode:
-                    await session.commit()
-                await session.refresh(updated_item)
-
-                self.logger.debug(f"Updated element with ID: {item_id}")
-                return updated_item
             except HTTPException:
                 await session.rollback()
                 raise
@@ -246,6 +269,12 @@ class CRUDMixin:
                     detail="Internal server error",
                 ) from ex
 
+        self.logger.warning(f"Version conflict updating {self.model.__name__} {item_id}")
+        raise HTTPException(
+            status_code=409,
+            detail=f"{self.model.__name__} {item_id} was modified concurrently",
+        )
+
     async def delete(self, item_id: int):
         self.logger.debug(f"Starting to delete element with ID: {item_id}")
         async with self.db.get_session_maker()() as session:
@@ -67,6 +67,13 @@ class UserDB(Base):
         server_default="false",
     )
 
+    token_version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+
     person: Mapped["PersonDB"] = relationship(
         "PersonDB",
         back_populates="user",
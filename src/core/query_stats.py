@@ -0,0 +1,127 @@
+"""Per-request SQL statement accounting used to spot N+1 query patterns.
+
+Database engines are instrumented with cursor execute hooks. While a request is
+being served (see RequestIDMiddleware), every statement executed in its context is
+counted, timed and fingerprinted so repeated statements stand out.
+"""
+
+import re
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.logging_config import get_logger
+
+logger = get_logger("query_stats")
+
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_PARAM_LIST_RE = re.compile(r"\((?:\s*(?:\$\d+|\?|%\(\w+\)s)\s*,?)+\)")
+_PARAM_RE = re.compile(r"\$\d+|%\(\w+\)s")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+_TIMER_KEY = "query_stats_start"
+
+
+def fingerprint_statement(statement: str) -> str:
+    """Normalize a SQL statement so executions differing only by parameters match."""
+    fingerprint = _STRING_RE.sub("?", statement)
+    fingerprint = _PARAM_RE.sub("?", fingerprint)
+    fingerprint = _PARAM_LIST_RE.sub("(?)", fingerprint)
+    fingerprint = _NUMBER_RE.sub("?", fingerprint)
+    return _WHITESPACE_RE.sub(" ", fingerprint).strip()
+
+
+class QueryStats:
+    """Statement count, total DB time and fingerprints for one unit of work."""
+
+    def __init__(self, request_id: str | None = None):
+        self.request_id = request_id
+        self.count = 0
+        self.total_time_ms = 0.0
+        self.fingerprints: Counter[str] = Counter()
+
+    def record(self, statement: str, duration_ms: float) -> None:
+        self.count += 1
+        self.total_time_ms += duration_ms
+        self.fingerprints[fingerprint_statement(statement)] += 1
+
+    def repeated_statements(self, min_repeats: int = 2) -> list[tuple[str, int]]:
+        """Return fingerprints executed at least min_repeats times, most frequent first."""
+        return [(fp, n) for fp, n in self.fingerprints.most_common() if n >= min_repeats]
+
+    def server_timing(self) -> str:
+        """Format stats as a Server-Timing header value."""
+        return f'db;dur={self.total_time_ms:.2f};desc="{self.count} queries"'
+
+
+_current_query_stats: ContextVar[QueryStats | None] = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+def get_current_query_stats() -> QueryStats | None:
+    return _current_query_stats.get()
+
+
+@contextmanager
+def track_queries(request_id: str | None = None) -> Iterator[QueryStats]:
+    """Collect stats for every statement executed in the current context."""
+    stats = QueryStats(request_id)
+    token = _current_query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_query_stats.reset(token)
+
+
+def log_query_stats_if_excessive(
+    stats: QueryStats, method: str, path: str, max_queries: int, max_repeats: int
+) -> None:
+    """Emit a debug log line when a request exceeds query thresholds."""
+    repeated = stats.repeated_statements(max_repeats)
+    if stats.count <= max_queries and not repeated:
+        return
+    top = "; ".join(f"{n}x {fp[:120]}" for fp, n in repeated[:3])
+    logger.debug(
+        f"Query thresholds exceeded: {method} {path} - "
+        f"queries={stats.count} db_time={stats.total_time_ms:.2f}ms "
+        f"repeated=[{top}] request_id={stats.request_id}"
+    )
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _current_query_stats.get() is not None:
+        conn.info.setdefault(_TIMER_KEY, []).append(perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = _current_query_stats.get()
+    if stats is None:
+        return
+    timers = conn.info.get(_TIMER_KEY)
+    if not timers:
+        return
+    stats.record(statement, (perf_counter() - timers.pop()) * 1000)
+
+
+def _handle_error(exception_context) -> None:
+    connection = exception_context.connection
+    if connection is not None and connection.info.get(_TIMER_KEY):
+        connection.info[_TIMER_KEY].pop()
+
+
+def instrument_engine(engine: AsyncEngine | Any) -> None:
+    """Attach query accounting hooks to an engine (idempotent)."""
+    sync_engine = getattr(engine, "sync_engine", engine)
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
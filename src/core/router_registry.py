@@ -172,5 +172,7 @@ def configure_routers(registry: RouterRegistry) -> RouterRegistry:
     registry.register_router("src.auth", "api_auth_router", priority=190)
     registry.register_router("src.users", "api_user_router", priority=200)
     registry.register_router("src.roles", "api_role_router", priority=201)
+    registry.register_router("src.import_jobs", "api_import_job_router", priority=210)
+    registry.register_router("src.images", "api_image_router", priority=220)
 
     return registry
@@ -165,6 +165,12 @@ def _sport_scoreboard_preset_factory(database: Database) -> BaseServiceDB:
     return SportScoreboardPresetServiceDB(database)
 
 
+def _import_job_factory(database: Database) -> BaseServiceDB:
+    from src.import_jobs.db_services import ImportJobServiceDB
+
+    return ImportJobServiceDB(database)
+
+
 def register_all_services(database: Database) -> ServiceRegistry:
     """Register all service factories with the global registry.
 
@@ -205,6 +211,7 @@ def register_all_services(database: Database) -> ServiceRegistry:
         ("global_setting", _global_setting_factory, False),
         ("role", _role_factory, False),
         ("sport_scoreboard_preset", _sport_scoreboard_preset_factory, False),
+        ("import_job", _import_job_factory, False),
     )
 
     for service_name, factory, singleton in services:
@@ -48,3 +48,22 @@ class LogoFieldsBase(BaseModel):
     original_url: Annotated[str, Path(max_length=500)] | None = ""
     icon_url: Annotated[str, Path(max_length=500)] | None = ""
     webview_url: Annotated[str, Path(max_length=500)] | None = ""
+
+
+class ImageVariantSchema(BaseModel):
+    """One responsive variant of an image, served under an immutable URL"""
+
+    url: str = Field(..., examples=["/static/uploads/images/variants/3f/3f9c2a7d1e0b4c5a6d8e.webp"])
+    width: int = Field(..., examples=[128])
+    height: int = Field(..., examples=[128])
+    type: str = Field(..., examples=["image/webp"])
+
+
+class ImageVariantsSchema(BaseModel):
+    """Responsive variants of an image, with ready-made srcset strings by MIME type"""
+
+    variants: list[ImageVariantSchema] = Field(default_factory=list)
+    srcset: dict[str, str] = Field(
+        default_factory=dict,
+        examples=[{"image/webp": "/static/uploads/images/variants/3f/3f9c.webp 64w, ..."}],
+    )
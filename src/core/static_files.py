@@ -0,0 +1,51 @@
+"""Serving of uploaded files under ``/static/uploads``.
+
+In the ``app`` mode the app streams files itself (``StaticFiles``). Behind a front server, the
+``x-accel-redirect`` mode only resolves and checks the path, then answers with an
+``X-Accel-Redirect`` header so nginx sends the file from an internal location and workers spend
+no time on image bytes. ``x-sendfile`` does the same with an absolute path for servers that
+support ``X-Sendfile`` (Apache, lighttpd).
+"""
+
+import mimetypes
+import os
+from pathlib import PurePath
+from typing import Literal
+from urllib.parse import quote
+
+from starlette.responses import Response
+from starlette.staticfiles import PathLike, StaticFiles
+from starlette.types import Scope
+
+UploadsServingMode = Literal["app", "x-accel-redirect", "x-sendfile"]
+
+
+class UploadFiles(StaticFiles):
+    def __init__(
+        self,
+        *,
+        directory: PathLike,
+        mode: UploadsServingMode = "app",
+        accel_redirect_prefix: str = "/_uploads/",
+    ) -> None:
+        super().__init__(directory=directory)
+        self.mode = mode
+        self.accel_redirect_prefix = accel_redirect_prefix.rstrip("/") + "/"
+
+    def file_response(
+        self,
+        full_path: PathLike,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        if self.mode == "app":
+            return super().file_response(full_path, stat_result, scope, status_code)
+
+        if self.mode == "x-accel-redirect":
+            relative_path = PurePath(self.get_path(scope)).as_posix()
+            headers = {"X-Accel-Redirect": self.accel_redirect_prefix + quote(relative_path)}
+        else:
+            headers = {"X-Sendfile": os.fspath(full_path)}
+        media_type = mimetypes.guess_type(os.fspath(full_path))[0] or "application/octet-stream"
+        return Response(status_code=status_code, media_type=media_type, headers=headers)
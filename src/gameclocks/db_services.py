@@ -18,7 +18,7 @@ from src.core.models import (
 from src.core.models.base import Database
 from src.core.period_clock import extract_period_index
 
-from ..clocks import clock_orchestrator
+from ..clocks import clock_orchestrator, is_superseded
 from ..logging_config import get_logger
 from .clock_state_machine import ClockStateMachine
 from .schemas import GameClockSchemaBase, GameClockSchemaCreate, GameClockSchemaUpdate
@@ -84,6 +84,8 @@ class GameClockServiceDB(BaseServiceDB):
     def _setup_orchestrator_callbacks(self) -> None:
         clock_orchestrator.set_gameclock_update_callback(self.trigger_update_gameclock)
         clock_orchestrator.set_gameclock_stop_callback(self._stop_gameclock_internal)
+        clock_orchestrator.set_gameclock_resume_callback(self.resume_gameclock)
+        clock_orchestrator.set_gameclock_running_callback(self.running_gameclock_timelines)
 
     @handle_service_exceptions(item_name="GAMECLOCK", operation="creating")
     async def create(self, item: GameClockSchemaCreate) -> GameClockDB:
@@ -99,6 +101,18 @@ class GameClockServiceDB(BaseServiceDB):
         """Persist terminal gameclock state and clean up runtime clock resources."""
         self.logger.info("Stopping gameclock %s at terminal value", gameclock_id)
         state_machine = self.clock_manager.get_clock_state_machine(gameclock_id)
+        gameclock = await self.get_by_id(gameclock_id)
+        if gameclock is not None and is_superseded(
+            gameclock.gameclock_status,
+            gameclock.started_at_ms,
+            clock_orchestrator.running_gameclocks.get(gameclock_id) or state_machine,
+        ):
+            self.logger.info(
+                "Gameclock %s was paused or restarted elsewhere; not persisting stop", gameclock_id
+            )
+            clock_orchestrator.unregister_gameclock(gameclock_id)
+            await self.clock_manager.end_clock(gameclock_id)
+            return
         terminal_gameclock_value = 0
         if state_machine:
             self.logger.debug(
@@ -112,7 +126,6 @@ class GameClockServiceDB(BaseServiceDB):
                 terminal_gameclock_value = max(0, state_machine.max_value)
             state_machine.stop()
         else:
-            gameclock = await self.get_by_id(gameclock_id)
             if gameclock and gameclock.direction == ClockDirection.UP:
                 max_value = gameclock.gameclock_max if gameclock.gameclock_max is not None else 0
                 terminal_gameclock_value = max(0, max_value)
@@ -175,34 +188,28 @@ class GameClockServiceDB(BaseServiceDB):
         self,
         item_id: int,
         item: BaseModel,
+        expected_version: int | None = None,
         **kwargs,
     ) -> GameClockDB | None:
         self.logger.debug(f"Update gameclock endpoint id:{item_id} data: {item}")
-        async with self.db.get_session_maker()() as session:
-            result = await session.execute(select(GameClockDB).where(GameClockDB.id == item_id))
-            updated_item = result.scalars().one_or_none()
-
-            if not updated_item:
-                self.logger.warning(f"GameClock not found: {item_id}")
-                return None
-
-            update_data = item.model_dump(exclude_unset=True)
-            update_data["version"] = (updated_item.version or 0) + 1
-
-            for key, value in update_data.items():
-                if value is not None or key == "started_at_ms":
-                    setattr(updated_item, key, value)
-
-            await session.flush()
-            await session.commit()
-            await session.refresh(updated_item)
+        update_data = {
+            key: value
+            for key, value in item.model_dump(exclude_unset=True).items()
+            if value is not None or key == "started_at_ms"
+        }
+        updated_item = await self.update_returning(
+            item_id, update_data, expected_version=expected_version
+        )
+        if not updated_item:
+            self.logger.warning(f"GameClock not found: {item_id}")
+            return None
 
-            self.logger.debug(f"Updated gameclock: {updated_item}")
-            if update_data.get("gameclock_status") == ClockStatus.RUNNING:
-                await self._register_running_gameclock(updated_item)
-            await self.trigger_update_gameclock(item_id)
+        self.logger.debug(f"Updated gameclock: {updated_item}")
+        if update_data.get("gameclock_status") == ClockStatus.RUNNING:
+            await self._register_running_gameclock(updated_item)
+        await self.trigger_update_gameclock(item_id)
 
-            return updated_item
+        return updated_item
 
     async def _register_running_gameclock(self, gameclock: GameClockDB) -> None:
         state_machine = self.clock_manager.get_clock_state_machine(gameclock.id)
@@ -223,6 +230,28 @@ class GameClockServiceDB(BaseServiceDB):
         state_machine.status = ClockStatus.RUNNING
         clock_orchestrator.register_gameclock(gameclock.id, state_machine)
 
+    async def resume_gameclock(self, gameclock_id: int) -> bool:
+        """Reload a gameclock before this worker takes over driving it.
+
+        Returns False when the clock is no longer running.
+        """
+        gameclock = await self.get_by_id(gameclock_id)
+        if gameclock is None or gameclock.gameclock_status != ClockStatus.RUNNING:
+            await self.clock_manager.end_clock(gameclock_id)
+            return False
+        await self._register_running_gameclock(gameclock)
+        return True
+
+    async def running_gameclock_timelines(self) -> dict[int, int | None]:
+        """Map each running gameclock id to its started_at_ms, for orchestrator reconciliation."""
+        async with self.db.get_session_maker()() as session:
+            result = await session.execute(
+                select(GameClockDB.id, GameClockDB.started_at_ms).where(
+                    GameClockDB.gameclock_status == ClockStatus.RUNNING
+                )
+            )
+            return dict(result.tuples().all())
+
     async def get_gameclock_status(
         self,
         item_id: int,
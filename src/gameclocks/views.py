@@ -6,6 +6,7 @@ from fastapi import (
     Depends,
     HTTPException,
     Path,
+    Query,
     status,
 )
 from fastapi.responses import JSONResponse
@@ -83,12 +84,14 @@ class GameClockAPIRouter(BaseRouter[GameClockSchema, GameClockSchemaCreate, Game
             game_clock_service: GameClockService,
             item_id: int,
             item: GameClockSchemaUpdate,
+            expected_version: Annotated[int | None, Query(ge=1)] = None,
         ):
             self.logger.debug(f"Update gameclock endpoint id:{item_id} data: {item}")
             try:
                 gameclock_update = await game_clock_service.update(
                     item_id,
                     item,
+                    expected_version=expected_version,
                 )
                 if gameclock_update is None:
                     raise HTTPException(status_code=404, detail=f"Gameclock {item_id} not found")
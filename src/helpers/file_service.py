@@ -9,16 +9,30 @@ from PIL import Image
 from src.core.config import settings
 from src.helpers.download_service import DownloadService
 from src.helpers.file_system_service import FileSystemService
-from src.helpers.image_processing_service import ImageProcessingService
+from src.helpers.image_processing_service import VARIANT_FORMATS, ImageProcessingService
+from src.helpers.image_store import ImageStore
 from src.helpers.text_helpers import convert_cyrillic_filename
 from src.helpers.upload_service import UploadService
 from src.logging_config import get_logger
 
 
+class ImageVariant(TypedDict):
+    url: str
+    width: int
+    height: int
+    type: str
+
+
+class ImageVariants(TypedDict):
+    variants: list[ImageVariant]
+    srcset: dict[str, str]
+
+
 class ResizedImagesPaths(TypedDict):
     original: str
     icon: str
     webview: str
+    variants: ImageVariants
 
 
 class DownloadedAndResizedImagesPaths(TypedDict):
@@ -27,6 +41,7 @@ class DownloadedAndResizedImagesPaths(TypedDict):
     image_url: str
     image_icon_url: str
     image_webview_url: str
+    image_variants: ImageVariants
 
 
 class FileService:
@@ -38,6 +53,8 @@ class FileService:
         self.upload_service = UploadService(self.fs_service)
         self.download_service = DownloadService(self.fs_service)
         self.image_service = ImageProcessingService()
+        self.upload_dir = upload_dir
+        self.image_store = ImageStore(upload_dir / "images")
         self.logger = get_logger("file_service", self)
         self.logger.debug("Initializing FileService")
 
@@ -67,6 +84,7 @@ class FileService:
         upload_dir = data["upload_dir"]
 
         image = await self.image_service.open_image_from_path(str(original_dest))
+        self.image_service.reduce_decoding(image, min_height=max(icon_height, web_view_height))
 
         icon_filename = await self.image_service.resize_and_save_image(
             icon_height,
@@ -91,10 +109,16 @@ class FileService:
             rel_icon_dest = Path("/static/uploads") / sub_folder / icon_filename
             rel_webview_dest = Path("/static/uploads") / sub_folder / webview_filename
 
+            digest = await self.image_store.adopt(original_dest)
+            variants = await self.create_image_variants(
+                digest, [str(rel_original_dest), str(rel_icon_dest), str(rel_webview_dest)]
+            )
+
             final_urls: ResizedImagesPaths = {
                 "original": str(rel_original_dest),
                 "icon": str(rel_icon_dest),
                 "webview": str(rel_webview_dest),
+                "variants": variants,
             }
 
             self.logger.info(f"URLs for uploaded and resized images generated: {final_urls}")
@@ -106,6 +130,85 @@ class FileService:
             )
             raise
 
+    @staticmethod
+    def _variant_widths(image_width: int) -> list[int]:
+        widths = [width for width in settings.image_variant_width_list if width <= image_width]
+        return widths or [image_width]
+
+    def _is_current_manifest(self, manifest: dict, mime_types: list[str]) -> bool:
+        planned = {
+            (mime_type, width)
+            for mime_type in mime_types
+            for width in self._variant_widths(manifest["width"])
+        }
+        return planned == {(entry["type"], entry["width"]) for entry in manifest["variants"]}
+
+    def _image_variants(self, manifest: dict) -> ImageVariants:
+        store_url = Path("/static/uploads") / self.image_store.root.relative_to(self.upload_dir)
+        variants: list[ImageVariant] = [
+            {
+                "url": str(store_url / entry["path"]),
+                "width": entry["width"],
+                "height": entry["height"],
+                "type": entry["type"],
+            }
+            for entry in manifest["variants"]
+        ]
+        candidates: dict[str, list[str]] = {}
+        for variant in variants:
+            candidates.setdefault(variant["type"], []).append(
+                f"{variant['url']} {variant['width']}w"
+            )
+        srcset = {mime_type: ", ".join(urls) for mime_type, urls in candidates.items()}
+        return {"variants": variants, "srcset": srcset}
+
+    async def create_image_variants(self, digest: str, urls: list[str]) -> ImageVariants:
+        """Encode the responsive variants of the stored image ``digest`` once.
+
+        The variants are found again later by any of ``urls`` through ``get_image_variants``.
+        """
+        formats = self.image_service.supported_variant_formats(settings.image_variant_format_list)
+        mime_types = [VARIANT_FORMATS[fmt][1] for fmt in formats]
+
+        manifest = await self.image_store.lookup_variants(digest)
+        if manifest is None or not self._is_current_manifest(manifest, mime_types):
+            image = await self.image_service.open_image_from_path(
+                str(self.image_store.blob_path(digest))
+            )
+            manifest = {"width": image.width, "height": image.height, "variants": []}
+            self.image_service.reduce_decoding(
+                image, min_width=max(self._variant_widths(image.width))
+            )
+            image = self.image_service.to_variant_mode(image)
+            for fmt, mime_type in zip(formats, mime_types, strict=True):
+                for width in self._variant_widths(image.width):
+                    data, height = await self.image_service.encode_variant(
+                        image, width, fmt, settings.image_variant_quality
+                    )
+                    path = await self.image_store.store_variant(data, fmt)
+                    manifest["variants"].append(
+                        {
+                            "path": path.relative_to(self.image_store.root).as_posix(),
+                            "width": width,
+                            "height": height,
+                            "type": mime_type,
+                        }
+                    )
+            await self.image_store.remember_variants(digest, manifest)
+            self.logger.debug(f"Encoded {len(manifest['variants'])} variants of {digest}")
+
+        for url in urls:
+            await self.image_store.remember_path(url, digest)
+        return self._image_variants(manifest)
+
+    async def get_image_variants(self, url: str) -> ImageVariants | None:
+        """Responsive variants of the image served at ``url``, if it has any."""
+        digest = await self.image_store.lookup_path(url)
+        if digest is None:
+            return None
+        manifest = await self.image_store.lookup_variants(digest)
+        return self._image_variants(manifest) if manifest is not None else None
+
     async def get_most_common_color(self, image_path: str) -> str | None:
         return await self.image_service.get_most_common_color(image_path)
 
@@ -132,43 +235,61 @@ class FileService:
         web_view_height: int = 400,
         force_redownload: bool = False,
     ) -> None:
+        """Download an image and its icon and webview derivatives through the image store.
+
+        An image already downloaded from ``img_url`` is only linked to the given paths, and
+        derivatives are resized once per distinct image.
+        """
         self.logger.debug(f"Initialize download and resize image from {img_url}")
         self.logger.debug(f"to full path with image filename {original_image_path_with_filename}")
 
-        image_path = await self.download_service.download_image(
-            img_url,
-            original_image_path_with_filename,
-            force_redownload=force_redownload,
-        )
-        self.logger.debug(f"img_path: {image_path}")
-        file_data = await self.download_service.open_file(image_path)
-        image = await self.image_service.open_image_from_file(file_data["data"])
-
-        icon_dir = str(Path(icon_image_path).parent)
-        await self.fs_service.create_path(icon_dir)
-        self.logger.debug(f"Created icon directory: {icon_dir}")
-        icon_filename = Path(icon_image_path).name
-        await self.image_service.resize_and_save_image(
-            icon_height,
-            image,
-            None,
-            Path(icon_dir),
-            icon_filename,
-            "",
-        )
-
-        webview_dir = str(Path(web_view_image_path).parent)
-        await self.fs_service.create_path(webview_dir)
-        self.logger.debug(f"Created webview directory: {webview_dir}")
-        webview_filename = Path(web_view_image_path).name
-        await self.image_service.resize_and_save_image(
-            web_view_height,
-            image,
-            None,
-            Path(webview_dir),
-            webview_filename,
-            "",
-        )
+        digest = None if force_redownload else await self.image_store.lookup_url(img_url)
+        if digest is not None and await self.image_store.link(
+            digest, original_image_path_with_filename
+        ):
+            self.logger.debug(f"Image from {img_url} is already stored as {digest}")
+        else:
+            self.image_store.detach(original_image_path_with_filename)
+            image_path = await self.download_service.download_image(
+                img_url,
+                original_image_path_with_filename,
+                force_redownload=True,
+            )
+            self.logger.debug(f"img_path: {image_path}")
+            digest = await self.image_store.adopt(image_path)
+            await self.image_store.remember_url(img_url, digest)
+
+        image = None
+        for height, path in (
+            (icon_height, icon_image_path),
+            (web_view_height, web_view_image_path),
+        ):
+            derivative = await self.image_store.lookup_derivative(digest, height)
+            if derivative is not None and await self.image_store.link(derivative, path):
+                continue
+
+            if image is None:
+                image = await self.image_service.open_image_from_path(
+                    original_image_path_with_filename
+                )
+                self.image_service.reduce_decoding(
+                    image, min_height=max(icon_height, web_view_height)
+                )
+
+            await self.fs_service.create_path(path)
+            self.image_store.detach(path)
+            await self.image_service.resize_and_save_image(
+                height,
+                image,
+                None,
+                Path(path).parent,
+                Path(path).name,
+                "",
+            )
+            self.logger.debug(f"Resized image to {height}px: {path}")
+            await self.image_store.remember_derivative(
+                digest, height, await self.image_store.adopt(path)
+            )
 
     @staticmethod
     def _sanitize_image_title(image_title: str) -> str:
@@ -242,12 +363,27 @@ class FileService:
             force_redownload=force_redownload,
         )
 
+        digest = await self.image_store.lookup_url(img_url)
+        variants: ImageVariants = (
+            await self.create_image_variants(
+                digest,
+                [
+                    paths["relative_image_url"],
+                    paths["relative_icon_url"],
+                    paths["relative_webview_url"],
+                ],
+            )
+            if digest is not None
+            else {"variants": [], "srcset": {}}
+        )
+
         final_paths_processed: DownloadedAndResizedImagesPaths = {
             "main_path": paths["main_path"],
             "image_path": paths["image_path"],
             "image_url": paths["relative_image_url"],
             "image_icon_url": paths["relative_icon_url"],
             "image_webview_url": paths["relative_webview_url"],
+            "image_variants": variants,
         }
 
         self.logger.info(f"Final processed paths: {final_paths_processed}")
@@ -1,3 +1,5 @@
+import asyncio
+import math
 from io import BytesIO
 from pathlib import Path
 
@@ -6,6 +8,11 @@ from PIL import Image
 
 from src.logging_config import get_logger
 
+VARIANT_FORMATS = {
+    "avif": ("AVIF", "image/avif"),
+    "webp": ("WEBP", "image/webp"),
+}
+
 
 class ImageProcessingService:
     def __init__(self):
@@ -21,15 +28,27 @@ class ImageProcessingService:
             raise
 
     async def open_image_from_path(self, image_path: str) -> Image.Image:
+        """Open the image at ``image_path``; it is decoded from the file when first used."""
         try:
             self.logger.debug(f"Opening image from {image_path}")
-            with open(image_path, "rb") as file:
-                image_data = file.read()
-                return Image.open(BytesIO(image_data))
+            return Image.open(image_path)
         except Exception as e:
             self.logger.error(f"Error opening image from {image_path}: {e}", exc_info=True)
             raise
 
+    def reduce_decoding(self, image: Image.Image, min_width: int = 0, min_height: int = 0) -> None:
+        """Decode ``image`` at the smallest scale still covering the given size.
+
+        Only decoders with scaled decoding (JPEG) support it; for images used to make smaller
+        derivatives. Must be called before the image is loaded.
+        """
+        scale = max(min_width / image.width, min_height / image.height)
+        if scale < 1:
+            image.draft(
+                image.mode, (math.ceil(image.width * scale), math.ceil(image.height * scale))
+            )
+            self.logger.debug(f"Decoding image at {image.size} instead of full size")
+
     async def save_image(
         self, dest: Path, save_image: Image.Image, source_image: Image.Image
     ) -> None:
@@ -70,6 +89,42 @@ class ImageProcessingService:
         await self.save_image(dest, resized_image, image)
         self.logger.info(f"Resized image {file_name} saved to {dest}")
 
+    @staticmethod
+    def to_variant_mode(image: Image.Image) -> Image.Image:
+        """``image`` in RGB, or RGBA if it has transparency; unchanged if it already is."""
+        has_alpha = image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info
+        mode = "RGBA" if has_alpha else "RGB"
+        return image if image.mode == mode else image.convert(mode)
+
+    @staticmethod
+    def supported_variant_formats(formats: list[str]) -> list[str]:
+        """The given responsive variant formats this Pillow build can encode, in order."""
+        Image.init()
+        return [
+            fmt
+            for fmt in formats
+            if fmt in VARIANT_FORMATS and VARIANT_FORMATS[fmt][0] in Image.SAVE
+        ]
+
+    async def encode_variant(
+        self, image: Image.Image, width: int, fmt: str, quality: int
+    ) -> tuple[bytes, int]:
+        """Resize ``image`` to ``width`` and encode it as ``fmt``; returns the data and height."""
+        height = max(1, round(image.height * width / image.width))
+        resized = self.to_variant_mode(image).resize((width, height), Image.Resampling.LANCZOS)
+        try:
+            data = await asyncio.to_thread(self._encode, resized, VARIANT_FORMATS[fmt][0], quality)
+        except Exception as e:
+            self.logger.error(f"Problem encoding {fmt} variant {width}w: {e}", exc_info=True)
+            raise
+        return data, height
+
+    @staticmethod
+    def _encode(image: Image.Image, image_format: str, quality: int) -> bytes:
+        buffer = BytesIO()
+        image.save(buffer, format=image_format, quality=quality)
+        return buffer.getvalue()
+
     async def generate_filename(
         self,
         _type: str | None,
@@ -0,0 +1,188 @@
+"""Content-addressed store for downloaded images.
+
+Every distinct image is kept once, under ``blobs/`` by the SHA-256 of its content. The paths
+pages use (``teams/logos/<title>.png`` and its ``_100px``/``_400px`` derivatives) are hard links
+to stored files: their URLs do not change, but identical logos and photos share one copy on
+disk. Two indexes of small files live next to the blobs:
+
+- ``index/urls/<sha256 of the URL>``: hash of the image last downloaded from that URL, so a
+  repeat download is a local lookup;
+- ``index/derivatives/<hash>_<height>px``: hash of that image resized to the height, so each
+  derivative is generated once per image;
+- ``index/paths/<sha256 of the public URL>``: hash of the image a legacy URL serves;
+- ``index/variants/<hash>.json``: manifest of the responsive variants of an image.
+
+Responsive variants (WebP/AVIF at several widths) live under ``variants/``, named by the hash of
+their own content, so their URLs are immutable and can be cached forever.
+
+Index entries and links are replaced atomically, so all workers can share the store. A path
+linked into the store must never be written in place: ``detach`` it first.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from pathlib import Path
+
+from src.logging_config import get_logger
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+class ImageStore:
+    def __init__(self, root: Path):
+        self.root = root
+        self.logger = get_logger("image_store", self)
+
+    def blob_path(self, digest: str) -> Path:
+        return self.root / "blobs" / digest[:2] / digest
+
+    def _url_index_path(self, img_url: str) -> Path:
+        url_digest = hashlib.sha256(img_url.encode()).hexdigest()
+        return self.root / "index" / "urls" / url_digest[:2] / url_digest
+
+    def _derivative_index_path(self, digest: str, height: int) -> Path:
+        return self.root / "index" / "derivatives" / digest[:2] / f"{digest}_{height}px"
+
+    def _path_index_path(self, url: str) -> Path:
+        url_digest = hashlib.sha256(url.encode()).hexdigest()
+        return self.root / "index" / "paths" / url_digest[:2] / url_digest
+
+    def _manifest_path(self, digest: str) -> Path:
+        return self.root / "index" / "variants" / digest[:2] / f"{digest}.json"
+
+    @staticmethod
+    def _temp_path(path: Path) -> Path:
+        return path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+
+    def _link(self, source: Path, dest: Path) -> None:
+        """Atomically make ``dest`` a hard link to ``source`` (a copy across file systems)."""
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        temp = self._temp_path(dest)
+        try:
+            os.link(source, temp)
+        except OSError:
+            shutil.copyfile(source, temp)
+        os.replace(temp, dest)
+
+    def _read_index(self, path: Path) -> str | None:
+        try:
+            digest = path.read_text().strip()
+        except FileNotFoundError:
+            return None
+        return digest if self.blob_path(digest).exists() else None
+
+    def _write_index(self, path: Path, digest: str) -> None:
+        self._write_file(path, digest.encode())
+
+    def _write_file(self, path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = self._temp_path(path)
+        temp.write_bytes(data)
+        os.replace(temp, path)
+
+    @staticmethod
+    def content_hash(path: str | Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as file:
+            while chunk := file.read(_CHUNK_SIZE):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    async def lookup_url(self, img_url: str) -> str | None:
+        return self._read_index(self._url_index_path(img_url))
+
+    async def remember_url(self, img_url: str, digest: str) -> None:
+        self._write_index(self._url_index_path(img_url), digest)
+
+    async def lookup_derivative(self, digest: str, height: int) -> str | None:
+        return self._read_index(self._derivative_index_path(digest, height))
+
+    async def remember_derivative(self, digest: str, height: int, derivative: str) -> None:
+        self._write_index(self._derivative_index_path(digest, height), derivative)
+
+    async def lookup_path(self, url: str) -> str | None:
+        return self._read_index(self._path_index_path(url))
+
+    async def remember_path(self, url: str, digest: str) -> None:
+        self._write_index(self._path_index_path(url), digest)
+
+    async def store_variant(self, data: bytes, extension: str) -> Path:
+        """Store an encoded variant under the hash of its content and return its path."""
+        variant_digest = hashlib.sha256(data).hexdigest()
+        path = self.root / "variants" / variant_digest[:2] / f"{variant_digest[:20]}.{extension}"
+        if not path.exists():
+            self._write_file(path, data)
+        return path
+
+    async def lookup_variants(self, digest: str) -> dict | None:
+        """Variant manifest of the stored image ``digest``; None unless all its files exist."""
+        try:
+            manifest = json.loads(self._manifest_path(digest).read_text())
+        except FileNotFoundError:
+            return None
+        if not all((self.root / entry["path"]).exists() for entry in manifest["variants"]):
+            return None
+        return manifest
+
+    async def remember_variants(self, digest: str, manifest: dict) -> None:
+        """Save the variant manifest of ``digest``; variant paths are relative to the store."""
+        self._write_file(self._manifest_path(digest), json.dumps(manifest).encode())
+
+    async def link(self, digest: str, dest: str | Path) -> bool:
+        """Make ``dest`` the stored image ``digest``; False if the store does not have it."""
+        blob = self.blob_path(digest)
+        if not blob.exists():
+            return False
+        dest = Path(dest)
+        if not (dest.exists() and os.path.samefile(blob, dest)):
+            self._link(blob, dest)
+        return True
+
+    async def adopt(self, path: str | Path) -> str:
+        """Store the file at ``path`` and return its hash.
+
+        If the store already has the same content, ``path`` becomes a link to it and its own
+        copy is freed.
+        """
+        path = Path(path)
+        digest = self.content_hash(path)
+        blob = self.blob_path(digest)
+        if not blob.exists():
+            self._link(path, blob)
+            self.logger.debug(f"Stored {path} as {digest}")
+        elif not os.path.samefile(blob, path):
+            self._link(blob, path)
+            self.logger.debug(f"Replaced duplicate {path} with a link to {digest}")
+        return digest
+
+    @staticmethod
+    def detach(path: str | Path) -> None:
+        """Unlink ``path`` if it shares its content with the store, before it is rewritten."""
+        path = Path(path)
+        if path.exists() and path.stat().st_nlink > 1:
+            path.unlink()
+
+    async def prune(self) -> int:
+        """Delete stored images no path links to any more; returns how many were deleted.
+
+        Variant manifests of deleted images and variants no manifest lists are deleted too.
+        """
+        pruned = 0
+        for blob in (self.root / "blobs").glob("*/*"):
+            if blob.is_file() and blob.stat().st_nlink == 1:
+                blob.unlink()
+                self._manifest_path(blob.name).unlink(missing_ok=True)
+                pruned += 1
+
+        listed = {
+            entry["path"]
+            for manifest in (self.root / "index" / "variants").glob("*/*.json")
+            for entry in json.loads(manifest.read_text())["variants"]
+        }
+        for variant in (self.root / "variants").glob("*/*"):
+            if variant.relative_to(self.root).as_posix() not in listed:
+                variant.unlink()
+        return pruned
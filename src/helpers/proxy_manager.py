@@ -1,12 +1,18 @@
-"""Proxy manager for handling proxy rotation, health tracking, and URL fetching."""
+"""Proxy manager for handling proxy rotation, health tracking, and URL fetching.
+
+Proxies are kept in two tiers. Healthy proxies are picked at random, weighted by success rate
+and latency. A proxy that fails ``PROXY_QUARANTINE_FAILURES`` times in a row is quarantined: it
+is no longer picked until a background probe through it succeeds.
+"""
 
 import asyncio
 import random
 import time
-from typing import NamedTuple
+from typing import Any, NamedTuple
 
 import aiohttp
 from aiohttp import ClientTimeout
+from aiohttp_socks import ProxyConnector
 
 from ..core.config import settings
 from ..logging_config import get_logger
@@ -29,6 +35,8 @@ class ProxyHealth(NamedTuple):
 
     success_count: int = 0
     failure_count: int = 0
+    consecutive_failures: int = 0
+    latency_seconds: float | None = None
 
     @property
     def success_rate(self) -> float:
@@ -38,6 +46,22 @@ class ProxyHealth(NamedTuple):
             return 1.0
         return self.success_count / total
 
+    @property
+    def weight(self) -> float:
+        """Selection weight in (0, 1]: smoothed success rate, lowered by slow responses."""
+        success = (self.success_count + 1) / (self.success_count + self.failure_count + 1)
+        latency = self.latency_seconds or 0.0
+        return max(_MIN_WEIGHT, success / (1 + latency / _LATENCY_SCALE_SECONDS))
+
+
+# A proxy answering in this many seconds has half the weight of an instant one.
+_LATENCY_SCALE_SECONDS = 1.0
+_MIN_WEIGHT = 0.05
+# Weight of the latest latency sample in the moving average.
+_LATENCY_SMOOTHING = 0.3
+# Random draws before get_proxy falls back to a weighted pass over all candidates.
+_MAX_DRAWS = 32
+
 
 class ProxyManager:
     """Manages proxy selection, health tracking, and URL fetching."""
@@ -57,6 +81,10 @@ class ProxyManager:
         self.proxies: list[ProxyInfo] = []
         self.health: dict[str, ProxyHealth] = {}
         self.cache_expiry: float = 0
+        # Healthy tier, with each proxy's position for O(1) removal.
+        self._healthy: list[ProxyInfo] = []
+        self._healthy_index: dict[str, int] = {}
+        self._quarantined: dict[str, ProxyInfo] = {}
         self._parse_proxy_list(proxy_list or "")
 
         if proxy_source_urls:
@@ -84,14 +112,32 @@ class ProxyManager:
 
             try:
                 proxy_info = self._parse_proxy_string(proxy_str)
-                self.proxies.append(proxy_info)
-                self.health[proxy_info.url] = ProxyHealth()
+                self._add_proxy(proxy_info)
                 logger.info(f"Added proxy: {proxy_info.host}:{proxy_info.port}")
             except (ValueError, IndexError) as e:
                 logger.warning(f"Invalid proxy format '{proxy_str}': {e}")
 
         logger.info(f"Proxy manager initialized with {len(self.proxies)} proxies")
 
+    def _add_proxy(self, proxy_info: ProxyInfo) -> None:
+        self.proxies.append(proxy_info)
+        self.health[proxy_info.url] = ProxyHealth()
+        self._add_healthy(proxy_info)
+
+    def _add_healthy(self, proxy_info: ProxyInfo) -> None:
+        self._healthy_index[proxy_info.url] = len(self._healthy)
+        self._healthy.append(proxy_info)
+
+    def _remove_healthy(self, proxy_url: str) -> ProxyInfo:
+        """Swap the proxy with the last healthy one and pop it."""
+        index = self._healthy_index.pop(proxy_url)
+        proxy_info = self._healthy[index]
+        last = self._healthy.pop()
+        if last.url != proxy_url:
+            self._healthy[index] = last
+            self._healthy_index[last.url] = index
+        return proxy_info
+
     def _parse_proxy_string(self, proxy_str: str) -> ProxyInfo:
         """
         Parse a single proxy string into ProxyInfo.
@@ -252,8 +298,7 @@ class ProxyManager:
 
             try:
                 proxy_info = self._parse_proxy_string(proxy_url)
-                self.proxies.append(proxy_info)
-                self.health[proxy_info.url] = ProxyHealth()
+                self._add_proxy(proxy_info)
                 logger.info(f"Added fetched proxy: {proxy_info.host}:{proxy_info.port}")
             except (ValueError, IndexError) as e:
                 logger.warning(f"Invalid fetched proxy format '{proxy_url}': {e}")
@@ -269,42 +314,67 @@ class ProxyManager:
 
     def get_proxy(self, exclude: list[str] | None = None) -> ProxyInfo | None:
         """
-        Get a random proxy, excluding specified ones.
+        Get a healthy proxy, weighted by success rate and latency, excluding specified ones.
+
+        Draws a random healthy proxy and keeps it with probability equal to its weight, so a
+        pick takes a few draws regardless of the number of proxies.
 
         Args:
             exclude: List of proxy URLs to exclude.
 
         Returns:
-            ProxyInfo or None if no proxies available.
+            ProxyInfo or None if no healthy proxies available.
         """
-        exclude = exclude or []
+        if not self._healthy:
+            return None
 
-        available = [p for p in self.proxies if p.url not in exclude]
+        excluded = set(exclude or ())
+        for _ in range(_MAX_DRAWS):
+            proxy = random.choice(self._healthy)
+            if proxy.url in excluded:
+                continue
+            if random.random() < self.health[proxy.url].weight:
+                return proxy
 
+        available = [p for p in self._healthy if p.url not in excluded]
         if not available:
             return None
+        weights = [self.health[p.url].weight for p in available]
+        return random.choices(available, weights=weights)[0]
 
-        return random.choice(available)
-
-    def record_success(self, proxy_url: str) -> None:
+    def record_success(self, proxy_url: str, latency_seconds: float | None = None) -> None:
         """
-        Record a successful request through a proxy.
+        Record a successful request through a proxy, returning it to the healthy tier.
 
         Args:
             proxy_url: URL of the proxy.
+            latency_seconds: How long the request took, if measured.
         """
         if proxy_url not in self.health:
             return
 
         current = self.health[proxy_url]
-        self.health[proxy_url] = ProxyHealth(
+        latency = current.latency_seconds
+        if latency_seconds is not None:
+            latency = (
+                latency_seconds
+                if latency is None
+                else latency + _LATENCY_SMOOTHING * (latency_seconds - latency)
+            )
+        self.health[proxy_url] = current._replace(
             success_count=current.success_count + 1,
-            failure_count=current.failure_count,
+            consecutive_failures=0,
+            latency_seconds=latency,
         )
 
+        proxy_info = self._quarantined.pop(proxy_url, None)
+        if proxy_info is not None:
+            self._add_healthy(proxy_info)
+            logger.info(f"Proxy {proxy_info.host}:{proxy_info.port} is healthy again")
+
     def record_failure(self, proxy_url: str) -> None:
         """
-        Record a failed request through a proxy.
+        Record a failed request through a proxy, quarantining it after repeated failures.
 
         Args:
             proxy_url: URL of the proxy.
@@ -313,11 +383,93 @@ class ProxyManager:
             return
 
         current = self.health[proxy_url]
-        self.health[proxy_url] = ProxyHealth(
-            success_count=current.success_count,
+        self.health[proxy_url] = current._replace(
             failure_count=current.failure_count + 1,
+            consecutive_failures=current.consecutive_failures + 1,
         )
 
+        if (
+            proxy_url in self._healthy_index
+            and current.consecutive_failures + 1 >= settings.proxy_quarantine_failures
+        ):
+            proxy_info = self._remove_healthy(proxy_url)
+            self._quarantined[proxy_url] = proxy_info
+            logger.warning(
+                f"Quarantined proxy {proxy_info.host}:{proxy_info.port} after "
+                f"{current.consecutive_failures + 1} consecutive failures"
+            )
+
+    async def probe_quarantined(self) -> None:
+        """Fetch the probe URL through every quarantined proxy; working ones become healthy."""
+        if not self._quarantined:
+            return
+
+        proxies = list(self._quarantined.values())
+        results = await asyncio.gather(*(self._probe(proxy) for proxy in proxies))
+        for proxy_info, latency in zip(proxies, results):
+            if latency is not None:
+                self.record_success(proxy_info.url, latency)
+        logger.info(
+            f"Probed {len(proxies)} quarantined proxies, "
+            f"{sum(latency is not None for latency in results)} healthy again"
+        )
+
+    async def _probe(self, proxy_info: ProxyInfo) -> float | None:
+        """Return the probe's latency through the proxy, or None if it failed."""
+        timeout = ClientTimeout(total=settings.proxy_probe_timeout)
+        is_socks = proxy_info.url.startswith(("socks://", "socks5://"))
+        connector = ProxyConnector.from_url(proxy_info.url) if is_socks else None
+        start = time.perf_counter()
+        try:
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+                async with session.get(
+                    settings.proxy_probe_url, proxy=None if is_socks else proxy_info.url
+                ) as response:
+                    response.raise_for_status()
+                    await response.read()
+        except Exception as e:
+            logger.debug(f"Probe through {proxy_info.host}:{proxy_info.port} failed: {e}")
+            return None
+        return time.perf_counter() - start
+
+    async def run_prober(self, interval_seconds: float) -> None:
+        """Background loop probing quarantined proxies."""
+        logger.info("Starting proxy prober")
+        while True:
+            try:
+                await asyncio.sleep(interval_seconds)
+                await self.probe_quarantined()
+            except asyncio.CancelledError:
+                logger.info("Proxy prober cancelled")
+                break
+            except Exception as e:
+                logger.error(f"Error in proxy prober: {e}", exc_info=True)
+
+    def stats(self) -> dict[str, Any]:
+        """Tier sizes and per-proxy health, without proxy credentials."""
+        proxies = []
+        for proxy_info in self.proxies:
+            health = self.get_proxy_health(proxy_info.url)
+            proxies.append(
+                {
+                    "host": proxy_info.host,
+                    "port": proxy_info.port,
+                    "quarantined": proxy_info.url in self._quarantined,
+                    "success_count": health.success_count,
+                    "failure_count": health.failure_count,
+                    "success_rate": round(health.success_rate, 3),
+                    "latency_ms": None
+                    if health.latency_seconds is None
+                    else round(health.latency_seconds * 1000),
+                    "weight": round(health.weight, 3),
+                }
+            )
+        return {
+            "healthy": len(self._healthy),
+            "quarantined": len(self._quarantined),
+            "proxies": proxies,
+        }
+
     def get_proxy_health(self, proxy_url: str) -> ProxyHealth:
         """
         Get health statistics for a proxy.
@@ -68,3 +68,33 @@ class TokenBucket:
             Current token count.
         """
         return self.tokens
+
+
+class RequestBudget:
+    """Concurrency and rate limit for the outgoing requests of one unit of work.
+
+    Used as ``async with budget:`` around each request, on top of the process-wide limits.
+    """
+
+    def __init__(self, rate: float, max_concurrent: int) -> None:
+        """
+        Initialize request budget.
+
+        Args:
+            rate: Requests per second.
+            max_concurrent: Maximum number of requests in flight at once.
+        """
+        self.rate_limiter = TokenBucket(rate=rate, capacity=max(1, int(rate * 2)))
+        self.concurrency_limiter = asyncio.Semaphore(max_concurrent)
+
+    async def __aenter__(self) -> "RequestBudget":
+        await self.concurrency_limiter.acquire()
+        try:
+            await self.rate_limiter.acquire()
+        except BaseException:
+            self.concurrency_limiter.release()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.concurrency_limiter.release()
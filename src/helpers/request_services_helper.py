@@ -1,8 +1,11 @@
 """HTTP client services for making external requests."""
 
 import asyncio
+from contextlib import nullcontext
+from contextvars import ContextVar
 from random import uniform
-from typing import NamedTuple
+from time import perf_counter
+from typing import Any, NamedTuple
 
 from aiohttp import ClientConnectorError, ClientProxyConnectionError, ClientSession, ClientTimeout
 from aiohttp.client_exceptions import ClientError
@@ -11,13 +14,15 @@ from aiohttp_socks import ProxyConnector
 from ..core.config import settings
 from ..logging_config import get_logger
 from .proxy_manager import ProxyManager
-from .rate_limiter import TokenBucket
+from .rate_limiter import RequestBudget, TokenBucket
 from .user_agent_rotator import get_random_user_agent
 
 logger = get_logger("request_services")
 
 _rate_limiter = TokenBucket(rate=settings.rate_limit_requests_per_second)
 _concurrency_limiter = asyncio.Semaphore(settings.rate_limit_max_concurrent)
+# Extra limits for the requests of the current task, e.g. a background import job.
+request_budget: ContextVar[RequestBudget | None] = ContextVar("request_budget", default=None)
 _proxy_manager = ProxyManager(
     proxy_list=settings.proxy_list,
     proxy_source_urls=settings.proxy_source_urls,
@@ -34,6 +39,16 @@ async def initialize_proxy_manager() -> None:
     logger.info(f"Proxy manager initialized with {_proxy_manager.proxy_count} proxies")
 
 
+async def run_proxy_prober() -> None:
+    """Probe quarantined proxies every PROXY_PROBE_INTERVAL_SECONDS until cancelled."""
+    await _proxy_manager.run_prober(settings.proxy_probe_interval_seconds)
+
+
+def get_proxy_stats() -> dict[str, Any]:
+    """Proxy tiers and per-proxy health of this worker."""
+    return _proxy_manager.stats()
+
+
 class Response(NamedTuple):
     content: str
 
@@ -56,7 +71,7 @@ async def get_url(
     """
     timeout_val = timeout if timeout is not None else uniform(1.0, 3.0)
 
-    async with _concurrency_limiter:
+    async with request_budget.get() or nullcontext(), _concurrency_limiter:
         await _rate_limiter.acquire()
 
         headers = {
@@ -91,6 +106,7 @@ async def get_url(
         max_retries = settings.proxy_max_retries if use_proxy and _proxy_manager.is_enabled else 1
 
         for attempt in range(max_retries):
+            start = perf_counter()
             try:
                 if proxy_url and proxy_url.startswith(("socks://", "socks5://")):
                     connector = ProxyConnector.from_url(proxy_url)
@@ -102,7 +118,7 @@ async def get_url(
                         ) as response:
                             response.raise_for_status()
                             text_content = await response.text()
-                            _proxy_manager.record_success(proxy_url)
+                            _proxy_manager.record_success(proxy_url, perf_counter() - start)
                             return Response(content=text_content)
                 else:
                     async with ClientSession() as session:
@@ -116,14 +132,15 @@ async def get_url(
                             text_content = await response.text()
 
                             if proxy_url:
-                                _proxy_manager.record_success(proxy_url)
+                                _proxy_manager.record_success(proxy_url, perf_counter() - start)
 
                             return Response(content=text_content)
 
-            except ClientProxyConnectionError as e:
+            except (ClientProxyConnectionError, TimeoutError) as e:
+                # A timeout through a proxy is most likely the proxy's fault: try another one.
                 if proxy_url:
                     logger.warning(
-                        f"Proxy connection failed (attempt {attempt + 1}/{max_retries}): {proxy_url} - {e}"
+                        f"Proxy request failed (attempt {attempt + 1}/{max_retries}): {proxy_url} - {e!r}"
                     )
                     _proxy_manager.record_failure(proxy_url)
                     excluded_proxies.append(proxy_url)
@@ -136,7 +153,7 @@ async def get_url(
                             proxy_url = None
                         continue
                 else:
-                    logger.warning(f"Proxy connection error: {e}")
+                    logger.warning(f"Error fetching URL {url}: {e!r}")
                     return None
 
             except ClientConnectorError as e:
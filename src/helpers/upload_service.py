@@ -1,7 +1,8 @@
-import shutil
+import asyncio
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import TypedDict
+from typing import BinaryIO, TypedDict
 
 from fastapi import HTTPException, UploadFile
 
@@ -19,21 +20,27 @@ class ImageData(TypedDict):
 
 class UploadService:
     MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+    CHUNK_SIZE = 1024 * 1024
 
     def __init__(self, fs_service: FileSystemService):
         self.fs_service = fs_service
         self.logger = get_logger("upload", self)
 
+    def _file_too_large(self) -> HTTPException:
+        return HTTPException(
+            status_code=413,
+            detail=f"File too large. Max size: {self.MAX_FILE_SIZE} bytes",
+        )
+
     async def validate_file_size(self, upload_file: UploadFile) -> None:
-        upload_file.file.seek(0, 2)  # Seek to end
-        size = upload_file.file.tell()
-        upload_file.file.seek(0)  # Reset
+        size = getattr(upload_file, "size", None)
+        if not isinstance(size, int):
+            upload_file.file.seek(0, 2)  # Seek to end
+            size = upload_file.file.tell()
+            upload_file.file.seek(0)  # Reset
 
         if size > self.MAX_FILE_SIZE:
-            raise HTTPException(
-                status_code=413,
-                detail=f"File too large. Max size: {self.MAX_FILE_SIZE} bytes",
-            )
+            raise self._file_too_large()
 
     async def sanitize_filename(self, filename: str) -> str:
         self.logger.debug(f"Sanitizing filename: {filename}")
@@ -67,12 +74,34 @@ class UploadService:
             self.logger.error("Uploaded file type not an image", exc_info=True)
             raise HTTPException(status_code=400, detail="Unsupported file type")
 
-    async def upload_file(self, dest: Path, upload_file: UploadFile) -> None:
+    def _copy_capped(self, source: BinaryIO, dest: Path) -> int:
+        size = 0
+        with dest.open("wb") as buffer:
+            while chunk := source.read(self.CHUNK_SIZE):
+                size += len(chunk)
+                if size > self.MAX_FILE_SIZE:
+                    raise self._file_too_large()
+                buffer.write(chunk)
+        return size
+
+    async def upload_file(self, dest: Path, upload_file: UploadFile) -> int:
+        """Stream the upload to ``dest`` in chunks and return its size.
+
+        The size limit is enforced while copying; ``dest`` only appears once the whole upload
+        has been written.
+        """
+        temp = dest.with_name(f".{dest.name}.part")
         try:
-            with dest.open("wb") as buffer:
-                self.logger.debug("Trying to save file")
-                shutil.copyfileobj(upload_file.file, buffer)
+            self.logger.debug("Trying to save file")
+            size = await asyncio.to_thread(self._copy_capped, upload_file.file, temp)
+            os.replace(temp, dest)
+            return size
+        except HTTPException:
+            temp.unlink(missing_ok=True)
+            self.logger.warning(f"Upload to {dest} exceeds {self.MAX_FILE_SIZE} bytes")
+            raise
         except Exception as ex:
+            temp.unlink(missing_ok=True)
             self.logger.error(
                 f"Problem with saving file to destination {dest} {ex}",
                 exc_info=True,
@@ -0,0 +1,5 @@
+"""Responsive variants of uploaded and downloaded images."""
+
+from .views import api_image_router
+
+__all__ = ["api_image_router"]
@@ -0,0 +1,46 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Query
+
+from src.core import MinimalBaseRouter
+from src.core.shared_schemas import ImageVariantsSchema
+from src.helpers.file_service import file_service
+from src.logging_config import get_logger
+
+MAX_URLS_PER_REQUEST = 200
+
+
+class ImageAPIRouter(
+    MinimalBaseRouter[ImageVariantsSchema, ImageVariantsSchema, ImageVariantsSchema]
+):
+    def __init__(self):
+        super().__init__("/api/images", ["images"], None)
+        self.logger = get_logger("ImageAPIRouter", self)
+        self.logger.debug("Initialized ImageAPIRouter")
+
+    def route(self):
+        router = APIRouter(prefix=self.prefix, tags=self.tags)
+
+        @router.get(
+            "/variants",
+            response_model=dict[str, ImageVariantsSchema | None],
+            summary="Get responsive image variants",
+            description=(
+                "Responsive variants (srcset data) of the images served at the given upload "
+                "URLs, e.g. all team logos of a tournament page in one request. Images without "
+                "variants map to null."
+            ),
+        )
+        async def get_image_variants_endpoint(
+            url: Annotated[list[str], Query(max_length=MAX_URLS_PER_REQUEST)],
+        ) -> dict[str, ImageVariantsSchema | None]:
+            self.logger.debug(f"Get image variants endpoint for {len(url)} urls")
+            return {
+                image_url: await file_service.get_image_variants(image_url)
+                for image_url in dict.fromkeys(url)
+            }
+
+        return router
+
+
+api_image_router = ImageAPIRouter().route()
@@ -0,0 +1,7 @@
+"""Background EESL import jobs."""
+
+from .db_services import ImportJobServiceDB
+from .runner import ImportJobRunner
+from .views import api_import_job_router
+
+__all__ = ["ImportJobRunner", "ImportJobServiceDB", "api_import_job_router"]
@@ -0,0 +1,216 @@
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from fastapi import HTTPException
+from sqlalchemy import select, update
+
+from src.core.enums import ImportJobStatus
+from src.core.models import BaseServiceDB, ImportJobDB
+from src.core.models.base import Database
+from src.logging_config import get_logger
+
+from .schemas import ImportJobSchemaCreate
+
+ITEM = "IMPORT_JOB"
+
+
+class ImportJobServiceDB(BaseServiceDB):
+    """Persisted import jobs.
+
+    A run of a job is identified by its ``started_at``: every write made on behalf of a run is
+    conditional on the job still being ``running`` since that time, so a run that was cancelled,
+    or taken over after its worker went silent, finds out on its next write.
+    """
+
+    def __init__(
+        self,
+        database: Database,
+    ) -> None:
+        super().__init__(database, ImportJobDB)
+        self.logger = get_logger("ImportJobServiceDB", self)
+        self.logger.debug("Initialized ImportJobServiceDB")
+
+    async def submit(
+        self,
+        item: ImportJobSchemaCreate,
+    ) -> ImportJobDB:
+        from .kinds import import_job_kinds
+
+        if item.kind not in import_job_kinds:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown import job kind '{item.kind}'",
+            )
+        self.logger.debug(f"Submitting {ITEM} {item}")
+        async with self.db.get_session_maker()() as session:
+            job = ImportJobDB(**item.model_dump(), status=ImportJobStatus.QUEUED)
+            session.add(job)
+            await session.commit()
+            await session.refresh(job)
+            return job
+
+    async def get_jobs(
+        self,
+        status: ImportJobStatus | None = None,
+        limit: int = 50,
+    ) -> list[ImportJobDB]:
+        self.logger.debug(f"Get {ITEM}s status:{status}")
+        async with self.db.get_session_maker()() as session:
+            stmt = select(ImportJobDB).order_by(ImportJobDB.id.desc()).limit(limit)
+            if status is not None:
+                stmt = stmt.where(ImportJobDB.status == status)
+            results = await session.execute(stmt)
+            return list(results.scalars().all())
+
+    async def claim_next(
+        self,
+        stale_after_seconds: float,
+        max_attempts: int,
+    ) -> ImportJobDB | None:
+        """Start the oldest queued job, or resume one whose worker stopped heartbeating.
+
+        Runs that already used up ``max_attempts`` are marked failed instead of resumed.
+        """
+        now = datetime.now(UTC)
+        stale = (ImportJobDB.status == ImportJobStatus.RUNNING) & (
+            ImportJobDB.heartbeat_at < now - timedelta(seconds=stale_after_seconds)
+        )
+        async with self.db.get_session_maker()() as session:
+            await session.execute(
+                update(ImportJobDB)
+                .where(stale, ImportJobDB.attempts >= max_attempts)
+                .values(
+                    status=ImportJobStatus.FAILED,
+                    error=f"Worker stopped responding; gave up after {max_attempts} attempts",
+                    finished_at=now,
+                )
+            )
+            stmt = (
+                select(ImportJobDB)
+                .where((ImportJobDB.status == ImportJobStatus.QUEUED) | stale)
+                .order_by(ImportJobDB.id)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            )
+            job = (await session.execute(stmt)).scalar_one_or_none()
+            if job is not None:
+                job.status = ImportJobStatus.RUNNING
+                job.attempts += 1
+                job.error = None
+                job.started_at = now
+                job.heartbeat_at = now
+                job.progress_at_start = job.progress_done
+            await session.commit()
+            if job is not None:
+                await session.refresh(job)
+                self.logger.info(f"Claimed {ITEM} id:{job.id} kind:{job.kind} run:{job.attempts}")
+            return job
+
+    async def _update_run(self, job_id: int, started_at: datetime, **values: Any) -> bool:
+        async with self.db.get_session_maker()() as session:
+            result = await session.execute(
+                update(ImportJobDB)
+                .where(
+                    ImportJobDB.id == job_id,
+                    ImportJobDB.started_at == started_at,
+                    ImportJobDB.status == ImportJobStatus.RUNNING,
+                )
+                .values(heartbeat_at=datetime.now(UTC), **values)
+            )
+            await session.commit()
+            return result.rowcount == 1
+
+    async def heartbeat(self, job_id: int, started_at: datetime) -> bool:
+        """Keep a run alive; False if it has been cancelled or taken over."""
+        return await self._update_run(job_id, started_at)
+
+    async def record_progress(
+        self,
+        job_id: int,
+        started_at: datetime,
+        done: int,
+        total: int | None = None,
+        checkpoint: dict[str, Any] | None = None,
+    ) -> bool:
+        values: dict[str, Any] = {"progress_done": done}
+        if total is not None:
+            values["progress_total"] = total
+        if checkpoint is not None:
+            values["checkpoint"] = checkpoint
+        return await self._update_run(job_id, started_at, **values)
+
+    async def finish(self, job_id: int, started_at: datetime, result: dict[str, Any]) -> bool:
+        self.logger.info(f"{ITEM} id:{job_id} succeeded: {result}")
+        return await self._update_run(
+            job_id,
+            started_at,
+            status=ImportJobStatus.SUCCEEDED,
+            result=result,
+            finished_at=datetime.now(UTC),
+        )
+
+    async def fail(self, job_id: int, started_at: datetime, error: str) -> bool:
+        self.logger.warning(f"{ITEM} id:{job_id} failed: {error}")
+        return await self._update_run(
+            job_id,
+            started_at,
+            status=ImportJobStatus.FAILED,
+            error=error,
+            finished_at=datetime.now(UTC),
+        )
+
+    async def release(self, job_id: int, started_at: datetime) -> bool:
+        """Queue a run interrupted by shutdown again, without counting it as an attempt."""
+        self.logger.info(f"Releasing {ITEM} id:{job_id}")
+        return await self._update_run(
+            job_id,
+            started_at,
+            status=ImportJobStatus.QUEUED,
+            attempts=ImportJobDB.attempts - 1,
+        )
+
+    async def _transition(
+        self,
+        job_id: int,
+        from_statuses: tuple[ImportJobStatus, ...],
+        **values: Any,
+    ) -> ImportJobDB:
+        async with self.db.get_session_maker()() as session:
+            job = await session.get(ImportJobDB, job_id, with_for_update=True)
+            if job is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"{ITEM} with id {job_id} not found",
+                )
+            if job.status not in from_statuses:
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"{ITEM} id:{job_id} is {job.status}",
+                )
+            for field, value in values.items():
+                setattr(job, field, value)
+            await session.commit()
+            await session.refresh(job)
+            return job
+
+    async def cancel(self, job_id: int) -> ImportJobDB:
+        """Cancel a job; a running job stops at its worker's next heartbeat."""
+        self.logger.debug(f"Cancel {ITEM} id:{job_id}")
+        return await self._transition(
+            job_id,
+            (ImportJobStatus.QUEUED, ImportJobStatus.RUNNING),
+            status=ImportJobStatus.CANCELLED,
+            finished_at=datetime.now(UTC),
+        )
+
+    async def resume(self, job_id: int) -> ImportJobDB:
+        """Queue a failed or cancelled job again; it continues from its checkpoint."""
+        self.logger.debug(f"Resume {ITEM} id:{job_id}")
+        return await self._transition(
+            job_id,
+            (ImportJobStatus.FAILED, ImportJobStatus.CANCELLED),
+            status=ImportJobStatus.QUEUED,
+            attempts=0,
+            error=None,
+            finished_at=None,
+        )
@@ -0,0 +1,315 @@
+"""The imports that can run as background jobs.
+
+Each kind is an async function of an ``ImportJobContext`` returning the job's result. It reads
+its arguments from ``context.params``, continues from ``context.checkpoint`` (empty on the
+first run) and calls ``context.report`` after each unit of work, so that a resumed run skips
+what is already imported. Every import is an upsert, so redoing the last unit is harmless.
+
+Imports are incremental: ``context.sync`` skips entities whose EESL data is unchanged since
+their last import (see ``src.pars_eesl.sync``), unless the job is submitted with
+``"force": true``. The fingerprints of what a run wrote are saved with each report.
+"""
+
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from src.core.models import ImportJobDB
+from src.core.models.base import Database
+from src.pars_eesl.db_services import EeslFingerprintServiceDB
+from src.pars_eesl.sync import EeslSync
+
+if TYPE_CHECKING:
+    from src.team_tournament.db_services import TeamTournamentServiceDB
+
+    from .db_services import ImportJobServiceDB
+
+
+class ImportJobInterrupted(Exception):
+    """The run was cancelled, or taken over by another worker."""
+
+
+class ImportJobContext:
+    def __init__(
+        self,
+        database: Database,
+        service: "ImportJobServiceDB",
+        job: ImportJobDB,
+    ) -> None:
+        self.database = database
+        self.service = service
+        self.job_id: int = job.id
+        self.started_at: datetime = job.started_at
+        self.params: dict[str, Any] = dict(job.params or {})
+        self.checkpoint: dict[str, Any] = dict(job.checkpoint or {})
+        self.sync = EeslSync(
+            EeslFingerprintServiceDB(database), force=bool(self.params.get("force"))
+        )
+
+    def param(self, name: str) -> Any:
+        if self.params.get(name) is None:
+            raise ValueError(f"Missing job parameter '{name}'")
+        return self.params[name]
+
+    def resume_index(self) -> int:
+        """Where to continue a list of entities parsed with ``sync`` from.
+
+        The fingerprints of what was written are saved with each report, so on a resumed run
+        those entities are already left out of the list; only a forced run, which keeps them,
+        continues from the checkpoint index.
+        """
+        return self.checkpoint.get("index", 0) if self.sync.force else 0
+
+    async def report(
+        self,
+        done: int,
+        total: int | None = None,
+        checkpoint: dict[str, Any] | None = None,
+    ) -> None:
+        """Persist progress, the checkpoint to resume from and the fingerprints written."""
+        await self.sync.save()
+        if checkpoint is not None:
+            self.checkpoint = checkpoint
+        if not await self.service.record_progress(
+            self.job_id, self.started_at, done, total, checkpoint
+        ):
+            raise ImportJobInterrupted(f"Import job {self.job_id} is no longer running here")
+
+
+ImportJobKind = Callable[[ImportJobContext], Awaitable[dict[str, Any]]]
+
+
+async def import_players(context: ImportJobContext) -> dict[str, Any]:
+    """All players of an EESL season, page by page. Params: season_id, start_page."""
+    from src.pars_eesl.pars_all_players_from_eesl import parse_players_index_page_eesl
+    from src.person.db_services import PersonServiceDB
+    from src.person.schemas import PersonSchemaCreate
+    from src.player.db_services import PlayerServiceDB
+    from src.player.schemas import PlayerSchemaCreate
+
+    person_service = PersonServiceDB(context.database)
+    player_service = PlayerServiceDB(context.database)
+    season_id = context.params.get("season_id", 8)
+    page = context.checkpoint.get("page", context.params.get("start_page", 0))
+    imported = context.checkpoint.get("players", 0)
+
+    while True:
+        players, has_next_page = await parse_players_index_page_eesl(
+            page, season_id, sync=context.sync
+        )
+        for player_with_person in players:
+            person = await person_service.create_or_update_person(
+                PersonSchemaCreate(**player_with_person["person"])
+            )
+            if person:
+                await player_service.create_or_update_player(
+                    PlayerSchemaCreate(**player_with_person["player"], person_id=person.id)
+                )
+                context.sync.written("player", player_with_person["player"]["player_eesl_id"])
+                imported += 1
+        page += 1
+        await context.report(imported, checkpoint={"page": page, "players": imported})
+        if not has_next_page:
+            return {"players": imported, "pages": page}
+
+
+async def import_tournaments(context: ImportJobContext) -> dict[str, Any]:
+    """Tournaments of an EESL season. Params: eesl_season_id, season_id, sport_id."""
+    from src.pars_eesl.pars_season import parse_season_and_create_jsons
+    from src.tournaments.db_services import TournamentServiceDB
+    from src.tournaments.schemas import TournamentSchemaCreate
+
+    tournament_service = TournamentServiceDB(context.database)
+    tournaments = (
+        await parse_season_and_create_jsons(
+            context.param("eesl_season_id"),
+            season_id=context.params.get("season_id"),
+            sport_id=context.params.get("sport_id"),
+            sync=context.sync,
+        )
+        or []
+    )
+    for index in range(context.resume_index(), len(tournaments)):
+        await tournament_service.create_or_update_tournament(
+            TournamentSchemaCreate(**tournaments[index])
+        )
+        context.sync.written("tournament", tournaments[index]["tournament_eesl_id"])
+        await context.report(index + 1, len(tournaments), {"index": index + 1})
+    return {"tournaments": len(tournaments)}
+
+
+async def import_teams(context: ImportJobContext) -> dict[str, Any]:
+    """Teams of an EESL tournament, linked to the tournament. Params: eesl_tournament_id."""
+    from src.pars_eesl.pars_tournament import parse_tournament_teams_index_page_eesl
+    from src.team_tournament.db_services import TeamTournamentServiceDB
+    from src.teams.db_services import TeamServiceDB
+    from src.teams.schemas import TeamSchemaCreate
+    from src.tournaments.db_services import TournamentServiceDB
+
+    eesl_tournament_id = context.param("eesl_tournament_id")
+    team_service = TeamServiceDB(context.database)
+    team_tournament_service = TeamTournamentServiceDB(context.database)
+    tournament = await TournamentServiceDB(context.database).get_tournament_by_eesl_id(
+        eesl_tournament_id
+    )
+    teams = (
+        await parse_tournament_teams_index_page_eesl(eesl_tournament_id, sync=context.sync) or []
+    )
+    for index in range(context.resume_index(), len(teams)):
+        team = await team_service.create_or_update_team(TeamSchemaCreate(**teams[index]))
+        if team and tournament:
+            await _link_team(context, team_tournament_service, team.id, tournament.id)
+        if team:
+            context.sync.written("team", teams[index]["team_eesl_id"])
+        await context.report(index + 1, len(teams), {"index": index + 1})
+
+    unchanged_ids = context.sync.unchanged_ids("team")
+    if tournament and unchanged_ids:
+        # An unchanged team may still be new to this tournament.
+        linked_ids = {
+            team.team_eesl_id
+            for team in await team_tournament_service.get_related_teams(tournament.id)
+        }
+        for team_eesl_id in unchanged_ids - linked_ids:
+            team = await team_service.get_team_by_eesl_id(team_eesl_id)
+            if team:
+                await _link_team(context, team_tournament_service, team.id, tournament.id)
+    return {"teams": len(teams)}
+
+
+async def _link_team(
+    context: ImportJobContext,
+    team_tournament_service: "TeamTournamentServiceDB",
+    team_id: int,
+    tournament_id: int,
+) -> None:
+    from src.team_tournament.schemas import TeamTournamentSchemaCreate
+
+    try:
+        await team_tournament_service.create(
+            TeamTournamentSchemaCreate(team_id=team_id, tournament_id=tournament_id)
+        )
+    except Exception as ex:
+        # As in the teams endpoint: the team is usually linked already.
+        context.service.logger.debug(f"Team {team_id} not linked to tournament: {ex}")
+
+
+async def import_match_roster(context: ImportJobContext) -> dict[str, Any]:
+    """Players of an EESL match, with their persons and team rosters. Params: eesl_match_id."""
+    from src.player_match.db_services import PlayerMatchServiceDB
+    from src.player_match.views import import_match_roster_player, load_parsed_match_roster
+
+    eesl_match_id = context.param("eesl_match_id")
+    parsed_match, match, roster = await load_parsed_match_roster(context.database, eesl_match_id)
+    if not (parsed_match and match):
+        return {"players": 0}
+    if await context.sync.unchanged("roster", eesl_match_id, _roster_source(parsed_match)):
+        return {"players": 0}
+
+    player_match_service = PlayerMatchServiceDB(context.database)
+    seen_player_ids = set(context.checkpoint.get("player_ids", []))
+    imported = context.checkpoint.get("players", 0)
+    for index in range(context.checkpoint.get("index", 0), len(roster)):
+        roster_player, team = roster[index]
+        if await import_match_roster_player(
+            context.database, player_match_service, match, team, roster_player, seen_player_ids
+        ):
+            imported += 1
+        if index + 1 == len(roster):
+            context.sync.written("roster", eesl_match_id)
+        await context.report(
+            index + 1,
+            len(roster),
+            {"index": index + 1, "players": imported, "player_ids": list(seen_player_ids)},
+        )
+    return {"players": imported}
+
+
+async def import_tournament(context: ImportJobContext) -> dict[str, Any]:
+    """An EESL tournament's teams, then its matches, then the roster of each match.
+
+    Params: eesl_tournament_id. Progress counts the units of the current stage.
+    """
+    from sqlalchemy import select
+
+    from src.core.models import MatchDB, TournamentDB
+    from src.matches.db_services import MatchServiceDB
+    from src.matches.parser import MatchParser
+    from src.player_match.db_services import PlayerMatchServiceDB
+    from src.player_match.views import import_match_roster_player, load_parsed_match_roster
+
+    eesl_tournament_id = context.param("eesl_tournament_id")
+    stage = context.checkpoint.get("stage", "teams")
+    if stage == "teams":
+        # import_teams keeps its {"index": ...} checkpoint; a missing stage means teams.
+        await import_teams(context)
+        stage = "matches"
+        await context.report(0, checkpoint={"stage": stage})
+    if stage == "matches":
+        await MatchParser().create_parsed_matches(
+            eesl_tournament_id, MatchServiceDB(context.database), sync=context.sync
+        )
+        stage = "rosters"
+        await context.report(0, checkpoint={"stage": stage, "index": 0, "players": 0})
+
+    async with context.database.get_session_maker()() as session:
+        result = await session.execute(
+            select(MatchDB.match_eesl_id)
+            .join(TournamentDB, MatchDB.tournament_id == TournamentDB.id)
+            .where(
+                TournamentDB.tournament_eesl_id == eesl_tournament_id,
+                MatchDB.match_eesl_id.is_not(None),
+            )
+            .order_by(MatchDB.match_eesl_id)
+        )
+        eesl_match_ids = list(result.scalars().all())
+
+    player_match_service = PlayerMatchServiceDB(context.database)
+    imported = context.checkpoint.get("players", 0)
+    for index in range(context.checkpoint.get("index", 0), len(eesl_match_ids)):
+        eesl_match_id = eesl_match_ids[index]
+        parsed_match, match, roster = await load_parsed_match_roster(
+            context.database, eesl_match_id
+        )
+        if (
+            parsed_match
+            and match
+            and not await context.sync.unchanged(
+                "roster", eesl_match_id, _roster_source(parsed_match)
+            )
+        ):
+            seen_player_ids: set = set()
+            for roster_player, team in roster:
+                if await import_match_roster_player(
+                    context.database,
+                    player_match_service,
+                    match,
+                    team,
+                    roster_player,
+                    seen_player_ids,
+                ):
+                    imported += 1
+            context.sync.written("roster", eesl_match_id)
+        await context.report(
+            index + 1,
+            len(eesl_match_ids),
+            {"stage": stage, "index": index + 1, "players": imported},
+        )
+    return {"matches": len(eesl_match_ids), "players": imported}
+
+
+def _roster_source(parsed_match: dict[str, Any]) -> dict[str, Any]:
+    """The parts of a parsed match a roster import depends on; the score is not one."""
+    return {
+        key: parsed_match.get(key)
+        for key in ("team_a_eesl_id", "team_b_eesl_id", "roster_a", "roster_b")
+    }
+
+
+import_job_kinds: dict[str, ImportJobKind] = {
+    "players": import_players,
+    "tournaments": import_tournaments,
+    "teams": import_teams,
+    "match_roster": import_match_roster,
+    "tournament": import_tournament,
+}
@@ -0,0 +1,116 @@
+"""Background execution of import jobs.
+
+Every worker process runs an ImportJobRunner with a fixed number of job slots. A free slot
+claims the next queued job (row-locked with SKIP LOCKED, so workers never claim the same job)
+and runs its kind with a per-job request budget, leaving HTTP workers and live match traffic
+alone. While a job runs, its slot heartbeats the row; a job whose heartbeat goes stale, because
+its worker died, is claimed again by any worker and continues from its last checkpoint. A failed
+heartbeat (the job was cancelled or taken over) stops the job.
+"""
+
+import asyncio
+import contextlib
+
+from src.core.models import ImportJobDB
+from src.core.models.base import Database
+from src.helpers.rate_limiter import RequestBudget
+from src.helpers.request_services_helper import request_budget
+from src.logging_config import get_logger
+
+from .db_services import ImportJobServiceDB
+from .kinds import ImportJobContext, ImportJobInterrupted, import_job_kinds
+
+
+class ImportJobRunner:
+    def __init__(
+        self,
+        database: Database,
+        workers: int = 1,
+        poll_interval_seconds: float = 5.0,
+        heartbeat_interval_seconds: float = 10.0,
+        stale_after_seconds: float = 60.0,
+        max_attempts: int = 3,
+        requests_per_second: float = 0.25,
+        max_concurrent_requests: int = 2,
+    ) -> None:
+        self.database = database
+        self.service = ImportJobServiceDB(database)
+        self.workers = workers
+        self.poll_interval_seconds = poll_interval_seconds
+        self.heartbeat_interval_seconds = heartbeat_interval_seconds
+        self.stale_after_seconds = stale_after_seconds
+        self.max_attempts = max_attempts
+        self.requests_per_second = requests_per_second
+        self.max_concurrent_requests = max_concurrent_requests
+        self.logger = get_logger("ImportJobRunner", self)
+
+    async def run(self) -> None:
+        """Run the job slots until cancelled; running jobs are queued again on the way out."""
+        self.logger.info(f"Import job runner started with {self.workers} slots")
+        await asyncio.gather(*(self._slot() for _ in range(self.workers)))
+
+    async def _slot(self) -> None:
+        while True:
+            try:
+                job = await self.service.claim_next(self.stale_after_seconds, self.max_attempts)
+            except Exception as ex:
+                self.logger.error(f"Error claiming import job: {ex}", exc_info=True)
+                job = None
+            if job is None:
+                await asyncio.sleep(self.poll_interval_seconds)
+                continue
+            await self.run_job(job)
+
+    async def run_job(self, job: ImportJobDB) -> None:
+        kind = import_job_kinds.get(job.kind)
+        if kind is None:
+            await self.service.fail(job.id, job.started_at, f"Unknown import job kind '{job.kind}'")
+            return
+
+        budget = RequestBudget(
+            job.requests_per_second or self.requests_per_second,
+            job.max_concurrent_requests or self.max_concurrent_requests,
+        )
+        # The job task copies the current context, so all of its requests use the budget.
+        context = ImportJobContext(self.database, self.service, job)
+        token = request_budget.set(budget)
+        try:
+            task = asyncio.create_task(kind(context))
+        finally:
+            request_budget.reset(token)
+        keep_alive = asyncio.create_task(self._keep_alive(job, task))
+
+        try:
+            result = await task
+        except asyncio.CancelledError:
+            if asyncio.current_task().cancelling():
+                # Shutting down: let the next worker to start pick the job up right away.
+                await self.service.release(job.id, job.started_at)
+                raise
+            self.logger.info(f"Import job {job.id} stopped: cancelled or taken over")
+        except ImportJobInterrupted as ex:
+            self.logger.info(str(ex))
+        except Exception as ex:
+            self.logger.error(f"Import job {job.id} failed: {ex}", exc_info=True)
+            await self.service.fail(job.id, job.started_at, f"{type(ex).__name__}: {ex}")
+        else:
+            await context.sync.save()
+            if summary := context.sync.summary():
+                result = {**result, "sync": summary}
+            await self.service.finish(job.id, job.started_at, result)
+        finally:
+            keep_alive.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await keep_alive
+
+    async def _keep_alive(self, job: ImportJobDB, task: asyncio.Task) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval_seconds)
+            try:
+                alive = await self.service.heartbeat(job.id, job.started_at)
+            except Exception as ex:
+                self.logger.warning(f"Error heartbeating import job {job.id}: {ex}")
+                continue
+            if not alive:
+                task.cancel()
+                return
@@ -0,0 +1,57 @@
+from datetime import UTC, datetime
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+
+from src.core.enums import ImportJobStatus
+
+
+class ImportJobSchemaCreate(BaseModel):
+    kind: str = Field(..., description="Import to run: players, tournaments, teams, match_roster")
+    params: dict[str, Any] = Field(default_factory=dict)
+    requests_per_second: float | None = Field(
+        default=None,
+        gt=0,
+        description="EESL request rate for this job; defaults to IMPORT_JOB_REQUESTS_PER_SECOND",
+    )
+    max_concurrent_requests: int | None = Field(
+        default=None,
+        ge=1,
+        description="Concurrent EESL requests for this job; defaults to "
+        "IMPORT_JOB_MAX_CONCURRENT_REQUESTS",
+    )
+
+
+class ImportJobSchema(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    kind: str
+    params: dict[str, Any]
+    status: ImportJobStatus
+    checkpoint: dict[str, Any] | None = None
+    progress_done: int
+    progress_total: int | None = None
+    progress_at_start: int = Field(default=0, exclude=True)
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    attempts: int
+    requests_per_second: float | None = None
+    max_concurrent_requests: int | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    heartbeat_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    @computed_field
+    @property
+    def eta_seconds(self) -> float | None:
+        """Remaining time at the current run's average rate, once it has made progress."""
+        if self.status != ImportJobStatus.RUNNING or not self.progress_total or not self.started_at:
+            return None
+        done_this_run = self.progress_done - self.progress_at_start
+        if done_this_run <= 0:
+            return None
+        elapsed = (datetime.now(UTC) - self.started_at).total_seconds()
+        remaining = max(self.progress_total - self.progress_done, 0)
+        return round(remaining * elapsed / done_this_run, 1)
@@ -0,0 +1,120 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from src.auth.dependencies import require_roles
+from src.core import MinimalBaseRouter
+from src.core.enums import ImportJobStatus
+from src.core.models import UserDB
+from src.logging_config import get_logger
+
+from .db_services import ImportJobServiceDB
+from .schemas import ImportJobSchema, ImportJobSchemaCreate
+
+ITEM = "IMPORT_JOB"
+
+
+class ImportJobAPIRouter(
+    MinimalBaseRouter[ImportJobSchema, ImportJobSchemaCreate, ImportJobSchemaCreate]
+):
+    def __init__(self, service: ImportJobServiceDB | None = None, service_name: str | None = None):
+        super().__init__("/api/import-jobs", ["import-jobs"], service, service_name=service_name)
+        self.logger = get_logger("ImportJobAPIRouter", self)
+        self.logger.debug("Initialized ImportJobAPIRouter")
+
+    def route(self):
+        router = APIRouter(prefix=self.prefix, tags=self.tags)
+
+        @router.post(
+            "/",
+            response_model=ImportJobSchema,
+            status_code=202,
+            summary="Submit import job",
+            description="Queue an EESL import to run in the background. Requires admin role.",
+            responses={
+                202: {"description": "Import job queued"},
+                400: {"description": "Unknown import job kind"},
+                401: {"description": "Unauthorized"},
+                403: {"description": "Forbidden - requires admin role"},
+            },
+        )
+        async def submit_import_job_endpoint(
+            job_data: ImportJobSchemaCreate,
+            _: Annotated[UserDB, Depends(require_roles("admin"))],
+        ) -> ImportJobSchema:
+            self.logger.debug(f"Submit import job endpoint: {job_data}")
+            job = await self.loaded_service.submit(job_data)
+            return ImportJobSchema.model_validate(job)
+
+        @router.get(
+            "/",
+            response_model=list[ImportJobSchema],
+            summary="List import jobs",
+            description="Most recent import jobs first, with progress and ETA. Requires admin role.",
+        )
+        async def get_import_jobs_endpoint(
+            _: Annotated[UserDB, Depends(require_roles("admin"))],
+            status: ImportJobStatus | None = Query(None),
+            limit: int = Query(50, ge=1, le=500),
+        ) -> list[ImportJobSchema]:
+            jobs = await self.loaded_service.get_jobs(status=status, limit=limit)
+            return [ImportJobSchema.model_validate(job) for job in jobs]
+
+        @router.get(
+            "/id/{job_id}/",
+            response_model=ImportJobSchema,
+            summary="Get import job",
+            description="Import job status, progress and ETA. Requires admin role.",
+            responses={404: {"description": "Import job not found"}},
+        )
+        async def get_import_job_endpoint(
+            job_id: int,
+            _: Annotated[UserDB, Depends(require_roles("admin"))],
+        ) -> ImportJobSchema:
+            job = await self.loaded_service.get_by_id(job_id)
+            if job is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"{ITEM} with id {job_id} not found",
+                )
+            return ImportJobSchema.model_validate(job)
+
+        @router.post(
+            "/id/{job_id}/cancel/",
+            response_model=ImportJobSchema,
+            summary="Cancel import job",
+            description="Cancel a queued or running import job. Requires admin role.",
+            responses={
+                404: {"description": "Import job not found"},
+                409: {"description": "Import job already finished"},
+            },
+        )
+        async def cancel_import_job_endpoint(
+            job_id: int,
+            _: Annotated[UserDB, Depends(require_roles("admin"))],
+        ) -> ImportJobSchema:
+            self.logger.debug(f"Cancel import job endpoint id:{job_id}")
+            return ImportJobSchema.model_validate(await self.loaded_service.cancel(job_id))
+
+        @router.post(
+            "/id/{job_id}/resume/",
+            response_model=ImportJobSchema,
+            summary="Resume import job",
+            description="Queue a failed or cancelled import job again, continuing from its "
+            "checkpoint. Requires admin role.",
+            responses={
+                404: {"description": "Import job not found"},
+                409: {"description": "Import job is not failed or cancelled"},
+            },
+        )
+        async def resume_import_job_endpoint(
+            job_id: int,
+            _: Annotated[UserDB, Depends(require_roles("admin"))],
+        ) -> ImportJobSchema:
+            self.logger.debug(f"Resume import job endpoint id:{job_id}")
+            return ImportJobSchema.model_validate(await self.loaded_service.resume(job_id))
+
+        return router
+
+
+api_import_job_router = ImportJobAPIRouter(service_name="import_job").route()
@@ -4,20 +4,29 @@ import asyncio
 import os
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import PlainTextResponse
 
-from src.clocks import clock_orchestrator
+from src.clocks import ClockLeaseManager, clock_orchestrator
 from src.core.config import settings
 from src.core.exception_handler import register_exception_handlers
-from src.core.middleware import LoggingMiddleware, RequestIDMiddleware
+from src.core.metrics import metrics_registry, render_metrics, write_snapshots_task
+from src.core.middleware import (
+    LoggingMiddleware,
+    RequestIDMiddleware,
+    UploadSizeLimitMiddleware,
+)
 from src.core.models.base import db
 from src.core.router_registry import RouterRegistry, configure_routers
 from src.core.service_initialization import register_all_services
 from src.core.service_registry import get_service_registry, init_service_registry
-from src.helpers.request_services_helper import initialize_proxy_manager
+from src.core.static_files import UploadFiles
+from src.helpers.request_services_helper import initialize_proxy_manager, run_proxy_prober
+from src.helpers.upload_service import UploadService
+from src.import_jobs import ImportJobRunner
 from src.logging_config import get_logger, logs_dir, setup_logging
 from src.utils.websocket.websocket_manager import connection_manager, ws_manager
 from src.websocket.match_handler import match_websocket_handler
@@ -27,25 +36,29 @@ db_logger = get_logger("db")
 setup_logging()
 
 
-async def mark_stale_users_offline_task():
-    """Background task to periodically mark inactive users as offline."""
+async def flush_user_heartbeats_task():
+    """Background task to flush buffered heartbeats and mark inactive users offline."""
     from src.users.db_services import UserServiceDB
 
     user_service = UserServiceDB(db)
-    logger.info("Starting stale users offline task")
+    interval = settings.heartbeat_flush_interval_seconds
+    logger.info("Starting user heartbeat flush task")
 
     while True:
         try:
-            count = await user_service.mark_stale_users_offline(timeout_minutes=2)
+            await asyncio.sleep(interval)
+            _, count = await user_service.flush_heartbeats(timeout_minutes=2)
             if count > 0:
                 logger.info(f"Marked {count} users as offline")
-            await asyncio.sleep(60)
         except asyncio.CancelledError:
-            logger.info("Stale users offline task cancelled")
+            try:
+                await user_service.flush_heartbeats(timeout_minutes=2)
+            except Exception as e:
+                logger.error(f"Error flushing heartbeats on shutdown: {e}", exc_info=True)
+            logger.info("User heartbeat flush task cancelled")
             break
         except Exception as e:
-            logger.error(f"Error in stale users offline task: {e}", exc_info=True)
-            await asyncio.sleep(60)
+            logger.error(f"Error in user heartbeat flush task: {e}", exc_info=True)
 
 
 async def cleanup_stale_websocket_connections_task():
@@ -80,8 +93,13 @@ async def lifespan(_app: FastAPI):
     """
     db_logger.info("Starting application lifespan.")
     ws_task = None
-    stale_users_task = None
+    heartbeat_flush_task = None
     stale_websocket_task = None
+    websocket_heartbeat_task = None
+    replica_lag_task = None
+    metrics_task = None
+    import_job_task = None
+    proxy_prober_task = None
     try:
         settings.validate_all()
         init_service_registry(db)
@@ -96,22 +114,65 @@ async def lifespan(_app: FastAPI):
             logger.info("Match data cache service initialized and set on WebSocket components")
 
         await initialize_proxy_manager()
+        proxy_prober_task = asyncio.create_task(run_proxy_prober())
         logger.info("Proxy manager initialized")
 
         await db.validate_database_connection()
 
+        if db.replica_engines:
+            await db.refresh_replica_lag()
+            replica_lag_task = asyncio.create_task(
+                db.monitor_replica_lag(settings.db_replica_lag_check_interval_seconds)
+            )
+            logger.info("Replica lag monitor started")
+
         await ws_manager.startup()
         ws_task = ws_manager._connection_retry_task
         logger.info("WebSocket manager started")
 
-        stale_users_task = asyncio.create_task(mark_stale_users_offline_task())
+        heartbeat_flush_task = asyncio.create_task(flush_user_heartbeats_task())
 
         stale_websocket_task = asyncio.create_task(cleanup_stale_websocket_connections_task())
         logger.info("Stale WebSocket connections cleanup task started")
 
+        websocket_heartbeat_task = asyncio.create_task(connection_manager.heartbeats.run())
+        logger.info("WebSocket heartbeat scheduler started")
+
+        if settings.clock_leases_enabled:
+            clock_orchestrator.set_lease_manager(
+                ClockLeaseManager(
+                    settings.db.db_url_websocket(),
+                    retry_interval_seconds=settings.clock_lease_retry_interval_seconds,
+                    reconcile_interval_seconds=settings.clock_reconcile_interval_seconds,
+                )
+            )
         await clock_orchestrator.start()
         logger.info("Clock orchestrator started")
 
+        if settings.import_job_workers > 0:
+            import_job_runner = ImportJobRunner(
+                db,
+                workers=settings.import_job_workers,
+                poll_interval_seconds=settings.import_job_poll_interval_seconds,
+                heartbeat_interval_seconds=settings.import_job_heartbeat_interval_seconds,
+                stale_after_seconds=settings.import_job_stale_after_seconds,
+                max_attempts=settings.import_job_max_attempts,
+                requests_per_second=settings.import_job_requests_per_second,
+                max_concurrent_requests=settings.import_job_max_concurrent_requests,
+            )
+            import_job_task = asyncio.create_task(import_job_runner.run())
+            logger.info("Import job runner started")
+
+        if settings.metrics_dir:
+            metrics_task = asyncio.create_task(
+                write_snapshots_task(
+                    metrics_registry,
+                    Path(settings.metrics_dir),
+                    settings.metrics_snapshot_interval_seconds,
+                )
+            )
+            logger.info("Metrics snapshot task started")
+
         yield
     except Exception as ex:
         db_logger.critical(f"Critical error during startup: {ex}", exc_info=True)
@@ -124,10 +185,10 @@ async def lifespan(_app: FastAPI):
             except asyncio.CancelledError:
                 pass
 
-        if stale_users_task:
-            stale_users_task.cancel()
+        if heartbeat_flush_task:
+            heartbeat_flush_task.cancel()
             try:
-                await stale_users_task
+                await heartbeat_flush_task
             except asyncio.CancelledError:
                 pass
 
@@ -138,6 +199,41 @@ async def lifespan(_app: FastAPI):
             except asyncio.CancelledError:
                 pass
 
+        if websocket_heartbeat_task:
+            websocket_heartbeat_task.cancel()
+            try:
+                await websocket_heartbeat_task
+            except asyncio.CancelledError:
+                pass
+
+        if metrics_task:
+            metrics_task.cancel()
+            try:
+                await metrics_task
+            except asyncio.CancelledError:
+                pass
+
+        if import_job_task:
+            import_job_task.cancel()
+            try:
+                await import_job_task
+            except asyncio.CancelledError:
+                pass
+
+        if proxy_prober_task:
+            proxy_prober_task.cancel()
+            try:
+                await proxy_prober_task
+            except asyncio.CancelledError:
+                pass
+
+        if replica_lag_task:
+            replica_lag_task.cancel()
+            try:
+                await replica_lag_task
+            except asyncio.CancelledError:
+                pass
+
         await clock_orchestrator.stop()
         logger.info("Clock orchestrator stopped")
 
@@ -167,6 +263,22 @@ async def health_check() -> dict[str, object]:
     }
 
 
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics() -> PlainTextResponse:
+    """
+    Prometheus metrics endpoint.
+
+    Returns:
+        PlainTextResponse: Request metrics in Prometheus text format, combined across
+        workers when METRICS_DIR is configured.
+    """
+    metrics_dir = Path(settings.metrics_dir) if settings.metrics_dir else None
+    return PlainTextResponse(
+        render_metrics(metrics_registry, metrics_dir),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
 registry = configure_routers(RouterRegistry())
 registry.register_all(app)
 
@@ -175,6 +287,8 @@ allowed_origins = os.getenv("ALLOWED_ORIGINS", "*")
 origins = [allowed_origins] if allowed_origins == "*" else allowed_origins.split(",")
 logger.info(f"allowed_origins: {origins}")
 
+# Room for the multipart boundaries and part headers around the largest allowed file
+app.add_middleware(UploadSizeLimitMiddleware, max_body_size=UploadService.MAX_FILE_SIZE + 64 * 1024)
 app.add_middleware(RequestIDMiddleware)
 app.add_middleware(LoggingMiddleware)
 app.add_middleware(
@@ -187,6 +301,10 @@ app.add_middleware(
 
 app.mount(
     "/static/uploads",
-    StaticFiles(directory=str(settings.uploads_path)),
+    UploadFiles(
+        directory=str(settings.uploads_path),
+        mode=settings.uploads_serving_mode,
+        accel_redirect_prefix=settings.uploads_accel_redirect_prefix,
+    ),
     name="uploads",
 )
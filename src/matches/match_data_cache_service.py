@@ -1,4 +1,6 @@
-from typing import TYPE_CHECKING
+import asyncio
+import json
+from typing import TYPE_CHECKING, Any
 
 from src.core.models.base import Database
 from src.logging_config import get_logger
@@ -9,12 +11,120 @@ if TYPE_CHECKING:
 ITEM = "MATCH_DATA_CACHE"
 
 
+def _dumps(value: Any) -> str:
+    # Same encoding as WebSocket.send_json.
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def compose_initial_load_document(
+    match_data: dict | None,
+    playclock_data: dict | None,
+    gameclock_data: dict | None,
+    event_data: dict | None,
+    stats_data: dict | None,
+) -> dict[str, Any]:
+    """Combine the component fetches into the shared ``data`` of an initial-load message."""
+    return {
+        **((match_data or {}).get("data") or {}),
+        "gameclock": gameclock_data.get("gameclock") if gameclock_data else None,
+        "playclock": playclock_data.get("playclock") if playclock_data else None,
+        "events": event_data.get("events", []) if event_data else [],
+        "statistics": stats_data.get("statistics", {}) if stats_data else {},
+    }
+
+
+class InitialLoadSnapshot:
+    """Initial-load message of one match, composed and serialized once for all joiners.
+
+    ``text`` is the JSON of ``{"type": "initial-load", "data": document}`` without its two
+    closing braces, so per-connection fields are appended to the shared text instead of
+    serializing the whole document again for every client.
+    """
+
+    def __init__(self, match_id: int, document: dict[str, Any], match_document: Any) -> None:
+        self.match_id = match_id
+        self.document = document
+        self.match_document = match_document
+        self.text = _dumps({"type": "initial-load", "data": document})[:-2]
+
+    def message_text(self, connection_fields: dict[str, Any]) -> str:
+        """Full message text with connection_fields added to ``data``."""
+        if not connection_fields:
+            return f"{self.text}}}}}"
+        return f"{self.text},{_dumps(connection_fields)[1:]}}}"
+
+
 class MatchDataCacheService:
     def __init__(self, database: Database) -> None:
         self.db = database
         self.logger = get_logger("MatchDataCacheService", self)
         self.logger.debug("Initialized MatchDataCacheService")
         self._cache: dict[str, dict] = {}
+        self._initial_loads: dict[int, InitialLoadSnapshot] = {}
+        self._initial_load_builds: dict[int, asyncio.Task] = {}
+
+    async def get_or_build_initial_load(self, match_id: int) -> InitialLoadSnapshot:
+        """Return the match's initial-load snapshot, building it once for concurrent joiners."""
+        snapshot = self._initial_loads.get(match_id)
+        if snapshot is not None:
+            self.logger.debug(f"Returning cached initial-load for match {match_id}")
+            return snapshot
+
+        build = self._initial_load_builds.get(match_id)
+        if build is None:
+            build = asyncio.create_task(self._build_initial_load(match_id))
+            self._initial_load_builds[match_id] = build
+        # A joiner that disconnects mid-build must not cancel the build shared with others.
+        return await asyncio.shield(build)
+
+    async def _build_initial_load(self, match_id: int) -> InitialLoadSnapshot:
+        from src.helpers.fetch_helpers import (
+            fetch_event,
+            fetch_gameclock,
+            fetch_playclock,
+            fetch_stats,
+            fetch_with_scoreboard_data,
+        )
+
+        build = asyncio.current_task()
+        try:
+            self.logger.debug(f"Building initial-load for match {match_id}")
+            (
+                match_data,
+                playclock_data,
+                gameclock_data,
+                event_data,
+                stats_data,
+            ) = await asyncio.gather(
+                fetch_with_scoreboard_data(match_id, database=self.db, cache_service=self),
+                fetch_playclock(match_id, database=self.db, cache_service=self),
+                fetch_gameclock(match_id, database=self.db, cache_service=self),
+                fetch_event(match_id, database=self.db, cache_service=self),
+                fetch_stats(match_id, database=self.db, cache_service=self),
+            )
+            match_document = (match_data or {}).get("data")
+            snapshot = InitialLoadSnapshot(
+                match_id,
+                compose_initial_load_document(
+                    match_data, playclock_data, gameclock_data, event_data, stats_data
+                ),
+                match_document,
+            )
+            # An invalidation during the build drops it from _initial_load_builds; its
+            # result is still handed to the joiners waiting on it but is not kept.
+            found = isinstance(match_document, dict) and match_document.get("status_code") == 200
+            if found and self._initial_load_builds.get(match_id) is build:
+                self._initial_loads[match_id] = snapshot
+                self.logger.debug(f"Cached initial-load for match {match_id}")
+            return snapshot
+        finally:
+            if self._initial_load_builds.get(match_id) is build:
+                del self._initial_load_builds[match_id]
+
+    def invalidate_initial_load(self, match_id: int) -> None:
+        self._initial_load_builds.pop(match_id, None)
+        if self._initial_loads.pop(match_id, None) is not None:
+            self.logger.debug(f"Invalidated initial-load for match {match_id}")
 
     async def get_or_fetch_match_data(self, match_id: int) -> dict | None:
         cache_key = f"match-update:{match_id}"
@@ -65,18 +175,21 @@ class MatchDataCacheService:
         return None
 
     def invalidate_match_data(self, match_id: int) -> None:
+        self.invalidate_initial_load(match_id)
         cache_key = f"match-update:{match_id}"
         if cache_key in self._cache:
             del self._cache[cache_key]
             self.logger.debug(f"Invalidated match data cache for match {match_id}")
 
     def invalidate_gameclock(self, match_id: int) -> None:
+        self.invalidate_initial_load(match_id)
         cache_key = f"gameclock-update:{match_id}"
         if cache_key in self._cache:
             del self._cache[cache_key]
             self.logger.debug(f"Invalidated gameclock cache for match {match_id}")
 
     def invalidate_playclock(self, match_id: int) -> None:
+        self.invalidate_initial_load(match_id)
         cache_key = f"playclock-update:{match_id}"
         if cache_key in self._cache:
             del self._cache[cache_key]
@@ -99,6 +212,7 @@ class MatchDataCacheService:
         return None
 
     def invalidate_event_data(self, match_id: int) -> None:
+        self.invalidate_initial_load(match_id)
         cache_key = f"event-update:{match_id}"
         if cache_key in self._cache:
             del self._cache[cache_key]
@@ -121,12 +235,14 @@ class MatchDataCacheService:
         return None
 
     def invalidate_stats(self, match_id: int) -> None:
+        self.invalidate_initial_load(match_id)
         cache_key = f"statistics-update:{match_id}"
         if cache_key in self._cache:
             del self._cache[cache_key]
             self.logger.debug(f"Invalidated stats cache for match {match_id}")
 
     def invalidate_players(self, match_id: int) -> None:
+        self.invalidate_initial_load(match_id)
         cache_key = f"players-update:{match_id}"
         if cache_key in self._cache:
             del self._cache[cache_key]
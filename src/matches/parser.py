@@ -1,3 +1,5 @@
+from typing import TYPE_CHECKING
+
 from sqlalchemy import select
 
 from src.core import db
@@ -21,6 +23,9 @@ from src.tournaments.db_services import TournamentServiceDB
 
 from .schemas import MatchSchemaCreate
 
+if TYPE_CHECKING:
+    from src.pars_eesl.sync import EeslSync
+
 
 class MatchParser:
     def __init__(self):
@@ -45,8 +50,13 @@ class MatchParser:
         return bool(getattr(preset, "has_playclock", True))
 
     async def create_parsed_matches(
-        self, eesl_tournament_id: int, match_service
+        self, eesl_tournament_id: int, match_service, sync: "EeslSync | None" = None
     ) -> list[dict] | None:
+        """Create or update the matches of an EESL tournament with their clocks and scoreboards.
+
+        With ``sync``, matches whose parsed data is unchanged since their last import are not
+        written, and are left out of the result.
+        """
         self.logger.debug(
             f"Get and Save parsed matches from tournament eesl_id:{eesl_tournament_id}"
         )
@@ -89,6 +99,9 @@ class MatchParser:
                 for m in matches_list:
                     try:
                         self.logger.debug(f"Parsed match: {m}")
+                        if sync and await sync.unchanged("match", m["match_eesl_id"], m):
+                            self.logger.debug(f"Match {m['match_eesl_id']} unchanged, skipping")
+                            continue
                         team_a = teams_by_eesl_id.get(m["team_a_eesl_id"])
                         if team_a:
                             self.logger.debug(f"team_a: {team_a}")
@@ -180,6 +193,8 @@ class MatchParser:
                         teams_data = await match_service.get_teams_by_match(created_match.id)
 
                         created_matches.append(created_match)
+                        if sync:
+                            sync.written("match", m["match_eesl_id"])
                         created_matches_full_data.append(
                             {
                                 "id": created_match.id,
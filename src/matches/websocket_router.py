@@ -37,9 +37,19 @@ class MatchWebSocketRouter(
             websocket: WebSocket,
             client_id: str,
             match_id: int,
+            clock_sync: str | None = None,
+            match_updates: str | None = None,
+            stream: str | None = None,
+            last_seq: int | None = None,
         ):
             await match_websocket_handler.handle_websocket_connection(
-                websocket, client_id, match_id
+                websocket,
+                client_id,
+                match_id,
+                clock_sync=clock_sync,
+                match_updates=match_updates,
+                stream=stream,
+                last_seq=last_seq,
             )
 
         return router
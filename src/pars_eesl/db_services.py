@@ -0,0 +1,56 @@
+from datetime import UTC, datetime
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from src.core.models import BaseServiceDB, EeslFingerprintDB
+from src.core.models.base import Database
+from src.logging_config import get_logger
+
+ITEM = "EESL_FINGERPRINT"
+
+
+class EeslFingerprintServiceDB(BaseServiceDB):
+    """Fingerprints of the EESL data each imported entity was last written from."""
+
+    def __init__(
+        self,
+        database: Database,
+    ) -> None:
+        super().__init__(database, EeslFingerprintDB)
+        self.logger = get_logger("EeslFingerprintServiceDB", self)
+        self.logger.debug("Initialized EeslFingerprintServiceDB")
+
+    async def get_fingerprints(self, entity: str) -> dict[int, str]:
+        self.logger.debug(f"Get {ITEM}s for {entity}")
+        async with self.db.get_session_maker()() as session:
+            result = await session.execute(
+                select(EeslFingerprintDB.eesl_id, EeslFingerprintDB.fingerprint).where(
+                    EeslFingerprintDB.entity == entity
+                )
+            )
+            return {eesl_id: fingerprint for eesl_id, fingerprint in result.all()}
+
+    async def save_fingerprints(self, entity: str, fingerprints: dict[int, str]) -> None:
+        if not fingerprints:
+            return
+        self.logger.debug(f"Save {len(fingerprints)} {ITEM}s for {entity}")
+        now = datetime.now(UTC)
+        stmt = insert(EeslFingerprintDB).values(
+            [
+                {
+                    "entity": entity,
+                    "eesl_id": eesl_id,
+                    "fingerprint": fingerprint,
+                    "updated_at": now,
+                }
+                for eesl_id, fingerprint in fingerprints.items()
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="idx_unique_eesl_fingerprint",
+            set_={"fingerprint": stmt.excluded.fingerprint, "updated_at": stmt.excluded.updated_at},
+        )
+        async with self.db.get_session_maker()() as session:
+            await session.execute(stmt)
+            await session.commit()
@@ -2,7 +2,7 @@ import asyncio
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import TypedDict
+from typing import TYPE_CHECKING, TypedDict
 from urllib.parse import urlparse
 
 from bs4 import BeautifulSoup
@@ -14,6 +14,10 @@ from src.helpers.file_service import file_service
 from src.helpers.text_helpers import convert_cyrillic_filename, ru_to_eng_datetime_month
 from src.logging_config import get_logger
 from src.pars_eesl.pars_settings import BASE_ALL_PLAYERS_URL, BASE_PLAYER
+from src.pars_eesl.parsing import parse_html
+
+if TYPE_CHECKING:
+    from src.pars_eesl.sync import EeslSync
 
 logger = get_logger("parse_players_from_eesl")
 ITEM_GOT = "PLAYER"
@@ -39,6 +43,31 @@ class ParsePlayerWithPersonData(TypedDict):
     player: ParsedPlayerData
 
 
+def _extract_player_dob(soup: BeautifulSoup) -> datetime:
+    dob_text = soup.find("span", class_="player-promo__value").text.strip().lower()
+    dob_text_eng = ru_to_eng_datetime_month(dob_text)
+    return datetime.strptime(dob_text_eng, "%d %B %Y")
+
+
+def _extract_player_page(soup: BeautifulSoup) -> dict:
+    """Date of birth, names and photo URL from a player's page."""
+    dob = _extract_player_dob(soup)
+    logger.debug(f"Parsing DoB {dob}")
+
+    player_full_name = soup.find("p", class_="player-promo__name").text.strip().lower()
+    logger.debug(f"Parsing full name {player_full_name}")
+
+    img_url, extension = soup.find("img", class_="player-promo__img").get("src").strip().split("_")
+    player_img_url = f"{img_url}.{extension.split('.')[1]}"
+    logger.debug(f"Parsing img url {player_img_url}")
+    return {
+        "dob": dob,
+        "first_name": player_full_name.split(" ")[1],
+        "second_name": player_full_name.split(" ")[0],
+        "img_url": player_img_url,
+    }
+
+
 async def collect_players_dob_from_all_eesl(player_eesl_id: int, base_url: str = BASE_PLAYER):
     logger.debug("Collect players date of birthday from eesl")
     url = base_url + str(player_eesl_id)
@@ -48,10 +77,7 @@ async def collect_players_dob_from_all_eesl(player_eesl_id: int, base_url: str =
         if req is None:
             logger.warning(f"Failed to fetch player DOB page for id:{player_eesl_id}")
             return None
-        soup = BeautifulSoup(req.content, "lxml")
-        dob_text = soup.find("span", class_="player-promo__value").text.strip().lower()
-        dob_text_eng = ru_to_eng_datetime_month(dob_text)
-        return datetime.strptime(dob_text_eng, "%d %B %Y")
+        return await parse_html(req.content, _extract_player_dob)
     except asyncio.TimeoutError:
         logger.error("Timeout occur while parsing date of birthday form eesl")
         return None
@@ -71,25 +97,12 @@ async def collect_player_full_data_eesl(
         if req is None:
             logger.warning(f"Failed to fetch player data page for id:{player_eesl_id}")
             return None
-        soup = BeautifulSoup(req.content, "lxml")
-        dob_text = soup.find("span", class_="player-promo__value").text.strip().lower()
-
-        dob_text_eng = ru_to_eng_datetime_month(dob_text)
-        dob = datetime.strptime(dob_text_eng, "%d %B %Y")
-        logger.debug(f"Parsing DoB {dob}")
-
-        player_full_name = soup.find("p", class_="player-promo__name").text.strip().lower()
-        logger.debug(f"Parsing full name {player_full_name}")
-
-        player_first_name = player_full_name.split(" ")[1]
-        player_second_name = player_full_name.split(" ")[0]
+        player_page = await parse_html(req.content, _extract_player_page)
+        dob = player_page["dob"]
+        player_first_name = player_page["first_name"]
+        player_second_name = player_page["second_name"]
         logger.debug(f"Getting first and second name {player_first_name} {player_second_name}")
-
-        img_url, extension = (
-            soup.find("img", class_="player-promo__img").get("src").strip().split("_")
-        )
-        player_img_url = f"{img_url}.{extension.split('.')[1]}"
-        logger.debug(f"Parsing img url {player_img_url}")
+        player_img_url = player_page["img_url"]
 
         icon_image_height = 100
         web_view_image_height = 400
@@ -205,59 +218,89 @@ async def parse_all_players_from_eesl_index_page_eesl(
     # players?season_id=8&page=2
     while True:
         remaining_limit = limit - len(players_in_eesl) if limit is not None else None
-        logger.debug(f"Parsing page: {num} Remaining limit of players to parse:{limit}")
-        url = (
-            f"{base_url}?season_id={season_id}"
-            if num == 0
-            else f"{base_url}?season_id={season_id}&page={num + 1}"
+        page_players, has_next_page = await parse_players_index_page_eesl(
+            num, season_id, base_url, remaining_limit
         )
-        logger.debug(f"URL:{url}")
-        req = await get_url(url)
-        if req is None:
-            logger.warning(f"Failed to fetch all players page {num}")
-            break
-        soup = BeautifulSoup(req.content, "lxml")
-        all_eesl_players = soup.find_all("tr", class_="table__row")
+        players_in_eesl.extend(page_players)
 
-        if not all_eesl_players:
-            logger.warning("No players found in eesl, stopping..")
+        if limit is not None and len(players_in_eesl) >= limit:
+            logger.warning(f"Reached the limit of {limit} players, stopping.")
+            break
+        if not has_next_page:
             break
+        num += 1
 
-        logger.debug("Parsing all players from eesl")
+    return players_in_eesl
 
-        try:
-            await get_player_from_eesl_participants(
-                players_in_eesl, all_eesl_players, remaining_limit
-            )
-        except Exception as ex:
-            logger.error(
-                f"Error while getting player from eesl participiants: {ex}",
-                exc_info=True,
-            )
-            break
 
-        if limit is not None and len(players_in_eesl) >= limit:
-            logger.warning(f"Reached the limit of {limit} players, stopping...")
-            break
+async def parse_players_index_page_eesl(
+    num: int,
+    season_id: int | None,
+    base_url: str = BASE_ALL_PLAYERS_URL,
+    remaining_limit: int | None = None,
+    sync: "EeslSync | None" = None,
+) -> tuple[list[ParsePlayerWithPersonData], bool]:
+    """Parse page ``num`` (0-based) of the players index.
+
+    Returns the page's players and whether the index has a next page. With ``sync``, players
+    listed as at their last import are left out, before their photo and date of birth are
+    fetched.
+    """
+    logger.debug(f"Parsing page: {num} Remaining limit of players to parse:{remaining_limit}")
+    players_in_eesl: list[ParsePlayerWithPersonData] = []
+    url = (
+        f"{base_url}?season_id={season_id}"
+        if num == 0
+        else f"{base_url}?season_id={season_id}&page={num + 1}"
+    )
+    logger.debug(f"URL:{url}")
+    req = await get_url(url)
+    if req is None:
+        logger.warning(f"Failed to fetch all players page {num}")
+        return players_in_eesl, False
+    players_basic_info, has_next_page = await parse_html(req.content, _extract_players_index)
 
-        # Pagination logic
-        pagination = soup.find("ul", {"id": "players-pagination"})
-        if pagination:
-            logger.debug("Pagination logic")
-            # Find the 'next' button. It's typically the last 'li' in the pagination 'ul'.
-            next_button = pagination.find_all("li", class_="pagination-section__item--arrow")[-1]
-            # Check if the 'next' button is disabled
-            is_disabled = "pagination-section__item--disabled" in next_button["class"]
-            if is_disabled:
-                logger.warning("Reached the last page, stopping...")
-                break
+    if not players_basic_info:
+        logger.warning("No players found in eesl, stopping..")
+        return players_in_eesl, False
 
-        if limit is not None and len(players_in_eesl) >= limit:
-            logger.warning(f"Reached the limit of {limit} players, stopping.")
-            break
-        num += 1
+    logger.debug("Parsing all players from eesl")
 
-    return players_in_eesl
+    try:
+        await get_player_from_eesl_participants(
+            players_in_eesl, players_basic_info, remaining_limit, sync
+        )
+    except Exception as ex:
+        logger.error(
+            f"Error while getting player from eesl participiants: {ex}",
+            exc_info=True,
+        )
+        return players_in_eesl, False
+
+    if not has_next_page:
+        logger.warning("Reached the last page, stopping...")
+    return players_in_eesl, has_next_page
+
+
+def _extract_players_index(soup: BeautifulSoup) -> tuple[list[dict], bool]:
+    """Basic info of each player on a players index page, and whether there is a next page."""
+    players_basic_info = []
+    for ppp in soup.find_all("tr", class_="table__row"):
+        try:
+            players_basic_info.append(_parse_player_basic_info(ppp))
+        except Exception as ex:
+            logger.error(f"Error parsing player row from eesl: {ex}", exc_info=True)
+
+    # Pagination logic
+    pagination = soup.find("ul", {"id": "players-pagination"})
+    if pagination:
+        logger.debug("Pagination logic")
+        # Find the 'next' button. It's typically the last 'li' in the pagination 'ul'.
+        next_button = pagination.find_all("li", class_="pagination-section__item--arrow")[-1]
+        # Check if the 'next' button is disabled
+        if "pagination-section__item--disabled" in next_button["class"]:
+            return players_basic_info, False
+    return players_basic_info, True
 
 
 def _parse_player_basic_info(ppp):
@@ -388,23 +431,26 @@ def _create_player_with_person_data(
 
 
 async def get_player_from_eesl_participants(
-    players_in_eesl, all_eesl_players, remaining_limit
+    players_in_eesl, players_basic_info, remaining_limit, sync: "EeslSync | None" = None
 ) -> list[ParsePlayerWithPersonData] | None | bool:
+    """Download the photo and date of birth of each player of an index page.
+
+    ``players_basic_info`` are the rows extracted by ``_parse_player_basic_info``.
+    """
     logger.debug("Parsing player from eesl participants")
     has_error = False
 
-    for ppp in all_eesl_players:
+    for basic_info in players_basic_info:
         if remaining_limit == 0:
             logger.debug("Remaining limit of players reached. Stopping...")
             break
 
         try:
-            if not ppp:
-                continue
-
             logger.debug("Parsing player from eesl")
 
-            basic_info = _parse_player_basic_info(ppp)
+            if sync and await sync.unchanged("player", basic_info["player_eesl_id"], basic_info):
+                logger.debug(f"Player {basic_info['player_eesl_id']} unchanged, skipping")
+                continue
             image_paths = _generate_player_image_paths(
                 basic_info["player_eesl_id"],
                 basic_info["player_second_name"],
@@ -8,6 +8,7 @@ from fastapi import HTTPException
 from src.helpers import get_url
 from src.logging_config import get_logger
 from src.pars_eesl.pars_settings import BASE_MATCH_URL
+from src.pars_eesl.parsing import parse_html
 
 logger = get_logger("parse_match_eesl")
 
@@ -69,96 +70,92 @@ async def parse_match_index_page_eesl(
         if req is None:
             logger.warning(f"Failed to fetch match page for id:{m_id}")
             return match_data
-        soup = BeautifulSoup(req.content, "lxml")
+        return await parse_html(req.content, _extract_match, match_data, m_id)
+    except Exception as ex:
+        logger.error(f"Error parsing match id:{m_id} {ex}", exc_info=True)
+        return None
 
-        team_a = soup.find("a", class_="match-protocol__team-name match-protocol__team-name--left")
 
-        team_b = soup.find("a", class_="match-protocol__team-name match-protocol__team-name--right")
-        logo_urls = soup.find_all("img", class_="match-promo__team-img")
-        score = soup.find("div", class_="match-promo__score-main")
+def _extract_match(soup: BeautifulSoup, match_data: ParsedMatch, m_id: int) -> ParsedMatch:
+    team_a = soup.find("a", class_="match-protocol__team-name match-protocol__team-name--left")
+
+    team_b = soup.find("a", class_="match-protocol__team-name match-protocol__team-name--right")
+    logo_urls = soup.find_all("img", class_="match-promo__team-img")
+    score = soup.find("div", class_="match-promo__score-main")
+
+    team_a_link = soup.find("a", class_="match-protocol__team-name match-protocol__team-name--left")
+    team_b_link = soup.find(
+        "a", class_="match-protocol__team-name match-protocol__team-name--right"
+    )
+    team_a_id = int(
+        team_a_link.get("href").strip().split("=")[1]
+        if team_a_link and team_a_link.get("href")
+        else 0
+    )
+    team_b_id = int(
+        team_b_link.get("href").strip().split("=")[1]
+        if team_b_link and team_b_link.get("href")
+        else 0
+    )
 
-        team_a_link = soup.find(
-            "a", class_="match-protocol__team-name match-protocol__team-name--left"
-        )
-        team_b_link = soup.find(
-            "a", class_="match-protocol__team-name match-protocol__team-name--right"
-        )
-        team_a_id = int(
-            team_a_link.get("href").strip().split("=")[1]
-            if team_a_link and team_a_link.get("href")
-            else 0
-        )
-        team_b_id = int(
-            team_b_link.get("href").strip().split("=")[1]
-            if team_b_link and team_b_link.get("href")
-            else 0
-        )
+    try:
+        match_data["team_a"] = team_a.text.strip() if team_a else ""
+        match_data["team_b"] = team_b.text.strip() if team_b else ""
+        match_data["team_a_eesl_id"] = team_a_id
+        match_data["team_b_eesl_id"] = team_b_id
+        match_data["team_logo_url_a"] = logo_urls[0].get("src") if len(logo_urls) > 0 else None
+        match_data["team_logo_url_b"] = logo_urls[1].get("src") if len(logo_urls) > 1 else None
+        match_data["score_a"] = score.text.split(":")[0].strip() if score else ""
+        match_data["score_b"] = score.text.split(":")[1].strip() if score else ""
+    except Exception as ex:
+        logger.error(f"Error with parsed match data {ex}", exc_info=True)
+
+    players_a = soup.find_all("li", class_="match-protocol__member match-protocol__member--left")
+    players_b = soup.find_all("li", class_="match-protocol__member match-protocol__member--right")
+
+    roster_a: list[ParsedMatchPlayer | None] = []
+    roster_b: list[ParsedMatchPlayer | None] = []
+    if players_a:
+        for p in players_a:
+            try:
+                player = get_player_eesl_from_match(
+                    p, match_data["team_a"], match_data["team_logo_url_a"] or ""
+                )
+                if player:
+                    roster_a.append(player.copy())
+            except Exception as ex:
+                logger.error(f"Error getting player for home roster {ex}", exc_info=True)
+    else:
+        logger.warning(f"No home players found for match id:{m_id}")
+
+    if players_b:
+        for p in players_b:
+            try:
+                player = get_player_eesl_from_match(
+                    p, match_data["team_b"], match_data["team_logo_url_b"] or ""
+                )
+                if player:
+                    roster_b.append(player.copy())
+            except Exception as ex:
+                logger.error(f"Error getting player for away roster {ex}", exc_info=True)
+    else:
+        logger.warning(f"No away players found for match id:{m_id}")
 
-        try:
-            match_data["team_a"] = team_a.text.strip() if team_a else ""
-            match_data["team_b"] = team_b.text.strip() if team_b else ""
-            match_data["team_a_eesl_id"] = team_a_id
-            match_data["team_b_eesl_id"] = team_b_id
-            match_data["team_logo_url_a"] = logo_urls[0].get("src") if len(logo_urls) > 0 else None
-            match_data["team_logo_url_b"] = logo_urls[1].get("src") if len(logo_urls) > 1 else None
-            match_data["score_a"] = score.text.split(":")[0].strip() if score else ""
-            match_data["score_b"] = score.text.split(":")[1].strip() if score else ""
-        except Exception as ex:
-            logger.error(f"Error with parsed match data {ex}", exc_info=True)
-
-        players_a = soup.find_all(
-            "li", class_="match-protocol__member match-protocol__member--left"
+    try:
+        logger.debug("Set sorted rosters")
+        match_data["roster_a"] = sorted(
+            [d for d in roster_a if d], key=lambda d: d["player_number"] if d else ""
         )
-        players_b = soup.find_all(
-            "li", class_="match-protocol__member match-protocol__member--right"
+        match_data["roster_b"] = sorted(
+            [d for d in roster_b if d], key=lambda d: d["player_number"] if d else ""
         )
-
-        roster_a: list[ParsedMatchPlayer | None] = []
-        roster_b: list[ParsedMatchPlayer | None] = []
-        if players_a:
-            for p in players_a:
-                try:
-                    player = await get_player_eesl_from_match(
-                        p, match_data["team_a"], match_data["team_logo_url_a"] or ""
-                    )
-                    if player:
-                        roster_a.append(player.copy())
-                except Exception as ex:
-                    logger.error(f"Error getting player for home roster {ex}", exc_info=True)
-        else:
-            logger.warning(f"No home players found for match id:{m_id}")
-
-        if players_b:
-            for p in players_b:
-                try:
-                    player = await get_player_eesl_from_match(
-                        p, match_data["team_b"], match_data["team_logo_url_b"] or ""
-                    )
-                    if player:
-                        roster_b.append(player.copy())
-                except Exception as ex:
-                    logger.error(f"Error getting player for away roster {ex}", exc_info=True)
-        else:
-            logger.warning(f"No away players found for match id:{m_id}")
-
-        try:
-            logger.debug("Set sorted rosters")
-            match_data["roster_a"] = sorted(
-                [d for d in roster_a if d], key=lambda d: d["player_number"] if d else ""
-            )
-            match_data["roster_b"] = sorted(
-                [d for d in roster_b if d], key=lambda d: d["player_number"] if d else ""
-            )
-        except Exception as ex:
-            logger.error(f"Error getting sorted rosters {ex}", exc_info=True)
-
-        return match_data
     except Exception as ex:
-        logger.error(f"Error parsing match id:{m_id} {ex}", exc_info=True)
-        return None
+        logger.error(f"Error getting sorted rosters {ex}", exc_info=True)
+
+    return match_data
 
 
-async def get_player_eesl_from_match(
+def get_player_eesl_from_match(
     soup_player_team: BeautifulSoup, team: str, team_logo_url: str
 ) -> ParsedMatchPlayer | None:
     try:
@@ -1,6 +1,5 @@
 import re
-from pathlib import Path
-from urllib.parse import urlparse
+from typing import TYPE_CHECKING
 
 from bs4 import BeautifulSoup
 
@@ -8,6 +7,10 @@ from src.helpers import get_url
 from src.helpers.file_service import file_service
 from src.logging_config import get_logger
 from src.pars_eesl.pars_settings import BASE_SEASON_URL, SEASON_ID
+from src.pars_eesl.parsing import parse_html
+
+if TYPE_CHECKING:
+    from src.pars_eesl.sync import EeslSync
 
 logger = get_logger("parser_eesl")
 ITEM_PARSED = "SEASON"
@@ -15,14 +18,19 @@ ITEM_GOT = "TOURNAMENT"
 
 
 async def parse_season_and_create_jsons(
-    _id: int, season_id: int | None = None, sport_id: int | None = None
+    _id: int,
+    season_id: int | None = None,
+    sport_id: int | None = None,
+    sync: "EeslSync | None" = None,
 ):
     logger.debug(
         f"Starting create parsed json for {ITEM_PARSED} of {ITEM_GOT} id:{_id} season_id:{season_id} sport_id:{sport_id}"
     )
     try:
         # _id = 8  # 2024
-        data = await parse_season_index_page_eesl(_id, season_id=season_id, sport_id=sport_id)
+        data = await parse_season_index_page_eesl(
+            _id, season_id=season_id, sport_id=sport_id, sync=sync
+        )
         logger.debug(f"Parsed json for {ITEM_PARSED} id{_id} data: {data}")
         return data
     except Exception as ex:
@@ -33,12 +41,53 @@ async def parse_season_and_create_jsons(
         return None
 
 
+def _extract_season_tournaments(soup: BeautifulSoup, _id: int) -> list[dict] | None:
+    """eesl_id, title and logo URL of each tournament on a season page, None if none."""
+    all_season_tournaments = soup.find_all("li", class_="tournaments-archive__item")
+    if not all_season_tournaments:
+        return None
+    tournaments = []
+    for t in all_season_tournaments:
+        try:
+            tournament_title = (
+                t.find("a", class_="tournaments-archive__link").get("title").lower().strip()
+            )
+            logger.debug(f"{ITEM_GOT} title: {tournament_title}")
+            tournament_logo_url = t.find("img", class_="tournaments-archive__img").get("src")
+            logger.debug(f"{ITEM_GOT} logo url: {tournament_logo_url}")
+            tournament_eesl_id = int(
+                re.findall(
+                    r"\d+",
+                    t.find("a", class_="tournaments-archive__link").get("href"),
+                )[0]
+            )
+            tournaments.append(
+                {
+                    "tournament_eesl_id": tournament_eesl_id,
+                    "title": tournament_title,
+                    "logo_url": tournament_logo_url,
+                }
+            )
+        except Exception as ex:
+            logger.error(
+                f"Problem parsing {ITEM_GOT} data for {ITEM_PARSED} id:{_id}, {ex}",
+                exc_info=True,
+            )
+    return tournaments
+
+
 async def parse_season_index_page_eesl(
     _id: int,
     base_url: str = BASE_SEASON_URL,
     season_id: int | None = None,
     sport_id: int | None = None,
+    sync: "EeslSync | None" = None,
 ):
+    """Parse the tournaments of EESL season ``_id``, downloading their logos.
+
+    With ``sync``, tournaments unchanged since their last import are left out, before their
+    logo is downloaded.
+    """
     logger.debug(f"Starting parse for eesl {ITEM_PARSED} id:{_id} url:{base_url}{_id}")
     tournaments_in_season = []
 
@@ -46,24 +95,25 @@ async def parse_season_index_page_eesl(
     if req is None:
         logger.warning(f"Failed to fetch season page for id:{_id}")
         return None
-    # logger.debug(f"Request: {req}")
-    soup = BeautifulSoup(req.content, "lxml")
-    # logger.debug(f"Soup: {soup}")
-
-    all_season_tournaments = soup.find_all("li", class_="tournaments-archive__item")
-    # logger.debug(f"All {ITEM_PARSED}'s {ITEM_GOT} html: {all_season_tournaments}")
-    if all_season_tournaments:
-        for t in all_season_tournaments:
-            # logger.debug(f"Parsing {ITEM_GOT}: {t}")
+    season_tournaments = await parse_html(req.content, _extract_season_tournaments, _id)
+    if season_tournaments is not None:
+        for parsed_tournament in season_tournaments:
             try:
-                tournament_title = (
-                    t.find("a", class_="tournaments-archive__link").get("title").lower().strip()
-                )
-                logger.debug(f"{ITEM_GOT} title: {tournament_title}")
-                tournament_logo_url = t.find("img", class_="tournaments-archive__img").get("src")
-                logger.debug(f"{ITEM_GOT} logo url: {tournament_logo_url}")
-                path = urlparse(tournament_logo_url).path
-                Path(path).suffix
+                tournament_eesl_id = parsed_tournament["tournament_eesl_id"]
+                tournament_title = parsed_tournament["title"]
+                tournament_logo_url = parsed_tournament["logo_url"]
+                if sync and await sync.unchanged(
+                    "tournament",
+                    tournament_eesl_id,
+                    {
+                        "title": tournament_title,
+                        "logo_url": tournament_logo_url,
+                        "season_id": season_id,
+                        "sport_id": sport_id,
+                    },
+                ):
+                    logger.debug(f"{ITEM_GOT} eesl_id:{tournament_eesl_id} unchanged, skipping")
+                    continue
 
                 icon_image_height = 100
                 web_view_image_height = 400
@@ -78,12 +128,7 @@ async def parse_season_index_page_eesl(
 
                 try:
                     final_tournament = {
-                        "tournament_eesl_id": int(
-                            re.findall(
-                                r"\d+",
-                                t.find("a", class_="tournaments-archive__link").get("href"),
-                            )[0]
-                        ),
+                        "tournament_eesl_id": tournament_eesl_id,
                         "title": tournament_title,
                         "description": "",
                         "tournament_logo_url": image_info["image_url"],
@@ -1,6 +1,6 @@
 import re
 from datetime import datetime
-from typing import TypedDict
+from typing import TYPE_CHECKING, TypedDict
 
 from bs4 import BeautifulSoup
 
@@ -9,6 +9,10 @@ from src.helpers.file_service import file_service
 from src.helpers.text_helpers import months, safe_int_conversion
 from src.logging_config import get_logger
 from src.pars_eesl.pars_settings import BASE_TEAM_URL, BASE_TOURNAMENT_URL, SEASON_ID
+from src.pars_eesl.parsing import parse_html
+
+if TYPE_CHECKING:
+    from src.pars_eesl.sync import EeslSync
 
 logger = get_logger("parser_eesl")
 ITEM_PARSED = "TOURNAMENT"
@@ -62,6 +66,18 @@ class ParsedTeamBasicData(TypedDict):
     sport_id: int
 
 
+def _extract_title_and_logo(soup: BeautifulSoup, title_tag: str, title_class: str) -> dict:
+    """Title (lowercased, None when missing) and og:image logo URL of a tournament or team page."""
+    title_el = soup.find(title_tag, class_=title_class)
+    og_image_tag = soup.find("meta", property="og:image") or soup.find(
+        "meta", attrs={"name": "og:image"}
+    )
+    return {
+        "title": title_el.text.strip().lower() if title_el else None,
+        "logo_url": og_image_tag.get("content", "") if og_image_tag else "",
+    }
+
+
 async def parse_tournament_and_create_jsons(
     _id: int, season_id: int | None = None, sport_id: int | None = None
 ):
@@ -92,26 +108,20 @@ async def parse_tournament_basic_data_eesl(
         logger.warning(f"Failed to fetch tournament page for id:{_id}")
         return None
 
-    soup = BeautifulSoup(req.content, "lxml")
-
     try:
-        tournament_title_tag = soup.find("h2", class_="tournament__title")
-        if tournament_title_tag:
-            tournament_title = tournament_title_tag.text.strip().lower()
+        page = await parse_html(req.content, _extract_title_and_logo, "h2", "tournament__title")
+        tournament_title = page["title"]
+        if tournament_title:
             logger.debug(f"{ITEM_PARSED} title: {tournament_title}")
         else:
             logger.warning(f"No title found for {ITEM_PARSED} id:{_id}")
             return None
 
-        og_image_tag = soup.find("meta", property="og:image") or soup.find(
-            "meta", attrs={"name": "og:image"}
-        )
-        if og_image_tag:
-            tournament_logo_url = og_image_tag.get("content", "")
+        tournament_logo_url = page["logo_url"]
+        if tournament_logo_url:
             logger.debug(f"{ITEM_PARSED} logo url: {tournament_logo_url}")
         else:
             logger.warning(f"No logo found for {ITEM_PARSED} id:{_id}, using empty string")
-            tournament_logo_url = ""
 
         icon_image_height = 100
         web_view_image_height = 400
@@ -165,26 +175,20 @@ async def parse_team_basic_data_eesl(
         logger.warning(f"Failed to fetch team page for id:{_id}")
         return None
 
-    soup = BeautifulSoup(req.content, "lxml")
-
     try:
-        team_title_tag = soup.find("h1", class_="team__title")
-        if team_title_tag:
-            team_title = team_title_tag.text.strip().lower()
+        page = await parse_html(req.content, _extract_title_and_logo, "h1", "team__title")
+        team_title = page["title"]
+        if team_title:
             logger.debug(f"{ITEM_GOT} title: {team_title}")
         else:
             logger.warning(f"No title found for {ITEM_GOT} id:{_id}")
             return None
 
-        og_image_tag = soup.find("meta", property="og:image") or soup.find(
-            "meta", attrs={"name": "og:image"}
-        )
-        if og_image_tag:
-            team_logo_url = og_image_tag.get("content", "")
+        team_logo_url = page["logo_url"]
+        if team_logo_url:
             logger.debug(f"{ITEM_GOT} logo url: {team_logo_url}")
         else:
             logger.warning(f"No logo found for {ITEM_GOT} id:{_id}, using empty string")
-            team_logo_url = ""
 
         icon_image_height = 100
         web_view_image_height = 400
@@ -286,7 +290,13 @@ async def parse_tournament_teams_and_create_jsons(_id: int):
 async def parse_tournament_teams_index_page_eesl(
     _id: int,
     base_url: str = BASE_TOURNAMENT_URL,
+    sync: "EeslSync | None" = None,
 ) -> list[ParsedTeamData] | None:
+    """Parse the teams of EESL tournament ``_id``, downloading their logos.
+
+    With ``sync``, teams whose title and logo are unchanged since their last import are left
+    out, before their logo is downloaded.
+    """
     logger.debug(
         f"Starting parse for eesl {ITEM_PARSED} for {ITEM_GOT} id:{_id} url:{base_url}{_id}"
     )
@@ -296,26 +306,19 @@ async def parse_tournament_teams_index_page_eesl(
     if req is None:
         logger.warning(f"Failed to fetch tournament teams page for id:{_id}")
         return None
-    # logger.debug(f"Request: {req}")
-    soup = BeautifulSoup(req.content, "lxml")
-    # logger.debug(f"Soup: {soup}")
-
-    all_tournament_teams = soup.find_all("li", class_="teams__item")
-    # logger.debug(f"All {ITEM_PARSED}'s {ITEM_GOT} html: {all_tournament_teams}")
-    if all_tournament_teams:
-        for t in all_tournament_teams:
-            # logger.debug(f"Parsing {ITEM_GOT}: {t}")
+    tournament_teams = await parse_html(req.content, _extract_tournament_teams, _id)
+    if tournament_teams is not None:
+        for parsed_team in tournament_teams:
             try:
-                team_eesl_id = int(
-                    re.findall(r"team_id=(\d+)", t.find("a", class_="teams__logo").get("href"))[0]
-                )
-                logger.debug(f"{ITEM_GOT} team_eesl_id: {team_eesl_id}")
-                team_title = t.find("a", class_="teams__name-link").text.strip().lower()
-                logger.debug(f"{ITEM_GOT} title: {team_title}")
-                team_logo_url = t.find(
-                    "img", alt=t.find("a", class_="teams__name-link").text.strip()
-                ).get("src")
-                logger.debug(f"{ITEM_GOT} logo url: {team_logo_url}")
+                team_eesl_id = parsed_team["team_eesl_id"]
+                team_title = parsed_team["title"]
+                team_logo_url = parsed_team["logo_url"]
+
+                if sync and await sync.unchanged(
+                    "team", team_eesl_id, {"title": team_title, "logo_url": team_logo_url}
+                ):
+                    logger.debug(f"{ITEM_GOT} eesl_id:{team_eesl_id} unchanged, skipping")
+                    continue
 
                 icon_image_height = 100
                 web_view_image_height = 400
@@ -372,6 +375,35 @@ async def parse_tournament_teams_index_page_eesl(
         return None
 
 
+def _extract_tournament_teams(soup: BeautifulSoup, _id: int) -> list[dict] | None:
+    """eesl_id, title and logo URL of each team on a tournament's teams page, None if none."""
+    all_tournament_teams = soup.find_all("li", class_="teams__item")
+    if not all_tournament_teams:
+        return None
+    teams = []
+    for t in all_tournament_teams:
+        try:
+            team_eesl_id = int(
+                re.findall(r"team_id=(\d+)", t.find("a", class_="teams__logo").get("href"))[0]
+            )
+            logger.debug(f"{ITEM_GOT} team_eesl_id: {team_eesl_id}")
+            team_title = t.find("a", class_="teams__name-link").text.strip().lower()
+            logger.debug(f"{ITEM_GOT} title: {team_title}")
+            team_logo_url = t.find(
+                "img", alt=t.find("a", class_="teams__name-link").text.strip()
+            ).get("src")
+            logger.debug(f"{ITEM_GOT} logo url: {team_logo_url}")
+            teams.append(
+                {"team_eesl_id": team_eesl_id, "title": team_title, "logo_url": team_logo_url}
+            )
+        except Exception as ex:
+            logger.error(
+                f"Problem parsing {ITEM_GOT} data for {ITEM_PARSED} id:{_id}, {ex}",
+                exc_info=True,
+            )
+    return teams
+
+
 def _parse_match_basic_info(item):
     match_eesl_id = int(re.findall(r"\d+", item.find("a", class_="schedule__score").get("href"))[0])
     logger.debug(f"{ITEM_GOT_MATCH} match_eesl_id:{match_eesl_id}")
@@ -488,22 +520,11 @@ def _process_matches_in_week(
     return week_counter, last_week_num
 
 
-async def parse_tournament_matches_index_page_eesl(
-    _id: int, base_url: str = BASE_TOURNAMENT_URL, year: int = 2024
-) -> list[ParsedMatchData] | None:
-    logger.debug(
-        f"Starting parse for eesl {ITEM_PARSED} for {ITEM_GOT_MATCH} id:{_id} url:{base_url}{_id}"
-    )
+def _extract_tournament_matches(soup: BeautifulSoup, _id: int) -> list[ParsedMatchData] | None:
+    """The matches of a tournament's calendar page, numbered by week; None on a broken page."""
     week_counter = 0
     last_week_num = None
-    matches_in_tournament = []
-
-    url = f"{base_url}{str(_id)}/calendar"
-    req = await get_url(url)
-    if req is None:
-        logger.warning(f"Failed to fetch tournament matches page for id:{_id}")
-        return None
-    soup = BeautifulSoup(req.content, "lxml")
+    matches_in_tournament: list[ParsedMatchData] = []
     all_schedule_matches = soup.select(".js-schedule")
 
     for week in all_schedule_matches:
@@ -549,6 +570,23 @@ async def parse_tournament_matches_index_page_eesl(
                 exc_info=True,
             )
             return None
+    return matches_in_tournament
+
+
+async def parse_tournament_matches_index_page_eesl(
+    _id: int, base_url: str = BASE_TOURNAMENT_URL, year: int = 2024
+) -> list[ParsedMatchData] | None:
+    logger.debug(
+        f"Starting parse for eesl {ITEM_PARSED} for {ITEM_GOT_MATCH} id:{_id} url:{base_url}{_id}"
+    )
+    url = f"{base_url}{str(_id)}/calendar"
+    req = await get_url(url)
+    if req is None:
+        logger.warning(f"Failed to fetch tournament matches page for id:{_id}")
+        return None
+    matches_in_tournament = await parse_html(req.content, _extract_tournament_matches, _id)
+    if matches_in_tournament is None:
+        return None
 
     logger.info(f"Parsed {ITEM_GOT_MATCH}s for {ITEM_PARSED} id:{_id}: {matches_in_tournament}")
     return matches_in_tournament
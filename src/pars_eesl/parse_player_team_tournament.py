@@ -9,6 +9,7 @@ from fastapi import HTTPException
 from src.helpers import get_url
 from src.logging_config import get_logger
 from src.pars_eesl.pars_settings import BASE_TOURNAMENT_URL
+from src.pars_eesl.parsing import parse_html
 
 logger = get_logger("parse_players_from_team_tournament_eesl")
 
@@ -52,11 +53,9 @@ async def parse_players_from_team_tournament_eesl(
                 f"Failed to fetch players page for tournament:{eesl_tournament_id} team:{eesl_team_id}"
             )
             return players_in_eesl
-        soup = BeautifulSoup(req.content, "lxml")
-        all_eesl_players = soup.find_all("tr", class_="table__row")
         try:
-            await get_player_from_team_tournament_eesl(
-                players_in_eesl, all_eesl_players, eesl_tournament_id, eesl_team_id
+            players_in_eesl = await parse_html(
+                req.content, _extract_team_tournament_players, eesl_tournament_id, eesl_team_id
             )
         except Exception as ex:
             logger.error(
@@ -70,7 +69,18 @@ async def parse_players_from_team_tournament_eesl(
         raise
 
 
-async def get_player_from_team_tournament_eesl(
+def _extract_team_tournament_players(
+    soup: BeautifulSoup, eesl_tournament_id: int, eesl_team_id: int
+) -> list[ParsedPlayerTeamTournament]:
+    players_in_eesl: list[ParsedPlayerTeamTournament] = []
+    all_eesl_players = soup.find_all("tr", class_="table__row")
+    get_player_from_team_tournament_eesl(
+        players_in_eesl, all_eesl_players, eesl_tournament_id, eesl_team_id
+    )
+    return players_in_eesl
+
+
+def get_player_from_team_tournament_eesl(
     players_in_eesl, all_eesl_players, eesl_tournament_id, eesl_team_id
 ) -> list[ParsedPlayerTeamTournament] | None:
     try:
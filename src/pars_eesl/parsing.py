@@ -0,0 +1,46 @@
+"""Off-loop HTML parsing for the EESL scrapers.
+
+Building a BeautifulSoup tree for a large EESL page and walking it takes long enough to delay
+clock ticks and WebSocket sends in the same worker. The scrapers therefore fetch a page on the
+event loop, then parse it and extract plain dicts in a small thread pool, and only continue on
+the loop with the extracted data (downloads, DB writes).
+"""
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from bs4 import BeautifulSoup
+
+from src.core.config import settings
+
+T = TypeVar("T")
+
+_parse_executor: ThreadPoolExecutor | None = None
+
+
+def _get_parse_executor() -> ThreadPoolExecutor:
+    """Bounded pool that parses EESL pages off the event loop."""
+    global _parse_executor
+    if _parse_executor is None:
+        _parse_executor = ThreadPoolExecutor(
+            max_workers=settings.eesl_parse_max_workers,
+            thread_name_prefix="eesl-parse",
+        )
+    return _parse_executor
+
+
+def _parse_and_extract(content: bytes | str, extract: Callable[..., T], args: tuple) -> T:
+    return extract(BeautifulSoup(content, "lxml"), *args)
+
+
+async def parse_html(content: bytes | str, extract: Callable[..., T], *args: Any) -> T:
+    """Parse ``content`` and return ``extract(soup, *args)``, both in the parsing pool.
+
+    ``extract`` must not touch the event loop; it should return plain data, not soup elements.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_parse_executor(), _parse_and_extract, content, extract, args
+    )
@@ -0,0 +1,81 @@
+"""Incremental EESL sync.
+
+An import records a fingerprint (a stable hash) of the EESL data each entity was written from,
+keyed by entity kind and eesl_id. On the next import, an entity whose parsed data hashes the
+same is skipped before any image download, color extraction or DB write.
+
+What is hashed is the data as parsed from EESL, before anything is downloaded: for a team, its
+title and logo URL rather than the processed logo paths and extracted color. A fingerprint is
+stored only once the entity has been written, so an import that fails part way retries the rest
+on its next run.
+"""
+
+import hashlib
+import json
+from typing import Any
+
+from src.logging_config import get_logger
+
+from .db_services import EeslFingerprintServiceDB
+
+
+def fingerprint(data: Any) -> str:
+    """sha256 of ``data`` as canonical JSON; the same for equal dicts in any key order."""
+    canonical = json.dumps(data, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class EeslSync:
+    """Fingerprint bookkeeping for one import run.
+
+    ``unchanged`` is asked before an entity is processed; ``written`` confirms it was stored,
+    and ``save`` persists the confirmed fingerprints. With ``force`` every entity counts as
+    changed, so that stale rows can be rewritten; fingerprints are still recorded.
+    """
+
+    def __init__(self, service: EeslFingerprintServiceDB, force: bool = False) -> None:
+        self.service = service
+        self.force = force
+        self.logger = get_logger("EeslSync", self)
+        self._stored: dict[str, dict[int, str]] = {}
+        self._pending: dict[tuple[str, int], str] = {}
+        self._confirmed: dict[str, dict[int, str]] = {}
+        self._counts: dict[str, dict[str, int]] = {}
+        self._unchanged: dict[str, set[int]] = {}
+
+    async def unchanged(self, entity: str, eesl_id: int, data: Any) -> bool:
+        if entity not in self._stored:
+            self._stored[entity] = await self.service.get_fingerprints(entity)
+        new = fingerprint(data)
+        if not self.force and self._stored[entity].get(eesl_id) == new:
+            self._count(entity, "unchanged")
+            self._unchanged.setdefault(entity, set()).add(eesl_id)
+            return True
+        self._pending[(entity, eesl_id)] = new
+        return False
+
+    def written(self, entity: str, eesl_id: int) -> None:
+        new = self._pending.pop((entity, eesl_id), None)
+        if new is None:
+            return
+        stored = self._stored.setdefault(entity, {})
+        self._count(entity, "updated" if eesl_id in stored else "created")
+        stored[eesl_id] = new
+        self._confirmed.setdefault(entity, {})[eesl_id] = new
+
+    async def save(self) -> None:
+        confirmed, self._confirmed = self._confirmed, {}
+        for entity, fingerprints in confirmed.items():
+            await self.service.save_fingerprints(entity, fingerprints)
+
+    def unchanged_ids(self, entity: str) -> set[int]:
+        """The eesl_ids of ``entity`` skipped as unchanged so far."""
+        return set(self._unchanged.get(entity, ()))
+
+    def summary(self) -> dict[str, dict[str, int]]:
+        """Created, updated and unchanged counts per entity kind."""
+        return {entity: dict(counts) for entity, counts in self._counts.items()}
+
+    def _count(self, entity: str, outcome: str) -> None:
+        counts = self._counts.setdefault(entity, {"created": 0, "updated": 0, "unchanged": 0})
+        counts[outcome] += 1
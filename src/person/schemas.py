@@ -7,6 +7,7 @@ from fastapi import Path
 from pydantic import BaseModel, ConfigDict, Field
 
 from src.core.schema_helpers import PaginationMetadata, make_fields_optional
+from src.core.shared_schemas import ImageVariantsSchema
 
 
 class PersonSchemaBase(BaseModel):
@@ -42,6 +43,7 @@ class UploadResizePersonPhotoResponse(BaseModel):
     original: str
     icon: str
     webview: str
+    variants: ImageVariantsSchema | None = None
 
 
 class PaginatedPersonResponse(BaseModel):
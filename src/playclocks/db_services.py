@@ -8,7 +8,7 @@ from src.core.enums import ClockStatus
 from src.core.models import BaseServiceDB, PlayClockDB, handle_service_exceptions
 from src.core.models.base import Database
 
-from ..clocks import clock_orchestrator
+from ..clocks import clock_orchestrator, is_superseded
 from ..logging_config import get_logger
 from .clock_manager import ClockManager
 from .schemas import PlayClockSchemaCreate, PlayClockSchemaUpdate
@@ -28,6 +28,8 @@ class PlayClockServiceDB(BaseServiceDB):
     def _setup_orchestrator_callbacks(self) -> None:
         clock_orchestrator.set_playclock_update_callback(self.trigger_update_playclock)
         clock_orchestrator.set_playclock_stop_callback(self._stop_playclock_internal)
+        clock_orchestrator.set_playclock_resume_callback(self.resume_playclock)
+        clock_orchestrator.set_playclock_running_callback(self.running_playclock_timelines)
 
     @handle_service_exceptions(item_name=ITEM, operation="creating")
     async def create(self, item: PlayClockSchemaCreate) -> PlayClockDB:
@@ -44,6 +46,18 @@ class PlayClockServiceDB(BaseServiceDB):
         """Handle playclock stop when it reaches 0"""
         self.logger.debug(f"Stopping playclock {playclock_id} (reached 0)")
         state_machine = self.clock_manager.get_clock_state_machine(playclock_id)
+        playclock = await self.get_by_id(playclock_id)
+        if playclock is not None and is_superseded(
+            playclock.playclock_status,
+            playclock.started_at_ms,
+            clock_orchestrator.running_playclocks.get(playclock_id) or state_machine,
+        ):
+            self.logger.info(
+                f"Playclock {playclock_id} was paused or restarted elsewhere; not persisting stop"
+            )
+            clock_orchestrator.unregister_playclock(playclock_id)
+            await self.clock_manager.end_clock(playclock_id)
+            return
         if state_machine:
             state_machine.stop()
         await self.update_with_none(
@@ -105,37 +119,33 @@ class PlayClockServiceDB(BaseServiceDB):
         self,
         item_id: int,
         item: PlayClockSchemaUpdate,
+        expected_version: int | None = None,
         **kwargs,
     ) -> PlayClockDB:
         self.logger.debug(f"Update playclock id:{item_id} data: {item}")
-        async with self.db.get_session_maker()() as session:
-            result = await session.execute(select(PlayClockDB).where(PlayClockDB.id == item_id))
-            updated_item = result.scalars().one_or_none()
-
-            if not updated_item:
-                self.logger.warning(f"PlayClock not found: {item_id}")
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"PlayClock with id {item_id} not found",
-                )
-
-            update_data = item.model_dump(exclude_unset=True)
-            update_data["version"] = (updated_item.version or 0) + 1
-
-            for key, value in update_data.items():
-                if value is not None:
-                    setattr(updated_item, key, value)
+        update_data = item.model_dump(exclude_unset=True, exclude_none=True)
+        updated_item = await self._update_or_404(item_id, update_data, expected_version)
 
-            await session.flush()
-            await session.commit()
-            await session.refresh(updated_item)
+        self.logger.debug(f"Updated playclock: {updated_item}")
+        if update_data.get("playclock_status") == ClockStatus.RUNNING:
+            await self._register_running_playclock(updated_item)
+        await self.trigger_update_playclock(item_id)
 
-            self.logger.debug(f"Updated playclock: {updated_item}")
-            if update_data.get("playclock_status") == ClockStatus.RUNNING:
-                await self._register_running_playclock(updated_item)
-            await self.trigger_update_playclock(item_id)
+        return updated_item
 
-            return updated_item
+    async def _update_or_404(
+        self, item_id: int, update_data: dict, expected_version: int | None
+    ) -> PlayClockDB:
+        updated_item = await self.update_returning(
+            item_id, update_data, expected_version=expected_version
+        )
+        if not updated_item:
+            self.logger.warning(f"PlayClock not found: {item_id}")
+            raise HTTPException(
+                status_code=404,
+                detail=f"PlayClock with id {item_id} not found",
+            )
+        return updated_item
 
     async def _register_running_playclock(self, playclock: PlayClockDB) -> None:
         state_machine = self.clock_manager.get_clock_state_machine(playclock.id)
@@ -154,40 +164,48 @@ class PlayClockServiceDB(BaseServiceDB):
         state_machine.status = ClockStatus.RUNNING
         clock_orchestrator.register_playclock(playclock.id, state_machine)
 
+    async def resume_playclock(self, playclock_id: int) -> bool:
+        """Reload a playclock before this worker takes over driving it.
+
+        Returns False when the clock is no longer running.
+        """
+        playclock = await self.get_by_id(playclock_id)
+        if playclock is None or playclock.playclock_status != ClockStatus.RUNNING:
+            await self.clock_manager.end_clock(playclock_id)
+            return False
+        await self._register_running_playclock(playclock)
+        return True
+
+    async def running_playclock_timelines(self) -> dict[int, int | None]:
+        """Map each running playclock id to its started_at_ms, for orchestrator reconciliation."""
+        async with self.db.get_session_maker()() as session:
+            result = await session.execute(
+                select(PlayClockDB.id, PlayClockDB.started_at_ms).where(
+                    PlayClockDB.playclock_status == ClockStatus.RUNNING
+                )
+            )
+            return dict(result.tuples().all())
+
     @handle_service_exceptions(item_name=ITEM, operation="updating")
     async def update_with_none(
         self,
         item_id: int,
         item: PlayClockSchemaUpdate,
+        expected_version: int | None = None,
         **kwargs,
     ) -> PlayClockDB:
         self.logger.debug(f"Update playclock with None allowed id:{item_id} data: {item}")
-        async with self.db.get_session_maker()() as session:
-            result = await session.execute(select(PlayClockDB).where(PlayClockDB.id == item_id))
-            updated_item = result.scalars().one_or_none()
-
-            if not updated_item:
-                self.logger.warning(f"PlayClock not found: {item_id}")
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"PlayClock with id {item_id} not found",
-                )
-
-            update_data = item.model_dump(exclude_unset=True)
-            update_data["version"] = (updated_item.version or 0) + 1
-
-            for key, value in update_data.items():
-                if key != "match_id" or value is not None:
-                    setattr(updated_item, key, value)
-
-            await session.flush()
-            await session.commit()
-            await session.refresh(updated_item)
+        update_data = {
+            key: value
+            for key, value in item.model_dump(exclude_unset=True).items()
+            if key != "match_id" or value is not None
+        }
+        updated_item = await self._update_or_404(item_id, update_data, expected_version)
 
-            self.logger.debug(f"Updated playclock: {updated_item}")
-            await self.trigger_update_playclock(item_id)
+        self.logger.debug(f"Updated playclock: {updated_item}")
+        await self.trigger_update_playclock(item_id)
 
-            return updated_item
+        return updated_item
 
     async def get_playclock_status(
         self,
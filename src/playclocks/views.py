@@ -6,6 +6,7 @@ from fastapi import (
     Depends,
     HTTPException,
     Path,
+    Query,
     status,
 )
 from fastapi.responses import JSONResponse
@@ -89,12 +90,14 @@ class PlayClockAPIRouter(
         async def update_playclock_(
             item_id: int,
             item: PlayClockSchemaUpdate,
+            expected_version: Annotated[int | None, Query(ge=1)] = None,
         ):
             self.logger.debug(f"Update playclock endpoint id:{item_id} data: {item}")
             try:
                 playclock_update = await self.loaded_service.update(
                     item_id,
                     item,
+                    expected_version=expected_version,
                 )
                 return playclock_update
             except HTTPException:
@@ -4,7 +4,7 @@ from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 from sqlalchemy.sql import func
 
-from src.core.decorators import handle_service_exceptions
+from src.core.decorators import handle_service_exceptions, read_only
 from src.core.models import (
     BaseServiceDB,
     PersonDB,
@@ -183,6 +183,7 @@ class PlayerServiceDB(BaseServiceDB):
         operation="searching players with pagination and details",
         return_value_on_not_found=None,
     )
+    @read_only
     async def search_players_with_pagination_details(
         self,
         sport_id: int,
@@ -286,6 +287,7 @@ class PlayerServiceDB(BaseServiceDB):
         operation="searching players with pagination and full details",
         return_value_on_not_found=None,
     )
+    @read_only
     async def search_players_with_pagination_full_details(
         self,
         sport_id: int,
@@ -401,6 +403,7 @@ class PlayerServiceDB(BaseServiceDB):
         operation="searching players with pagination and details and photos",
         return_value_on_not_found=None,
     )
+    @read_only
     async def search_players_with_pagination_details_and_photos(
         self,
         sport_id: int,
@@ -509,6 +512,7 @@ class PlayerServiceDB(BaseServiceDB):
             )
 
     @handle_service_exceptions(item_name=ITEM, operation="fetching player career data")
+    @read_only
     async def get_player_career(self, player_id: int) -> PlayerCareerResponseSchema:
         self.logger.debug(f"Get player career data for player_id:{player_id}")
 
@@ -629,6 +633,7 @@ class PlayerServiceDB(BaseServiceDB):
         operation="fetching player detail in tournament context",
         reraise_not_found=True,
     )
+    @read_only
     async def get_player_detail_in_tournament(
         self, player_id: int, tournament_id: int
     ) -> PlayerDetailInTournamentResponse:
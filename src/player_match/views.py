@@ -5,13 +5,14 @@ from fastapi import Depends, HTTPException
 from src.auth.dependencies import require_roles
 from src.core import BaseRouter, db
 from src.core.models import PlayerMatchDB
+from src.core.models.base import Database
 from src.core.service_registry import get_service_registry
 from src.helpers.photo_utils import photo_files_exist
 
 from ..logging_config import get_logger
 from ..matches.schemas import MatchSchemaBase
 from ..pars_eesl.pars_all_players_from_eesl import collect_player_full_data_eesl
-from ..pars_eesl.pars_match import ParsedMatch, logger, parse_match_and_create_jsons
+from ..pars_eesl.pars_match import ParsedMatch, parse_match_and_create_jsons
 from ..person.schemas import PersonSchemaCreate
 from ..player.schemas import PlayerSchema, PlayerSchemaCreate
 from ..player_team_tournament.schemas import (
@@ -24,6 +25,179 @@ from ..teams.schemas import TeamSchemaBase
 from .db_services import PlayerMatchServiceDB
 from .schemas import PlayerMatchSchema, PlayerMatchSchemaCreate, PlayerMatchSchemaUpdate
 
+roster_import_logger = get_logger("MatchRosterImport")
+
+
+async def load_parsed_match_roster(
+    database: Database, eesl_match_id: int
+) -> tuple[ParsedMatch, MatchSchemaBase | None, list[tuple[dict, TeamSchemaBase | None]]]:
+    """Parse an EESL match and pair each roster player with their team in the database."""
+    from ..matches.db_services import MatchServiceDB
+    from ..teams.db_services import TeamServiceDB
+
+    parsed_match: ParsedMatch = await parse_match_and_create_jsons(eesl_match_id)
+    match: MatchSchemaBase = await MatchServiceDB(database).get_match_by_eesl_id(eesl_match_id)
+    team_a: TeamSchemaBase = await TeamServiceDB(database).get_team_by_eesl_id(
+        parsed_match["team_a_eesl_id"]
+    )
+    team_b: TeamSchemaBase = await TeamServiceDB(database).get_team_by_eesl_id(
+        parsed_match["team_b_eesl_id"]
+    )
+    roster = [
+        *((player, team_a) for player in parsed_match["roster_a"]),
+        *((player, team_b) for player in parsed_match["roster_b"]),
+    ]
+    return parsed_match, match, roster
+
+
+async def import_match_roster_player(
+    database: Database,
+    player_match_service: PlayerMatchServiceDB,
+    match: MatchSchemaBase,
+    team: TeamSchemaBase,
+    roster_player: dict,
+    existing_player_ids: set,
+) -> dict | None:
+    """Create or update one parsed roster player of ``match`` playing for ``team``.
+
+    Creates the position, person (downloading the photo when missing), player and player in
+    team-tournament as needed. Returns the created player in match with its related records,
+    or None when the player is skipped.
+    """
+    from ..person.db_services import PersonServiceDB
+    from ..player.db_services import PlayerServiceDB
+    from ..player_team_tournament.db_services import PlayerTeamTournamentServiceDB
+    from ..positions.db_services import PositionServiceDB
+
+    position_service = PositionServiceDB(database)
+    player_position = roster_player.get("player_position", "").strip()
+    if not player_position:
+        roster_import_logger.debug(
+            f"Skipping player {roster_player.get('player_eesl_id')} - no position"
+        )
+        return None
+
+    try:
+        position: PositionSchemaBase = await position_service.get_position_by_title(player_position)
+    except HTTPException:
+        roster_import_logger.debug("No position found for player, creating new position")
+        position = await position_service.create(
+            PositionSchemaCreate(title=player_position, sport_id=1)
+        )
+    person = await PersonServiceDB(database).get_person_by_eesl_id(roster_player["player_eesl_id"])
+    needs_photo_download = (
+        person is None
+        or not person.person_photo_url
+        or not person.person_photo_icon_url
+        or not person.person_photo_web_url
+        or not photo_files_exist(person.person_photo_url)
+    )
+    if person is None:
+        roster_import_logger.debug("No person for player")
+    elif needs_photo_download:
+        roster_import_logger.debug(
+            f"Person exists but missing photos for {roster_player['player_eesl_id']}"
+        )
+
+    if needs_photo_download:
+        player_in_team = await collect_player_full_data_eesl(roster_player["player_eesl_id"])
+        if player_in_team is None:
+            roster_import_logger.warning(
+                f"Failed to fetch player data for {roster_player['player_eesl_id']}, skipping"
+            )
+            return None
+        person_schema = PersonSchemaCreate(**player_in_team["person"])
+        roster_import_logger.debug("Creating/updating person for player")
+        person = await PersonServiceDB(database).create_or_update_person(person_schema)
+
+    player = await PlayerServiceDB(database).get_player_by_eesl_id(roster_player["player_eesl_id"])
+    if player is None:
+        roster_import_logger.debug("Creating new player for match player")
+        player = await PlayerServiceDB(database).create_or_update_player(
+            PlayerSchemaCreate(
+                sport_id=1,
+                person_id=person.id,
+                player_eesl_id=roster_player["player_eesl_id"],
+            )
+        )
+
+    player_team_tournament_service = PlayerTeamTournamentServiceDB(database)
+    player_in_team = await player_team_tournament_service.get_player_team_tournament_by_eesl_id(
+        roster_player["player_eesl_id"]
+    )
+    player_in_team_data = {
+        "player_team_tournament_eesl_id": roster_player["player_eesl_id"],
+        "player_id": player.id,
+        "position_id": position.id,
+        "team_id": team.id,
+        "tournament_id": match.tournament_id,
+        "player_number": roster_player["player_number"],
+    }
+    if player_in_team is None:
+        roster_import_logger.debug("Creating new player in team")
+        player_in_team = (
+            await player_team_tournament_service.create_or_update_player_team_tournament(
+                PlayerTeamTournamentSchemaCreate(**player_in_team_data)
+            )
+        )
+    else:
+        roster_import_logger.debug("Player exists in team, updating")
+        player_in_team = (
+            await player_team_tournament_service.create_or_update_player_team_tournament(
+                PlayerTeamTournamentSchemaUpdate(**player_in_team_data)
+            )
+        )
+
+    if team is None or player_in_team is None:
+        roster_import_logger.debug("No team for player, continue")
+        return None
+
+    player_eesl_id = roster_player.get("player_eesl_id")
+    if player_eesl_id in existing_player_ids:
+        roster_import_logger.debug("Player already imported for this match, skipping")
+        return None
+
+    existing_player_ids.add(player_eesl_id)
+    player_schema = {
+        "player_match_eesl_id": player_eesl_id,
+        "player_team_tournament_id": player_in_team.id,
+        "match_position_id": position.id,
+        "match_id": match.id,
+        "match_number": roster_player["player_number"],
+        "team_id": team.id,
+        "is_start": False,
+    }
+
+    exist_player_in_match = await player_match_service.get_player_match_by_match_id_and_eesl_id(
+        player_schema["match_id"],
+        player_schema["player_match_eesl_id"],
+    )
+
+    if exist_player_in_match:
+        roster_import_logger.debug("Player in match exist")
+        if exist_player_in_match.is_start:
+            roster_import_logger.warning("Player in match is in Start")
+            player_schema["player_match_eesl_id"] = exist_player_in_match.player_match_eesl_id
+            player_schema["player_team_tournament_id"] = (
+                exist_player_in_match.player_team_tournament_id
+            )
+            player_schema["match_position_id"] = exist_player_in_match.match_position_id
+            player_schema["match_id"] = exist_player_in_match.match_id
+            player_schema["match_number"] = exist_player_in_match.match_number
+            player_schema["team_id"] = exist_player_in_match.team_id
+            player_schema["is_start"] = True
+            position = await position_service.get_by_id(exist_player_in_match.match_position_id)
+
+    created_player = await player_match_service.create_or_update_player_match(
+        PlayerMatchSchemaCreate(**player_schema)
+    )
+    return {
+        "match_player": created_player,
+        "person": person,
+        "player_team_tournament": player_in_team,
+        "position": position,
+    }
+
 
 class PlayerMatchAPIRouter(
     BaseRouter[
@@ -153,29 +327,13 @@ class PlayerMatchAPIRouter(
             eesl_match_id: int,
         ):
             self.logger.debug(f"Start parsing eesl match endpoint with eesl_id:{eesl_match_id}")
-            from ..matches.db_services import MatchServiceDB
-            from ..person.db_services import PersonServiceDB
-            from ..player.db_services import PlayerServiceDB
-            from ..player_team_tournament.db_services import (
-                PlayerTeamTournamentServiceDB,
-            )
-            from ..positions.db_services import PositionServiceDB
-            from ..teams.db_services import TeamServiceDB
-
             try:
                 # Get database from service registry for correct event loop context
                 registry = get_service_registry()
                 database = registry.database
 
-                parsed_match: ParsedMatch = await parse_match_and_create_jsons(eesl_match_id)
-                match_service = MatchServiceDB(database)
-                position_service = PositionServiceDB(database)
-                match: MatchSchemaBase = await match_service.get_match_by_eesl_id(eesl_match_id)
-                team_a: TeamSchemaBase = await TeamServiceDB(database).get_team_by_eesl_id(
-                    parsed_match["team_a_eesl_id"]
-                )
-                team_b: TeamSchemaBase = await TeamServiceDB(database).get_team_by_eesl_id(
-                    parsed_match["team_b_eesl_id"]
+                parsed_match, match, roster = await load_parsed_match_roster(
+                    database, eesl_match_id
                 )
 
                 created_players_match = []
@@ -183,338 +341,17 @@ class PlayerMatchAPIRouter(
                 if parsed_match and match:
                     self.logger.debug("Got parse match and match in db")
                     existing_player_ids = set()
-                    for home_player in parsed_match["roster_a"]:
-                        player_position = home_player.get("player_position", "").strip()
-                        if not player_position:
-                            self.logger.debug(
-                                f"Skipping home player {home_player.get('player_eesl_id')} - no position"
-                            )
-                            continue
-
-                        try:
-                            position: PositionSchemaBase = (
-                                await position_service.get_position_by_title(player_position)
-                            )
-                        except HTTPException:
-                            self.logger.debug("No position found for home player")
-                            position_schema = {
-                                "title": player_position,
-                                "sport_id": 1,
-                            }
-                            self.logger.debug("Creating new position for home player")
-                            position = await PositionServiceDB(database).create(
-                                PositionSchemaCreate(**position_schema)
-                            )
-                        person = await PersonServiceDB(database).get_person_by_eesl_id(
-                            home_player["player_eesl_id"]
-                        )
-                        needs_photo_download = (
-                            person is None
-                            or not person.person_photo_url
-                            or not person.person_photo_icon_url
-                            or not person.person_photo_web_url
-                            or not photo_files_exist(person.person_photo_url)
-                        )
-                        if person is None:
-                            self.logger.debug("No person for home player")
-                        elif needs_photo_download:
-                            self.logger.debug(
-                                f"Person exists but missing photos for {home_player['player_eesl_id']}"
-                            )
-
-                        if needs_photo_download:
-                            player_in_team = await collect_player_full_data_eesl(
-                                home_player["player_eesl_id"]
-                            )
-                            if player_in_team is None:
-                                self.logger.warning(
-                                    f"Failed to fetch player data for {home_player['player_eesl_id']}, skipping"
-                                )
-                                continue
-                            person_schema = PersonSchemaCreate(**player_in_team["person"])
-                            self.logger.debug("Creating/updating person for home player")
-                            person = await PersonServiceDB(database).create_or_update_person(
-                                person_schema
-                            )
-
-                        player = await PlayerServiceDB(database).get_player_by_eesl_id(
-                            home_player["player_eesl_id"]
-                        )
-                        if player is None:
-                            self.logger.debug("No player for home match player")
-                            player_schema = PlayerSchemaCreate(
-                                **{
-                                    "sport_id": 1,
-                                    "person_id": person.id,
-                                    "player_eesl_id": home_player["player_eesl_id"],
-                                }
-                            )
-                            self.logger.debug("Creating new player for home player")
-                            player = await PlayerServiceDB(database).create_or_update_player(
-                                player_schema
-                            )
-
-                        player_in_team = await PlayerTeamTournamentServiceDB(
-                            database
-                        ).get_player_team_tournament_by_eesl_id(home_player["player_eesl_id"])
-
-                        if player_in_team is None:
-                            self.logger.debug("No player in team for home player")
-                            created_player_in_team_schema = PlayerTeamTournamentSchemaCreate(
-                                **{
-                                    "player_team_tournament_eesl_id": home_player["player_eesl_id"],
-                                    "player_id": player.id,
-                                    "position_id": position.id,
-                                    "team_id": team_a.id,
-                                    "tournament_id": match.tournament_id,
-                                    "player_number": home_player["player_number"],
-                                }
-                            )
-                            self.logger.debug("Creating new player in team for home player")
-                            player_in_team = await PlayerTeamTournamentServiceDB(
-                                database
-                            ).create_or_update_player_team_tournament(created_player_in_team_schema)
-                        else:
-                            self.logger.debug("Player exists in team for home player, updating")
-                            updated_player_in_team_schema = PlayerTeamTournamentSchemaUpdate(
-                                **{
-                                    "player_team_tournament_eesl_id": home_player["player_eesl_id"],
-                                    "player_id": player.id,
-                                    "position_id": position.id,
-                                    "team_id": team_a.id,
-                                    "tournament_id": match.tournament_id,
-                                    "player_number": home_player["player_number"],
-                                }
-                            )
-                            player_in_team = await PlayerTeamTournamentServiceDB(
-                                database
-                            ).create_or_update_player_team_tournament(updated_player_in_team_schema)
-
-                        if team_a is None or player_in_team is None:
-                            self.logger.debug("No team for home player, continue")
-                            continue
-
-                        player_eesl_id = home_player.get("player_eesl_id")
-                        if player_eesl_id in existing_player_ids:
-                            self.logger.debug("No eesl id for home player, skipping")
-                            continue
-
-                        existing_player_ids.add(player_eesl_id)
-                        player_schema = {
-                            "player_match_eesl_id": player_eesl_id,
-                            "player_team_tournament_id": player_in_team.id,
-                            "match_position_id": position.id,
-                            "match_id": match.id,
-                            "match_number": home_player["player_number"],
-                            "team_id": team_a.id,
-                            "is_start": False,
-                        }
-
-                        exist_player_in_match = (
-                            await self.loaded_service.get_player_match_by_match_id_and_eesl_id(
-                                player_schema["match_id"],
-                                player_schema["player_match_eesl_id"],
-                            )
-                        )
-
-                        if exist_player_in_match:
-                            self.logger.debug("Player in match exist")
-                            if exist_player_in_match.is_start:
-                                self.logger.warning("Player in match is in Start")
-                                player_schema["player_match_eesl_id"] = (
-                                    exist_player_in_match.player_match_eesl_id
-                                )
-                                player_schema["player_team_tournament_id"] = (
-                                    exist_player_in_match.player_team_tournament_id
-                                )
-                                player_schema["match_position_id"] = (
-                                    exist_player_in_match.match_position_id
-                                )
-                                player_schema["match_id"] = exist_player_in_match.match_id
-                                player_schema["match_number"] = exist_player_in_match.match_number
-                                player_schema["team_id"] = exist_player_in_match.team_id
-                                player_schema["is_start"] = True
-                                position = await PositionServiceDB(database).get_by_id(
-                                    exist_player_in_match.match_position_id
-                                )
-
-                        player = PlayerMatchSchemaCreate(**player_schema)
-                        created_player = await self.loaded_service.create_or_update_player_match(player)
-                        created_players_match.append(
-                            {
-                                "match_player": created_player,
-                                "person": person,
-                                "player_team_tournament": player_in_team,
-                                "position": position,
-                            }
-                        )
-
-                    for away_player in parsed_match["roster_b"]:
-                        player_position = away_player.get("player_position", "").strip()
-                        if not player_position:
-                            self.logger.debug(
-                                f"Skipping away player {away_player.get('player_eesl_id')} - no position"
-                            )
-                            continue
-
-                        try:
-                            position = await position_service.get_position_by_title(player_position)
-                        except HTTPException:
-                            self.logger.debug("No position for away player")
-                            position_schema = {
-                                "title": player_position,
-                                "sport_id": 1,
-                            }
-                            self.logger.debug("Creating new position for away player")
-                            position = await PositionServiceDB(database).create(
-                                PositionSchemaCreate(**position_schema)
-                            )
-                        person = await PersonServiceDB(database).get_person_by_eesl_id(
-                            away_player["player_eesl_id"]
-                        )
-                        needs_photo_download = (
-                            person is None
-                            or not person.person_photo_url
-                            or not person.person_photo_icon_url
-                            or not person.person_photo_web_url
-                            or not photo_files_exist(person.person_photo_url)
-                        )
-                        if person is None:
-                            self.logger.debug("No person for away player")
-                        elif needs_photo_download:
-                            self.logger.debug(
-                                f"Person exists but missing photos for {away_player['player_eesl_id']}"
-                            )
-
-                        if needs_photo_download:
-                            player_in_team = await collect_player_full_data_eesl(
-                                away_player["player_eesl_id"]
-                            )
-                            if player_in_team is None:
-                                self.logger.warning(
-                                    f"Failed to fetch player data for {away_player['player_eesl_id']}, skipping"
-                                )
-                                continue
-                            person_schema = PersonSchemaCreate(**player_in_team["person"])
-                            self.logger.debug("Creating/updating person for away player")
-                            person = await PersonServiceDB(database).create_or_update_person(
-                                person_schema
-                            )
-
-                        player = await PlayerServiceDB(database).get_player_by_eesl_id(
-                            away_player["player_eesl_id"]
-                        )
-                        if player is None:
-                            self.logger.debug("No player for away match player")
-                            player_schema = PlayerSchemaCreate(
-                                **{
-                                    "sport_id": 1,
-                                    "person_id": person.id,
-                                    "player_eesl_id": away_player["player_eesl_id"],
-                                }
-                            )
-                            self.logger.debug("Creating new player for away player")
-                            player = await PlayerServiceDB(database).create_or_update_player(
-                                player_schema
-                            )
-
-                        player_in_team = await PlayerTeamTournamentServiceDB(
-                            database
-                        ).get_player_team_tournament_by_eesl_id(away_player["player_eesl_id"])
-
-                        if player_in_team is None:
-                            created_player_in_team_schema = PlayerTeamTournamentSchemaCreate(
-                                **{
-                                    "player_team_tournament_eesl_id": away_player["player_eesl_id"],
-                                    "player_id": player.id,
-                                    "position_id": position.id,
-                                    "team_id": team_b.id,
-                                    "tournament_id": match.tournament_id,
-                                    "player_number": away_player["player_number"],
-                                }
-                            )
-                            logger.debug("Creating new player in team for away player")
-                            player_in_team = await PlayerTeamTournamentServiceDB(
-                                database
-                            ).create_or_update_player_team_tournament(created_player_in_team_schema)
-                        else:
-                            logger.debug("Player in team exists, updating player")
-                            updated_player_in_team_schema = PlayerTeamTournamentSchemaUpdate(
-                                **{
-                                    "player_team_tournament_eesl_id": away_player["player_eesl_id"],
-                                    "player_id": player.id,
-                                    "position_id": position.id,
-                                    "team_id": team_b.id,
-                                    "tournament_id": match.tournament_id,
-                                    "player_number": away_player["player_number"],
-                                }
-                            )
-                            player_in_team = await PlayerTeamTournamentServiceDB(
-                                database
-                            ).create_or_update_player_team_tournament(updated_player_in_team_schema)
-
-                        # player_in_team = await PlayerTeamTournamentServiceDB(db).get_player_team_tournament_by_eesl_id(
-                        #     away_player['player_eesl_id'])
-
-                        if team_b is None or player_in_team is None:
-                            self.logger.debug("No team for away player, continue")
-                            continue
-
-                        player_eesl_id = away_player.get("player_eesl_id")
-                        if player_eesl_id in existing_player_ids:
-                            self.logger.debug("No eesl id for away player, skipping")
-                            continue
-
-                        existing_player_ids.add(player_eesl_id)
-                        player_schema = {
-                            "player_match_eesl_id": player_eesl_id,
-                            "player_team_tournament_id": player_in_team.id,
-                            "match_position_id": position.id,
-                            "match_id": match.id,
-                            "match_number": away_player["player_number"],
-                            "team_id": team_b.id,
-                            "is_start": False,
-                        }
-
-                        exist_player_in_match = (
-                            await self.loaded_service.get_player_match_by_match_id_and_eesl_id(
-                                player_schema["match_id"],
-                                player_schema["player_match_eesl_id"],
-                            )
-                        )
-
-                        if exist_player_in_match:
-                            self.logger.debug("Player in already in match")
-                            if exist_player_in_match.is_start:
-                                self.logger.warning("Player in start")
-                                player_schema["player_match_eesl_id"] = (
-                                    exist_player_in_match.player_match_eesl_id
-                                )
-                                player_schema["player_team_tournament_id"] = (
-                                    exist_player_in_match.player_team_tournament_id
-                                )
-                                player_schema["match_position_id"] = (
-                                    exist_player_in_match.match_position_id
-                                )
-                                player_schema["match_id"] = exist_player_in_match.match_id
-                                player_schema["match_number"] = exist_player_in_match.match_number
-                                player_schema["team_id"] = exist_player_in_match.team_id
-                                player_schema["is_start"] = True
-                                position = await PositionServiceDB(database).get_by_id(
-                                    exist_player_in_match.match_position_id
-                                )
-
-                        self.logger.debug("Creating player in match")
-                        player = PlayerMatchSchemaCreate(**player_schema)
-                        created_player = await self.loaded_service.create_or_update_player_match(player)
-                        created_players_match.append(
-                            {
-                                "match_player": created_player,
-                                "person": person,
-                                "player_team_tournament": player_in_team,
-                                "position": position,
-                            }
+                    for roster_player, team in roster:
+                        created = await import_match_roster_player(
+                            database,
+                            self.loaded_service,
+                            match,
+                            team,
+                            roster_player,
+                            existing_player_ids,
                         )
+                        if created:
+                            created_players_match.append(created)
 
                     return created_players_match
                 else:
@@ -2,6 +2,7 @@ from fastapi import HTTPException
 from sqlalchemy import func, select
 from sqlalchemy.orm import selectinload
 
+from src.auth.principal_cache import principal_cache
 from src.core.decorators import handle_service_exceptions
 from src.core.models import BaseServiceDB, RoleDB, UserRoleDB
 from src.core.models.base import Database
@@ -93,6 +94,8 @@ class RoleServiceDB(BaseServiceDB, SearchPaginationMixin):
 
             await session.commit()
             await session.refresh(role)
+            if "name" in update_data:
+                principal_cache.clear()
             return role
 
     async def delete(
@@ -8,7 +8,10 @@ logger = get_logger("server")
 
 
 class StatsboardUvicornWorker(UvicornWorker):
-    CONFIG_KWARGS = {"ws_per_message_deflate": True}
+    CONFIG_KWARGS = {
+        "ws": "src.utils.websocket.deflate:SmallFrameDeflateWebSocketProtocol",
+        "ws_per_message_deflate": True,
+    }
 
 
 class Application(BaseApplication):
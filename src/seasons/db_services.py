@@ -3,7 +3,7 @@ from sqlalchemy import and_, asc, select, update
 from sqlalchemy.sql import func
 
 from src.core.config import settings
-from src.core.decorators import handle_service_exceptions
+from src.core.decorators import handle_service_exceptions, read_only
 from src.core.models import (
     BaseServiceDB,
     MatchDB,
@@ -233,6 +233,7 @@ class SeasonServiceDB(BaseServiceDB, SearchPaginationMixin):
         operation="searching seasons with pagination",
         return_value_on_not_found=None,
     )
+    @read_only
     async def search_seasons_with_pagination(
         self,
         search_query: str | None = None,
@@ -8,6 +8,7 @@ from src.core.models import (
     PlayerTeamTournamentDB,
     TeamDB,
     handle_service_exceptions,
+    read_only,
 )
 from src.core.models.base import Database
 from src.core.schema_helpers import PaginationMetadata
@@ -63,6 +64,7 @@ class TeamServiceDB(BaseServiceDB):
         operation="fetching team with details",
         return_value_on_not_found=None,
     )
+    @read_only
     async def get_team_with_details(
         self,
         team_id: int,
@@ -167,6 +169,7 @@ class TeamServiceDB(BaseServiceDB):
         operation="searching teams with pagination",
         return_value_on_not_found=None,
     )
+    @read_only
     async def search_teams_with_pagination(
         self,
         search_query: str | None = None,
@@ -222,6 +225,7 @@ class TeamServiceDB(BaseServiceDB):
         operation="searching teams by sport with pagination",
         return_value_on_not_found=None,
     )
+    @read_only
     async def search_teams_by_sport_with_pagination(
         self,
         sport_id: int,
@@ -269,6 +273,7 @@ class TeamServiceDB(BaseServiceDB):
         operation="searching teams with pagination and details",
         return_value_on_not_found=None,
     )
+    @read_only
     async def search_teams_with_details_pagination(
         self,
         search_query: str | None = None,
@@ -6,7 +6,7 @@ from fastapi import Path
 from pydantic import BaseModel, ConfigDict, Field
 
 from src.core.schema_helpers import PaginationMetadata, make_fields_optional
-from src.core.shared_schemas import PrivacyFieldsBase, SponsorFieldsBase
+from src.core.shared_schemas import ImageVariantsSchema, PrivacyFieldsBase, SponsorFieldsBase
 from src.sponsor_lines.schemas import SponsorLineSchema
 from src.sponsors.schemas import SponsorSchema
 from src.sports.schemas import SportSchema
@@ -55,6 +55,7 @@ class UploadResizeTeamLogoResponse(BaseModel):
         ..., examples=["https://example.com/uploads/icons/manchester-united-icon.png"]
     )
     webview: str = Field(..., examples=["https://example.com/uploads/web/manchester-united.png"])
+    variants: ImageVariantsSchema | None = None
 
 
 class PaginatedTeamResponse(BaseModel):
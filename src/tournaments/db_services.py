@@ -4,7 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload, selectinload
 from sqlalchemy.sql import func
 
-from src.core.decorators import handle_service_exceptions
+from src.core.decorators import handle_service_exceptions, read_only
 from src.core.models import (
     BaseServiceDB,
     MatchDB,
@@ -79,6 +79,7 @@ class TournamentServiceDB(BaseServiceDB):
         operation="fetching tournament with details",
         return_value_on_not_found=None,
     )
+    @read_only
     async def get_tournament_with_details(
         self,
         tournament_id: int,
@@ -922,6 +923,7 @@ class TournamentServiceDB(BaseServiceDB):
         operation="searching tournaments with pagination and details",
         return_value_on_not_found=None,
     )
+    @read_only
     async def search_tournaments_with_details_pagination(
         self,
         search_query: str | None = None,
@@ -6,7 +6,7 @@ from fastapi import Path
 from pydantic import BaseModel, ConfigDict, Field
 
 from src.core.schema_helpers import PaginationMetadata, make_fields_optional
-from src.core.shared_schemas import PrivacyFieldsBase, SponsorFieldsBase
+from src.core.shared_schemas import ImageVariantsSchema, PrivacyFieldsBase, SponsorFieldsBase
 from src.seasons.schemas import SeasonSchema
 from src.sponsor_lines.schemas import SponsorLineSchema
 from src.sponsors.schemas import SponsorSchema
@@ -48,6 +48,7 @@ class UploadResizeTournamentLogoResponse(BaseModel):
     original: str = Field(..., examples=["https://example.com/uploads/logos/premier-league.png"])
     icon: str = Field(..., examples=["https://example.com/uploads/icons/premier-league-icon.png"])
     webview: str = Field(..., examples=["https://example.com/web/premier-league.png"])
+    variants: ImageVariantsSchema | None = None
 
 
 class TournamentSchema(TournamentSchemaBase):
@@ -3,10 +3,15 @@
 from datetime import UTC, datetime, timedelta
 
 from fastapi import HTTPException
-from sqlalchemy import func, or_, select, update
+from sqlalchemy import DateTime, Integer, column, func, or_, select, update, values
 from sqlalchemy.orm import selectinload
 
-from src.auth.security import get_password_hash, verify_password
+from src.auth.principal_cache import principal_cache
+from src.auth.security import (
+    get_password_hash_async,
+    password_needs_rehash,
+    verify_password_async,
+)
 from src.core.models import (
     BaseServiceDB,
     RoleDB,
@@ -17,6 +22,7 @@ from src.core.models.base import Database
 from src.core.schema_helpers import PaginationMetadata
 from src.logging_config import get_logger
 
+from .heartbeat_buffer import heartbeat_buffer
 from .schemas import PaginatedUserResponse, UserSchema, UserSchemaCreate, UserSchemaUpdate
 
 ITEM = "USER"
@@ -39,7 +45,7 @@ class UserServiceDB(BaseServiceDB):
             UserDB: Created user.
         """
         item_dict = item.model_dump()
-        item_dict["hashed_password"] = get_password_hash(item_dict.pop("password"))
+        item_dict["hashed_password"] = await get_password_hash_async(item_dict.pop("password"))
 
         user = UserDB(**item_dict)
         async with self.db.get_session_maker()() as session:
@@ -98,7 +104,8 @@ class UserServiceDB(BaseServiceDB):
         async with self.db.get_session_maker()() as session:
             stmt = select(UserDB).where(UserDB.id == user_id).options(selectinload(UserDB.roles))
             results = await session.execute(stmt)
-            return results.scalar_one_or_none()
+            user = results.scalar_one_or_none()
+            return heartbeat_buffer.overlay(user) if user is not None else None
 
     async def update(
         self,
@@ -133,11 +140,15 @@ class UserServiceDB(BaseServiceDB):
 
             update_data = item.model_dump(exclude_unset=True)
 
+            if update_data.get("is_active") is False and user.is_active:
+                user.token_version += 1
+
             for field, value in update_data.items():
                 setattr(user, field, value)
 
             await session.commit()
             await session.refresh(user)
+            principal_cache.invalidate(item_id)
             return user
 
     async def change_password(
@@ -171,15 +182,17 @@ class UserServiceDB(BaseServiceDB):
                     detail=f"{ITEM} with id {user_id} not found",
                 )
 
-            if not verify_password(old_password, user.hashed_password):
+            if not await verify_password_async(old_password, user.hashed_password):
                 raise HTTPException(
                     status_code=400,
                     detail="Incorrect password",
                 )
 
-            user.hashed_password = get_password_hash(new_password)
+            user.hashed_password = await get_password_hash_async(new_password)
+            user.token_version += 1
             await session.commit()
             await session.refresh(user)
+            principal_cache.invalidate(user_id)
             return user
 
     async def admin_change_password(
@@ -211,9 +224,11 @@ class UserServiceDB(BaseServiceDB):
                     detail=f"{ITEM} with id {user_id} not found",
                 )
 
-            user.hashed_password = get_password_hash(new_password)
+            user.hashed_password = await get_password_hash_async(new_password)
+            user.token_version += 1
             await session.commit()
             await session.refresh(user)
+            principal_cache.invalidate(user_id)
             return user
 
     async def assign_role(
@@ -264,6 +279,7 @@ class UserServiceDB(BaseServiceDB):
             user.roles.append(role)
             await session.commit()
             await session.refresh(user)
+            principal_cache.invalidate(user_id)
             return user
 
     async def remove_role(
@@ -310,6 +326,17 @@ class UserServiceDB(BaseServiceDB):
 
             user.roles.remove(role)
             await session.commit()
+            principal_cache.invalidate(user_id)
+
+    async def delete(self, item_id: int):
+        """Delete a user and drop its cached principal.
+
+        Args:
+            item_id: User ID to delete.
+        """
+        result = await super().delete(item_id)
+        principal_cache.invalidate(item_id)
+        return result
 
     async def authenticate(
         self,
@@ -328,7 +355,7 @@ class UserServiceDB(BaseServiceDB):
         self.logger.debug(f"Authenticate {ITEM} username:{username}")
         user = await self.get_by_username(username)
 
-        if user is None or not verify_password(password, user.hashed_password):
+        if user is None or not await verify_password_async(password, user.hashed_password):
             return None
 
         if not user.is_active:
@@ -337,23 +364,74 @@ class UserServiceDB(BaseServiceDB):
                 detail="User account is inactive",
             )
 
+        if password_needs_rehash(user.hashed_password):
+            await self._rehash_password(user, password)
+
         return user
 
+    async def _rehash_password(self, user: UserDB, password: str) -> None:
+        """Re-hash a verified password with the configured work factor."""
+        self.logger.debug(f"Rehash password for {ITEM} id:{user.id}")
+        new_hash = await get_password_hash_async(password)
+        async with self.db.get_session_maker()() as session:
+            # Skip if the password was changed concurrently.
+            await session.execute(
+                update(UserDB)
+                .where(UserDB.id == user.id, UserDB.hashed_password == user.hashed_password)
+                .values(hashed_password=new_hash)
+            )
+            await session.commit()
+        user.hashed_password = new_hash
+
     async def heartbeat(self, user_id: int) -> None:
-        """Update user's last_online timestamp and set is_online to True.
+        """Record a heartbeat for the user.
+
+        The heartbeat is buffered in memory and written by flush_heartbeats.
 
         Args:
             user_id: User ID to update.
         """
         self.logger.debug(f"Heartbeat for {ITEM} id:{user_id}")
-        async with self.db.get_session_maker()() as session:
-            stmt = (
-                update(UserDB)
-                .where(UserDB.id == user_id)
-                .values(last_online=datetime.now(UTC), is_online=True)
-            )
-            await session.execute(stmt)
-            await session.commit()
+        heartbeat_buffer.record(user_id)
+
+    async def flush_heartbeats(self, timeout_minutes: int = 2) -> tuple[int, int]:
+        """Write buffered heartbeats and mark stale users offline in one transaction.
+
+        Args:
+            timeout_minutes: Minutes of inactivity before marking offline.
+
+        Returns:
+            tuple[int, int]: Number of heartbeats flushed and users marked offline.
+        """
+        pending = heartbeat_buffer.drain()
+        try:
+            async with self.db.get_session_maker()() as session:
+                if pending:
+                    heartbeats = values(
+                        column("id", Integer),
+                        column("last_online", DateTime(timezone=True)),
+                        name="heartbeats",
+                    ).data(list(pending.items()))
+                    await session.execute(
+                        update(UserDB)
+                        .where(UserDB.id == heartbeats.c.id)
+                        .values(
+                            # Another worker may already have flushed a newer heartbeat.
+                            last_online=func.greatest(
+                                func.coalesce(UserDB.last_online, heartbeats.c.last_online),
+                                heartbeats.c.last_online,
+                            ),
+                            is_online=True,
+                        )
+                    )
+                result = await session.execute(self._stale_users_offline_stmt(timeout_minutes))
+                await session.commit()
+        except Exception:
+            heartbeat_buffer.restore(pending)
+            raise
+        if pending:
+            self.logger.debug(f"Flushed {len(pending)} {ITEM} heartbeats")
+        return len(pending), result.rowcount
 
     async def mark_stale_users_offline(self, timeout_minutes: int = 2) -> int:
         """Mark users as offline if they haven't been seen for timeout_minutes.
@@ -366,22 +444,26 @@ class UserServiceDB(BaseServiceDB):
         """
         self.logger.debug(f"Marking stale users offline (timeout: {timeout_minutes} minutes)")
         async with self.db.get_session_maker()() as session:
-            cutoff_time = datetime.now(UTC) - timedelta(minutes=timeout_minutes)
-            stmt = (
-                update(UserDB)
-                .where(
-                    or_(
-                        UserDB.last_online < cutoff_time,
-                        UserDB.last_online.is_(None),  # Include users who never had a heartbeat
-                    )
-                )
-                .where(UserDB.is_online.is_(True))
-                .values(is_online=False)
-            )
-            result = await session.execute(stmt)
+            result = await session.execute(self._stale_users_offline_stmt(timeout_minutes))
             await session.commit()
             return result.rowcount
 
+    @staticmethod
+    def _stale_users_offline_stmt(timeout_minutes: int):
+        cutoff_time = datetime.now(UTC) - timedelta(minutes=timeout_minutes)
+        return (
+            update(UserDB)
+            .where(
+                or_(
+                    UserDB.last_online < cutoff_time,
+                    UserDB.last_online.is_(None),  # Include users who never had a heartbeat
+                )
+            )
+            .where(UserDB.is_online.is_(True))
+            .where(UserDB.id.not_in(heartbeat_buffer.user_ids()))
+            .values(is_online=False)
+        )
+
     @handle_service_exceptions(
         item_name=ITEM,
         operation="searching users with pagination",
@@ -409,8 +491,15 @@ class UserServiceDB(BaseServiceDB):
             if role_names:
                 base_query = base_query.join(UserDB.roles).where(RoleDB.name.in_(role_names))
 
-            if is_online is not None:
-                base_query = base_query.where(UserDB.is_online == is_online)
+            buffered_ids = heartbeat_buffer.user_ids()
+            if is_online is True:
+                base_query = base_query.where(
+                    or_(UserDB.is_online.is_(True), UserDB.id.in_(buffered_ids))
+                )
+            elif is_online is False:
+                base_query = base_query.where(
+                    UserDB.is_online.is_(False), UserDB.id.not_in(buffered_ids)
+                )
 
             if search_query:
                 search_pattern = await self._build_search_pattern(search_query)
@@ -428,7 +517,7 @@ class UserServiceDB(BaseServiceDB):
 
             data_query = base_query.order_by(order_expr, order_expr_two).offset(skip).limit(limit)
             result = await session.execute(data_query)
-            users = result.scalars().all()
+            users = [heartbeat_buffer.overlay(user) for user in result.scalars().all()]
 
             return PaginatedUserResponse(
                 data=[
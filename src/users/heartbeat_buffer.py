@@ -0,0 +1,56 @@
+"""In-memory write-behind buffer for user heartbeats.
+
+Heartbeats are recorded here instead of being written one UPDATE at a time. A
+background task periodically drains the buffer and flushes it to the database in a
+single batched statement (see UserServiceDB.flush_heartbeats). Until then, user
+reads overlay the buffered timestamps so online status stays current.
+"""
+
+from datetime import UTC, datetime
+
+from sqlalchemy.orm.attributes import set_committed_value
+
+from src.core.models import UserDB
+
+
+class HeartbeatBuffer:
+    """Latest unflushed heartbeat timestamp per user id."""
+
+    def __init__(self) -> None:
+        self._pending: dict[int, datetime] = {}
+
+    def record(self, user_id: int, at: datetime | None = None) -> None:
+        at = at or datetime.now(UTC)
+        previous = self._pending.get(user_id)
+        if previous is None or previous < at:
+            self._pending[user_id] = at
+
+    def last_seen(self, user_id: int) -> datetime | None:
+        return self._pending.get(user_id)
+
+    def user_ids(self) -> list[int]:
+        return list(self._pending)
+
+    def drain(self) -> dict[int, datetime]:
+        """Take every pending heartbeat, leaving the buffer empty."""
+        pending, self._pending = self._pending, {}
+        return pending
+
+    def restore(self, pending: dict[int, datetime]) -> None:
+        """Put back heartbeats from a failed flush without overwriting newer ones."""
+        for user_id, at in pending.items():
+            self.record(user_id, at)
+
+    def overlay(self, user: UserDB) -> UserDB:
+        """Apply a buffered heartbeat to a loaded user without marking it dirty."""
+        at = self._pending.get(user.id)
+        if at is not None:
+            set_committed_value(user, "last_online", at)
+            set_committed_value(user, "is_online", True)
+        return user
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+
+heartbeat_buffer = HeartbeatBuffer()
@@ -6,6 +6,7 @@ from fastapi import Depends, HTTPException, Query
 
 from src.auth.dependencies import CurrentUser, UserService, require_roles
 from src.auth.schemas import UserRoleAssign
+from src.auth.security import create_access_token
 from src.core import BaseRouter
 from src.core.models import UserDB
 from src.logging_config import get_logger
@@ -142,7 +143,10 @@ class UserAPIRouter(BaseRouter[UserSchema, UserSchemaCreate, UserSchemaUpdate]):
         @router.post(
             "/me/change-password",
             summary="Change own password",
-            description="Change password for current user. Requires verification of current password.",
+            description=(
+                "Change password for current user. Requires verification of current password. "
+                "Existing tokens are revoked; the response carries a fresh access token."
+            ),
             responses={
                 200: {"description": "Password changed successfully"},
                 400: {"description": "Incorrect current password"},
@@ -154,14 +158,19 @@ class UserAPIRouter(BaseRouter[UserSchema, UserSchemaCreate, UserSchemaUpdate]):
             password_data: UserChangePassword,
             current_user: CurrentUser,
         ):
-            """Change own password."""
+            """Change own password and return a token for the new token version."""
             self.logger.debug(f"Change own password for user: {current_user.id}")
-            await user_service.change_password(
+            user = await user_service.change_password(
                 current_user.id,
                 password_data.old_password,
                 password_data.new_password,
             )
-            return {"message": "Password changed successfully"}
+            access_token = create_access_token(data={"sub": str(user.id), "tv": user.token_version})
+            return {
+                "message": "Password changed successfully",
+                "access_token": access_token,
+                "token_type": "bearer",
+            }
 
         @router.post(
             "/{user_id}/roles",
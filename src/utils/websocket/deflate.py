@@ -0,0 +1,64 @@
+"""permessage-deflate that leaves small frames uncompressed.
+
+Compressing a clock tick or a ping costs more CPU than the few bytes it saves, which matters on
+the low-end PCs and LED controllers that run overlays. RFC 7692 lets the sender choose per
+message: an uncompressed message simply goes out without the RSV1 bit, and with context
+takeover both sides' windows only ever contain compressed messages, so skipping some is safe.
+"""
+
+from typing import Any
+
+from uvicorn.protocols.websockets.websockets_sansio_impl import WebSocketsSansIOProtocol
+from websockets.extensions.permessage_deflate import (
+    PerMessageDeflate,
+    ServerPerMessageDeflateFactory,
+)
+from websockets.frames import BINARY, TEXT, Frame
+
+from src.core.config import settings
+
+
+class SmallFrameDeflate(PerMessageDeflate):
+    def __init__(self, *args: Any, min_bytes: int, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.min_bytes = min_bytes
+
+    def encode(self, frame: Frame) -> Frame:
+        # Only whole messages can be skipped; a fragmented message is compressed throughout.
+        if frame.opcode in (TEXT, BINARY) and frame.fin and len(frame.data) < self.min_bytes:
+            return frame
+        return super().encode(frame)
+
+
+class SmallFrameDeflateFactory(ServerPerMessageDeflateFactory):
+    def __init__(self, *args: Any, min_bytes: int, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.min_bytes = min_bytes
+
+    def process_request_params(self, *args: Any, **kwargs: Any) -> tuple[Any, PerMessageDeflate]:
+        params, extension = super().process_request_params(*args, **kwargs)
+        return params, SmallFrameDeflate(
+            extension.remote_no_context_takeover,
+            extension.local_no_context_takeover,
+            extension.remote_max_window_bits,
+            extension.local_max_window_bits,
+            extension.compress_settings,
+            min_bytes=self.min_bytes,
+        )
+
+
+class SmallFrameDeflateWebSocketProtocol(WebSocketsSansIOProtocol):
+    """uvicorn's default websocket protocol, negotiating ``SmallFrameDeflate``."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        if self.config.ws_per_message_deflate:
+            # Same window and memory settings as uvicorn's own deflate factory.
+            self.conn.available_extensions = [
+                SmallFrameDeflateFactory(
+                    server_max_window_bits=12,
+                    client_max_window_bits=12,
+                    compress_settings={"memLevel": 5},
+                    min_bytes=settings.websocket_deflate_min_bytes,
+                )
+            ]
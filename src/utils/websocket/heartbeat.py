@@ -0,0 +1,103 @@
+"""Per-worker heartbeat for match websockets.
+
+A single scheduler pings every connected socket, and sends ``time-sync`` to clock-extrapolating
+clients, in batches. This replaces a sleep loop per connection. A socket whose heartbeat send
+fails is recorded as unreachable; ``cleanup_stale_connections`` disconnects those together
+with clients whose last activity timed out.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from typing import Any
+
+from starlette.websockets import WebSocket, WebSocketState
+
+from src.logging_config import get_logger
+
+
+class HeartbeatScheduler:
+    """Liveness of a worker's match websockets and the loop that pings them."""
+
+    def __init__(
+        self,
+        ping_interval_seconds: float,
+        time_sync_interval_seconds: float,
+        batch_size: int,
+    ) -> None:
+        self.ping_interval_seconds = ping_interval_seconds
+        self.time_sync_interval_seconds = time_sync_interval_seconds
+        self.batch_size = batch_size
+        self.sockets: dict[str, WebSocket] = {}
+        self.time_sync_clients: set[str] = set()
+        self.unreachable: set[str] = set()
+        self.logger = get_logger("HeartbeatScheduler", self)
+
+    def register(self, client_id: str, websocket: WebSocket) -> None:
+        self.sockets[client_id] = websocket
+        self.unreachable.discard(client_id)
+
+    def enable_time_sync(self, client_id: str) -> None:
+        if client_id in self.sockets:
+            self.time_sync_clients.add(client_id)
+
+    def unregister(self, client_id: str) -> None:
+        self.sockets.pop(client_id, None)
+        self.time_sync_clients.discard(client_id)
+        self.unreachable.discard(client_id)
+
+    async def run(self) -> None:
+        """Send pings and time-syncs on their intervals until cancelled."""
+        loop = asyncio.get_running_loop()
+        next_ping = loop.time() + self.ping_interval_seconds
+        next_time_sync = loop.time() + self.time_sync_interval_seconds
+        self.logger.info("Starting websocket heartbeat scheduler")
+
+        while True:
+            await asyncio.sleep(max(0.0, min(next_ping, next_time_sync) - loop.time()))
+            now = loop.time()
+            try:
+                if now >= next_ping:
+                    next_ping = now + self.ping_interval_seconds
+                    await self.ping_all()
+                if now >= next_time_sync:
+                    next_time_sync = now + self.time_sync_interval_seconds
+                    await self.time_sync_all()
+            except Exception as e:
+                self.logger.error(f"Error in websocket heartbeat: {e}", exc_info=True)
+
+    async def ping_all(self) -> None:
+        await self._send_in_batches(
+            list(self.sockets), lambda: {"type": "ping", "timestamp": time.time()}
+        )
+
+    async def time_sync_all(self) -> None:
+        from src.websocket.clock_sync import time_sync_message
+
+        await self._send_in_batches(list(self.time_sync_clients), time_sync_message)
+
+    async def _send_in_batches(
+        self, client_ids: list[str], make_message: Callable[[], dict[str, Any]]
+    ) -> None:
+        for start in range(0, len(client_ids), self.batch_size):
+            # One message per batch keeps timestamps close to the actual send.
+            message = make_message()
+            await asyncio.gather(
+                *(
+                    self._send(client_id, message)
+                    for client_id in client_ids[start : start + self.batch_size]
+                )
+            )
+
+    async def _send(self, client_id: str, message: dict[str, Any]) -> None:
+        websocket = self.sockets.get(client_id)
+        if websocket is None or client_id in self.unreachable:
+            return
+        if websocket.application_state != WebSocketState.CONNECTED:
+            self.unreachable.add(client_id)
+            return
+        try:
+            await websocket.send_json(message)
+        except Exception as e:
+            self.logger.debug(f"Error sending {message['type']} to client {client_id}: {e}")
+            self.unreachable.add(client_id)
@@ -0,0 +1,46 @@
+"""Per-match replay of recent broadcasts for resuming websocket clients.
+
+Every message broadcast to a match is stamped with ``match_seq``, a number increasing by one
+per broadcast, and kept in a bounded ring buffer. A client that reconnects with the ``stream``
+id and the last ``match_seq`` it saw is replayed only the messages it missed, instead of
+reloading the whole match. Sequence numbers are per worker: ``stream`` changes whenever a
+buffer is (re)created, so a client resuming against another worker, or after the buffer was
+evicted, is told to reload.
+"""
+
+import secrets
+import time
+from collections import deque
+from typing import Any
+
+
+class MatchReplayBuffer:
+    """Ring buffer of the last ``size`` messages broadcast to one match."""
+
+    def __init__(self, size: int) -> None:
+        self.stream = secrets.token_hex(8)
+        self.seq = 0
+        self.last_active = time.monotonic()
+        self._messages: deque[dict[str, Any]] = deque(maxlen=size)
+
+    def stamp(self, message: dict[str, Any]) -> dict[str, Any]:
+        """Return a copy of message stamped with the next sequence number, and keep it."""
+        self.seq += 1
+        self.touch()
+        stamped = {**message, "match_seq": self.seq}
+        self._messages.append(stamped)
+        return stamped
+
+    def touch(self) -> None:
+        self.last_active = time.monotonic()
+
+    def missed_since(self, stream: str | None, last_seq: int | None) -> list[dict[str, Any]] | None:
+        """Messages after last_seq, or None when the buffer no longer covers the gap."""
+        if stream != self.stream or last_seq is None or not 0 <= last_seq <= self.seq:
+            return None
+        if last_seq == self.seq:
+            return []
+        oldest = self._messages[0]["match_seq"] if self._messages else self.seq + 1
+        if last_seq + 1 < oldest:
+            return None
+        return [message for message in self._messages if message["match_seq"] > last_seq]
@@ -10,8 +10,14 @@ from starlette.websockets import WebSocket, WebSocketState
 from src.core.config import settings
 from src.logging_config import get_logger
 
+from .heartbeat import HeartbeatScheduler
+from .replay_buffer import MatchReplayBuffer
+
 connection_socket_logger_helper = get_logger("ConnectionManager")
 
+# Put on a client's queue when its connection is gone, to end the queue consumer.
+QUEUE_CLOSED = object()
+
 
 class MatchDataWebSocketManager:
     def __init__(self, db_url):
@@ -332,46 +338,52 @@ class ConnectionManager:
         self.queues: dict[str, asyncio.Queue] = {}
         self.match_subscriptions: dict[str | int, list[str]] = {}
         self.last_activity: dict[str, float] = {}
+        self.clock_sync_modes: dict[str, str] = {}
+        self.match_updates_modes: dict[str, str] = {}
+        self.replay_buffers: dict[str | int, MatchReplayBuffer] = {}
+        self.heartbeats = HeartbeatScheduler(
+            settings.websocket_ping_interval_seconds,
+            settings.clock_time_sync_interval_seconds,
+            settings.websocket_heartbeat_batch_size,
+        )
         self.logger = get_logger("ConnectionManager", self)
         self.logger.info("ConnectionManager initialized")
 
     async def connect(self, websocket: WebSocket, client_id: str, match_id: int | None = None):
         self.logger.info(f"Active Connections len: {len(self.active_connections)}")
-        self.logger.info(f"Active Connections {self.active_connections}")
         self.logger.info(
             f"Connecting to WebSocket at {websocket} with client_id: {client_id} and match_id: {match_id}"
         )
 
         if client_id in self.active_connections:
-            self.logger.debug(
-                f"Client with client_id:{client_id} in active_connections: {self.active_connections}"
-            )
+            self.logger.debug(f"Client with client_id:{client_id} in active_connections")
             self.logger.warning(f"Disconnecting existing connection for client_id:{client_id}")
             await self.disconnect(client_id)
-            self.logger.debug(f"Active connections after disconnect: {self.active_connections}")
+            self.logger.debug(
+                f"Active connections after disconnect: {len(self.active_connections)}"
+            )
 
         self.logger.debug(f"Adding new connection for client with client_id: {client_id}")
         self.active_connections[client_id] = websocket
         self.queues[client_id] = asyncio.Queue()
+        self.heartbeats.register(client_id, websocket)
         self.update_client_activity(client_id)
         self.logger.info(f"New connection created: {self.active_connections[client_id]}")
         self.logger.info(f"New queue created: {self.queues[client_id]}")
 
         if match_id:
+            self.replay_buffer(match_id).touch()
             if match_id in self.match_subscriptions:
                 self.logger.debug(
-                    f"Match with match_id: {match_id} in match subscriptions {self.match_subscriptions}"
+                    f"Adding client with client_id: {client_id} to match_subscription {match_id}"
                 )
+                self.match_subscriptions[match_id].append(client_id)
                 self.logger.debug(
-                    f"Adding client with client_id: {client_id} to match_subscription {self.match_subscriptions[match_id]}"
+                    f"Match subscription added, {len(self.match_subscriptions[match_id])} clients"
                 )
-                self.match_subscriptions[match_id].append(client_id)
-                self.logger.debug(f"Match subscription added {self.match_subscriptions[match_id]}")
 
             else:
-                self.logger.debug(
-                    f"Match with match_id: {match_id} not in match subscriptions {self.match_subscriptions}"
-                )
+                self.logger.debug(f"Match with match_id: {match_id} not in match subscriptions")
                 self.match_subscriptions[match_id] = [client_id]
                 self.logger.debug(f"Match subscription added {self.match_subscriptions[match_id]}")
 
@@ -382,6 +394,7 @@ class ConnectionManager:
                     self.queues[client_id].get_nowait()
                 except asyncio.QueueEmpty:
                     break
+            self.queues[client_id].put_nowait(QUEUE_CLOSED)
             del self.queues[client_id]
 
         if client_id in self.active_connections:
@@ -390,9 +403,15 @@ class ConnectionManager:
         if client_id in self.last_activity:
             del self.last_activity[client_id]
 
-        for _match_id, clients in self.match_subscriptions.items():
+        self.clock_sync_modes.pop(client_id, None)
+        self.match_updates_modes.pop(client_id, None)
+        self.heartbeats.unregister(client_id)
+
+        for match_id, clients in self.match_subscriptions.items():
             if client_id in clients:
                 clients.remove(client_id)
+                if match_id in self.replay_buffers:
+                    self.replay_buffers[match_id].touch()
 
     async def disconnect(self, client_id: str):
         """
@@ -451,6 +470,38 @@ class ConnectionManager:
         queue = self.queues[client_id]
         return queue
 
+    def set_clock_sync_mode(self, client_id: str, mode: str) -> None:
+        self.clock_sync_modes[client_id] = mode
+        self.logger.debug(f"Clock sync mode for client {client_id}: {mode}")
+
+    def get_clock_sync_mode(self, client_id: str) -> str | None:
+        return self.clock_sync_modes.get(client_id)
+
+    def set_match_updates_mode(self, client_id: str, mode: str) -> None:
+        self.match_updates_modes[client_id] = mode
+        self.logger.debug(f"Match updates mode for client {client_id}: {mode}")
+
+    def get_match_updates_mode(self, client_id: str) -> str | None:
+        return self.match_updates_modes.get(client_id)
+
+    def replay_buffer(self, match_id: str | int) -> MatchReplayBuffer:
+        """Return the match's replay buffer, creating it on first use."""
+        buffer = self.replay_buffers.get(match_id)
+        if buffer is None:
+            buffer = MatchReplayBuffer(settings.websocket_replay_buffer_size)
+            self.replay_buffers[match_id] = buffer
+        return buffer
+
+    def evict_idle_replay_buffers(self, retention_seconds: float) -> None:
+        """Drop replay buffers of matches without clients or broadcasts for retention_seconds."""
+        now = time.monotonic()
+        for match_id, buffer in list(self.replay_buffers.items()):
+            if not self.match_subscriptions.get(match_id) and now - buffer.last_active > (
+                retention_seconds
+            ):
+                del self.replay_buffers[match_id]
+                self.logger.debug(f"Evicted idle replay buffer for match {match_id}")
+
     def update_client_activity(self, client_id: str):
         self.last_activity[client_id] = time.time()
         self.logger.debug(
@@ -469,6 +520,11 @@ class ConnectionManager:
                 f"Cleaning up stale connection for client {client_id} (inactive for {now - self.last_activity[client_id]:.1f}s)"
             )
             await self.disconnect(client_id)
+        for client_id in list(self.heartbeats.unreachable):
+            self.logger.warning(f"Cleaning up unreachable connection for client {client_id}")
+            await self.disconnect(client_id)
+            self.heartbeats.unregister(client_id)
+        self.evict_idle_replay_buffers(settings.websocket_replay_retention_seconds)
 
     async def send_to_all(self, data: dict[str, Any] | str, match_id: str | None = None):
         data_type = data["type"] if isinstance(data, dict) and "type" in data else "unknown"
@@ -477,6 +533,10 @@ class ConnectionManager:
             f"Sending {data_type} data for match_id: {match_id} to {len(self.match_subscriptions.get(match_key, []))} clients"
         )
         if match_id:
+            if isinstance(data, dict) and (
+                self.match_subscriptions.get(match_key) or match_key in self.replay_buffers
+            ):
+                data = self.replay_buffer(match_key).stamp(data)
             for client_id in self.match_subscriptions.get(match_key, []):
                 if client_id in self.queues:
                     self.logger.debug(
@@ -0,0 +1,207 @@
+"""MessagePack encoding of match websocket messages, negotiated as a subprotocol.
+
+Clients opt in by offering ``statsboard.msgpack.v1`` in ``Sec-WebSocket-Protocol``. The server
+then accepts with that subprotocol and sends every message as a binary frame holding the same
+message, MessagePack-encoded, with the object keys listed in ``MESSAGE_KEYS`` replaced by their
+index in that tuple. Other keys stay strings, so unknown keys still decode. Clients may send
+binary (same encoding) or text (JSON) frames. Clients that offer nothing keep getting JSON text.
+
+``MESSAGE_KEYS`` is part of the protocol: only ever append to it, and bump the subprotocol
+version for any other change.
+"""
+
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+import msgpack
+from starlette.websockets import WebSocket, WebSocketDisconnect
+
+MSGPACK_SUBPROTOCOL = "statsboard.msgpack.v1"
+
+MESSAGE_KEYS: tuple[str, ...] = (
+    # Envelope
+    "type",
+    "data",
+    "match_id",
+    "id",
+    "match_seq",
+    "seq",
+    "stream",
+    "server_time_ms",
+    "client_time_ms",
+    "timestamp",
+    "replayed",
+    "clock_sync",
+    "match_updates",
+    "status_code",
+    # Clocks
+    "gameclock",
+    "gameclock_status",
+    "gameclock_max",
+    "gameclock_time_remaining",
+    "playclock",
+    "playclock_status",
+    "started_at_ms",
+    "version",
+    "direction",
+    "on_stop_behavior",
+    "use_sport_preset",
+    "clock",
+    "status",
+    "value",
+    "max_value",
+    # Match patches
+    "ops",
+    "op",
+    "path",
+    # Initial load and match document
+    "match",
+    "match_data",
+    "teams_data",
+    "scoreboard_data",
+    "players",
+    "events",
+    "statistics",
+    "team_a",
+    "team_b",
+    "title",
+    "team_logo_url",
+    "team_color",
+    "match_date",
+    "week",
+    "tournament_id",
+    "team_a_id",
+    "team_b_id",
+    # Match data
+    "score_team_a",
+    "score_team_b",
+    "qtr",
+    "down",
+    "distance",
+    "ball_on",
+    "timeout_team_a",
+    "timeout_team_b",
+    "game_status",
+    "field_length",
+    "period_key",
+    # Scoreboard
+    "is_qtr",
+    "is_time",
+    "is_playclock",
+    "is_downdistance",
+    "is_tournament_logo",
+    "is_main_sponsor",
+    "is_sponsor_line",
+    "is_match_sponsor_line",
+    "is_team_a_start_offense",
+    "is_team_b_start_offense",
+    "is_team_a_start_defense",
+    "is_team_b_start_defense",
+    "is_home_match_team_lower",
+    "is_away_match_team_lower",
+    "is_football_qb_full_stats_lower",
+    "is_match_player_lower",
+    "is_flag",
+    "is_goal_team_a",
+    "is_goal_team_b",
+    "is_timeout_team_a",
+    "is_timeout_team_b",
+    "has_timeouts",
+    "has_playclock",
+    "team_a_game_color",
+    "team_b_game_color",
+    "use_team_a_game_color",
+    "use_team_b_game_color",
+    "team_a_game_title",
+    "team_b_game_title",
+    "use_team_a_game_title",
+    "use_team_b_game_title",
+    "team_a_game_logo",
+    "team_b_game_logo",
+    "use_team_a_game_logo",
+    "use_team_b_game_logo",
+    "scale_tournament_logo",
+    "scale_main_sponsor",
+    "scale_logo_a",
+    "scale_logo_b",
+    "player_match_lower_id",
+    "football_qb_full_stats_match_lower_id",
+    "language_code",
+    "period_mode",
+    "period_count",
+    "period_labels_json",
+)
+
+_KEY_CODES = {key: code for code, key in enumerate(MESSAGE_KEYS)}
+_CONTAINERS = (dict, list, tuple)
+
+
+def select_subprotocol(offered: str) -> str | None:
+    """Pick the subprotocol to accept from a ``Sec-WebSocket-Protocol`` header value."""
+    protocols = [protocol.strip() for protocol in offered.split(",")]
+    return MSGPACK_SUBPROTOCOL if MSGPACK_SUBPROTOCOL in protocols else None
+
+
+def _compact_keys(value: dict | list | tuple) -> dict | list:
+    # Only containers are recursed into; this runs for every message sent.
+    if isinstance(value, dict):
+        # Like JSON, object keys are always strings on the wire; integer keys are key codes.
+        return {
+            _KEY_CODES.get(key, key) if isinstance(key, str) else str(key): (
+                _compact_keys(item) if isinstance(item, _CONTAINERS) else item
+            )
+            for key, item in value.items()
+        }
+    return [_compact_keys(item) if isinstance(item, _CONTAINERS) else item for item in value]
+
+
+def _expand_keys(value: dict | list) -> dict | list:
+    if isinstance(value, dict):
+        return {
+            MESSAGE_KEYS[key] if isinstance(key, int) else key: (
+                _expand_keys(item) if isinstance(item, _CONTAINERS) else item
+            )
+            for key, item in value.items()
+        }
+    return [_expand_keys(item) if isinstance(item, _CONTAINERS) else item for item in value]
+
+
+def encode_message(message: dict[str, Any]) -> bytes:
+    return msgpack.packb(_compact_keys(message), use_bin_type=True)
+
+
+def decode_message(payload: bytes) -> dict[str, Any]:
+    return _expand_keys(msgpack.unpackb(payload, raw=False, strict_map_key=False))
+
+
+class MsgPackWebSocket:
+    """A websocket that sends and receives ``send_json``/``iter_json`` messages as MessagePack.
+
+    Everything else (``application_state``, ``close``, ...) is the wrapped websocket's, so the
+    handler, connection manager and heartbeat use it like any other websocket.
+    """
+
+    def __init__(self, websocket: WebSocket) -> None:
+        self.websocket = websocket
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.websocket, name)
+
+    async def send_json(self, data: Any, mode: str = "binary") -> None:
+        await self.websocket.send_bytes(encode_message(data))
+
+    async def receive_json(self, mode: str = "binary") -> Any:
+        message = await self.websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(message["code"], message.get("reason"))
+        if message.get("bytes") is not None:
+            return decode_message(message["bytes"])
+        return json.loads(message["text"])
+
+    async def iter_json(self) -> AsyncIterator[Any]:
+        try:
+            while True:
+                yield await self.receive_json()
+        except WebSocketDisconnect:
+            pass
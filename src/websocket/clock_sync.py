@@ -0,0 +1,95 @@
+"""Client-side clock extrapolation protocol for match websockets.
+
+Connections opt in with ``?clock_sync=extrapolate`` on the websocket URL. Instead of a
+``gameclock-update``/``playclock-update`` carrying the full clock row, such clients receive
+a compact ``clock-state`` message only when a clock transitions (start, pause, stop, reset,
+adjust). Each message carries the clock's ``value``, ``started_at_ms``, ``direction`` and
+``max_value`` plus ``server_time_ms``, which is everything needed to compute the displayed
+value locally (see ClockStateMachine.get_current_value). Periodic ``time-sync`` messages
+let clients keep their estimate of the server clock offset current.
+"""
+
+import time
+from typing import Any, Literal
+
+from src.core.enums import ClockDirection
+
+ClockKind = Literal["gameclock", "playclock"]
+
+CLOCK_SYNC_LEGACY = "legacy"
+CLOCK_SYNC_EXTRAPOLATE = "extrapolate"
+CLOCK_SYNC_MODES = (CLOCK_SYNC_LEGACY, CLOCK_SYNC_EXTRAPOLATE)
+
+CLOCK_UPDATE_TYPES: dict[str, ClockKind] = {
+    "gameclock-update": "gameclock",
+    "gameclock": "gameclock",
+    "playclock-update": "playclock",
+    "playclock": "playclock",
+}
+
+_TRANSITION_FIELDS = ("id", "status", "value", "started_at_ms", "direction", "max_value")
+
+
+def server_time_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def normalize_clock_sync_mode(mode: str | None) -> str:
+    """Return a supported mode, falling back to legacy for unknown or missing values."""
+    return mode if mode in CLOCK_SYNC_MODES else CLOCK_SYNC_LEGACY
+
+
+def has_clock_state(kind: ClockKind, clock: dict[str, Any] | None) -> bool:
+    """Whether a clock payload carries every field a client needs to extrapolate."""
+    if not clock:
+        return False
+    return all(key in clock for key in (kind, f"{kind}_status", "started_at_ms"))
+
+
+def clock_state_message(
+    kind: ClockKind, match_id: int, clock: dict[str, Any], now_ms: int | None = None
+) -> dict[str, Any]:
+    """Build a ``clock-state`` message from a gameclock or playclock row/payload."""
+    if kind == "gameclock":
+        direction = clock.get("direction") or ClockDirection.DOWN
+        max_value = clock.get("gameclock_max")
+    else:
+        direction = ClockDirection.DOWN
+        max_value = None
+
+    return {
+        "type": "clock-state",
+        "clock": kind,
+        "match_id": match_id,
+        "id": clock.get("id"),
+        "version": clock.get("version"),
+        "status": clock.get(f"{kind}_status"),
+        "value": clock.get(kind),
+        "started_at_ms": clock.get("started_at_ms"),
+        "direction": getattr(direction, "value", direction),
+        "max_value": max_value,
+        "server_time_ms": server_time_ms() if now_ms is None else now_ms,
+    }
+
+
+def time_sync_message(client_time_ms: int | None = None) -> dict[str, Any]:
+    """Build a ``time-sync`` message, echoing the client's timestamp when it asked for one."""
+    message: dict[str, Any] = {"type": "time-sync", "server_time_ms": server_time_ms()}
+    if client_time_ms is not None:
+        message["client_time_ms"] = client_time_ms
+    return message
+
+
+class ClockTransitionFilter:
+    """Per-connection memory of the last clock state sent, to drop repeats."""
+
+    def __init__(self) -> None:
+        self._last_sent: dict[ClockKind, tuple] = {}
+
+    def is_transition(self, message: dict[str, Any]) -> bool:
+        kind: ClockKind = message["clock"]
+        key = tuple(message.get(field) for field in _TRANSITION_FIELDS)
+        if self._last_sent.get(kind) == key:
+            return False
+        self._last_sent[kind] = key
+        return True
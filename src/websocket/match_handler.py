@@ -1,5 +1,6 @@
 import asyncio
 import time
+from functools import partial
 
 from starlette.websockets import WebSocket, WebSocketDisconnect, WebSocketState
 from websockets import ConnectionClosedError, ConnectionClosedOK
@@ -8,69 +9,82 @@ from src.gameclocks.db_services import GameClockServiceDB
 from src.playclocks.db_services import PlayClockServiceDB
 
 from ..logging_config import get_logger
-from ..utils.websocket.websocket_manager import connection_manager, ws_manager
+from ..utils.websocket.websocket_manager import QUEUE_CLOSED, connection_manager, ws_manager
+from .binary_protocol import MsgPackWebSocket, select_subprotocol
+from .clock_sync import (
+    CLOCK_SYNC_EXTRAPOLATE,
+    CLOCK_SYNC_LEGACY,
+    CLOCK_UPDATE_TYPES,
+    ClockTransitionFilter,
+    clock_state_message,
+    has_clock_state,
+    normalize_clock_sync_mode,
+    time_sync_message,
+)
+from .match_patches import (
+    MATCH_DOCUMENT_TYPES,
+    MATCH_UPDATES_FULL,
+    MATCH_UPDATES_PATCH,
+    MatchPatchStream,
+    is_match_document,
+    normalize_match_updates_mode,
+)
 
 websocket_logger = get_logger("MatchDataWebSocketManager")
 connection_socket_logger = get_logger("ConnectionManager")
 
 
+def _carry_match_seq(message: dict, data: dict | None) -> dict:
+    """Copy the broadcast's match_seq onto a message rebuilt from fresh data."""
+    if data and "match_seq" in data:
+        message["match_seq"] = data["match_seq"]
+    return message
+
+
 class MatchWebSocketHandler:
     def __init__(self, cache_service=None):
         self.cache_service = cache_service
         self.logger = get_logger("MatchWebSocketHandler", self)
         self.logger.debug("Initialized MatchWebSocketHandler")
 
-    async def send_initial_data(self, websocket: WebSocket, client_id: str, match_id: int):
-        import time
-
-        from src.helpers.fetch_helpers import (
-            fetch_event,
-            fetch_gameclock,
-            fetch_playclock,
-            fetch_stats,
-            fetch_with_scoreboard_data,
-        )
+    async def send_initial_data(
+        self, websocket: WebSocket, client_id: str, match_id: int, match_seq: int | None = None
+    ):
+        connection_fields = {
+            "server_time_ms": int(time.time() * 1000),
+            "clock_sync": connection_manager.get_clock_sync_mode(client_id) or CLOCK_SYNC_LEGACY,
+            "match_updates": connection_manager.get_match_updates_mode(client_id)
+            or MATCH_UPDATES_FULL,
+            "stream": connection_manager.replay_buffer(match_id).stream,
+            "match_seq": match_seq,
+        }
 
-        (
-            initial_data,
-            initial_playclock_data,
-            initial_gameclock_data,
-            initial_event_data,
-            initial_stats_data,
-        ) = await asyncio.gather(
-            fetch_with_scoreboard_data(match_id, cache_service=self.cache_service),
-            fetch_playclock(match_id, cache_service=self.cache_service),
-            fetch_gameclock(match_id, cache_service=self.cache_service),
-            fetch_event(match_id, cache_service=self.cache_service),
-            fetch_stats(match_id, cache_service=self.cache_service),
-        )
+        if self.cache_service:
+            # Joiners share one snapshot; only the per-connection fields are serialized here.
+            snapshot = await self.cache_service.get_or_build_initial_load(match_id)
+            document = snapshot.document
+            match_document = snapshot.match_document
+        else:
+            snapshot = None
+            document, match_document = await self._fetch_initial_load_document(match_id)
 
-        combined_data = {
-            "type": "initial-load",
-            "data": {
-                **(initial_data.get("data") or {}),
-                "gameclock": initial_gameclock_data.get("gameclock")
-                if initial_gameclock_data
-                else None,
-                "playclock": initial_playclock_data.get("playclock")
-                if initial_playclock_data
-                else None,
-                "events": initial_event_data.get("events", []) if initial_event_data else [],
-                "statistics": initial_stats_data.get("statistics", {})
-                if initial_stats_data
-                else {},
-                "server_time_ms": int(time.time() * 1000),
-            },
-        }
         websocket_logger.debug("WebSocket Connection sending initial-load message")
-        data_summary = combined_data.get("data", {})
         websocket_logger.info(
             f"Sending initial-load for match_id: {match_id}, "
-            f"players: {len(data_summary.get('players', []))}, "
-            f"events: {len(data_summary.get('events', []))}"
+            f"players: {len(document.get('players', []))}, "
+            f"events: {len(document.get('events', []))}"
         )
 
-        await websocket.send_json(combined_data)
+        combined_data = {"type": "initial-load", "data": {**document, **connection_fields}}
+        # The snapshot is pre-serialized JSON; MessagePack clients get the message encoded.
+        if snapshot is not None and not isinstance(websocket, MsgPackWebSocket):
+            await websocket.send_text(snapshot.message_text(connection_fields))
+        else:
+            await websocket.send_json(combined_data)
+
+        if connection_manager.get_match_updates_mode(client_id) == MATCH_UPDATES_PATCH:
+            # Patch clients get the bare match document, which later patches are based on.
+            combined_data = {"type": "initial-load", "data": match_document}
 
         if client_id in connection_manager.queues:
             await connection_manager.queues[client_id].put(combined_data)
@@ -82,6 +96,28 @@ class MatchWebSocketHandler:
                 f"No queue found for client_id {client_id}. Data not enqueued."
             )
 
+    async def _fetch_initial_load_document(self, match_id: int) -> tuple[dict, dict | None]:
+        from src.helpers.fetch_helpers import (
+            fetch_event,
+            fetch_gameclock,
+            fetch_playclock,
+            fetch_stats,
+            fetch_with_scoreboard_data,
+        )
+        from src.matches.match_data_cache_service import compose_initial_load_document
+
+        match_data, playclock_data, gameclock_data, event_data, stats_data = await asyncio.gather(
+            fetch_with_scoreboard_data(match_id),
+            fetch_playclock(match_id),
+            fetch_gameclock(match_id),
+            fetch_event(match_id),
+            fetch_stats(match_id),
+        )
+        document = compose_initial_load_document(
+            match_data, playclock_data, gameclock_data, event_data, stats_data
+        )
+        return document, (match_data or {}).get("data")
+
     async def cleanup_websocket(self, client_id: str):
         try:
             await connection_manager.disconnect(client_id)
@@ -100,6 +136,16 @@ class MatchWebSocketHandler:
             if message_type == "pong":
                 connection_manager.update_client_activity(client_id)
                 websocket_logger.debug(f"Received pong from client {client_id}")
+            elif message_type == "time-sync":
+                connection_manager.update_client_activity(client_id)
+                await websocket.send_json(time_sync_message(message.get("client_time_ms")))
+            elif message_type == "resync":
+                connection_manager.update_client_activity(client_id)
+                if (
+                    connection_manager.get_match_updates_mode(client_id) == MATCH_UPDATES_PATCH
+                    and client_id in connection_manager.queues
+                ):
+                    await connection_manager.queues[client_id].put({"type": "match-resync"})
             else:
                 websocket_logger.debug(f"Received non-pong message: {message_type}")
 
@@ -120,6 +166,13 @@ class MatchWebSocketHandler:
             "scoreboard": self.process_match_data,
             "players-update": self.process_match_data,
         }
+        if connection_manager.get_match_updates_mode(client_id) == MATCH_UPDATES_PATCH:
+            process_match_patch = partial(self.process_match_patch, stream=MatchPatchStream())
+            handlers.update(dict.fromkeys(MATCH_DOCUMENT_TYPES, process_match_patch))
+        extrapolate_clocks = (
+            connection_manager.get_clock_sync_mode(client_id) == CLOCK_SYNC_EXTRAPOLATE
+        )
+        clock_transitions = ClockTransitionFilter()
 
         while True:
             if websocket.application_state != WebSocketState.CONNECTED:
@@ -130,38 +183,30 @@ class MatchWebSocketHandler:
 
             try:
                 queue = await connection_manager.get_queue_for_client(client_id)
-                timeout_ = 60.0
-
-                try:
-                    data = await asyncio.wait_for(queue.get(), timeout=timeout_)
+                data = await queue.get()
+                if data is QUEUE_CLOSED:
+                    websocket_logger.debug(
+                        f"Connection closed, ending processing loop for {client_id}"
+                    )
+                    break
 
-                    if not isinstance(data, dict):
-                        websocket_logger.warning(f"Received non-dictionary data: {data}")
-                        continue
+                if not isinstance(data, dict):
+                    websocket_logger.warning(f"Received non-dictionary data: {data}")
+                    continue
 
-                    message_type = data.get("type")
-                    if message_type not in handlers:
-                        websocket_logger.warning(f"Unknown message type received: {message_type}")
-                        continue
+                message_type = data.get("type")
+                if message_type not in handlers:
+                    websocket_logger.warning(f"Unknown message type received: {message_type}")
+                    continue
 
-                    if websocket.application_state == WebSocketState.CONNECTED:
-                        await handlers[message_type](websocket, match_id, data)
+                if websocket.application_state == WebSocketState.CONNECTED:
+                    if extrapolate_clocks and message_type in CLOCK_UPDATE_TYPES:
+                        await self.process_clock_state(websocket, match_id, data, clock_transitions)
                     else:
-                        websocket_logger.warning(
-                            "WebSocket disconnected, stopping message processing"
-                        )
-                        break
-
-                except asyncio.TimeoutError:
-                    websocket_logger.debug(
-                        f"Queue get operation timed out after {timeout_} seconds"
-                    )
-                    if websocket.application_state != WebSocketState.CONNECTED:
-                        websocket_logger.warning(
-                            f"WebSocket disconnected (state: {websocket.application_state}), ending processing loop after timeout"
-                        )
-                        break
-                    continue
+                        await handlers[message_type](websocket, match_id, data)
+                else:
+                    websocket_logger.warning("WebSocket disconnected, stopping message processing")
+                    break
 
             except Exception as e:
                 websocket_logger.error(f"Error in processing loop: {e}", exc_info=True)
@@ -217,6 +262,70 @@ class MatchWebSocketHandler:
         except Exception as e:
             websocket_logger.error(f"Error processing match data: {e}", exc_info=True)
 
+    async def process_match_patch(
+        self,
+        websocket: WebSocket,
+        match_id: int,
+        data: dict,
+        stream: MatchPatchStream,
+    ):
+        """Send a match document change as a patch to a client that keeps the document."""
+        from src.helpers.fetch_helpers import fetch_with_scoreboard_data
+
+        try:
+            if websocket.application_state != WebSocketState.CONNECTED:
+                websocket_logger.warning("WebSocket not connected, skipping match patch send")
+                return
+
+            message_type = data.get("type")
+            if message_type == "initial-load" and stream.has_document:
+                websocket_logger.debug(f"Skipping stale initial document for match {match_id}")
+                return
+
+            document = data.get("data")
+            if message_type == "match-resync" or not is_match_document(document):
+                fetched = await fetch_with_scoreboard_data(
+                    match_id, cache_service=self.cache_service
+                )
+                document = (fetched or {}).get("data")
+            if not is_match_document(document):
+                websocket_logger.warning(f"No match document for match {match_id}, skipping")
+                return
+
+            if message_type == "match-resync":
+                message = stream.snapshot_message(match_id, document)
+            else:
+                message = stream.next_message(match_id, document)
+            if message is None:
+                websocket_logger.debug(f"Match {match_id} document unchanged, skipping")
+                return
+            _carry_match_seq(message, data)
+
+            if websocket.application_state == WebSocketState.CONNECTED:
+                websocket_logger.debug(
+                    f"Sending {message['type']} seq {message['seq']} for match_id: {match_id}"
+                )
+                try:
+                    await websocket.send_json(message)
+                except ConnectionClosedOK:
+                    websocket_logger.debug("WebSocket closed normally while sending match patch")
+                except ConnectionClosedError as e:
+                    websocket_logger.error(
+                        f"WebSocket closed with error while sending match patch: {e}"
+                    )
+                except RuntimeError as e:
+                    if "websocket.close" in str(e) or "websocket.send" in str(e):
+                        websocket_logger.debug("WebSocket already closed, skipping send")
+                    else:
+                        websocket_logger.error(f"Unexpected RuntimeError: {e}")
+                        raise
+            else:
+                websocket_logger.warning(
+                    f"WebSocket no longer connected (state: {websocket.application_state}), skipping match patch send"
+                )
+        except Exception as e:
+            websocket_logger.error(f"Error processing match patch: {e}", exc_info=True)
+
     async def process_gameclock_data(
         self, websocket: WebSocket, match_id: int, data: dict | None = None
     ):
@@ -229,6 +338,7 @@ class MatchWebSocketHandler:
 
             gameclock_data = await fetch_gameclock(match_id, cache_service=self.cache_service)
             gameclock_data["type"] = "gameclock-update"
+            _carry_match_seq(gameclock_data, data)
 
             if websocket.application_state == WebSocketState.CONNECTED:
                 websocket_logger.debug(f"Processing match data type: {gameclock_data.get('type')}")
@@ -266,6 +376,7 @@ class MatchWebSocketHandler:
 
             playclock_data = await fetch_playclock(match_id, cache_service=self.cache_service)
             playclock_data["type"] = "playclock-update"
+            _carry_match_seq(playclock_data, data)
 
             if websocket.application_state == WebSocketState.CONNECTED:
                 websocket_logger.debug(f"Processing match data type: {playclock_data.get('type')}")
@@ -291,6 +402,60 @@ class MatchWebSocketHandler:
         except Exception as e:
             websocket_logger.error(f"Error processing playclock data: {e}", exc_info=True)
 
+    async def process_clock_state(
+        self,
+        websocket: WebSocket,
+        match_id: int,
+        data: dict,
+        transitions: ClockTransitionFilter,
+    ):
+        """Send a clock transition to a client that extrapolates clock values locally."""
+        try:
+            if websocket.application_state != WebSocketState.CONNECTED:
+                websocket_logger.warning("WebSocket not connected, skipping clock state send")
+                return
+
+            kind = CLOCK_UPDATE_TYPES[data["type"]]
+            clock = data.get(kind)
+            if not has_clock_state(kind, clock):
+                from src.helpers.fetch_helpers import fetch_gameclock, fetch_playclock
+
+                fetch = fetch_gameclock if kind == "gameclock" else fetch_playclock
+                fetched = await fetch(match_id, cache_service=self.cache_service)
+                clock = (fetched or {}).get(kind)
+            if not clock:
+                websocket_logger.debug(f"No {kind} state for match {match_id}, skipping")
+                return
+
+            clock_state = clock_state_message(kind, match_id, clock)
+            if not transitions.is_transition(clock_state):
+                websocket_logger.debug(f"Skipping unchanged {kind} state for match {match_id}")
+                return
+            _carry_match_seq(clock_state, data)
+
+            if websocket.application_state == WebSocketState.CONNECTED:
+                websocket_logger.debug(f"Sending {kind} clock-state for match_id: {match_id}")
+                try:
+                    await websocket.send_json(clock_state)
+                except ConnectionClosedOK:
+                    websocket_logger.debug("WebSocket closed normally while sending clock state")
+                except ConnectionClosedError as e:
+                    websocket_logger.error(
+                        f"WebSocket closed with error while sending clock state: {e}"
+                    )
+                except RuntimeError as e:
+                    if "websocket.close" in str(e) or "websocket.send" in str(e):
+                        websocket_logger.debug("WebSocket already closed, skipping send")
+                    else:
+                        websocket_logger.error(f"Unexpected RuntimeError: {e}")
+                        raise
+            else:
+                websocket_logger.warning(
+                    f"WebSocket no longer connected (state: {websocket.application_state}), skipping clock state send"
+                )
+        except Exception as e:
+            websocket_logger.error(f"Error processing clock state: {e}", exc_info=True)
+
     async def process_event_data(
         self, websocket: WebSocket, match_id: int, data: dict | None = None
     ):
@@ -377,19 +542,42 @@ class MatchWebSocketHandler:
             websocket_logger.error(f"Error processing stats data: {e}", exc_info=True)
 
     async def handle_websocket_connection(
-        self, websocket: WebSocket, client_id: str, match_id: int
+        self,
+        websocket: WebSocket,
+        client_id: str,
+        match_id: int,
+        clock_sync: str | None = None,
+        match_updates: str | None = None,
+        stream: str | None = None,
+        last_seq: int | None = None,
     ):
         websocket_logger.debug(f"Websocket endpoint /ws/id/{match_id}/{client_id} {websocket} ")
 
         extensions = websocket.headers.get("sec-websocket-extensions", "")
         compression_enabled = "permessage-deflate" in extensions
+        subprotocol = select_subprotocol(websocket.headers.get("sec-websocket-protocol", ""))
         websocket_logger.info(
             f"WebSocket connection from client {client_id} for match {match_id}: "
-            f"compression={compression_enabled}, extensions={extensions}"
+            f"compression={compression_enabled}, extensions={extensions}, "
+            f"subprotocol={subprotocol}"
         )
 
-        await websocket.accept()
+        await websocket.accept(subprotocol=subprotocol)
+        if subprotocol is not None:
+            websocket = MsgPackWebSocket(websocket)
         await connection_manager.connect(websocket, client_id, match_id)
+        # No await until the replay is queued, so no broadcast can slip in ahead of it.
+        replay_buffer = connection_manager.replay_buffer(match_id)
+        match_seq = replay_buffer.seq
+        missed = replay_buffer.missed_since(stream, last_seq)
+        if missed is not None:
+            for message in missed:
+                connection_manager.queues[client_id].put_nowait(message)
+        clock_sync_mode = normalize_clock_sync_mode(clock_sync)
+        connection_manager.set_clock_sync_mode(client_id, clock_sync_mode)
+        connection_manager.set_match_updates_mode(
+            client_id, normalize_match_updates_mode(match_updates)
+        )
         if not ws_manager.is_connected:
             try:
                 await ws_manager.startup()
@@ -397,30 +585,37 @@ class MatchWebSocketHandler:
                 websocket_logger.warning(
                     f"WebSocket manager startup failed, continuing without real-time notifications: {e}"
                 )
-        await self.enable_match_clock_queues(match_id)
+        if missed is None:
+            await self.enable_match_clock_queues(match_id)
 
-        async def ping_task():
-            while True:
-                await asyncio.sleep(60)
-                try:
-                    if websocket.application_state != WebSocketState.CONNECTED:
-                        websocket_logger.debug(
-                            f"WebSocket disconnected, stopping ping task for client {client_id}"
-                        )
-                        break
-                    ping_message = {"type": "ping", "timestamp": time.time()}
-                    await websocket.send_json(ping_message)
-                    websocket_logger.debug(f"Sent ping to client {client_id}")
-                except Exception as e:
-                    websocket_logger.debug(f"Error sending ping to client {client_id}: {e}")
-                    break
+        if clock_sync_mode == CLOCK_SYNC_EXTRAPOLATE:
+            connection_manager.heartbeats.enable_time_sync(client_id)
 
-        ping_handle = asyncio.create_task(ping_task())
+        # Pings and time-syncs come from the shared heartbeat scheduler; the receive loop is
+        # the connection's only background task. When it ends the client is gone, so the
+        # queue consumer below is told to stop.
+        queue = connection_manager.queues[client_id]
         receive_handle = asyncio.create_task(self.receive_messages(websocket, client_id))
+        receive_handle.add_done_callback(lambda _: queue.put_nowait(QUEUE_CLOSED))
         websocket_logger.debug(f"Started background tasks for client {client_id}")
 
         try:
-            await self.send_initial_data(websocket, client_id, match_id)
+            if missed is None:
+                await self.send_initial_data(websocket, client_id, match_id, match_seq)
+            else:
+                websocket_logger.info(
+                    f"Client {client_id} resumed match {match_id} at seq {last_seq}, "
+                    f"replaying {len(missed)} messages"
+                )
+                await websocket.send_json(
+                    {
+                        "type": "resumed",
+                        "match_id": match_id,
+                        "stream": replay_buffer.stream,
+                        "match_seq": match_seq,
+                        "replayed": len(missed),
+                    }
+                )
             await self.process_data_websocket(websocket, client_id, match_id)
 
         except WebSocketDisconnect as e:
@@ -436,16 +631,13 @@ class MatchWebSocketHandler:
         except Exception as e:
             websocket_logger.error(f"Unexpected error:{str(e)}", exc_info=True)
         finally:
-            ping_handle.cancel()
             receive_handle.cancel()
-            try:
-                await ping_handle
-            except asyncio.CancelledError:
-                websocket_logger.debug(f"Ping task cancelled for client {client_id}")
             try:
                 await receive_handle
             except asyncio.CancelledError:
                 websocket_logger.debug(f"Receive task cancelled for client {client_id}")
+            except Exception as e:
+                websocket_logger.debug(f"Receive task for client {client_id} ended: {e}")
             websocket_logger.info(
                 f"Background tasks cancelled for client {client_id}, starting cleanup"
             )
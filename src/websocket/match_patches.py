@@ -0,0 +1,91 @@
+"""Delta (JSON Patch) delivery of match updates for match websockets.
+
+Connections opt in with ``?match_updates=patch`` on the websocket URL. The match document is
+the ``data`` object of a full ``match-update`` (see fetch_with_scoreboard_data). Such clients
+receive that document once as a ``match-update`` tagged with a ``seq`` number, and afterwards
+only ``match-patch`` messages holding RFC 6902 operations against the previous document, each
+with the next ``seq``. A client that misses a ``seq`` (or fails to apply a patch) sends
+``{"type": "resync"}`` and gets a fresh full ``match-update``.
+"""
+
+from typing import Any
+
+MATCH_UPDATES_FULL = "full"
+MATCH_UPDATES_PATCH = "patch"
+MATCH_UPDATES_MODES = (MATCH_UPDATES_FULL, MATCH_UPDATES_PATCH)
+
+MATCH_DOCUMENT_TYPES = ("initial-load", "match-update", "match-resync")
+
+# Keys only present in a fully fetched match document, not in raw trigger rows.
+_DOCUMENT_KEYS = ("match", "scoreboard_data", "match_data", "teams_data")
+
+
+def normalize_match_updates_mode(mode: str | None) -> str:
+    """Return a supported mode, falling back to full updates for unknown or missing values."""
+    return mode if mode in MATCH_UPDATES_MODES else MATCH_UPDATES_FULL
+
+
+def is_match_document(data: Any) -> bool:
+    """Whether a match-update payload is a full match document rather than a trigger row."""
+    return isinstance(data, dict) and all(key in data for key in _DOCUMENT_KEYS)
+
+
+def _pointer_token(key: Any) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def diff_match_documents(previous: Any, current: Any, path: str = "") -> list[dict[str, Any]]:
+    """Return JSON Patch operations turning ``previous`` into ``current``.
+
+    Objects are compared key by key and equal-length arrays item by item; arrays that
+    changed length are replaced whole.
+    """
+    if previous == current:
+        return []
+    if isinstance(previous, dict) and isinstance(current, dict):
+        ops: list[dict[str, Any]] = []
+        for key in previous:
+            if key not in current:
+                ops.append({"op": "remove", "path": f"{path}/{_pointer_token(key)}"})
+        for key, value in current.items():
+            child = f"{path}/{_pointer_token(key)}"
+            if key not in previous:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(diff_match_documents(previous[key], value, child))
+        return ops
+    if isinstance(previous, list) and isinstance(current, list) and len(previous) == len(current):
+        ops = []
+        for index, (old, new) in enumerate(zip(previous, current, strict=True)):
+            ops.extend(diff_match_documents(old, new, f"{path}/{index}"))
+        return ops
+    return [{"op": "replace", "path": path, "value": current}]
+
+
+class MatchPatchStream:
+    """Per-connection match document last sent to the client and its sequence number."""
+
+    def __init__(self) -> None:
+        self.seq = 0
+        self._document: dict[str, Any] | None = None
+
+    @property
+    def has_document(self) -> bool:
+        return self._document is not None
+
+    def snapshot_message(self, match_id: int, document: dict[str, Any]) -> dict[str, Any]:
+        """Full ``match-update`` that (re)starts the client's document."""
+        self._document = document
+        self.seq += 1
+        return {"type": "match-update", "match_id": match_id, "seq": self.seq, "data": document}
+
+    def next_message(self, match_id: int, document: dict[str, Any]) -> dict[str, Any] | None:
+        """``match-patch`` from the last sent document, or None when nothing changed."""
+        if self._document is None:
+            return self.snapshot_message(match_id, document)
+        ops = diff_match_documents(self._document, document)
+        if not ops:
+            return None
+        self._document = document
+        self.seq += 1
+        return {"type": "match-patch", "match_id": match_id, "seq": self.seq, "ops": ops}
@@ -259,6 +259,8 @@ async def session_app(session_database):
     from src.football_events.views import FootballEventAPIRouter
     from src.gameclocks.views import GameClockAPIRouter
     from src.global_settings.views import GlobalSettingAPIRouter
+    from src.images.views import ImageAPIRouter
+    from src.import_jobs.views import ImportJobAPIRouter
     from src.matchdata.views import MatchDataAPIRouter
     from src.matches.crud_router import MatchCRUDRouter
     from src.matches.parser_router import MatchParserRouter
@@ -310,6 +312,8 @@ async def session_app(session_database):
     app.include_router(GlobalSettingAPIRouter().route())
     app.include_router(get_user_router())
     app.include_router(health.router)
+    app.include_router(ImportJobAPIRouter(service_name="import_job").route())
+    app.include_router(ImageAPIRouter().route())
 
     try:
         role_router = RoleAPIRouter(None, service_name="role").route()
@@ -48,6 +48,8 @@ def create_test_app(
     from src.football_events.views import FootballEventAPIRouter
     from src.gameclocks.views import GameClockAPIRouter
     from src.global_settings.views import GlobalSettingAPIRouter
+    from src.images.views import ImageAPIRouter
+    from src.import_jobs.views import ImportJobAPIRouter
     from src.matchdata.views import MatchDataAPIRouter
     from src.matches.crud_router import MatchCRUDRouter
     from src.matches.parser_router import MatchParserRouter
@@ -91,6 +93,9 @@ def create_test_app(
         except Exception:
             pass  # Role router may fail to initialize in test environment
 
+        app.include_router(ImportJobAPIRouter(None, service_name="import_job").route())
+        app.include_router(ImageAPIRouter().route())
+
     # Sport-related routers
     if include_all or "sport" in router_groups:
         app.include_router(SportAPIRouter().route())
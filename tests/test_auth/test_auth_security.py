@@ -1,12 +1,20 @@
 """Test auth security functions."""
 
+import pytest
 
 from src.auth.security import (
     create_access_token,
     decode_access_token,
     get_password_hash,
+    get_password_hash_async,
+    password_hash_rounds,
+    password_needs_rehash,
     verify_password,
+    verify_password_async,
 )
+from src.core.config import settings
+from src.core.models import UserDB
+from src.users.db_services import UserServiceDB
 
 
 class TestAuthSecurity:
@@ -65,3 +73,68 @@ class TestAuthSecurity:
         assert hash1 != hash2
         assert verify_password(password, hash1)
         assert verify_password(password, hash2)
+
+    def test_password_hash_uses_configured_rounds(self, monkeypatch):
+        """Test hashes are made with settings.bcrypt_rounds."""
+        monkeypatch.setattr(settings, "bcrypt_rounds", 5)
+
+        hashed = get_password_hash("SecurePass123!")
+
+        assert password_hash_rounds(hashed) == 5
+        assert password_needs_rehash(hashed) is False
+
+    def test_password_needs_rehash_when_rounds_change(self, monkeypatch):
+        """Test hashes with a different work factor need rehashing."""
+        hashed = get_password_hash("SecurePass123!", rounds=4)
+        monkeypatch.setattr(settings, "bcrypt_rounds", 5)
+
+        assert password_needs_rehash(hashed) is True
+        assert password_hash_rounds("not-a-bcrypt-hash") is None
+
+    @pytest.mark.asyncio
+    async def test_async_hash_and_verify(self):
+        """Test thread-offloaded hashing round-trips."""
+        hashed = await get_password_hash_async("SecurePass123!")
+
+        assert await verify_password_async("SecurePass123!", hashed) is True
+        assert await verify_password_async("WrongPass!", hashed) is False
+
+
+class TestRehashOnLogin:
+    """Test transparent rehash of passwords when the work factor changes."""
+
+    @pytest.mark.asyncio
+    async def test_authenticate_rehashes_outdated_password(self, test_db, monkeypatch):
+        async with test_db.get_session_maker()() as session:
+            user = UserDB(
+                username="rehash_user",
+                email="rehash@example.com",
+                hashed_password=get_password_hash("SecurePass123!", rounds=4),
+            )
+            session.add(user)
+            await session.flush()
+        monkeypatch.setattr(settings, "bcrypt_rounds", 5)
+        service = UserServiceDB(test_db)
+
+        authenticated = await service.authenticate("rehash_user", "SecurePass123!")
+        stored = await service.get_by_username("rehash_user")
+
+        assert authenticated is not None
+        assert password_hash_rounds(stored.hashed_password) == 5
+        assert verify_password("SecurePass123!", stored.hashed_password)
+
+    @pytest.mark.asyncio
+    async def test_authenticate_keeps_current_hash(self, test_db, monkeypatch):
+        monkeypatch.setattr(settings, "bcrypt_rounds", 4)
+        hashed = get_password_hash("SecurePass123!")
+        async with test_db.get_session_maker()() as session:
+            session.add(
+                UserDB(username="current_hash", email="current@example.com", hashed_password=hashed)
+            )
+            await session.flush()
+        service = UserServiceDB(test_db)
+
+        await service.authenticate("current_hash", "SecurePass123!")
+        stored = await service.get_by_username("current_hash")
+
+        assert stored.hashed_password == hashed
@@ -150,6 +150,14 @@ class TestAuthViews:
         assert user.last_online is not None
         assert user.is_online is True
 
+        await user_service.flush_heartbeats()
+        async with test_db.get_session_maker()() as session:
+            stored = await session.get(UserDB, test_user_with_role.id)
+            await session.refresh(stored)
+
+        assert stored.last_online == user.last_online
+        assert stored.is_online is True
+
     async def test_heartbeat_no_token(self, client: AsyncClient):
         """Test heartbeat endpoint without token returns 401."""
         response = await client.post("/api/auth/heartbeat")
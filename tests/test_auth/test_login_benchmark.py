@@ -0,0 +1,85 @@
+"""Benchmark: 50 operators logging in at once before kickoff.
+
+Measures logins/sec and event-loop lag (how late a 10ms ticker wakes up) while
+the logins run, for thread-offloaded bcrypt and for bcrypt called inline on the
+loop. Run with: pytest -m slow -s tests/test_auth/test_login_benchmark.py
+"""
+
+import asyncio
+from time import perf_counter
+
+import pytest
+import pytest_asyncio
+
+from src.auth.security import get_password_hash, verify_password
+from src.core.models import UserDB
+from src.users.db_services import UserServiceDB
+
+OPERATORS = 50
+PASSWORD = "SecurePass123!"
+TICK_SECONDS = 0.01
+
+
+@pytest_asyncio.fixture
+async def operators(test_db):
+    hashed = get_password_hash(PASSWORD)
+    async with test_db.get_session_maker()() as session:
+        session.add_all(
+            UserDB(
+                username=f"bench_operator_{index}",
+                email=f"bench_operator_{index}@example.com",
+                hashed_password=hashed,
+            )
+            for index in range(OPERATORS)
+        )
+        await session.flush()
+    return [f"bench_operator_{index}" for index in range(OPERATORS)]
+
+
+async def _measure(login) -> tuple[float, float]:
+    """Run login concurrently for every operator; return (logins/sec, max loop lag)."""
+    max_lag = 0.0
+    done = asyncio.Event()
+
+    async def ticker():
+        nonlocal max_lag
+        while not done.is_set():
+            expected = perf_counter() + TICK_SECONDS
+            await asyncio.sleep(TICK_SECONDS)
+            max_lag = max(max_lag, perf_counter() - expected)
+
+    ticker_task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    start = perf_counter()
+    results = await asyncio.gather(*(login(index) for index in range(OPERATORS)))
+    elapsed = perf_counter() - start
+    done.set()
+    await ticker_task
+
+    assert all(results)
+    return OPERATORS / elapsed, max_lag
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_concurrent_login_throughput_and_loop_lag(test_db, operators):
+    service = UserServiceDB(test_db)
+
+    async def offloaded_login(index: int):
+        return await service.authenticate(operators[index], PASSWORD)
+
+    async def inline_login(index: int):
+        user = await service.get_by_username(operators[index])
+        return verify_password(PASSWORD, user.hashed_password)
+
+    inline_rate, inline_lag = await _measure(inline_login)
+    offloaded_rate, offloaded_lag = await _measure(offloaded_login)
+
+    print(
+        f"\n{OPERATORS} concurrent logins:"
+        f"\n  inline bcrypt:    {inline_rate:7.1f} logins/s, max loop lag {inline_lag * 1000:7.1f}ms"
+        f"\n  offloaded bcrypt: {offloaded_rate:7.1f} logins/s, "
+        f"max loop lag {offloaded_lag * 1000:7.1f}ms"
+    )
+
+    assert offloaded_lag < inline_lag
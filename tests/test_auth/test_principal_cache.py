@@ -0,0 +1,159 @@
+"""Test the authenticated principal cache and the auth dependencies using it."""
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+
+from src.auth.dependencies import get_current_user, require_roles
+from src.auth.principal_cache import Principal, PrincipalCache, principal_cache
+from src.auth.security import create_access_token
+from src.core.models import RoleDB
+from src.users.db_services import UserServiceDB
+from src.users.schemas import UserSchemaCreate, UserSchemaUpdate
+from tests.testhelpers import assert_max_queries
+
+
+def _principal(user_id: int = 1, token_version: int = 0, roles=("user",)) -> Principal:
+    return Principal(
+        id=user_id,
+        username=f"user{user_id}",
+        is_active=True,
+        roles=frozenset(roles),
+        token_version=token_version,
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_principal_cache():
+    principal_cache.clear()
+    yield
+    principal_cache.clear()
+
+
+@pytest_asyncio.fixture
+async def user_service(test_db):
+    return UserServiceDB(test_db)
+
+
+@pytest_asyncio.fixture
+async def scorer(user_service):
+    return await user_service.create(
+        UserSchemaCreate(
+            username="principal_scorer",
+            email="principal_scorer@example.com",
+            password="SecurePass123!",
+        )
+    )
+
+
+def _token_for(user) -> str:
+    return create_access_token(data={"sub": str(user.id), "tv": user.token_version})
+
+
+class TestPrincipalCache:
+    def test_get_returns_cached_principal(self):
+        cache = PrincipalCache(ttl_seconds=30)
+        principal = _principal()
+        cache.set(principal)
+
+        assert cache.get(1, 0) is principal
+        assert cache.get(1, 1) is None
+
+    def test_expired_entries_are_dropped(self, monkeypatch):
+        cache = PrincipalCache(ttl_seconds=30)
+        cache.set(_principal())
+
+        monkeypatch.setattr("src.auth.principal_cache.monotonic", lambda: float("inf"))
+
+        assert cache.get(1, 0) is None
+        assert len(cache) == 0
+
+    def test_invalidate_drops_all_token_versions_of_user(self):
+        cache = PrincipalCache(ttl_seconds=30)
+        cache.set(_principal(1, 0))
+        cache.set(_principal(1, 1))
+        cache.set(_principal(2, 0))
+
+        cache.invalidate(1)
+
+        assert cache.get(1, 0) is None
+        assert cache.get(1, 1) is None
+        assert cache.get(2, 0) is not None
+
+    def test_zero_ttl_disables_cache(self):
+        cache = PrincipalCache(ttl_seconds=0)
+        cache.set(_principal())
+
+        assert len(cache) == 0
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestCachedAuthDependencies:
+    async def _create_role(self, test_db, name: str) -> int:
+        async with test_db.get_session_maker()() as session:
+            role = RoleDB(name=name, description=name)
+            session.add(role)
+            await session.flush()
+            return role.id
+
+    async def test_second_lookup_does_not_query_database(self, user_service, scorer, test_db):
+        await user_service.assign_role(scorer.id, await self._create_role(test_db, "scorer"))
+        token = _token_for(scorer)
+        first = await get_current_user(token, user_service)
+
+        with assert_max_queries(0):
+            second = await get_current_user(token, user_service)
+            await require_roles("scorer")(second)
+
+        assert second is first
+        assert "scorer" in first.roles
+
+    async def test_role_assignment_invalidates_principal(self, user_service, scorer, test_db):
+        token = _token_for(scorer)
+        principal = await get_current_user(token, user_service)
+        assert "scorer" not in principal.roles
+
+        await user_service.assign_role(scorer.id, await self._create_role(test_db, "scorer"))
+        principal = await get_current_user(token, user_service)
+
+        assert "scorer" in principal.roles
+        assert await require_roles("scorer")(principal) is principal
+
+    async def test_missing_role_is_forbidden(self, user_service, scorer):
+        principal = await get_current_user(_token_for(scorer), user_service)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await require_roles("admin")(principal)
+
+        assert exc_info.value.status_code == 403
+
+    async def test_deactivation_revokes_existing_tokens(self, user_service, scorer):
+        token = _token_for(scorer)
+        await get_current_user(token, user_service)
+
+        await user_service.update(scorer.id, UserSchemaUpdate(is_active=False))
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user(token, user_service)
+
+        assert exc_info.value.status_code == 401
+
+    async def test_password_change_revokes_existing_tokens(self, user_service, scorer):
+        token = _token_for(scorer)
+        await get_current_user(token, user_service)
+
+        user = await user_service.admin_change_password(scorer.id, "NewSecurePass123!")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user(token, user_service)
+        assert exc_info.value.status_code == 401
+
+        principal = await get_current_user(_token_for(user), user_service)
+        assert principal.id == scorer.id
+
+    async def test_token_without_version_matches_initial_version(self, user_service, scorer):
+        token = create_access_token(data={"sub": str(scorer.id)})
+
+        principal = await get_current_user(token, user_service)
+
+        assert principal.token_version == 0
@@ -0,0 +1,174 @@
+"""Test cross-worker clock ownership through PostgreSQL advisory-lock leases."""
+
+import asyncio
+import time
+from collections import defaultdict
+
+import pytest
+import pytest_asyncio
+
+from src.clocks import ClockLeaseManager, ClockOrchestrator
+from src.core.enums import ClockDirection
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+RETRY_INTERVAL = 0.05
+RECONCILE_INTERVAL = 0.1
+
+
+class FakeStateMachine:
+    def __init__(self, started_at_ms: int, value: int = 100) -> None:
+        self.started_at_ms = started_at_ms
+        self.value = value
+        self.direction = ClockDirection.DOWN
+        self.max_value = 720
+
+    def get_current_value(self) -> int:
+        return self.value
+
+
+@pytest.fixture
+def lease_dsn(test_db_url: str) -> str:
+    return test_db_url.replace("postgresql+asyncpg://", "postgresql://")
+
+
+@pytest_asyncio.fixture
+async def workers(lease_dsn):
+    """Three orchestrators standing in for three workers, recording ticks per second.
+
+    ``started_at`` doubles as the shared database: it maps each running clock id to
+    its started_at_ms, and orchestrators reconcile against it.
+    """
+    ticks: dict[tuple[int, int], list[int]] = defaultdict(list)
+    started_at: dict[int, int] = {}
+    orchestrators = []
+
+    for worker in range(3):
+        orchestrator = ClockOrchestrator()
+        orchestrator.set_lease_manager(
+            ClockLeaseManager(
+                lease_dsn,
+                retry_interval_seconds=RETRY_INTERVAL,
+                reconcile_interval_seconds=RECONCILE_INTERVAL,
+            )
+        )
+
+        async def on_update(clock_id: int, worker: int = worker) -> None:
+            second = round((time.time() * 1000 - started_at[clock_id]) / 1000)
+            ticks[(clock_id, second)].append(worker)
+
+        async def running_timelines() -> dict[int, int | None]:
+            return dict(started_at)
+
+        async def resume(clock_id: int, orchestrator=orchestrator) -> bool:
+            if clock_id not in started_at:
+                return False
+            orchestrator.register_playclock(clock_id, FakeStateMachine(started_at[clock_id]))
+            return True
+
+        orchestrator.set_playclock_update_callback(on_update)
+        orchestrator.set_playclock_running_callback(running_timelines)
+        orchestrator.set_playclock_resume_callback(resume)
+        await orchestrator.start()
+        # Connect up front so connection setup does not delay the first lease past second 0.
+        await orchestrator._leases._get_connection()
+        orchestrators.append(orchestrator)
+
+    yield orchestrators, ticks, started_at
+
+    for orchestrator in orchestrators:
+        await orchestrator.stop()
+
+
+def _register_everywhere(orchestrators, started_at, clock_ids, started_at_ms):
+    for clock_id in clock_ids:
+        started_at[clock_id] = started_at_ms
+        for orchestrator in orchestrators:
+            orchestrator.register_playclock(clock_id, FakeStateMachine(started_at_ms))
+
+
+async def _sleep_until(deadline_ms: int) -> None:
+    await asyncio.sleep(max(0.0, deadline_ms / 1000 - time.time()))
+
+
+def _owner(orchestrators, clock_id: int) -> int:
+    owners = [
+        index
+        for index, orchestrator in enumerate(orchestrators)
+        if orchestrator._leases.owns("playclock", clock_id)
+    ]
+    assert len(owners) == 1
+    return owners[0]
+
+
+class TestClockLeases:
+    async def test_each_clock_ticks_once_per_second_across_workers(self, workers):
+        orchestrators, ticks, started_at = workers
+        clock_ids = range(9101, 9106)
+        start_ms = int(time.time() * 1000)
+        _register_everywhere(orchestrators, started_at, clock_ids, start_ms)
+
+        await _sleep_until(start_ms + 2300)
+
+        for clock_id in clock_ids:
+            _owner(orchestrators, clock_id)
+            for second in (0, 1, 2):
+                assert ticks[(clock_id, second)] != []
+                assert len(ticks[(clock_id, second)]) == 1
+
+    async def test_surviving_worker_takes_over_without_missing_ticks(self, workers):
+        orchestrators, ticks, started_at = workers
+        clock_id = 9201
+        start_ms = int(time.time() * 1000)
+        _register_everywhere(orchestrators, started_at, [clock_id], start_ms)
+
+        await _sleep_until(start_ms + 1300)
+        owner = _owner(orchestrators, clock_id)
+        await orchestrators[owner].stop()  # worker dies, its lease connection closes
+        await _sleep_until(start_ms + 3300)
+
+        assert [len(ticks[(clock_id, second)]) for second in (0, 1, 2, 3)] == [1, 1, 1, 1]
+        assert ticks[(clock_id, 1)] == [owner]
+        assert owner not in ticks[(clock_id, 2)] + ticks[(clock_id, 3)]
+        assert _owner(orchestrators, clock_id) != owner
+
+    async def test_owner_stops_driving_clock_paused_on_another_worker(self, workers):
+        orchestrators, ticks, started_at = workers
+        clock_id = 9401
+        start_ms = int(time.time() * 1000)
+        _register_everywhere(orchestrators, started_at, [clock_id], start_ms)
+
+        await _sleep_until(start_ms + 1300)
+        owner = _owner(orchestrators, clock_id)
+        other = orchestrators[(owner + 1) % len(orchestrators)]
+        del started_at[clock_id]  # paused through another worker: row no longer running
+        other.unregister_playclock(clock_id)
+        await _sleep_until(start_ms + 3300)
+
+        assert ticks[(clock_id, 1)] == [owner]
+        assert ticks[(clock_id, 2)] == []
+        assert ticks[(clock_id, 3)] == []
+        assert all(clock_id not in o.running_playclocks for o in orchestrators)
+
+    async def test_stopped_clock_is_dropped_on_takeover(self, lease_dsn):
+        orchestrator = ClockOrchestrator()
+        orchestrator.set_lease_manager(
+            ClockLeaseManager(lease_dsn, retry_interval_seconds=RETRY_INTERVAL)
+        )
+        resumed: list[int] = []
+
+        async def resume(clock_id: int) -> bool:
+            resumed.append(clock_id)
+            return False  # another worker paused it in the meantime
+
+        orchestrator.set_playclock_resume_callback(resume)
+        await orchestrator.start()
+        try:
+            orchestrator.register_playclock(9301, FakeStateMachine(int(time.time() * 1000)))
+            await asyncio.sleep(0.2)
+
+            assert resumed == [9301]
+            assert 9301 not in orchestrator.running_playclocks
+            assert not orchestrator._leases.owns("playclock", 9301)
+        finally:
+            await orchestrator.stop()
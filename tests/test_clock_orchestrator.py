@@ -1,20 +1,30 @@
+import asyncio
 import gc
+import random
 import time
 import weakref
 
 import pytest
 
 from src.clocks.clock_orchestrator import ClockOrchestrator
+from src.core.enums import ClockDirection
 
 pytestmark = pytest.mark.asyncio(loop_scope="session")
 
 
 class FakeStateMachine:
-    def __init__(self, started_at_ms: int | None) -> None:
+    def __init__(self, started_at_ms: int | None, value: int = 1) -> None:
         self.started_at_ms = started_at_ms
+        self.value = value
+        self.direction = ClockDirection.DOWN
+        self.max_value = 720
 
     def get_current_value(self) -> int:
-        return 1
+        return self.value
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
 
 
 class TestClockOrchestrator:
@@ -32,12 +42,11 @@ class TestClockOrchestrator:
     async def test_unregister_playclock_releases_references(self):
         orchestrator = ClockOrchestrator()
         clock_id = 1
-        state_machine = FakeStateMachine(int(time.time() * 1000) - 1500)
+        state_machine = FakeStateMachine(_now_ms() - 1500)
 
         orchestrator.register_playclock(clock_id, state_machine)
-        assert orchestrator._should_update(clock_id, state_machine) is True
         assert clock_id in orchestrator.running_playclocks
-        assert clock_id in orchestrator._last_updated_second
+        assert ("playclock", clock_id) in orchestrator._next_tick
 
         state_machine_ref = weakref.ref(state_machine)
         orchestrator.unregister_playclock(clock_id)
@@ -46,18 +55,17 @@ class TestClockOrchestrator:
         gc.collect()
 
         assert clock_id not in orchestrator.running_playclocks
-        assert clock_id not in orchestrator._last_updated_second
+        assert ("playclock", clock_id) not in orchestrator._next_tick
         assert state_machine_ref() is None
 
     async def test_unregister_gameclock_releases_references(self):
         orchestrator = ClockOrchestrator()
         clock_id = 2
-        state_machine = FakeStateMachine(int(time.time() * 1000) - 1500)
+        state_machine = FakeStateMachine(_now_ms() - 1500)
 
         orchestrator.register_gameclock(clock_id, state_machine)
-        assert orchestrator._should_update(clock_id, state_machine) is True
         assert clock_id in orchestrator.running_gameclocks
-        assert clock_id in orchestrator._last_updated_second
+        assert ("gameclock", clock_id) in orchestrator._next_tick
 
         state_machine_ref = weakref.ref(state_machine)
         orchestrator.unregister_gameclock(clock_id)
@@ -66,5 +74,141 @@ class TestClockOrchestrator:
         gc.collect()
 
         assert clock_id not in orchestrator.running_gameclocks
-        assert clock_id not in orchestrator._last_updated_second
+        assert ("gameclock", clock_id) not in orchestrator._next_tick
         assert state_machine_ref() is None
+
+    async def test_deadline_is_next_whole_second_since_start(self):
+        orchestrator = ClockOrchestrator()
+        started_at_ms = _now_ms() - 1500
+        orchestrator.register_playclock(1, FakeStateMachine(started_at_ms))
+
+        deadline, *_ = orchestrator._deadlines[0]
+
+        assert orchestrator._next_tick[("playclock", 1)] == (started_at_ms, 1)
+        assert deadline == pytest.approx(started_at_ms / 1000 + 1)
+
+    async def test_reregistering_same_timeline_does_not_tick_twice(self):
+        orchestrator = ClockOrchestrator()
+        state_machine = FakeStateMachine(_now_ms())
+
+        orchestrator.register_playclock(1, state_machine)
+        orchestrator.register_playclock(1, state_machine)
+
+        assert len(orchestrator._deadlines) == 1
+
+    async def test_playclock_and_gameclock_with_same_id_tick_independently(self):
+        orchestrator = ClockOrchestrator()
+        ticks: list[tuple[str, int]] = []
+
+        async def on_playclock(clock_id: int) -> None:
+            ticks.append(("playclock", clock_id))
+
+        async def on_gameclock(clock_id: int) -> None:
+            ticks.append(("gameclock", clock_id))
+
+        orchestrator.set_playclock_update_callback(on_playclock)
+        orchestrator.set_gameclock_update_callback(on_gameclock)
+        await orchestrator.start()
+        try:
+            orchestrator.register_playclock(7, FakeStateMachine(_now_ms()))
+            orchestrator.register_gameclock(7, FakeStateMachine(_now_ms()))
+            await asyncio.sleep(0.05)
+        finally:
+            await orchestrator.stop()
+
+        assert sorted(ticks) == [("gameclock", 7), ("playclock", 7)]
+
+    async def test_slow_callback_does_not_delay_other_clocks(self):
+        orchestrator = ClockOrchestrator(callback_timeout_seconds=0.2)
+        ticked_at: dict[int, float] = {}
+
+        async def on_update(clock_id: int) -> None:
+            if clock_id == 1:
+                await asyncio.sleep(10)
+            ticked_at[clock_id] = time.perf_counter()
+
+        orchestrator.set_playclock_update_callback(on_update)
+        await orchestrator.start()
+        try:
+            start = time.perf_counter()
+            orchestrator.register_playclock(1, FakeStateMachine(_now_ms()))
+            orchestrator.register_playclock(2, FakeStateMachine(_now_ms()))
+            await asyncio.sleep(0.3)
+        finally:
+            await orchestrator.stop()
+
+        assert 1 not in ticked_at  # timed out
+        assert ticked_at[2] - start < 0.1
+
+    async def test_stop_callback_is_not_cut_off_by_callback_timeout(self):
+        orchestrator = ClockOrchestrator(callback_timeout_seconds=0.05)
+        stopped: list[int] = []
+
+        async def on_stop(clock_id: int) -> None:
+            await asyncio.sleep(0.15)  # slow terminal-state commit
+            stopped.append(clock_id)
+
+        orchestrator.set_gameclock_stop_callback(on_stop)
+        await orchestrator.start()
+        try:
+            orchestrator.register_gameclock(4, FakeStateMachine(_now_ms(), value=0))
+            await asyncio.sleep(0.3)
+        finally:
+            await orchestrator.stop()
+
+        assert stopped == [4]
+        assert 4 not in orchestrator.running_gameclocks
+
+    async def test_stop_callback_unregisters_clock_at_zero(self):
+        orchestrator = ClockOrchestrator()
+        stopped: list[int] = []
+
+        async def on_stop(clock_id: int) -> None:
+            stopped.append(clock_id)
+
+        orchestrator.set_playclock_stop_callback(on_stop)
+        await orchestrator.start()
+        try:
+            orchestrator.register_playclock(3, FakeStateMachine(_now_ms(), value=0))
+            await asyncio.sleep(0.05)
+        finally:
+            await orchestrator.stop()
+
+        assert stopped == [3]
+        assert 3 not in orchestrator.running_playclocks
+
+    @pytest.mark.slow
+    async def test_500_clocks_tick_with_low_jitter(self):
+        """Benchmark: 500 clocks started at random offsets tick within 20ms of their boundary."""
+        orchestrator = ClockOrchestrator()
+        jitter_ms: list[float] = []
+        started_at: dict[int, int] = {}
+
+        async def on_update(clock_id: int) -> None:
+            elapsed_ms = time.time() * 1000 - started_at[clock_id]
+            second = round(elapsed_ms / 1000)
+            if second > 0:
+                jitter_ms.append(elapsed_ms - second * 1000)
+
+        orchestrator.set_playclock_update_callback(on_update)
+        await orchestrator.start()
+        try:
+            now_ms = _now_ms()
+            for clock_id in range(500):
+                started_at[clock_id] = now_ms - random.randint(0, 999)
+                orchestrator.register_playclock(
+                    clock_id, FakeStateMachine(started_at[clock_id], value=100)
+                )
+            await asyncio.sleep(3.05)
+        finally:
+            await orchestrator.stop()
+
+        jitter_ms.sort()
+        p99 = jitter_ms[int(len(jitter_ms) * 0.99)]
+        print(
+            f"\n500 clocks: {len(jitter_ms)} ticks, "
+            f"median jitter {jitter_ms[len(jitter_ms) // 2]:.2f}ms, "
+            f"p99 {p99:.2f}ms, max {jitter_ms[-1]:.2f}ms"
+        )
+        assert len(jitter_ms) >= 500 * 2
+        assert p99 < 20
@@ -0,0 +1,134 @@
+"""Test read replica routing in the Database class.
+
+The "replica" is a second local PostgreSQL database, so routing can be verified by
+checking current_database() on the session handed out inside @read_only methods.
+"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+
+from src.core import settings
+from src.core.decorators import is_read_only_context, read_only
+from src.core.models.base import Database
+
+
+def _replica_url_for(primary_url: str) -> str:
+    db_name = primary_url.rsplit("/", 1)[-1]
+    replica_name = f"{settings.test_db.name}2"
+    if db_name == replica_name:
+        replica_name = f"{settings.test_db.name}3"
+    return f"{primary_url.rsplit('/', 1)[0]}/{replica_name}"
+
+
+class RoutedService:
+    def __init__(self, database: Database):
+        self.db = database
+
+    async def current_database(self) -> str:
+        async with self.db.get_session_maker()() as session:
+            result = await session.execute(text("SELECT current_database()"))
+            return result.scalar()
+
+    @read_only
+    async def current_database_read_only(self) -> str:
+        return await self.current_database()
+
+
+@pytest_asyncio.fixture
+async def replicated_db(test_db_url):
+    database = Database(test_db_url, replica_urls=[_replica_url_for(test_db_url)])
+    try:
+        yield database
+    finally:
+        await database.close()
+
+
+class TestReadOnlyDecorator:
+    @pytest.mark.asyncio
+    async def test_context_set_only_inside_decorated_method(self):
+        @read_only
+        async def probe():
+            return is_read_only_context()
+
+        assert is_read_only_context() is False
+        assert await probe() is True
+        assert is_read_only_context() is False
+
+
+class TestReplicaRouting:
+    @pytest.mark.asyncio
+    async def test_without_replicas_reads_use_primary(self, test_db_url):
+        database = Database(test_db_url)
+        try:
+            service = RoutedService(database)
+            primary_name = test_db_url.rsplit("/", 1)[-1]
+            assert await service.current_database_read_only() == primary_name
+        finally:
+            await database.close()
+
+    @pytest.mark.asyncio
+    async def test_unchecked_replica_is_not_used(self, replicated_db, test_db_url):
+        service = RoutedService(replicated_db)
+        primary_name = test_db_url.rsplit("/", 1)[-1]
+
+        assert replicated_db.replica_lag_seconds == [None]
+        assert await service.current_database_read_only() == primary_name
+
+    @pytest.mark.asyncio
+    async def test_read_only_methods_route_to_healthy_replica(self, replicated_db, test_db_url):
+        service = RoutedService(replicated_db)
+        primary_name = test_db_url.rsplit("/", 1)[-1]
+        replica_name = _replica_url_for(test_db_url).rsplit("/", 1)[-1]
+
+        lags = await replicated_db.refresh_replica_lag()
+
+        assert lags == [0.0]
+        assert await service.current_database_read_only() == replica_name
+        assert await service.current_database() == primary_name
+
+    @pytest.mark.asyncio
+    async def test_lagging_replica_falls_back_to_primary(self, replicated_db, test_db_url):
+        service = RoutedService(replicated_db)
+        primary_name = test_db_url.rsplit("/", 1)[-1]
+
+        await replicated_db.refresh_replica_lag()
+        replicated_db.replica_lag_seconds[0] = replicated_db.max_replica_lag_seconds + 1
+
+        assert await service.current_database_read_only() == primary_name
+
+    @pytest.mark.asyncio
+    async def test_round_robin_across_replicas(self, test_db_url):
+        database = Database(
+            test_db_url,
+            replica_urls=[_replica_url_for(test_db_url), _replica_url_for(test_db_url)],
+        )
+        try:
+            database.replica_lag_seconds = [0.0, 0.0]
+
+            @read_only
+            async def pick():
+                return database.get_session_maker()
+
+            picked = [await pick() for _ in range(4)]
+
+            assert picked[0] is not picked[1]
+            assert picked[0] is picked[2]
+            assert picked[1] is picked[3]
+        finally:
+            await database.close()
+
+    @pytest.mark.asyncio
+    async def test_test_session_takes_precedence(self, test_db):
+        test_db.replica_sessions.append(object())
+        test_db.replica_lag_seconds.append(0.0)
+        try:
+
+            @read_only
+            async def pick():
+                return test_db.get_session_maker()
+
+            assert await pick() is test_db.test_async_session
+        finally:
+            test_db.replica_sessions.pop()
+            test_db.replica_lag_seconds.pop()
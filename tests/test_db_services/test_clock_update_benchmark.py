@@ -0,0 +1,63 @@
+"""Benchmark: scorer actions on a gameclock, read-modify-write vs UPDATE ... RETURNING.
+
+Measures mean and p95 latency per update for the previous ORM path (SELECT, mutate,
+flush, commit, refresh) and for the single-statement RETURNING path.
+Run with: pytest -m slow -s tests/test_db_services/test_clock_update_benchmark.py
+"""
+
+from statistics import mean, quantiles
+from time import perf_counter
+
+import pytest
+from sqlalchemy import select
+
+from src.core.models import GameClockDB
+from src.gameclocks.db_services import GameClockServiceDB
+from src.gameclocks.schemas import GameClockSchemaCreate
+from tests.test_db_services.test_gameclock_service import _create_match
+
+ACTIONS = 200
+
+
+async def _read_modify_write(service: GameClockServiceDB, item_id: int, values: dict) -> None:
+    async with service.db.get_session_maker()() as session:
+        result = await session.execute(select(GameClockDB).where(GameClockDB.id == item_id))
+        gameclock = result.scalars().one()
+        for key, value in values.items():
+            setattr(gameclock, key, value)
+        gameclock.version = (gameclock.version or 0) + 1
+        await session.flush()
+        await session.commit()
+        await session.refresh(gameclock)
+
+
+async def _measure(update) -> tuple[float, float]:
+    """Run ACTIONS sequential updates; return (mean ms, p95 ms)."""
+    latencies = []
+    for action in range(ACTIONS):
+        start = perf_counter()
+        await update({"gameclock": 720 - action % 720})
+        latencies.append((perf_counter() - start) * 1000)
+    return mean(latencies), quantiles(latencies, n=20)[-1]
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_returning_update_latency(test_db):
+    service = GameClockServiceDB(test_db)
+    match = await _create_match(test_db)
+    gameclock = await service.create(GameClockSchemaCreate(match_id=match.id))
+
+    rmw_mean, rmw_p95 = await _measure(
+        lambda values: _read_modify_write(service, gameclock.id, values)
+    )
+    returning_mean, returning_p95 = await _measure(
+        lambda values: service.update_returning(gameclock.id, values)
+    )
+
+    print(
+        f"\n{ACTIONS} gameclock updates:"
+        f"\n  read-modify-write: mean {rmw_mean:6.2f}ms, p95 {rmw_p95:6.2f}ms"
+        f"\n  UPDATE RETURNING:  mean {returning_mean:6.2f}ms, p95 {returning_p95:6.2f}ms"
+    )
+    assert returning_mean < rmw_mean
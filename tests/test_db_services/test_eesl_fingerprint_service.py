@@ -0,0 +1,25 @@
+import pytest
+
+from src.pars_eesl.db_services import EeslFingerprintServiceDB
+
+
+@pytest.fixture
+def service(test_db) -> EeslFingerprintServiceDB:
+    return EeslFingerprintServiceDB(test_db)
+
+
+@pytest.mark.asyncio
+class TestEeslFingerprintServiceDB:
+    async def test_save_upserts_per_entity(self, service):
+        await service.save_fingerprints("team", {1: "a" * 64, 2: "b" * 64})
+        await service.save_fingerprints("team", {2: "c" * 64})
+        await service.save_fingerprints("match", {1: "d" * 64})
+
+        assert await service.get_fingerprints("team") == {1: "a" * 64, 2: "c" * 64}
+        assert await service.get_fingerprints("match") == {1: "d" * 64}
+        assert await service.get_fingerprints("player") == {}
+
+    async def test_save_nothing(self, service):
+        await service.save_fingerprints("team", {})
+
+        assert await service.get_fingerprints("team") == {}
@@ -1,4 +1,5 @@
 import pytest
+from fastapi import HTTPException
 
 from src.core.enums import ClockDirection, ClockStatus, PeriodClockVariant
 from src.gameclocks.db_services import GameClockServiceDB
@@ -19,6 +20,21 @@ from tests.factories import (
     TeamFactory,
     TournamentFactory,
 )
+from tests.testhelpers import assert_max_queries
+
+
+async def _create_match(test_db):
+    sport = await SportServiceDB(test_db).create(SportFactorySample.build())
+    season = await SeasonServiceDB(test_db).create(SeasonFactorySample.build())
+    tournament = await TournamentServiceDB(test_db).create(
+        TournamentFactory.build(sport_id=sport.id, season_id=season.id)
+    )
+    team_service = TeamServiceDB(test_db)
+    team_a = await team_service.create(TeamFactory.build(sport_id=sport.id))
+    team_b = await team_service.create(TeamFactory.build(sport_id=sport.id))
+    return await MatchServiceDB(test_db).create(
+        MatchFactory.build(tournament_id=tournament.id, team_a_id=team_a.id, team_b_id=team_b.id)
+    )
 
 
 @pytest.mark.asyncio
@@ -127,6 +143,45 @@ class TestGameClockServiceDB:
         assert updated.gameclock == 600
         assert updated.gameclock_status == "running"
 
+    async def test_update_is_single_returning_statement_and_bumps_version(self, test_db):
+        gameclock_service = GameClockServiceDB(test_db)
+        match = await _create_match(test_db)
+        created = await gameclock_service.create(
+            GameClockSchemaCreate(match_id=match.id, gameclock=720)
+        )
+
+        with assert_max_queries(1):
+            updated = await gameclock_service.update_returning(created.id, {"gameclock": 500})
+
+        assert updated.gameclock == 500
+        assert updated.version == created.version + 1
+
+    async def test_update_with_stale_expected_version_conflicts(self, test_db):
+        gameclock_service = GameClockServiceDB(test_db)
+        match = await _create_match(test_db)
+        created = await gameclock_service.create(
+            GameClockSchemaCreate(match_id=match.id, gameclock=720)
+        )
+        await gameclock_service.update(
+            created.id, GameClockSchemaUpdate(gameclock=600), expected_version=created.version
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await gameclock_service.update(
+                created.id, GameClockSchemaUpdate(gameclock=500), expected_version=created.version
+            )
+
+        assert exc_info.value.status_code == 409
+        current = await gameclock_service.get_by_id(created.id)
+        assert current.gameclock == 600
+        assert current.version == created.version + 1
+        assert (
+            await gameclock_service.update(
+                999999, GameClockSchemaUpdate(gameclock=1), expected_version=1
+            )
+            is None
+        )
+
     async def test_get_gameclock_by_match_id(self, test_db):
         sport_service = SportServiceDB(test_db)
         sport = await sport_service.create(SportFactorySample.build())
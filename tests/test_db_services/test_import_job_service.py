@@ -0,0 +1,181 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import update
+
+from src.core.enums import ImportJobStatus
+from src.core.models import ImportJobDB
+from src.import_jobs.db_services import ImportJobServiceDB
+from src.import_jobs.schemas import ImportJobSchema, ImportJobSchemaCreate
+
+
+@pytest.fixture
+def service(test_db) -> ImportJobServiceDB:
+    return ImportJobServiceDB(test_db)
+
+
+async def _backdate_heartbeat(database, job_id: int, seconds: float) -> None:
+    async with database.get_session_maker()() as session:
+        await session.execute(
+            update(ImportJobDB)
+            .where(ImportJobDB.id == job_id)
+            .values(heartbeat_at=datetime.now(UTC) - timedelta(seconds=seconds))
+        )
+        await session.commit()
+
+
+@pytest.mark.asyncio
+class TestImportJobServiceDB:
+    async def test_submit_queues_job(self, service):
+        job = await service.submit(
+            ImportJobSchemaCreate(kind="teams", params={"eesl_tournament_id": 5})
+        )
+
+        assert job.status == ImportJobStatus.QUEUED
+        assert job.params == {"eesl_tournament_id": 5}
+        assert job.attempts == 0
+
+    async def test_submit_rejects_unknown_kind(self, service):
+        with pytest.raises(HTTPException) as exc_info:
+            await service.submit(ImportJobSchemaCreate(kind="nope"))
+
+        assert exc_info.value.status_code == 400
+
+    async def test_claim_next_takes_oldest_queued_job_once(self, service):
+        first = await service.submit(ImportJobSchemaCreate(kind="players"))
+        second = await service.submit(ImportJobSchemaCreate(kind="players"))
+
+        claimed = [await service.claim_next(60, 3) for _ in range(3)]
+
+        assert [job.id for job in claimed[:2]] == [first.id, second.id]
+        assert claimed[2] is None
+        assert claimed[0].status == ImportJobStatus.RUNNING
+        assert claimed[0].attempts == 1
+        assert claimed[0].heartbeat_at is not None
+
+    async def test_progress_is_fenced_to_the_claiming_run(self, service):
+        await service.submit(ImportJobSchemaCreate(kind="players"))
+        job = await service.claim_next(60, 3)
+
+        assert await service.record_progress(job.id, job.started_at, 3, 10, {"page": 2})
+        assert not await service.record_progress(
+            job.id, job.started_at - timedelta(seconds=1), 4, 10, {"page": 3}
+        )
+
+        stored = await service.get_by_id(job.id)
+        assert (stored.progress_done, stored.progress_total) == (3, 10)
+        assert stored.checkpoint == {"page": 2}
+
+    async def test_stale_run_is_resumed_from_checkpoint(self, service, test_db):
+        await service.submit(ImportJobSchemaCreate(kind="players"))
+        job = await service.claim_next(60, 3)
+        await service.record_progress(job.id, job.started_at, 4, checkpoint={"page": 4})
+
+        assert await service.claim_next(60, 3) is None
+        await _backdate_heartbeat(test_db, job.id, 120)
+        resumed = await service.claim_next(60, 3)
+
+        assert resumed.id == job.id
+        assert resumed.attempts == 2
+        assert resumed.checkpoint == {"page": 4}
+        assert resumed.progress_at_start == 4
+        # The first run lost the job.
+        assert not await service.heartbeat(job.id, job.started_at)
+        assert await service.heartbeat(resumed.id, resumed.started_at)
+
+    async def test_stale_run_out_of_attempts_fails(self, service, test_db):
+        await service.submit(ImportJobSchemaCreate(kind="players"))
+        job = await service.claim_next(60, 1)
+        await _backdate_heartbeat(test_db, job.id, 120)
+
+        assert await service.claim_next(60, 1) is None
+
+        stored = await service.get_by_id(job.id)
+        assert stored.status == ImportJobStatus.FAILED
+        assert "1 attempts" in stored.error
+
+    async def test_cancel_stops_heartbeats_and_resume_requeues(self, service):
+        await service.submit(ImportJobSchemaCreate(kind="players"))
+        job = await service.claim_next(60, 3)
+        await service.record_progress(job.id, job.started_at, 2, checkpoint={"page": 2})
+
+        cancelled = await service.cancel(job.id)
+        assert cancelled.status == ImportJobStatus.CANCELLED
+        assert not await service.heartbeat(job.id, job.started_at)
+
+        resumed = await service.resume(job.id)
+        assert resumed.status == ImportJobStatus.QUEUED
+        assert resumed.attempts == 0
+        assert resumed.checkpoint == {"page": 2}
+
+        with pytest.raises(HTTPException) as exc_info:
+            await service.resume(job.id)
+        assert exc_info.value.status_code == 409
+
+    async def test_release_requeues_without_using_an_attempt(self, service):
+        await service.submit(ImportJobSchemaCreate(kind="players"))
+        job = await service.claim_next(60, 3)
+
+        assert await service.release(job.id, job.started_at)
+
+        stored = await service.get_by_id(job.id)
+        assert stored.status == ImportJobStatus.QUEUED
+        assert stored.attempts == 0
+
+    async def test_finish_and_fail(self, service):
+        await service.submit(ImportJobSchemaCreate(kind="players"))
+        await service.submit(ImportJobSchemaCreate(kind="players"))
+        done = await service.claim_next(60, 3)
+        broken = await service.claim_next(60, 3)
+
+        assert await service.finish(done.id, done.started_at, {"players": 7})
+        assert await service.fail(broken.id, broken.started_at, "ValueError: boom")
+
+        jobs = {job.id: job for job in await service.get_jobs()}
+        assert jobs[done.id].status == ImportJobStatus.SUCCEEDED
+        assert jobs[done.id].result == {"players": 7}
+        assert jobs[broken.id].status == ImportJobStatus.FAILED
+        assert jobs[broken.id].error == "ValueError: boom"
+        assert [job.id for job in await service.get_jobs(ImportJobStatus.FAILED)] == [broken.id]
+
+
+class TestImportJobSchema:
+    def _job(self, **values) -> ImportJobSchema:
+        now = datetime.now(UTC)
+        return ImportJobSchema(
+            **{
+                "id": 1,
+                "kind": "players",
+                "params": {},
+                "status": ImportJobStatus.RUNNING,
+                "progress_done": 30,
+                "progress_total": 50,
+                "progress_at_start": 10,
+                "attempts": 2,
+                "created_at": now,
+                "started_at": now - timedelta(seconds=100),
+                **values,
+            }
+        )
+
+    def test_eta_uses_this_runs_rate(self):
+        # 20 units in 100s, 20 left.
+        assert self._job().eta_seconds == pytest.approx(100, abs=1)
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            {"status": ImportJobStatus.SUCCEEDED},
+            {"progress_total": None},
+            {"progress_at_start": 30},
+        ],
+    )
+    def test_no_eta_without_a_rate(self, values):
+        assert self._job(**values).eta_seconds is None
+
+    def test_eta_is_serialized(self):
+        dumped = self._job().model_dump()
+
+        assert "eta_seconds" in dumped
+        assert "progress_at_start" not in dumped
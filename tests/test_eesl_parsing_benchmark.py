@@ -0,0 +1,143 @@
+"""Benchmark: parsing a large EESL players index page.
+
+Compares the BeautifulSoup traversal the scrapers use with an lxml XPath extractor producing the
+same rows, and measures how long the event loop stalls while pages are parsed inline on the loop
+versus in the parsing pool (``parse_html``).
+Run with: pytest -m slow -s tests/test_eesl_parsing_benchmark.py
+"""
+
+import asyncio
+import re
+from time import perf_counter
+
+import lxml.html
+import pytest
+from bs4 import BeautifulSoup
+
+from src.pars_eesl.pars_all_players_from_eesl import _extract_players_index
+from src.pars_eesl.parsing import parse_html
+
+PLAYERS = 2000
+PAGES = 5
+ROUNDS = 3
+TICK_SECONDS = 0.001
+
+
+def _players_page() -> str:
+    rows = "".join(
+        f'<tr class="table__row"><td class="table__cell">'
+        f'<a href="/player?id={player}" class="table__player">'
+        f'<img class="table__player-img" src="https://eesl.test/photos/{player}_200.jpg" />'
+        f'<span class="table__player-name">игрок{player} имя{player}</span></a></td>'
+        f'<td class="table__cell table__cell--number">{player % 99}</td>'
+        f'<td class="table__cell table__cell--amplua">wr</td></tr>'
+        for player in range(1, PLAYERS + 1)
+    )
+    return (
+        f"<html><body><table>{rows}</table>"
+        '<ul id="players-pagination">'
+        '<li class="pagination-section__item--arrow"></li>'
+        '<li class="pagination-section__item--arrow pagination-section__item--disabled"></li>'
+        "</ul></body></html>"
+    )
+
+
+def _xpath_players_index(content: str) -> tuple[list[dict], bool]:
+    """Candidate extractor: the same rows via lxml XPath, without a BeautifulSoup tree."""
+    tree = lxml.html.fromstring(content)
+    players_basic_info = []
+    for row in tree.xpath('//tr[contains(concat(" ", @class, " "), " table__row ")]'):
+        href = row.xpath('.//a[contains(@class, "table__player")]/@href')[0]
+        full_name = row.xpath('string(.//span[@class="table__player-name"])').strip().lower()
+        src = row.xpath('.//img[@class="table__player-img"]/@src')[0]
+        img_url, extension = src.strip().split("_")
+        players_basic_info.append(
+            {
+                "player_eesl_id": int(re.findall(r"\d+", href)[0]),
+                "player_first_name": full_name.split(" ")[1],
+                "player_second_name": full_name.split(" ")[0],
+                "player_img_url": f"{img_url}.{extension.split('.')[1]}",
+            }
+        )
+    arrows = tree.xpath('//ul[@id="players-pagination"]/li[contains(@class, "--arrow")]/@class')
+    has_next_page = not arrows or "pagination-section__item--disabled" not in arrows[-1].split()
+    return players_basic_info, has_next_page
+
+
+def _best_of(extract, content: str) -> tuple[float, tuple]:
+    best, result = float("inf"), None
+    for _ in range(ROUNDS):
+        start = perf_counter()
+        result = extract(content)
+        best = min(best, perf_counter() - start)
+    return best, result
+
+
+async def _max_loop_stall(parse_pages) -> tuple[float, float]:
+    """Run ``parse_pages`` next to a ticker and return (elapsed, longest gap between ticks)."""
+    done = asyncio.Event()
+    longest = 0.0
+
+    async def ticker():
+        nonlocal longest
+        last = perf_counter()
+        while not done.is_set():
+            await asyncio.sleep(TICK_SECONDS)
+            now = perf_counter()
+            longest = max(longest, now - last - TICK_SECONDS)
+            last = now
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    start = perf_counter()
+    await parse_pages()
+    elapsed = perf_counter() - start
+    done.set()
+    await task
+    return elapsed, longest
+
+
+@pytest.mark.slow
+def test_xpath_extraction_matches_beautifulsoup():
+    content = _players_page()
+
+    soup_seconds, soup_result = _best_of(
+        lambda page: _extract_players_index(BeautifulSoup(page, "lxml")), content
+    )
+    xpath_seconds, xpath_result = _best_of(_xpath_players_index, content)
+
+    print(
+        f"\nPlayers index page, {PLAYERS} rows ({len(content) // 1024} KiB), best of {ROUNDS}:"
+        f"\n  BeautifulSoup traversal {soup_seconds * 1000:8.1f} ms"
+        f"\n  lxml XPath              {xpath_seconds * 1000:8.1f} ms"
+        f"  ({soup_seconds / xpath_seconds:.1f}x faster)"
+    )
+
+    assert xpath_result == soup_result
+    assert len(soup_result[0]) == PLAYERS
+    assert soup_result[1] is False
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_parsing_pool_keeps_event_loop_responsive():
+    content = _players_page()
+
+    async def inline():
+        for _ in range(PAGES):
+            _extract_players_index(BeautifulSoup(content, "lxml"))
+
+    async def pooled():
+        for _ in range(PAGES):
+            await parse_html(content, _extract_players_index)
+
+    inline_seconds, inline_stall = await _max_loop_stall(inline)
+    pooled_seconds, pooled_stall = await _max_loop_stall(pooled)
+
+    print(
+        f"\n{PAGES} players index pages of {PLAYERS} rows, longest event loop stall:"
+        f"\n  parsed on the loop   {inline_stall * 1000:8.1f} ms  ({inline_seconds:.2f}s total)"
+        f"\n  parsed in the pool   {pooled_stall * 1000:8.1f} ms  ({pooled_seconds:.2f}s total)"
+    )
+
+    assert pooled_stall < inline_stall
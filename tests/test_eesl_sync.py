@@ -0,0 +1,49 @@
+"""
+Tests for incremental EESL sync fingerprints.
+
+Run with:
+    pytest tests/test_eesl_sync.py
+"""
+
+import pytest
+
+from src.pars_eesl.db_services import EeslFingerprintServiceDB
+from src.pars_eesl.sync import EeslSync, fingerprint
+
+
+def test_fingerprint_ignores_key_order():
+    assert fingerprint({"a": 1, "b": [1, 2]}) == fingerprint({"b": [1, 2], "a": 1})
+    assert fingerprint({"a": 1}) != fingerprint({"a": 2})
+
+
+@pytest.mark.asyncio
+class TestEeslSync:
+    async def test_unchanged_after_written_and_saved(self, test_db):
+        service = EeslFingerprintServiceDB(test_db)
+        sync = EeslSync(service)
+        assert not await sync.unchanged("team", 1, {"title": "a"})
+        assert not await sync.unchanged("team", 2, {"title": "b"})
+        sync.written("team", 1)
+        await sync.save()
+
+        # Team 2 was never written, so the next run imports it again.
+        next_run = EeslSync(service)
+        assert await next_run.unchanged("team", 1, {"title": "a"})
+        assert not await next_run.unchanged("team", 2, {"title": "b"})
+        assert not await next_run.unchanged("team", 1, {"title": "renamed"})
+        next_run.written("team", 1)
+        next_run.written("team", 2)
+
+        assert sync.summary() == {"team": {"created": 1, "updated": 0, "unchanged": 0}}
+        assert next_run.summary() == {"team": {"created": 1, "updated": 1, "unchanged": 1}}
+        assert next_run.unchanged_ids("team") == {1}
+
+    async def test_force_treats_everything_as_changed(self, test_db):
+        service = EeslFingerprintServiceDB(test_db)
+        await service.save_fingerprints("match", {5: fingerprint({"week": 1})})
+        sync = EeslSync(service, force=True)
+
+        assert not await sync.unchanged("match", 5, {"week": 1})
+        sync.written("match", 5)
+
+        assert sync.summary() == {"match": {"created": 0, "updated": 1, "unchanged": 0}}
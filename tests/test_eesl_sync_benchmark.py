@@ -0,0 +1,220 @@
+"""Benchmark: re-importing an unchanged EESL tournament, with and without fingerprints.
+
+Runs the "tournament" import job (teams, matches, match rosters) three times against the same
+simulated EESL data: a first import, a forced re-import that ignores fingerprints (what every
+re-import did before), and an incremental re-import. EESL pages, logo and photo downloads
+are simulated with fixed latencies; the DB is the test database.
+Run with: pytest -m slow -s tests/test_eesl_sync_benchmark.py
+"""
+
+import asyncio
+from collections import Counter
+from time import perf_counter
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.core.models import PositionDB, SeasonDB, SportDB, TournamentDB
+from src.core.query_stats import track_queries
+from src.import_jobs.db_services import ImportJobServiceDB
+from src.import_jobs.kinds import ImportJobContext, import_tournament
+from src.import_jobs.schemas import ImportJobSchemaCreate
+
+EESL_TOURNAMENT_ID = 4242
+TEAMS = 8
+MATCHES = 12
+PLAYERS_PER_TEAM = 8
+PAGE_SECONDS = 0.02
+DOWNLOAD_SECONDS = 0.03
+COLOR_SECONDS = 0.005
+
+
+def _teams_page() -> str:
+    items = "".join(
+        f'<li class="teams__item">'
+        f'<a href="/team?team_id={team}" class="teams__logo">'
+        f'<img src="https://eesl.test/logo{team}.png" alt="Team {team}" /></a>'
+        f'<a href="/team?team_id={team}" class="teams__name-link">Team {team}</a></li>'
+        for team in range(1, TEAMS + 1)
+    )
+    return f"<html><body><ul>{items}</ul></body></html>"
+
+
+def _pairing(match: int) -> tuple[int, int]:
+    team_a = match % TEAMS + 1
+    return team_a, (match + 3) % TEAMS + 1
+
+
+def _calendar_page() -> str:
+    matches = "".join(
+        f'<li class="js-calendar-match">'
+        f'<a class="schedule__score" href="/match/{500 + match}"></a>'
+        f'<a class="schedule__team-1" href="/team?team_id={_pairing(match)[0]}"></a>'
+        f'<a class="schedule__team-2" href="/team?team_id={_pairing(match)[1]}"></a>'
+        f'<div class="schedule__score-main">21:14</div>'
+        f'<span class="schedule__time">18:00</span></li>'
+        for match in range(MATCHES)
+    )
+    return (
+        '<html><body><div class="js-schedule"><div class="js-calendar-matches-header">'
+        '<span class="schedule__head-text">15 мая, суббота</span>'
+        f'<ul class="schedule__matches-list">{matches}</ul>'
+        "</div></div></body></html>"
+    )
+
+
+def _roster(team: int) -> list[dict]:
+    return [
+        {
+            "player_number": str(number),
+            "player_position": "qb" if number == 1 else "wr",
+            "player_eesl_id": team * 100 + number,
+        }
+        for number in range(1, PLAYERS_PER_TEAM + 1)
+    ]
+
+
+class SimulatedEesl:
+    """EESL pages and downloads with fixed latencies, counted by kind."""
+
+    def __init__(self) -> None:
+        self.calls: Counter[str] = Counter()
+
+    async def get_url(self, url: str):
+        self.calls["page"] += 1
+        await asyncio.sleep(PAGE_SECONDS)
+        return Mock(content=_teams_page() if url.endswith("/teams") else _calendar_page())
+
+    async def download_and_process_image(self, img_url: str, **kwargs) -> dict:
+        self.calls["logo download"] += 1
+        await asyncio.sleep(DOWNLOAD_SECONDS)
+        return {
+            "image_path": f"/tmp/{img_url.rsplit('/', 1)[-1]}",
+            "image_url": img_url,
+            "image_icon_url": img_url,
+            "image_webview_url": img_url,
+        }
+
+    async def get_most_common_color(self, image_path: str) -> str:
+        self.calls["color extraction"] += 1
+        await asyncio.sleep(COLOR_SECONDS)
+        return "#112233"
+
+    async def parse_match(self, eesl_match_id: int) -> dict:
+        self.calls["page"] += 1
+        await asyncio.sleep(PAGE_SECONDS)
+        team_a, team_b = _pairing(eesl_match_id - 500)
+        return {
+            "team_a_eesl_id": team_a,
+            "team_b_eesl_id": team_b,
+            "score_a": "21",
+            "score_b": "14",
+            "roster_a": _roster(team_a),
+            "roster_b": _roster(team_b),
+        }
+
+    async def collect_player(self, player_eesl_id: int) -> dict:
+        self.calls["photo download"] += 1
+        await asyncio.sleep(PAGE_SECONDS + DOWNLOAD_SECONDS)
+        return {
+            "person": {
+                "first_name": "player",
+                "second_name": str(player_eesl_id),
+                "person_photo_url": f"/static/uploads/persons/photos/{player_eesl_id}.png",
+                "person_photo_icon_url": f"/static/uploads/persons/photos/{player_eesl_id}.png",
+                "person_photo_web_url": f"/static/uploads/persons/photos/{player_eesl_id}.png",
+                "person_eesl_id": player_eesl_id,
+            },
+            "player": {"sport_id": "1", "player_eesl_id": player_eesl_id},
+        }
+
+
+async def _create_tournament(database) -> None:
+    async with database.get_session_maker()() as session:
+        # Parsed teams, players and positions belong to sport 1.
+        if await session.get(SportDB, 1) is None:
+            session.add(SportDB(id=1, title="football"))
+        season = SeasonDB(year=2099, description="benchmark")
+        session.add(season)
+        session.add_all([PositionDB(title="qb", sport_id=1), PositionDB(title="wr", sport_id=1)])
+        await session.flush()
+        session.add(
+            TournamentDB(
+                tournament_eesl_id=EESL_TOURNAMENT_ID,
+                title="benchmark cup",
+                season_id=season.id,
+                sport_id=1,
+            )
+        )
+        await session.commit()
+
+
+async def _import(database, eesl: SimulatedEesl, force: bool = False) -> dict:
+    service = ImportJobServiceDB(database)
+    await service.submit(
+        ImportJobSchemaCreate(
+            kind="tournament",
+            params={"eesl_tournament_id": EESL_TOURNAMENT_ID, "force": force},
+        )
+    )
+    context = ImportJobContext(database, service, await service.claim_next(60, 3))
+    eesl.calls.clear()
+    start = perf_counter()
+    with track_queries("benchmark") as stats:
+        result = await import_tournament(context)
+        await context.sync.save()
+    return {
+        "seconds": perf_counter() - start,
+        "queries": stats.count,
+        "calls": dict(eesl.calls),
+        "result": result,
+        "summary": context.sync.summary(),
+    }
+
+
+def _report(name: str, run: dict) -> str:
+    calls = ", ".join(f"{count} {kind}s" for kind, count in sorted(run["calls"].items()))
+    return f"\n  {name:<22} {run['seconds']:6.2f}s, {run['queries']:5d} queries, {calls}"
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_incremental_reimport_skips_unchanged_entities(test_db):
+    await _create_tournament(test_db)
+    eesl = SimulatedEesl()
+
+    with (
+        patch("src.pars_eesl.pars_tournament.get_url", eesl.get_url),
+        patch("src.pars_eesl.pars_tournament.file_service") as file_service,
+        patch("src.player_match.views.parse_match_and_create_jsons", eesl.parse_match),
+        patch("src.player_match.views.collect_player_full_data_eesl", eesl.collect_player),
+        patch("src.player_match.views.photo_files_exist", return_value=True),
+        # The match parser uses the application database; point it at the test one.
+        patch("src.matches.parser.db", test_db),
+        patch.object(test_db, "async_session", test_db.test_async_session),
+    ):
+        file_service.download_and_process_image = eesl.download_and_process_image
+        file_service.get_most_common_color = eesl.get_most_common_color
+
+        first = await _import(test_db, eesl)
+        forced = await _import(test_db, eesl, force=True)
+        incremental = await _import(test_db, eesl)
+
+    print(
+        f"\nTournament import, {TEAMS} teams, {MATCHES} matches, "
+        f"{2 * PLAYERS_PER_TEAM} players per match:"
+        + _report("first import", first)
+        + _report("re-import (forced)", forced)
+        + _report("re-import (incremental)", incremental)
+        + f"\n  incremental summary: {incremental['summary']}"
+    )
+
+    assert first["result"]["matches"] == MATCHES
+    assert incremental["summary"] == {
+        "team": {"created": 0, "updated": 0, "unchanged": TEAMS},
+        "match": {"created": 0, "updated": 0, "unchanged": MATCHES},
+        "roster": {"created": 0, "updated": 0, "unchanged": MATCHES},
+    }
+    assert "logo download" not in incremental["calls"]
+    assert incremental["queries"] < forced["queries"]
+    assert incremental["seconds"] < forced["seconds"]
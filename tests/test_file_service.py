@@ -156,21 +156,18 @@ class TestFileService:
             "download_image",
             return_value=original_image_path,
         ):
-            with patch.object(file_service.fs_service, "create_path", side_effect=lambda x: x):
-                with patch.object(
-                    file_service.image_service,
-                    "resize_and_save_image",
-                    new_callable=AsyncMock,
-                ):
-                    await file_service.download_and_resize_image(
-                        img_url,
-                        original_file_path,
-                        original_image_path,
-                        icon_image_path,
-                        web_view_image_path,
-                        icon_height=100,
-                        web_view_height=400,
-                    )
+            await file_service.download_and_resize_image(
+                img_url,
+                original_file_path,
+                original_image_path,
+                icon_image_path,
+                web_view_image_path,
+                icon_height=100,
+                web_view_height=400,
+            )
+
+        assert Image.open(icon_image_path).height == 100
+        assert Image.open(web_view_image_path).height == 400
 
     @staticmethod
     def test_generate_image_paths():
@@ -252,25 +249,17 @@ class TestFileService:
 
         mock_download.return_value = original_image_path
 
-        with patch.object(file_service.fs_service, "create_path", side_effect=lambda x: x):
-            with patch.object(
-                file_service.image_service,
-                "resize_and_save_image",
-                new_callable=AsyncMock,
-            ):
-                await file_service.download_and_resize_image(
-                    img_url,
-                    original_file_path,
-                    original_image_path,
-                    icon_image_path,
-                    web_view_image_path,
-                    icon_height=100,
-                    web_view_height=400,
-                    force_redownload=True,
-                )
-                mock_download.assert_called_once_with(
-                    img_url, original_image_path, force_redownload=True
-                )
+        await file_service.download_and_resize_image(
+            img_url,
+            original_file_path,
+            original_image_path,
+            icon_image_path,
+            web_view_image_path,
+            icon_height=100,
+            web_view_height=400,
+            force_redownload=True,
+        )
+        mock_download.assert_called_once_with(img_url, original_image_path, force_redownload=True)
 
     @pytest.mark.asyncio
     @patch.object(DownloadService, "fetch_image_data_from_url", new_callable=AsyncMock)
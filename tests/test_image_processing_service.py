@@ -43,6 +43,35 @@ class TestImageProcessingService:
         assert isinstance(image, Image.Image)
         assert image.size == (100, 100)
 
+    @pytest.mark.asyncio
+    async def test_reduce_decoding_jpeg(self, image_service, tmp_path):
+        """Test a JPEG is decoded at the smallest scale covering the requested size."""
+        image_path = tmp_path / "large.jpg"
+        Image.new("RGB", (2000, 1000), color="red").save(image_path, format="JPEG")
+
+        image = await image_service.open_image_from_path(str(image_path))
+        image_service.reduce_decoding(image, min_height=400)
+        image.load()
+
+        assert image.size == (1000, 500)
+        assert image.format == "JPEG"
+
+    @pytest.mark.asyncio
+    async def test_reduce_decoding_keeps_full_size_when_needed(self, image_service, tmp_path):
+        """Test images are decoded at full size when the requested size needs it."""
+        jpeg_path = tmp_path / "small.jpg"
+        png_path = tmp_path / "large.png"
+        Image.new("RGB", (300, 300), color="red").save(jpeg_path, format="JPEG")
+        Image.new("RGB", (2000, 1000), color="red").save(png_path, format="PNG")
+
+        jpeg = await image_service.open_image_from_path(str(jpeg_path))
+        image_service.reduce_decoding(jpeg, min_height=400)
+        png = await image_service.open_image_from_path(str(png_path))
+        image_service.reduce_decoding(png, min_height=400)
+
+        assert jpeg.size == (300, 300)
+        assert png.size == (2000, 1000)
+
     @pytest.mark.asyncio
     async def test_save_image(self, image_service, tmp_path):
         """Test saving image to destination."""
@@ -0,0 +1,233 @@
+"""
+Tests for the content-addressed image store.
+
+Run with:
+    pytest tests/test_image_store.py
+"""
+
+import hashlib
+import os
+from io import BytesIO
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from PIL import Image
+
+from src.core.config import settings
+from src.helpers.download_service import DownloadService
+from src.helpers.file_service import FileService
+from src.helpers.image_store import ImageStore
+
+
+def _jpeg(color: str) -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", (200, 200), color=color).save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def store(tmp_path) -> ImageStore:
+    return ImageStore(tmp_path / "images")
+
+
+@pytest.mark.asyncio
+class TestImageStore:
+    async def test_adopt_links_duplicates_to_one_copy(self, store, tmp_path):
+        first = tmp_path / "teams" / "a.png"
+        second = tmp_path / "tournaments" / "b.png"
+        for path in (first, second):
+            path.parent.mkdir(parents=True)
+            path.write_bytes(b"same logo")
+
+        assert await store.adopt(first) == await store.adopt(second)
+        assert os.path.samefile(first, second)
+        assert second.read_bytes() == b"same logo"
+
+    async def test_url_index_needs_the_stored_image(self, store, tmp_path):
+        path = tmp_path / "a.png"
+        path.write_bytes(b"logo")
+        digest = await store.adopt(path)
+
+        await store.remember_url("https://eesl.test/a.png", digest)
+        assert await store.lookup_url("https://eesl.test/a.png") == digest
+        assert await store.lookup_url("https://eesl.test/b.png") is None
+
+        path.unlink()
+        assert await store.prune() == 1
+        assert await store.lookup_url("https://eesl.test/a.png") is None
+
+    async def test_link_replaces_destination(self, store, tmp_path):
+        source = tmp_path / "a.png"
+        source.write_bytes(b"new")
+        digest = await store.adopt(source)
+        dest = tmp_path / "copy" / "a.png"
+        dest.parent.mkdir()
+        dest.write_bytes(b"old")
+
+        assert await store.link(digest, dest)
+        assert dest.read_bytes() == b"new"
+        assert not await store.link("0" * 64, dest)
+
+    async def test_detach_keeps_stored_content(self, store, tmp_path):
+        path = tmp_path / "a.png"
+        path.write_bytes(b"stored")
+        digest = await store.adopt(path)
+
+        store.detach(path)
+        path.write_bytes(b"rewritten")
+
+        assert await store.link(digest, tmp_path / "b.png")
+        assert (tmp_path / "b.png").read_bytes() == b"stored"
+
+
+@pytest.mark.asyncio
+class TestFileServiceImageStore:
+    @pytest.fixture
+    def file_service(self, tmp_path) -> FileService:
+        return FileService(upload_dir=tmp_path / "uploads")
+
+    async def _download(self, file_service, tmp_path, img_url: str, name: str) -> None:
+        logos = tmp_path / "uploads" / "teams" / "logos"
+        await file_service.download_and_resize_image(
+            img_url,
+            str(logos),
+            str(logos / f"{name}.jpg"),
+            str(logos / f"{name}_100px.jpg"),
+            str(logos / f"{name}_400px.jpg"),
+        )
+
+    async def test_repeat_download_is_a_local_lookup(self, file_service, tmp_path):
+        with (
+            patch.object(
+                DownloadService, "fetch_image_data_from_url", AsyncMock(return_value=_jpeg("red"))
+            ) as fetch,
+            patch.object(DownloadService, "get_remote_file_size", AsyncMock()) as head,
+            patch.object(
+                file_service.image_service,
+                "resize_and_save_image",
+                wraps=file_service.image_service.resize_and_save_image,
+            ) as resize,
+        ):
+            await self._download(file_service, tmp_path, "https://eesl.test/a.jpg", "team_a")
+            await self._download(file_service, tmp_path, "https://eesl.test/a.jpg", "team_a2")
+
+        assert fetch.await_count == 1
+        head.assert_not_called()
+        assert resize.await_count == 2
+        logos = tmp_path / "uploads" / "teams" / "logos"
+        assert os.path.samefile(logos / "team_a.jpg", logos / "team_a2.jpg")
+        assert os.path.samefile(logos / "team_a_400px.jpg", logos / "team_a2_400px.jpg")
+
+    async def test_same_image_from_another_url_is_stored_once(self, file_service, tmp_path):
+        with (
+            patch.object(
+                DownloadService, "fetch_image_data_from_url", AsyncMock(return_value=_jpeg("red"))
+            ) as fetch,
+            patch.object(
+                file_service.image_service,
+                "resize_and_save_image",
+                wraps=file_service.image_service.resize_and_save_image,
+            ) as resize,
+        ):
+            await self._download(file_service, tmp_path, "https://eesl.test/a.jpg", "team_a")
+            await self._download(file_service, tmp_path, "https://cdn.test/a.jpg", "team_b")
+
+        assert fetch.await_count == 2
+        assert resize.await_count == 2
+        logos = tmp_path / "uploads" / "teams" / "logos"
+        assert os.path.samefile(logos / "team_a_100px.jpg", logos / "team_b_100px.jpg")
+
+    async def test_force_redownload_does_not_overwrite_shared_copy(self, file_service, tmp_path):
+        logos = tmp_path / "uploads" / "teams" / "logos"
+        with patch.object(
+            DownloadService,
+            "fetch_image_data_from_url",
+            AsyncMock(side_effect=[_jpeg("red"), _jpeg("blue")]),
+        ):
+            await self._download(file_service, tmp_path, "https://eesl.test/a.jpg", "team_a")
+            await self._download(file_service, tmp_path, "https://eesl.test/a.jpg", "team_b")
+            before = (logos / "team_a.jpg").read_bytes()
+            await file_service.download_and_resize_image(
+                "https://eesl.test/a.jpg",
+                str(logos),
+                str(logos / "team_b.jpg"),
+                str(logos / "team_b_100px.jpg"),
+                str(logos / "team_b_400px.jpg"),
+                force_redownload=True,
+            )
+
+        assert (logos / "team_a.jpg").read_bytes() == before
+        assert (logos / "team_b.jpg").read_bytes() == _jpeg("blue")
+        assert not os.path.samefile(logos / "team_a_100px.jpg", logos / "team_b_100px.jpg")
+
+
+@pytest.mark.asyncio
+class TestImageVariants:
+    @pytest.fixture
+    def file_service(self, tmp_path) -> FileService:
+        return FileService(upload_dir=tmp_path / "uploads")
+
+    async def _store(self, file_service, tmp_path, name: str, size=(300, 200)) -> str:
+        path = tmp_path / "uploads" / "teams" / "logos" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        Image.new("RGBA", size, color=(10, 120, 200, 255)).save(path, format="PNG")
+        return await file_service.image_store.adopt(path)
+
+    async def test_variants_are_encoded_once_with_immutable_names(self, file_service, tmp_path):
+        digest = await self._store(file_service, tmp_path, "a.png")
+
+        with (
+            patch.object(settings, "image_variant_formats", "webp"),
+            patch.object(
+                file_service.image_service,
+                "encode_variant",
+                wraps=file_service.image_service.encode_variant,
+            ) as encode,
+        ):
+            first = await file_service.create_image_variants(digest, ["/static/uploads/a.png"])
+            second = await file_service.create_image_variants(digest, ["/static/uploads/b.png"])
+
+        assert encode.await_count == 3
+        assert first == second
+        assert [(v["width"], v["height"]) for v in first["variants"]] == [
+            (64, 43),
+            (128, 85),
+            (256, 171),
+        ]
+        variant = first["variants"][0]
+        variant_path = tmp_path / "uploads" / variant["url"].removeprefix("/static/uploads/")
+        assert variant_path.name.startswith(
+            hashlib.sha256(variant_path.read_bytes()).hexdigest()[:20]
+        )
+        assert Image.open(variant_path).format == "WEBP"
+        assert first["srcset"]["image/webp"].endswith(" 256w")
+        assert await file_service.get_image_variants("/static/uploads/b.png") == first
+
+    async def test_small_image_gets_one_variant_at_its_width(self, file_service, tmp_path):
+        digest = await self._store(file_service, tmp_path, "small.png", size=(40, 40))
+
+        with patch.object(settings, "image_variant_formats", "webp,jpegxl"):
+            variants = await file_service.create_image_variants(digest, [])
+
+        assert [(v["width"], v["type"]) for v in variants["variants"]] == [(40, "image/webp")]
+
+    async def test_changed_widths_reencode_variants(self, file_service, tmp_path):
+        digest = await self._store(file_service, tmp_path, "a.png")
+
+        with patch.object(settings, "image_variant_formats", "webp"):
+            await file_service.create_image_variants(digest, [])
+            with patch.object(settings, "image_variant_widths", "100,200"):
+                variants = await file_service.create_image_variants(digest, [])
+
+        assert [v["width"] for v in variants["variants"]] == [100, 200]
+
+    async def test_prune_deletes_variants_of_unused_images(self, file_service, tmp_path):
+        digest = await self._store(file_service, tmp_path, "a.png")
+        with patch.object(settings, "image_variant_formats", "webp"):
+            await file_service.create_image_variants(digest, ["/static/uploads/a.png"])
+
+        (tmp_path / "uploads" / "teams" / "logos" / "a.png").unlink()
+        await file_service.image_store.prune()
+
+        assert not list((file_service.image_store.root / "variants").glob("*/*"))
+        assert await file_service.get_image_variants("/static/uploads/a.png") is None
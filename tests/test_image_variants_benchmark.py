@@ -0,0 +1,92 @@
+"""Benchmark: image bytes transferred for a typical tournament page.
+
+Builds a tournament logo and 16 team logos as 1000px PNGs with shapes over a grainy gradient,
+like scanned club logos. Compares the bytes a page showing them at 48 CSS px on a 2x screen
+transfers with the full-size PNGs (what overlays and mobile pages load now), with the 100px and
+400px PNG derivatives, and with the smallest responsive variant of each format covering 96 device
+pixels.
+Run with: pytest -m slow -s tests/test_image_variants_benchmark.py
+"""
+
+import random
+from unittest.mock import patch
+
+import pytest
+from PIL import Image, ImageDraw
+
+from src.core.config import settings
+from src.helpers.file_service import FileService
+
+TEAMS = 16
+LOGO_SIZE = 1000
+DISPLAY_PIXELS = 96
+
+
+def _logo(seed: int) -> Image.Image:
+    rng = random.Random(seed)
+    image = Image.new("RGBA", (LOGO_SIZE, LOGO_SIZE), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    primary = tuple(rng.randrange(256) for _ in range(3))
+    for y in range(LOGO_SIZE):
+        shade = tuple(int(c * (0.6 + 0.4 * y / LOGO_SIZE)) for c in primary)
+        draw.line([(0, y), (LOGO_SIZE, y)], fill=(*shade, 255))
+    grain = Image.effect_noise(image.size, 12).convert("RGBA")
+    image = Image.blend(image, grain, 0.08)
+    draw = ImageDraw.Draw(image)
+    mask = Image.new("L", image.size, 0)
+    ImageDraw.Draw(mask).ellipse([20, 20, LOGO_SIZE - 20, LOGO_SIZE - 20], fill=255)
+    image.putalpha(mask)
+    for _ in range(12):
+        x, y = rng.randrange(150, 700), rng.randrange(150, 700)
+        size = rng.randrange(80, 250)
+        color = (*(rng.randrange(256) for _ in range(3)), 255)
+        if rng.random() < 0.5:
+            draw.ellipse(
+                [x, y, x + size, y + size], fill=color, outline=(255, 255, 255, 255), width=8
+            )
+        else:
+            draw.polygon([(x, y + size), (x + size // 2, y), (x + size, y + size)], fill=color)
+    return image
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_variants_cut_tournament_page_bytes(tmp_path):
+    file_service = FileService(upload_dir=tmp_path / "uploads")
+    logos = tmp_path / "uploads" / "teams" / "logos"
+    logos.mkdir(parents=True)
+
+    totals: dict[str, int] = {"original PNG": 0, "400px PNG": 0, "100px PNG": 0}
+    with patch.object(settings, "image_variant_formats", "avif,webp"):
+        for seed in range(TEAMS + 1):
+            path = logos / f"logo_{seed}.png"
+            image = _logo(seed)
+            image.save(path, format="PNG")
+            totals["original PNG"] += path.stat().st_size
+            for height in (400, 100):
+                derivative = logos / f"logo_{seed}_{height}px.png"
+                image.resize((height, height), Image.Resampling.LANCZOS).save(derivative)
+                totals[f"{height}px PNG"] += derivative.stat().st_size
+
+            digest = await file_service.image_store.adopt(path)
+            variants = await file_service.create_image_variants(digest, [])
+            for mime_type in variants["srcset"]:
+                chosen = min(
+                    (
+                        v
+                        for v in variants["variants"]
+                        if v["type"] == mime_type and v["width"] >= DISPLAY_PIXELS
+                    ),
+                    key=lambda v: v["width"],
+                )
+                variant_path = tmp_path / "uploads" / chosen["url"].removeprefix("/static/uploads/")
+                label = f"{chosen['width']}w {mime_type.removeprefix('image/').upper()}"
+                totals[label] = totals.get(label, 0) + variant_path.stat().st_size
+
+    print(f"\nImage bytes of a tournament page with {TEAMS + 1} logos at {DISPLAY_PIXELS} px:")
+    for label, total in totals.items():
+        print(f"  {label:<14} {total / 1024:9.1f} KiB  ({total / totals['original PNG']:6.1%})")
+
+    webp = next(total for label, total in totals.items() if label.endswith("WEBP"))
+    assert webp < totals["100px PNG"]
+    assert webp * 20 < totals["original PNG"]
@@ -0,0 +1,222 @@
+"""
+Tests for the background import job runner and import job kinds.
+
+Run with:
+    pytest tests/test_import_job_runner.py
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.core.enums import ImportJobStatus
+from src.helpers.request_services_helper import request_budget
+from src.import_jobs.db_services import ImportJobServiceDB
+from src.import_jobs.kinds import ImportJobContext, import_match_roster, import_players
+from src.import_jobs.runner import ImportJobRunner
+from src.import_jobs.schemas import ImportJobSchemaCreate
+from src.pars_eesl.db_services import EeslFingerprintServiceDB
+from src.pars_eesl.sync import fingerprint
+
+
+@pytest.fixture
+def runner(test_db) -> ImportJobRunner:
+    return ImportJobRunner(
+        test_db,
+        poll_interval_seconds=0.01,
+        requests_per_second=5.0,
+        max_concurrent_requests=3,
+    )
+
+
+async def _claim(runner: ImportJobRunner, kind: str = "test", **values):
+    await runner.service.submit(ImportJobSchemaCreate(kind="players", **values))
+    job = await runner.service.claim_next(60, 3)
+    job.kind = kind
+    return job
+
+
+@pytest.mark.asyncio
+class TestImportJobRunner:
+    async def test_runs_kind_with_job_budget_and_records_result(self, runner):
+        seen = {}
+
+        async def kind(context: ImportJobContext):
+            seen["budget"] = request_budget.get()
+            await context.report(1, 2, {"index": 1})
+            await context.report(2, 2, {"index": 2})
+            return {"done": 2}
+
+        job = await _claim(runner, requests_per_second=2.0)
+        with patch.dict("src.import_jobs.runner.import_job_kinds", {"test": kind}):
+            await runner.run_job(job)
+
+        stored = await runner.service.get_by_id(job.id)
+        assert stored.status == ImportJobStatus.SUCCEEDED
+        assert stored.result == {"done": 2}
+        assert stored.checkpoint == {"index": 2}
+        assert seen["budget"].rate_limiter.rate == 2.0
+        assert seen["budget"].concurrency_limiter._value == 3
+        assert request_budget.get() is None
+
+    async def test_sync_summary_is_added_to_result_and_fingerprints_saved(self, runner):
+        async def kind(context: ImportJobContext):
+            if not await context.sync.unchanged("team", 3, {"title": "a"}):
+                context.sync.written("team", 3)
+            return {"teams": 1}
+
+        job = await _claim(runner)
+        with patch.dict("src.import_jobs.runner.import_job_kinds", {"test": kind}):
+            await runner.run_job(job)
+
+        stored = await runner.service.get_by_id(job.id)
+        assert stored.result == {
+            "teams": 1,
+            "sync": {"team": {"created": 1, "updated": 0, "unchanged": 0}},
+        }
+        fingerprints = await EeslFingerprintServiceDB(runner.database).get_fingerprints("team")
+        assert fingerprints == {3: fingerprint({"title": "a"})}
+
+    async def test_failing_kind_marks_job_failed(self, runner):
+        async def kind(context: ImportJobContext):
+            raise ValueError("Missing job parameter 'eesl_match_id'")
+
+        job = await _claim(runner)
+        with patch.dict("src.import_jobs.runner.import_job_kinds", {"test": kind}):
+            await runner.run_job(job)
+
+        stored = await runner.service.get_by_id(job.id)
+        assert stored.status == ImportJobStatus.FAILED
+        assert stored.error == "ValueError: Missing job parameter 'eesl_match_id'"
+
+    async def test_job_is_stopped_when_heartbeat_finds_it_gone(self, runner):
+        started = asyncio.Event()
+        stopped = asyncio.Event()
+
+        async def kind(context: ImportJobContext):
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            finally:
+                stopped.set()
+
+        job = await _claim(runner)
+        runner.heartbeat_interval_seconds = 0.01
+        # Cancelled (or taken over): the run's heartbeat no longer matches the row.
+        runner.service.heartbeat = AsyncMock(return_value=False)
+        with patch.dict("src.import_jobs.runner.import_job_kinds", {"test": kind}):
+            await asyncio.wait_for(runner.run_job(job), timeout=2)
+
+        assert started.is_set()
+        assert stopped.is_set()
+        stored = await runner.service.get_by_id(job.id)
+        assert stored.status == ImportJobStatus.RUNNING
+        assert stored.finished_at is None
+
+    async def test_shutdown_requeues_running_job(self, runner):
+        started = asyncio.Event()
+
+        async def kind(context: ImportJobContext):
+            started.set()
+            await asyncio.sleep(10)
+
+        job = await runner.service.submit(ImportJobSchemaCreate(kind="players"))
+        with patch.dict("src.import_jobs.runner.import_job_kinds", {"players": kind}):
+            run = asyncio.create_task(runner.run())
+            await asyncio.wait_for(started.wait(), timeout=2)
+            run.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await run
+
+        stored = await runner.service.get_by_id(job.id)
+        assert stored.status == ImportJobStatus.QUEUED
+        assert stored.attempts == 0
+
+
+@pytest.mark.asyncio
+class TestImportJobKinds:
+    async def _context(self, test_db, params: dict, checkpoint: dict) -> ImportJobContext:
+        service = ImportJobServiceDB(test_db)
+        await service.submit(ImportJobSchemaCreate(kind="players", params=params))
+        job = await service.claim_next(60, 3)
+        job.checkpoint = checkpoint
+        return ImportJobContext(test_db, service, job)
+
+    async def test_players_resume_from_checkpoint_page(self, test_db):
+        context = await self._context(test_db, {"season_id": 9}, {"page": 2, "players": 5})
+
+        with patch(
+            "src.pars_eesl.pars_all_players_from_eesl.parse_players_index_page_eesl",
+            AsyncMock(return_value=([], False)),
+        ) as parse_page:
+            result = await import_players(context)
+
+        parse_page.assert_awaited_once_with(2, 9, sync=context.sync)
+        assert result == {"players": 5, "pages": 3}
+        assert context.checkpoint == {"page": 3, "players": 5}
+
+    async def test_match_roster_skips_imported_players(self, test_db):
+        context = await self._context(
+            test_db, {"eesl_match_id": 77}, {"index": 1, "players": 1, "player_ids": [10]}
+        )
+        roster = [({"player_eesl_id": 10}, "team_a"), ({"player_eesl_id": 11}, "team_b")]
+        imported = []
+
+        async def import_player(database, service, match, team, roster_player, seen_ids):
+            imported.append(roster_player["player_eesl_id"])
+            seen_ids.add(roster_player["player_eesl_id"])
+            return {"match_player": roster_player}
+
+        with (
+            patch(
+                "src.player_match.views.load_parsed_match_roster",
+                AsyncMock(return_value=({"roster_a": []}, object(), roster)),
+            ),
+            patch("src.player_match.views.import_match_roster_player", import_player),
+        ):
+            result = await import_match_roster(context)
+
+        assert imported == [11]
+        assert result == {"players": 2}
+        assert sorted(context.checkpoint["player_ids"]) == [10, 11]
+
+    async def test_match_roster_skips_unchanged_roster(self, test_db):
+        context = await self._context(test_db, {"eesl_match_id": 77}, {})
+        parsed_match = {
+            "team_a_eesl_id": 1,
+            "team_b_eesl_id": 2,
+            "score_a": "7",
+            "roster_a": [{"player_eesl_id": 10}],
+            "roster_b": [],
+        }
+        # Only the roster counts: a new score does not import the players again.
+        source = {key: value for key, value in parsed_match.items() if key != "score_a"}
+        await context.sync.service.save_fingerprints("roster", {77: fingerprint(source)})
+        import_player = AsyncMock()
+
+        with (
+            patch(
+                "src.player_match.views.load_parsed_match_roster",
+                AsyncMock(return_value=(parsed_match, object(), [({}, "team_a")])),
+            ),
+            patch("src.player_match.views.import_match_roster_player", import_player),
+        ):
+            result = await import_match_roster(context)
+
+        assert result == {"players": 0}
+        import_player.assert_not_called()
+        assert context.sync.summary() == {"roster": {"created": 0, "updated": 0, "unchanged": 1}}
+
+    async def test_resume_index_only_applies_to_forced_runs(self, test_db):
+        context = await self._context(test_db, {}, {"index": 4})
+        forced = await self._context(test_db, {"force": True}, {"index": 4})
+
+        assert context.resume_index() == 0
+        assert forced.resume_index() == 4
+
+    async def test_missing_param_raises(self, test_db):
+        context = await self._context(test_db, {}, {})
+
+        with pytest.raises(ValueError, match="eesl_match_id"):
+            await import_match_roster(context)
@@ -17,6 +17,8 @@ def mock_settings():
     """Mock settings."""
     with patch("src.main.settings") as mock:
         mock.uploads_path = "/tmp/uploads"
+        mock.metrics_dir = None
+        mock.import_job_workers = 0
         mock.validate_all = Mock()
         yield mock
 
@@ -27,14 +29,15 @@ def mock_db():
     with patch("src.main.db") as mock:
         mock.validate_database_connection = AsyncMock()
         mock.close = AsyncMock()
+        mock.replica_engines = []
         yield mock
 
 
 @pytest.fixture
 def mock_user_service():
     """Mock user service."""
-    with patch("src.users.db_services.UserServiceDB.mark_stale_users_offline") as mock:
-        mock.return_value = 0
+    with patch("src.users.db_services.UserServiceDB.flush_heartbeats") as mock:
+        mock.return_value = (0, 0)
         yield mock
 
 
@@ -92,7 +95,7 @@ async def test_lifespan_startup(
         patch("src.main.init_service_registry", Mock()) as mock_init,
         patch("src.main.register_all_services", Mock()) as mock_register,
         patch("src.main.get_service_registry") as mock_get_registry,
-        patch("src.main.mark_stale_users_offline_task", AsyncMock()),
+        patch("src.main.flush_user_heartbeats_task", AsyncMock()),
         patch("src.main.cleanup_stale_websocket_connections_task", AsyncMock()),
     ):
         mock_ws_manager._connection_retry_task = mock_ws_task
@@ -157,6 +160,23 @@ async def test_health_check():
     assert "timestamp" in data
 
 
+@pytest.mark.asyncio
+async def test_metrics_endpoint():
+    """Test Prometheus metrics endpoint reports templated routes."""
+    from fastapi.testclient import TestClient
+
+    from src.main import app
+
+    client = TestClient(app)
+    client.get("/health")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'http_requests_total{method="GET",route="/health",status="200"}' in response.text
+
+
 def test_app_initialization(mock_settings, mock_db, mock_ws_manager, mock_registry):
     """Test app initialization with all components."""
     from src.main import app
@@ -225,7 +245,7 @@ async def test_websocket_in_lifespan(
         patch("src.main.init_service_registry", Mock()),
         patch("src.main.register_all_services", Mock()),
         patch("src.main.get_service_registry") as mock_get_registry,
-        patch("src.main.mark_stale_users_offline_task", AsyncMock()),
+        patch("src.main.flush_user_heartbeats_task", AsyncMock()),
         patch("src.main.cleanup_stale_websocket_connections_task", AsyncMock()),
     ):
         mock_ws_manager._connection_retry_task = mock_ws_task
@@ -114,6 +114,44 @@ class TestMatchParser:
 
             assert result == []
 
+    @pytest.mark.asyncio
+    async def test_create_parsed_matches_skips_unchanged(self, parser):
+        with (
+            patch("src.matches.parser.TournamentServiceDB") as mock_tournament_service,
+            patch("src.matches.parser.parse_tournament_matches_index_page_eesl") as mock_parse,
+            patch("src.matches.parser.db") as mock_db,
+        ):
+            mock_tournament_instance = MagicMock()
+            mock_tournament_instance.get_tournament_by_eesl_id = AsyncMock(
+                return_value=MagicMock(id=1)
+            )
+            mock_tournament_service.return_value = mock_tournament_instance
+            parsed_match = {
+                "week": 1,
+                "match_eesl_id": 123,
+                "team_a_eesl_id": 1,
+                "team_b_eesl_id": 2,
+            }
+            mock_parse.return_value = [parsed_match]
+
+            mock_session = MagicMock()
+            mock_execute_result = MagicMock()
+            mock_execute_result.scalars.return_value.all.return_value = []
+            mock_session.execute = AsyncMock(return_value=mock_execute_result)
+            mock_db.async_session.return_value.__aenter__ = AsyncMock(return_value=mock_session)
+            mock_db.async_session.return_value.__aexit__ = AsyncMock()
+
+            sync = MagicMock()
+            sync.unchanged = AsyncMock(return_value=True)
+            mock_match_service = AsyncMock()
+
+            result = await parser.create_parsed_matches(123, mock_match_service, sync=sync)
+
+            assert result == []
+            sync.unchanged.assert_awaited_once_with("match", 123, parsed_match)
+            mock_match_service.create_or_update_match.assert_not_called()
+            sync.written.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_create_parsed_matches_exception(self, parser):
         with (
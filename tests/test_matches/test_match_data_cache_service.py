@@ -1,4 +1,7 @@
 import asyncio
+import json
+from contextlib import ExitStack
+from functools import partial
 from unittest.mock import patch
 
 import pytest
@@ -215,3 +218,95 @@ class TestMatchDataCacheService:
 
             assert result is None
             assert "match-update:1" not in cache_service._cache
+
+
+def _patch_initial_load_fetches(calls: dict, match_status: int = 200, delay: float = 0.05):
+    async def fetch(name, result, *args, **kwargs):
+        calls[name] = calls.get(name, 0) + 1
+        await asyncio.sleep(delay)
+        return result
+
+    results = {
+        "fetch_with_scoreboard_data": {
+            "data": {"match_id": 1, "id": 1, "status_code": match_status, "players": []}
+        },
+        "fetch_playclock": {"match_id": 1, "playclock": {"id": 1, "playclock": 25}},
+        "fetch_gameclock": {"match_id": 1, "gameclock": {"id": 1, "gameclock": 720}},
+        "fetch_event": {"match_id": 1, "status_code": 200, "events": [{"id": 1}]},
+        "fetch_stats": {"match_id": 1, "statistics": {"team_a": {}}},
+    }
+    return [
+        patch(f"src.helpers.fetch_helpers.{name}", side_effect=partial(fetch, name, result))
+        for name, result in results.items()
+    ]
+
+
+@pytest.mark.asyncio
+class TestInitialLoadSnapshot:
+    @pytest.fixture
+    def cache_service(self, test_db):
+        return MatchDataCacheService(test_db)
+
+    async def _build(self, cache_service, joiners: int = 1, **kwargs):
+        calls: dict[str, int] = {}
+        with ExitStack() as stack:
+            for fetch_patch in _patch_initial_load_fetches(calls, **kwargs):
+                stack.enter_context(fetch_patch)
+            snapshots = await asyncio.gather(
+                *(cache_service.get_or_build_initial_load(1) for _ in range(joiners))
+            )
+        return snapshots, calls
+
+    async def test_concurrent_joiners_share_one_build(self, cache_service):
+        snapshots, calls = await self._build(cache_service, joiners=20)
+
+        assert all(snapshot is snapshots[0] for snapshot in snapshots)
+        assert set(calls.values()) == {1}
+        assert cache_service._initial_loads[1] is snapshots[0]
+
+    async def test_message_text_adds_connection_fields(self, cache_service):
+        (snapshot,), _ = await self._build(cache_service)
+        fields = {"server_time_ms": 1, "clock_sync": "legacy", "match_seq": None}
+
+        message = json.loads(snapshot.message_text(fields))
+
+        assert message == {"type": "initial-load", "data": {**snapshot.document, **fields}}
+        assert message["data"]["gameclock"] == {"id": 1, "gameclock": 720}
+        assert json.loads(snapshot.message_text({}))["data"] == snapshot.document
+
+    @pytest.mark.parametrize(
+        "invalidate",
+        [
+            "invalidate_match_data",
+            "invalidate_gameclock",
+            "invalidate_playclock",
+            "invalidate_event_data",
+            "invalidate_stats",
+            "invalidate_players",
+        ],
+    )
+    async def test_component_invalidation_drops_snapshot(self, cache_service, invalidate):
+        (snapshot,), _ = await self._build(cache_service)
+
+        getattr(cache_service, invalidate)(1)
+
+        assert 1 not in cache_service._initial_loads
+        (rebuilt,), calls = await self._build(cache_service)
+        assert rebuilt is not snapshot
+        assert calls
+
+    async def test_invalidation_during_build_is_not_cached(self, cache_service):
+        build = asyncio.create_task(self._build(cache_service, delay=0.1))
+        await asyncio.sleep(0.02)
+
+        cache_service.invalidate_gameclock(1)
+        (snapshot,), _ = await build
+
+        assert snapshot.document["match_id"] == 1
+        assert 1 not in cache_service._initial_loads
+        assert 1 not in cache_service._initial_load_builds
+
+    async def test_missing_match_is_not_cached(self, cache_service):
+        await self._build(cache_service, match_status=404)
+
+        assert 1 not in cache_service._initial_loads
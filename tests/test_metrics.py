@@ -0,0 +1,144 @@
+"""Tests for the pure ASGI middleware stack and the metrics registry."""
+
+import json
+import os
+import subprocess
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from src.core.metrics import (
+    UNMATCHED_ROUTE,
+    MetricsRegistry,
+    collect_snapshots,
+    merge_snapshots,
+    render_metrics,
+    render_prometheus,
+)
+from src.core.middleware import LoggingMiddleware, RequestIDMiddleware
+
+
+def _dead_pid() -> int:
+    process = subprocess.Popen(["true"])
+    process.wait()
+    return process.pid
+
+
+class TestMetricsRegistry:
+    def test_histogram_buckets_and_status_counts(self):
+        registry = MetricsRegistry(buckets=(0.1, 1.0))
+        registry.request_started("GET")
+        registry.request_finished("GET", "/api/items/{item_id}", 200, 0.05)
+        registry.request_started("GET")
+        registry.request_finished("GET", "/api/items/{item_id}", 404, 5.0)
+
+        snapshot = registry.snapshot()
+        key = "GET\x1f/api/items/{item_id}"
+
+        assert snapshot["latency_buckets"][key] == [1, 0, 1]
+        assert snapshot["latency_sum"][key] == pytest.approx(5.05)
+        assert snapshot["in_flight"] == {"GET": 0}
+        assert sorted(snapshot["status_counts"].values()) == [1, 1]
+
+    def test_render_prometheus_is_cumulative(self):
+        registry = MetricsRegistry(buckets=(0.1, 1.0))
+        registry.request_started("GET")
+        registry.request_finished("GET", "/a", 200, 0.5)
+
+        text = render_prometheus(registry.snapshot())
+
+        assert 'http_request_duration_seconds_bucket{method="GET",route="/a",le="0.1"} 0' in text
+        assert 'http_request_duration_seconds_bucket{method="GET",route="/a",le="1.0"} 1' in text
+        assert 'http_request_duration_seconds_bucket{method="GET",route="/a",le="+Inf"} 1' in text
+        assert 'http_request_duration_seconds_count{method="GET",route="/a"} 1' in text
+        assert 'http_requests_total{method="GET",route="/a",status="200"} 1' in text
+        assert 'http_requests_in_flight{method="GET"} 0' in text
+
+    def test_merge_snapshots_sums_workers(self):
+        first, second = MetricsRegistry(), MetricsRegistry()
+        first.request_started("GET")
+        first.request_finished("GET", "/a", 200, 0.01)
+        second.request_started("GET")
+        second.request_finished("GET", "/a", 200, 0.02)
+        second.request_started("GET")
+
+        merged = merge_snapshots([first.snapshot(), second.snapshot()])
+
+        assert sum(merged["latency_buckets"]["GET\x1f/a"]) == 2
+        assert merged["status_counts"]["GET\x1f/a\x1f200"] == 2
+        assert merged["in_flight"] == {"GET": 1}
+
+    def test_render_metrics_combines_live_workers_only(self, tmp_path):
+        other = MetricsRegistry()
+        other.request_started("POST")
+        other.request_finished("POST", "/b", 201, 0.01)
+        (tmp_path / f"{os.getppid()}.json").write_text(json.dumps(other.snapshot()))
+        dead_file = tmp_path / f"{_dead_pid()}.json"
+        dead_file.write_text(json.dumps(other.snapshot()))
+
+        registry = MetricsRegistry()
+        registry.request_started("GET")
+        registry.request_finished("GET", "/a", 200, 0.01)
+
+        text = render_metrics(registry, tmp_path)
+
+        assert 'http_requests_total{method="GET",route="/a",status="200"} 1' in text
+        assert 'http_requests_total{method="POST",route="/b",status="201"} 1' in text
+        assert not dead_file.exists()
+        assert len(collect_snapshots(tmp_path)) == 2
+
+
+@pytest.fixture
+def middleware_app(monkeypatch):
+    registry = MetricsRegistry()
+    monkeypatch.setattr("src.core.middleware.metrics_registry", registry)
+
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"item_id": item_id}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for index in range(3):
+                yield f"chunk{index};"
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    app.add_middleware(RequestIDMiddleware)
+    app.add_middleware(LoggingMiddleware)
+    return app, registry
+
+
+@pytest.mark.asyncio
+class TestAsgiMiddleware:
+    async def test_request_id_and_route_template(self, middleware_app):
+        app, registry = middleware_app
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            first = await client.get("/items/1")
+            await client.get("/items/2", headers={"X-Request-ID": "given"})
+            missing = await client.get("/nope")
+
+        assert first.headers["X-Request-ID"]
+        assert first.headers["Server-Timing"].startswith("db;dur=")
+        assert missing.status_code == 404
+        assert registry.status_counts == {
+            "GET\x1f/items/{item_id}\x1f200": 2,
+            f"GET\x1f{UNMATCHED_ROUTE}\x1f404": 1,
+        }
+        assert registry.in_flight == {"GET": 0}
+
+    async def test_streaming_response_passes_through(self, middleware_app):
+        app, registry = middleware_app
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/stream", headers={"X-Request-ID": "stream-id"})
+
+        assert response.text == "chunk0;chunk1;chunk2;"
+        assert response.headers["X-Request-ID"] == "stream-id"
+        assert registry.status_counts == {"GET\x1f/stream\x1f200": 1}
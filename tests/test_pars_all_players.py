@@ -121,9 +121,9 @@ class TestParsAllPlayersFromEesl:
         players_in_eesl = []
         result = await pars_all_players_from_eesl.get_player_from_eesl_participants(
             players_in_eesl,
-            BeautifulSoup(mock_players_list_html, "lxml").find_all(
-                "tr", class_="table__row"
-            ),
+            pars_all_players_from_eesl._extract_players_index(
+                BeautifulSoup(mock_players_list_html, "lxml")
+            )[0],
             remaining_limit=10,
         )
 
@@ -133,6 +133,32 @@ class TestParsAllPlayersFromEesl:
         assert players_in_eesl[0]["person"]["second_name"] == "петров"
         assert players_in_eesl[0]["person"]["first_name"] == "петр"
 
+    @pytest.mark.asyncio
+    @patch("src.pars_eesl.pars_all_players_from_eesl.file_service")
+    @patch("src.pars_eesl.pars_all_players_from_eesl.collect_players_dob_from_all_eesl")
+    async def test_get_player_from_eesl_participants_skips_unchanged(
+        self, mock_collect_dob, mock_file_service, mock_players_list_html
+    ):
+        """Unchanged players are left out before their photo and DOB are fetched."""
+        mock_file_service.download_and_resize_image = AsyncMock()
+        sync = Mock()
+        sync.unchanged = AsyncMock(return_value=True)
+
+        players_in_eesl = []
+        await pars_all_players_from_eesl.get_player_from_eesl_participants(
+            players_in_eesl,
+            pars_all_players_from_eesl._extract_players_index(
+                BeautifulSoup(mock_players_list_html, "lxml")
+            )[0],
+            remaining_limit=10,
+            sync=sync,
+        )
+
+        assert players_in_eesl == []
+        assert sync.unchanged.await_args.args[:2] == ("player", 123)
+        mock_file_service.download_and_resize_image.assert_not_called()
+        mock_collect_dob.assert_not_called()
+
     @pytest.mark.asyncio
     @patch("src.pars_eesl.pars_all_players_from_eesl.get_url")
     @patch("src.pars_eesl.pars_all_players_from_eesl.file_service")
@@ -153,9 +179,9 @@ class TestParsAllPlayersFromEesl:
         players_in_eesl = []
         result = await pars_all_players_from_eesl.get_player_from_eesl_participants(
             players_in_eesl,
-            BeautifulSoup(mock_players_list_html, "lxml").find_all(
-                "tr", class_="table__row"
-            ),
+            pars_all_players_from_eesl._extract_players_index(
+                BeautifulSoup(mock_players_list_html, "lxml")
+            )[0],
             remaining_limit=10,
         )
 
@@ -203,11 +203,10 @@ class TestParseMatchIndexPageEesl:
             assert result is None
 
 
-@pytest.mark.asyncio
 class TestGetPlayerEeslFromMatch:
     """Test get_player_eesl_from_match function."""
 
-    async def test_get_player_success(self):
+    def test_get_player_success(self):
         """Test successful parsing of player data."""
         from src.pars_eesl.pars_match import get_player_eesl_from_match
 
@@ -222,7 +221,7 @@ class TestGetPlayerEeslFromMatch:
         soup = BeautifulSoup(html, "lxml")
         player_el = soup.find("li", class_="match-protocol__member")
 
-        result = await get_player_eesl_from_match(player_el, "Team A", "/logo_a.png")
+        result = get_player_eesl_from_match(player_el, "Team A", "/logo_a.png")
 
         assert result is not None
         assert result["player_number"] == "10"
@@ -235,7 +234,7 @@ class TestGetPlayerEeslFromMatch:
         assert result["player_team"] == "Team A"
         assert result["player_team_logo_url"] == "/logo_a.png"
 
-    async def test_get_player_no_name(self):
+    def test_get_player_no_name(self):
         """Test parsing when player name element is missing."""
         from src.pars_eesl.pars_match import get_player_eesl_from_match
 
@@ -248,7 +247,7 @@ class TestGetPlayerEeslFromMatch:
         soup = BeautifulSoup(html, "lxml")
         player_el = soup.find("li", class_="match-protocol__member")
 
-        result = await get_player_eesl_from_match(player_el, "Team A", "/logo_a.png")
+        result = get_player_eesl_from_match(player_el, "Team A", "/logo_a.png")
 
         assert result is not None
         assert result["player_full_name"] == ""
@@ -256,7 +255,7 @@ class TestGetPlayerEeslFromMatch:
         assert result["player_second_name"] == ""
         assert result["player_eesl_id"] == 0
 
-    async def test_get_player_no_link(self):
+    def test_get_player_no_link(self):
         """Test parsing when player link has no href."""
         from src.pars_eesl.pars_match import get_player_eesl_from_match
 
@@ -269,12 +268,12 @@ class TestGetPlayerEeslFromMatch:
         soup = BeautifulSoup(html, "lxml")
         player_el = soup.find("li", class_="match-protocol__member")
 
-        result = await get_player_eesl_from_match(player_el, "Team A", "/logo_a.png")
+        result = get_player_eesl_from_match(player_el, "Team A", "/logo_a.png")
 
         assert result is not None
         assert result["player_eesl_id"] == 0
 
-    async def test_get_player_single_name(self):
+    def test_get_player_single_name(self):
         """Test parsing when player has only one name."""
         from src.pars_eesl.pars_match import get_player_eesl_from_match
 
@@ -287,13 +286,13 @@ class TestGetPlayerEeslFromMatch:
         soup = BeautifulSoup(html, "lxml")
         player_el = soup.find("li", class_="match-protocol__member")
 
-        result = await get_player_eesl_from_match(player_el, "Team A", "/logo_a.png")
+        result = get_player_eesl_from_match(player_el, "Team A", "/logo_a.png")
 
         assert result is not None
         assert result["player_first_name"] == "John"
         assert result["player_second_name"] == ""
 
-    async def test_get_player_no_img(self):
+    def test_get_player_no_img(self):
         """Test parsing when player image is missing."""
         from src.pars_eesl.pars_match import get_player_eesl_from_match
 
@@ -306,16 +305,16 @@ class TestGetPlayerEeslFromMatch:
         soup = BeautifulSoup(html, "lxml")
         player_el = soup.find("li", class_="match-protocol__member")
 
-        result = await get_player_eesl_from_match(player_el, "Team A", "/logo_a.png")
+        result = get_player_eesl_from_match(player_el, "Team A", "/logo_a.png")
 
         assert result is not None
         assert result["player_img_url"] is None
 
-    async def test_get_player_exception_handling(self):
+    def test_get_player_exception_handling(self):
         """Test exception handling during player parsing."""
         from src.pars_eesl.pars_match import get_player_eesl_from_match
 
-        result = await get_player_eesl_from_match(None, "Team A", "/logo_a.png")
+        result = get_player_eesl_from_match(None, "Team A", "/logo_a.png")
 
         assert result is None
 
@@ -0,0 +1,30 @@
+"""Tests for off-loop EESL page parsing.
+
+Run with:
+    pytest tests/test_pars_eesl/test_parsing.py
+"""
+
+import threading
+
+import pytest
+from bs4 import BeautifulSoup
+
+from src.pars_eesl.parsing import parse_html
+
+
+def _extract_title(soup: BeautifulSoup, tag: str) -> dict:
+    return {"title": soup.find(tag).text, "thread": threading.current_thread().name}
+
+
+@pytest.mark.asyncio
+class TestParseHtml:
+    async def test_extracts_in_parsing_pool(self):
+        result = await parse_html(b"<html><body><h1>Cup</h1></body></html>", _extract_title, "h1")
+
+        assert result["title"] == "Cup"
+        assert result["thread"].startswith("eesl-parse")
+        assert result["thread"] != threading.current_thread().name
+
+    async def test_extraction_errors_are_raised_on_the_loop(self):
+        with pytest.raises(AttributeError):
+            await parse_html("<html></html>", _extract_title, "h1")
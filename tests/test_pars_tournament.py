@@ -43,6 +43,41 @@ class TestParsTournament:
         # The function may return None or an empty list depending on structure
         assert result is not None or result == []
 
+    @pytest.mark.asyncio
+    @patch("src.pars_eesl.pars_tournament.get_url")
+    @patch("src.pars_eesl.pars_tournament.file_service")
+    async def test_parse_tournament_teams_index_page_eesl_skips_unchanged(
+        self, mock_file_service, mock_get_url
+    ):
+        """Unchanged teams are left out before their logo is downloaded."""
+        mock_response = Mock()
+        mock_response.content = """
+        <html>
+            <body>
+                <ul class="teams__list">
+                    <li class="teams__item">
+                        <a href="/team?team_id=123" class="teams__logo">
+                            <img src="https://example.com/teams/team1.png" alt="Team Alpha" />
+                        </a>
+                        <a href="/team?team_id=123" class="teams__name-link">Team Alpha</a>
+                    </li>
+                </ul>
+            </body>
+        </html>
+        """
+        mock_get_url.return_value = mock_response
+        mock_file_service.download_and_process_image = AsyncMock()
+        sync = Mock()
+        sync.unchanged = AsyncMock(return_value=True)
+
+        result = await pars_tournament.parse_tournament_teams_index_page_eesl(1, sync=sync)
+
+        assert result == []
+        sync.unchanged.assert_awaited_once_with(
+            "team", 123, {"title": "team alpha", "logo_url": "https://example.com/teams/team1.png"}
+        )
+        mock_file_service.download_and_process_image.assert_not_called()
+
     @pytest.mark.asyncio
     @patch("src.pars_eesl.pars_tournament.get_url")
     async def test_parse_tournament_matches_index_page_eesl_no_matches(self, mock_get_url):
@@ -0,0 +1,92 @@
+"""Benchmark: scraping through a proxy set where most proxies are dead.
+
+Runs a series of get_url calls through local fake proxies: two working HTTP proxies and six that
+accept connections but never answer, so every request through them costs a full timeout. Compares
+the health-weighted pool with quarantine against picking uniformly among all proxies (quarantine
+disabled), counting proxy timeouts and the total scrape time.
+Run with: pytest -m slow -s tests/test_proxy_pool_benchmark.py
+"""
+
+import asyncio
+from time import perf_counter
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from aiohttp import web
+
+from src.core.config import settings
+from src.helpers.proxy_manager import ProxyManager
+from src.helpers.request_services_helper import get_url
+
+WORKING_PROXIES = 2
+DEAD_PROXIES = 6
+REQUESTS = 40
+TIMEOUT_SECONDS = 0.2
+
+
+async def _working_proxy() -> tuple[web.AppRunner, int]:
+    async def forward(request: web.Request) -> web.Response:
+        return web.Response(text=f"<html>{request.path}</html>")
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", forward)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    return runner, site._server.sockets[0].getsockname()[1]
+
+
+async def _dead_proxy() -> asyncio.Server:
+    async def hang(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        await reader.read()
+        writer.close()
+
+    return await asyncio.start_server(hang, "127.0.0.1", 0)
+
+
+async def _scrape(manager: ProxyManager) -> dict:
+    start = perf_counter()
+    fetched = 0
+    with patch("src.helpers.request_services_helper._proxy_manager", manager):
+        for page in range(REQUESTS):
+            if await get_url(f"http://eesl.test/page/{page}", timeout=TIMEOUT_SECONDS):
+                fetched += 1
+    return {
+        "seconds": perf_counter() - start,
+        "fetched": fetched,
+        "timeouts": sum(manager.get_proxy_health(p.url).failure_count for p in manager.proxies),
+    }
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_quarantine_cuts_proxy_timeouts():
+    working = [await _working_proxy() for _ in range(WORKING_PROXIES)]
+    dead = [await _dead_proxy() for _ in range(DEAD_PROXIES)]
+    ports = [port for _, port in working] + [s.sockets[0].getsockname()[1] for s in dead]
+    proxy_list = ",".join(f"127.0.0.1:{port}" for port in ports)
+
+    try:
+        with patch("src.helpers.request_services_helper._rate_limiter.acquire", AsyncMock()):
+            with patch.object(settings, "proxy_quarantine_failures", REQUESTS * 10):
+                uniform = await _scrape(ProxyManager(proxy_list=proxy_list))
+            weighted = await _scrape(ProxyManager(proxy_list=proxy_list))
+    finally:
+        for runner, _ in working:
+            await runner.cleanup()
+        for server in dead:
+            server.close()
+
+    print(
+        f"\n{REQUESTS} pages through {WORKING_PROXIES} working and {DEAD_PROXIES} dead proxies, "
+        f"{TIMEOUT_SECONDS}s timeout:"
+        f"\n  uniform, no quarantine   {uniform['seconds']:5.2f}s, {uniform['timeouts']:3d} "
+        f"timeouts, {uniform['fetched']} pages fetched"
+        f"\n  weighted with quarantine {weighted['seconds']:5.2f}s, {weighted['timeouts']:3d} "
+        f"timeouts, {weighted['fetched']} pages fetched"
+    )
+
+    assert weighted["timeouts"] <= DEAD_PROXIES * settings.proxy_quarantine_failures
+    assert weighted["timeouts"] < uniform["timeouts"]
+    assert weighted["fetched"] >= uniform["fetched"]
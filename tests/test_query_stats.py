@@ -0,0 +1,89 @@
+"""Tests for per-request SQL query accounting."""
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+
+from src.core.middleware import RequestIDMiddleware
+from src.core.query_stats import (
+    QueryStats,
+    fingerprint_statement,
+    get_current_query_stats,
+    track_queries,
+)
+from tests.testhelpers import assert_max_queries
+
+
+class TestFingerprintStatement:
+    def test_literals_and_params_are_normalized(self):
+        first = fingerprint_statement("SELECT * FROM match WHERE id = $1 AND title = 'a'")
+        second = fingerprint_statement("SELECT  *\nFROM match WHERE id = $2 AND title = 'b'")
+        assert first == second == "SELECT * FROM match WHERE id = ? AND title = ?"
+
+    def test_in_lists_of_any_length_match(self):
+        assert fingerprint_statement("WHERE id IN ($1, $2, $3)") == fingerprint_statement(
+            "WHERE id IN ($1)"
+        )
+
+
+class TestQueryStats:
+    def test_repeated_statements_and_server_timing(self):
+        stats = QueryStats("req-1")
+        for item_id in range(3):
+            stats.record(f"SELECT * FROM team WHERE id = {item_id}", 1.5)
+        stats.record("SELECT 1", 0.5)
+
+        assert stats.count == 4
+        assert stats.repeated_statements() == [("SELECT * FROM team WHERE id = ?", 3)]
+        assert stats.server_timing() == 'db;dur=5.00;desc="4 queries"'
+
+    def test_track_queries_resets_context(self):
+        assert get_current_query_stats() is None
+        with track_queries("req") as stats:
+            assert get_current_query_stats() is stats
+        assert get_current_query_stats() is None
+
+
+@pytest.mark.asyncio
+class TestQueryTracking:
+    async def test_statements_are_counted(self, test_db):
+        with track_queries() as stats:
+            async with test_db.get_session_maker()() as session:
+                for _ in range(3):
+                    await session.execute(text("SELECT 1"))
+
+        assert stats.count == 3
+        assert stats.total_time_ms > 0
+
+    async def test_statements_outside_context_are_ignored(self, test_db):
+        async with test_db.get_session_maker()() as session:
+            await session.execute(text("SELECT 1"))
+        with track_queries() as stats:
+            pass
+        assert stats.count == 0
+
+    async def test_assert_max_queries_fails_when_exceeded(self, test_db):
+        with pytest.raises(AssertionError, match="at most 1 queries, got 2"):
+            with assert_max_queries(1):
+                async with test_db.get_session_maker()() as session:
+                    await session.execute(text("SELECT 1"))
+                    await session.execute(text("SELECT 1"))
+
+    async def test_middleware_sets_server_timing_header(self, test_db):
+        app = FastAPI()
+        app.add_middleware(RequestIDMiddleware)
+
+        @app.get("/probe")
+        async def probe():
+            async with test_db.get_session_maker()() as session:
+                await session.execute(text("SELECT 1"))
+                await session.execute(text("SELECT 2"))
+            return {"ok": True}
+
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/probe", headers={"X-Request-ID": "abc"})
+
+        assert response.headers["X-Request-ID"] == "abc"
+        assert response.headers["Server-Timing"].endswith('desc="2 queries"')
@@ -10,7 +10,7 @@ import time
 
 import pytest
 
-from src.helpers.rate_limiter import TokenBucket
+from src.helpers.rate_limiter import RequestBudget, TokenBucket
 
 
 @pytest.mark.slow
@@ -149,3 +149,47 @@ class TestTokenBucket:
         tokens = bucket.get_tokens()
 
         assert tokens <= 5.0
+
+
+class TestRequestBudget:
+    """Test suite for RequestBudget."""
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrency(self):
+        """Test that no more than max_concurrent requests are in flight."""
+        budget = RequestBudget(rate=1000.0, max_concurrent=2)
+        in_flight = 0
+        peak = 0
+
+        async def request():
+            nonlocal in_flight, peak
+            async with budget:
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        await asyncio.gather(*(request() for _ in range(6)))
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_limits_rate(self):
+        """Test that requests beyond the burst wait for tokens."""
+        budget = RequestBudget(rate=20.0, max_concurrent=5)
+        start = time.time()
+
+        for _ in range(budget.rate_limiter.capacity + 2):
+            async with budget:
+                pass
+
+        assert time.time() - start >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_slow_rate_still_has_a_token(self):
+        """Test that a rate below 0.5/s does not produce an empty bucket."""
+        budget = RequestBudget(rate=0.25, max_concurrent=1)
+
+        assert budget.rate_limiter.capacity == 1
+        async with budget:
+            pass
@@ -10,7 +10,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.helpers.request_services_helper import Response, get_url
+from src.helpers.proxy_manager import ProxyManager
+from src.helpers.request_services_helper import Response, get_url, request_budget
 
 
 class TestResponse:
@@ -192,3 +193,86 @@ class TestGetUrl:
 
             assert result is not None
             mock_rate_limiter.acquire.assert_called_once()
+
+
+class TestRequestBudget:
+    """Tests for the per-task request budget of get_url."""
+
+    @pytest.mark.asyncio
+    @patch("src.helpers.request_services_helper._rate_limiter")
+    @patch("src.helpers.request_services_helper._proxy_manager")
+    async def test_get_url_enters_current_budget(self, mock_proxy_manager, mock_rate_limiter):
+        """Test get_url acquires the request budget set for the current task."""
+        mock_proxy_manager.is_enabled = False
+        mock_rate_limiter.acquire = AsyncMock()
+        budget = MagicMock()
+        budget.__aenter__ = AsyncMock()
+        budget.__aexit__ = AsyncMock(return_value=False)
+
+        mock_response = AsyncMock()
+        mock_response.text = AsyncMock(return_value="test content")
+        mock_response.raise_for_status = MagicMock()
+        mock_session = AsyncMock()
+        mock_session.get = MagicMock()
+        mock_session.get.return_value.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_session.get.return_value.__aexit__ = AsyncMock()
+
+        token = request_budget.set(budget)
+        try:
+            with patch("src.helpers.request_services_helper.ClientSession") as mock_session_class:
+                mock_session_class.return_value.__aenter__ = AsyncMock(return_value=mock_session)
+                mock_session_class.return_value.__aexit__ = AsyncMock()
+
+                result = await get_url("http://example.com")
+        finally:
+            request_budget.reset(token)
+
+        assert result.content == "test content"
+        budget.__aenter__.assert_awaited_once()
+        budget.__aexit__.assert_awaited_once()
+
+
+class TestProxyFailover:
+    """Tests for get_url moving to another proxy when one fails."""
+
+    @pytest.mark.asyncio
+    @patch("src.helpers.request_services_helper._rate_limiter")
+    async def test_timeout_through_proxy_tries_next_proxy(self, mock_rate_limiter):
+        """Test a proxy timeout is recorded as a failure and the request retried elsewhere."""
+        mock_rate_limiter.acquire = AsyncMock()
+        manager = ProxyManager(proxy_list="slow.com:8080,fast.com:8080")
+        proxies_used = []
+
+        mock_response = AsyncMock()
+        mock_response.text = AsyncMock(return_value="test content")
+        mock_response.raise_for_status = MagicMock()
+
+        def get(url, headers, timeout, proxy):
+            proxies_used.append(proxy)
+            request = MagicMock()
+            if proxy == "http://slow.com:8080":
+                request.__aenter__ = AsyncMock(side_effect=asyncio.TimeoutError())
+            else:
+                request.__aenter__ = AsyncMock(return_value=mock_response)
+            request.__aexit__ = AsyncMock(return_value=False)
+            return request
+
+        mock_session = AsyncMock()
+        mock_session.get = MagicMock(side_effect=get)
+
+        with (
+            patch("src.helpers.request_services_helper._proxy_manager", manager),
+            patch.object(manager, "get_proxy", side_effect=manager.proxies),
+            patch("src.helpers.request_services_helper.ClientSession") as mock_session_class,
+        ):
+            mock_session_class.return_value.__aenter__ = AsyncMock(return_value=mock_session)
+            mock_session_class.return_value.__aexit__ = AsyncMock(return_value=False)
+
+            result = await get_url("http://example.com")
+
+        assert result.content == "test content"
+        assert proxies_used == ["http://slow.com:8080", "http://fast.com:8080"]
+        assert manager.get_proxy_health("http://slow.com:8080").failure_count == 1
+        fast = manager.get_proxy_health("http://fast.com:8080")
+        assert fast.success_count == 1
+        assert fast.latency_seconds is not None
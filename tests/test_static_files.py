@@ -0,0 +1,62 @@
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from src.core.static_files import UploadFiles
+
+
+@pytest.fixture
+def uploads_dir(tmp_path):
+    logos = tmp_path / "teams" / "logos"
+    logos.mkdir(parents=True)
+    (logos / "Team A.png").write_bytes(b"\x89PNG logo")
+    return tmp_path
+
+
+async def _get(uploads_dir, path: str, **kwargs):
+    app = FastAPI()
+    app.mount("/static/uploads", UploadFiles(directory=str(uploads_dir), **kwargs))
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path)
+
+
+@pytest.mark.asyncio
+class TestUploadFiles:
+    async def test_app_mode_streams_file(self, uploads_dir):
+        response = await _get(uploads_dir, "/static/uploads/teams/logos/Team%20A.png")
+
+        assert response.status_code == 200
+        assert response.content == b"\x89PNG logo"
+        assert "X-Accel-Redirect" not in response.headers
+
+    async def test_accel_redirect_mode_hands_file_to_nginx(self, uploads_dir):
+        response = await _get(
+            uploads_dir,
+            "/static/uploads/teams/logos/Team%20A.png",
+            mode="x-accel-redirect",
+            accel_redirect_prefix="/_uploads",
+        )
+
+        assert response.status_code == 200
+        assert response.headers["X-Accel-Redirect"] == "/_uploads/teams/logos/Team%20A.png"
+        assert response.headers["Content-Type"] == "image/png"
+        assert response.content == b""
+
+    async def test_sendfile_mode_sends_absolute_path(self, uploads_dir):
+        response = await _get(
+            uploads_dir, "/static/uploads/teams/logos/Team%20A.png", mode="x-sendfile"
+        )
+
+        assert response.status_code == 200
+        assert response.headers["X-Sendfile"] == str(uploads_dir / "teams" / "logos" / "Team A.png")
+
+    @pytest.mark.parametrize(
+        "path",
+        ["/static/uploads/teams/logos/missing.png", "/static/uploads/../../etc/passwd"],
+    )
+    async def test_paths_are_checked_before_handoff(self, uploads_dir, path):
+        response = await _get(uploads_dir, path, mode="x-accel-redirect")
+
+        assert response.status_code == 404
+        assert "X-Accel-Redirect" not in response.headers
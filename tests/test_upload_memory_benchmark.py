@@ -0,0 +1,109 @@
+"""Benchmark: peak memory of uploading and resizing a large photo.
+
+Each flow runs in a fresh interpreter whose peak RSS (``VmHWM``, reset after imports through
+``/proc/self/clear_refs``, so Linux only) covers one upload of a 24-megapixel JPEG. The buffered flow is the previous code: the saved file is read into a
+``BytesIO`` and fully decoded before the 100px and 400px derivatives are made. The streaming flow
+is ``save_and_resize_upload_image``, which copies the upload in chunks, decodes the file directly
+and at reduced scale, and also encodes the WebP variants.
+Run with: pytest -m slow -s tests/test_upload_memory_benchmark.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from src.helpers.upload_service import UploadService
+
+PHOTO_SIZE = (6000, 4000)
+
+_PRELUDE = r"""
+import asyncio, json, re, shutil, sys
+from io import BytesIO
+from pathlib import Path
+from PIL import Image
+from starlette.datastructures import Headers, UploadFile
+from src.helpers.file_service import FileService
+
+photo, upload_dir = Path(sys.argv[1]), Path(sys.argv[2])
+service = FileService(upload_dir=upload_dir)
+
+def memory_kib(field):
+    status = Path("/proc/self/status").read_text()
+    return int(re.search(field + r":\s+(\d+) kB", status).group(1))
+
+Path("/proc/self/clear_refs").write_text("5")
+baseline = memory_kib("VmRSS")
+"""
+
+_BUFFERED = """
+async def run():
+    dest = upload_dir / "buffered.jpg"
+    with photo.open("rb") as upload, dest.open("wb") as buffer:
+        shutil.copyfileobj(upload, buffer)
+    with dest.open("rb") as file:
+        image = Image.open(BytesIO(file.read()))
+    for height in (100, 400):
+        image.resize((image.width * height // image.height, height)).save(
+            upload_dir / f"buffered_{height}.jpg", format=image.format
+        )
+"""
+
+_STREAMING = """
+async def run():
+    with photo.open("rb") as file:
+        upload = UploadFile(
+            file=file, filename="photo.jpg", headers=Headers({"content-type": "image/jpeg"})
+        )
+        await service.save_and_resize_upload_image(upload, "streaming")
+"""
+
+_RUN = """
+asyncio.run(run())
+peak = memory_kib("VmHWM")
+print(json.dumps({"baseline_kib": baseline, "peak_kib": peak}))
+"""
+
+
+def _photo(path: Path) -> None:
+    gradient = Image.linear_gradient("L").resize(PHOTO_SIZE)
+    noise = Image.effect_noise(PHOTO_SIZE, 40)
+    Image.merge("RGB", (gradient, noise, Image.blend(gradient, noise, 0.5))).save(
+        path, format="JPEG", quality=75
+    )
+
+
+def _peak_mib(flow: str, photo: Path, upload_dir: Path) -> float:
+    result = subprocess.run(
+        [sys.executable, "-c", _PRELUDE + flow + _RUN, str(photo), str(upload_dir)],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).resolve().parent.parent,
+        env={**os.environ, "IMAGE_VARIANT_FORMATS": "webp"},
+    )
+    usage = json.loads(result.stdout.strip().splitlines()[-1])
+    return (usage["peak_kib"] - usage["baseline_kib"]) / 1024
+
+
+@pytest.mark.slow
+def test_streaming_upload_peak_memory(tmp_path):
+    photo = tmp_path / "photo.jpg"
+    _photo(photo)
+    assert photo.stat().st_size <= UploadService.MAX_FILE_SIZE
+
+    buffered = _peak_mib(_BUFFERED, photo, tmp_path / "buffered")
+    streaming = _peak_mib(_STREAMING, photo, tmp_path / "streaming")
+
+    print(
+        f"\nPeak RSS growth uploading a {photo.stat().st_size / 2**20:.1f} MiB "
+        f"{PHOTO_SIZE[0]}x{PHOTO_SIZE[1]} JPEG:"
+        f"\n  buffered, full decode    {buffered:7.1f} MiB"
+        f"\n  streaming, draft decode  {streaming:7.1f} MiB"
+    )
+
+    assert streaming * 3 < buffered
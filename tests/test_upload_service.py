@@ -132,6 +132,44 @@ class TestUploadService:
         await upload_service.upload_file(dest, upload_file)
         assert dest.exists()
 
+    @pytest.mark.asyncio
+    async def test_upload_file_streams_in_chunks(self, upload_service, temp_upload_dir):
+        """Test the upload is copied in fixed-size chunks."""
+        dest = temp_upload_dir / "test.jpg"
+        data = b"x" * (upload_service.CHUNK_SIZE * 2 + 10)
+        upload_file = Mock(spec=UploadFile)
+        upload_file.file = Mock(wraps=BytesIO(data))
+
+        assert await upload_service.upload_file(dest, upload_file) == len(data)
+        assert dest.read_bytes() == data
+        assert {c.args[0] for c in upload_file.file.read.call_args_list} == {
+            upload_service.CHUNK_SIZE
+        }
+
+    @pytest.mark.asyncio
+    async def test_upload_file_too_large_while_streaming(self, upload_service, temp_upload_dir):
+        """Test the size limit stops the copy and leaves no file behind."""
+        upload_service.MAX_FILE_SIZE = upload_service.CHUNK_SIZE
+        dest = temp_upload_dir / "test.jpg"
+        source = BytesIO(b"x" * (upload_service.CHUNK_SIZE * 3))
+        upload_file = Mock(spec=UploadFile)
+        upload_file.file = source
+
+        with pytest.raises(HTTPException) as exc_info:
+            await upload_service.upload_file(dest, upload_file)
+        assert exc_info.value.status_code == 413
+        assert source.tell() == upload_service.CHUNK_SIZE * 2
+        assert list(temp_upload_dir.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_validate_file_size_uses_declared_size(self, upload_service):
+        """Test a size known from the request is checked without reading the file."""
+        upload_file = UploadFile(file=Mock(), size=upload_service.MAX_FILE_SIZE + 1)
+        with pytest.raises(HTTPException) as exc_info:
+            await upload_service.validate_file_size(upload_file)
+        assert exc_info.value.status_code == 413
+        upload_file.file.seek.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_upload_file_error(self, upload_service, temp_upload_dir):
         """Test uploading file with error."""
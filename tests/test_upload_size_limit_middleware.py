@@ -0,0 +1,81 @@
+import pytest
+from fastapi import FastAPI, File, UploadFile
+from httpx import ASGITransport, AsyncClient
+
+from src.core.middleware import UploadSizeLimitMiddleware
+
+MAX_BODY_SIZE = 1024
+
+
+def _multipart(size: int) -> tuple[bytes, str]:
+    boundary = "test-boundary"
+    body = (
+        f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="a.png"\r\n'
+        f"Content-Type: image/png\r\n\r\n"
+    ).encode()
+    body += b"x" * size + f"\r\n--{boundary}--\r\n".encode()
+    return body, f"multipart/form-data; boundary={boundary}"
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(UploadSizeLimitMiddleware, max_body_size=MAX_BODY_SIZE)
+
+    @app.post("/upload")
+    async def upload(file: UploadFile = File(...)):
+        return {"size": len(await file.read())}
+
+    @app.post("/json")
+    async def json_body(data: dict):
+        return {"keys": len(data)}
+
+    return app
+
+
+@pytest.mark.asyncio
+class TestUploadSizeLimitMiddleware:
+    async def _post(self, app: FastAPI, path: str, **kwargs):
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post(path, **kwargs)
+
+    async def test_upload_within_limit(self, app):
+        body, content_type = _multipart(100)
+        response = await self._post(
+            app, "/upload", content=body, headers={"Content-Type": content_type}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"size": 100}
+
+    async def test_declared_length_over_limit_is_refused(self, app):
+        body, content_type = _multipart(MAX_BODY_SIZE * 4)
+        response = await self._post(
+            app, "/upload", content=body, headers={"Content-Type": content_type}
+        )
+
+        assert response.status_code == 413
+        assert "Request body too large" in response.json()["detail"]
+
+    async def test_streamed_body_over_limit_is_cut_off(self, app):
+        body, content_type = _multipart(MAX_BODY_SIZE * 4)
+        sent = 0
+
+        async def chunks():
+            nonlocal sent
+            for start in range(0, len(body), 256):
+                sent += 1
+                yield body[start : start + 256]
+
+        response = await self._post(
+            app, "/upload", content=chunks(), headers={"Content-Type": content_type}
+        )
+
+        assert response.status_code == 413
+        assert sent < len(body) // 256
+
+    async def test_other_bodies_are_not_limited(self, app):
+        response = await self._post(app, "/json", json={str(i): "x" * 100 for i in range(50)})
+
+        assert response.status_code == 200
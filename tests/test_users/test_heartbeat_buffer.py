@@ -0,0 +1,143 @@
+"""Test write-behind buffering of user heartbeats."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+import pytest_asyncio
+
+from src.core.models import UserDB
+from src.core.models.base import Database
+from src.users.db_services import UserServiceDB
+from src.users.heartbeat_buffer import HeartbeatBuffer, heartbeat_buffer
+from tests.testhelpers import assert_max_queries
+
+
+@pytest.fixture(autouse=True)
+def clear_heartbeat_buffer():
+    heartbeat_buffer.drain()
+    yield
+    heartbeat_buffer.drain()
+
+
+@pytest_asyncio.fixture
+async def users(test_db: Database):
+    async with test_db.get_session_maker()() as session:
+        created = [
+            UserDB(
+                username=f"heartbeat_user_{index}",
+                email=f"heartbeat_{index}@example.com",
+                hashed_password="hashed_password",
+                is_online=False,
+            )
+            for index in range(3)
+        ]
+        session.add_all(created)
+        await session.flush()
+        return created
+
+
+async def _stored(test_db: Database, user_id: int) -> UserDB:
+    async with test_db.get_session_maker()() as session:
+        user = await session.get(UserDB, user_id)
+        await session.refresh(user)
+        return user
+
+
+class TestHeartbeatBuffer:
+    def test_record_keeps_latest_timestamp(self):
+        buffer = HeartbeatBuffer()
+        now = datetime.now(UTC)
+
+        buffer.record(1, now)
+        buffer.record(1, now - timedelta(seconds=5))
+
+        assert buffer.last_seen(1) == now
+
+    def test_restore_does_not_overwrite_newer_heartbeats(self):
+        buffer = HeartbeatBuffer()
+        now = datetime.now(UTC)
+        buffer.record(1, now - timedelta(seconds=10))
+        drained = buffer.drain()
+        buffer.record(1, now)
+
+        buffer.restore(drained)
+
+        assert buffer.last_seen(1) == now
+        assert len(buffer) == 1
+
+
+class TestBufferedHeartbeats:
+    @pytest.mark.asyncio
+    async def test_heartbeat_does_not_write(self, test_db: Database, users):
+        service = UserServiceDB(test_db)
+
+        with assert_max_queries(0):
+            await service.heartbeat(users[0].id)
+
+        assert heartbeat_buffer.last_seen(users[0].id) is not None
+        assert (await _stored(test_db, users[0].id)).is_online is False
+
+    @pytest.mark.asyncio
+    async def test_reads_overlay_buffered_heartbeat(self, test_db: Database, users):
+        service = UserServiceDB(test_db)
+        await service.heartbeat(users[0].id)
+
+        user = await service.get_by_id_with_roles(users[0].id)
+        online = await service.search_users_with_pagination(
+            search_query="heartbeat_user", is_online=True
+        )
+        offline = await service.search_users_with_pagination(
+            search_query="heartbeat_user", is_online=False
+        )
+
+        assert user.is_online is True
+        assert user.last_online == heartbeat_buffer.last_seen(users[0].id)
+        assert [u.id for u in online.data] == [users[0].id]
+        assert online.data[0].is_online is True
+        assert users[0].id not in {u.id for u in offline.data}
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_batch_in_one_statement(self, test_db: Database, users):
+        service = UserServiceDB(test_db)
+        for user in users[:2]:
+            await service.heartbeat(user.id)
+
+        with assert_max_queries(2) as stats:
+            flushed, _ = await service.flush_heartbeats()
+
+        assert flushed == 2
+        assert stats.count == 2
+        assert len(heartbeat_buffer) == 0
+        assert (await _stored(test_db, users[0].id)).is_online is True
+        assert (await _stored(test_db, users[1].id)).is_online is True
+        assert (await _stored(test_db, users[2].id)).is_online is False
+
+    @pytest.mark.asyncio
+    async def test_flush_never_moves_last_online_backwards(self, test_db: Database, users):
+        service = UserServiceDB(test_db)
+        newer = datetime.now(UTC)
+        async with test_db.get_session_maker()() as session:
+            user = await session.get(UserDB, users[0].id)
+            user.last_online = newer
+            await session.flush()
+
+        heartbeat_buffer.record(users[0].id, newer - timedelta(seconds=30))
+        heartbeat_buffer.record(users[1].id, newer)
+        await service.flush_heartbeats()
+
+        assert (await _stored(test_db, users[0].id)).last_online == newer
+        assert (await _stored(test_db, users[1].id)).last_online == newer
+
+    @pytest.mark.asyncio
+    async def test_flush_marks_stale_users_offline(self, test_db: Database, users):
+        service = UserServiceDB(test_db)
+        async with test_db.get_session_maker()() as session:
+            stale = await session.get(UserDB, users[0].id)
+            stale.is_online = True
+            stale.last_online = datetime.now(UTC) - timedelta(minutes=10)
+            await session.flush()
+
+        _, marked_offline = await service.flush_heartbeats(timeout_minutes=2)
+
+        assert marked_offline >= 1
+        assert (await _stored(test_db, users[0].id)).is_online is False
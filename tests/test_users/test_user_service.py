@@ -155,7 +155,7 @@ class TestUserServiceDB:
 
     @pytest.mark.asyncio
     async def test_heartbeat_updates_last_online_and_is_online(self, test_db: Database):
-        """Test heartbeat updates last_online timestamp and is_online flag."""
+        """Test flushed heartbeat updates last_online timestamp and is_online flag."""
         from src.auth.security import get_password_hash
         from src.core.models import UserDB
 
@@ -172,6 +172,7 @@ class TestUserServiceDB:
 
         service = UserServiceDB(test_db)
         await service.heartbeat(user_id)
+        await service.flush_heartbeats()
 
         async with test_db.get_session_maker()() as session:
             from sqlalchemy import select
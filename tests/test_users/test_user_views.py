@@ -461,6 +461,14 @@ class TestUserViews:
         assert response.status_code == 200
         data = response.json()
         assert data["message"] == "Password changed successfully"
+        assert data["token_type"] == "bearer"
+
+        stale = await client.get("/api/users/me", headers={"Authorization": f"Bearer {token}"})
+        assert stale.status_code == 401
+        fresh = await client.get(
+            "/api/users/me", headers={"Authorization": f"Bearer {data['access_token']}"}
+        )
+        assert fresh.status_code == 200
 
         async with test_db.get_session_maker()() as db_session:
             stmt = select(UserDB).where(UserDB.id == test_user.id)
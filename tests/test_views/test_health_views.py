@@ -36,3 +36,16 @@ class TestHealthViews:
 
         pool_keys = data.keys()
         assert "pool_size" in pool_keys or len(pool_keys) >= 0
+
+    async def test_proxy_status_endpoint(self, client, monkeypatch):
+        monkeypatch.setattr(
+            "src.core.health.get_proxy_stats",
+            lambda: {"healthy": 1, "quarantined": 0, "proxies": [{"host": "proxy.com"}]},
+        )
+        response = await client.get("/health/proxies")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "healthy"
+        assert data["healthy"] == 1
+        assert data["proxies"] == [{"host": "proxy.com"}]
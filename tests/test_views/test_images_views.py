@@ -0,0 +1,36 @@
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+
+def create_test_image():
+    img = Image.new("RGBA", (300, 150), color=(200, 30, 30, 128))
+    buf = BytesIO()
+    img.save(buf, format="PNG")
+    buf.seek(0)
+    return buf.getvalue()
+
+
+@pytest.mark.asyncio
+class TestImageViews:
+    async def test_get_variants_of_uploaded_logo(self, client):
+        files = {"file": ("variants_logo.png", BytesIO(create_test_image()), "image/png")}
+        uploaded = (await client.post("/api/teams/upload_resize_logo", files=files)).json()
+
+        response = await client.get(
+            "/api/images/variants",
+            params={"url": [uploaded["icon"], "/static/uploads/teams/logos/missing.png"]},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data[uploaded["icon"]] == uploaded["variants"]
+        assert data["/static/uploads/teams/logos/missing.png"] is None
+        widths = [v["width"] for v in uploaded["variants"]["variants"] if v["type"] == "image/webp"]
+        assert widths == [64, 128, 256]
+
+    async def test_get_variants_requires_url(self, client):
+        response = await client.get("/api/images/variants")
+
+        assert response.status_code == 422
@@ -0,0 +1,71 @@
+"""Test import job endpoints."""
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+
+from src.auth.security import create_access_token, get_password_hash
+from src.core.models import RoleDB, UserDB
+from src.core.models.base import Database
+
+
+@pytest_asyncio.fixture
+async def admin_headers(test_db: Database) -> dict[str, str]:
+    async with test_db.get_session_maker()() as db_session:
+        role = RoleDB(name="admin", description="Admin role")
+        user = UserDB(
+            username="import_admin",
+            email="import_admin@example.com",
+            hashed_password=get_password_hash("SecurePass123!"),
+        )
+        user.roles = [role]
+        db_session.add(user)
+        await db_session.flush()
+        await db_session.refresh(user)
+    return {"Authorization": f"Bearer {create_access_token(data={'sub': str(user.id)})}"}
+
+
+@pytest.mark.asyncio
+class TestImportJobViews:
+    async def test_submit_list_cancel_resume(self, client: AsyncClient, admin_headers):
+        response = await client.post(
+            "/api/import-jobs/",
+            json={"kind": "teams", "params": {"eesl_tournament_id": 5}, "requests_per_second": 1},
+            headers=admin_headers,
+        )
+        assert response.status_code == 202
+        job = response.json()
+        assert job["status"] == "queued"
+        assert job["requests_per_second"] == 1
+        assert job["eta_seconds"] is None
+
+        response = await client.get("/api/import-jobs/?status=queued", headers=admin_headers)
+        assert [listed["id"] for listed in response.json()] == [job["id"]]
+
+        response = await client.post(
+            f"/api/import-jobs/id/{job['id']}/cancel/", headers=admin_headers
+        )
+        assert response.json()["status"] == "cancelled"
+
+        response = await client.post(
+            f"/api/import-jobs/id/{job['id']}/resume/", headers=admin_headers
+        )
+        assert response.json()["status"] == "queued"
+
+        response = await client.get(f"/api/import-jobs/id/{job['id']}/", headers=admin_headers)
+        assert response.status_code == 200
+        assert response.json()["params"] == {"eesl_tournament_id": 5}
+
+    async def test_unknown_kind_and_missing_job(self, client: AsyncClient, admin_headers):
+        response = await client.post(
+            "/api/import-jobs/", json={"kind": "everything"}, headers=admin_headers
+        )
+        assert response.status_code == 400
+
+        response = await client.get("/api/import-jobs/id/999999/", headers=admin_headers)
+        assert response.status_code == 404
+
+    async def test_requires_admin(self, client: AsyncClient):
+        response = await client.post("/api/import-jobs/", json={"kind": "teams"})
+
+        assert response.status_code == 401
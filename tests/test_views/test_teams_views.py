@@ -122,6 +122,7 @@ class TestTeamViews:
         assert "teams/logos" in response_data["original"]
         assert "teams/logos" in response_data["icon"]
         assert "teams/logos" in response_data["webview"]
+        assert "image/webp" in response_data["variants"]["srcset"]
 
     async def test_upload_and_resize_team_logo_with_invalid_file(self, client):
         file_content = b"not a valid image"
@@ -0,0 +1,257 @@
+"""Test the negotiated MessagePack subprotocol and small-frame deflate."""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import msgpack
+import pytest
+from starlette.websockets import WebSocketDisconnect, WebSocketState
+from uvicorn.config import Config
+from uvicorn.server import ServerState
+from websockets.extensions.permessage_deflate import PerMessageDeflate
+from websockets.frames import BINARY, TEXT, Frame
+
+from src.matches.match_data_cache_service import InitialLoadSnapshot
+from src.utils.websocket.deflate import (
+    SmallFrameDeflate,
+    SmallFrameDeflateFactory,
+    SmallFrameDeflateWebSocketProtocol,
+)
+from src.utils.websocket.websocket_manager import ConnectionManager
+from src.websocket.binary_protocol import (
+    MESSAGE_KEYS,
+    MSGPACK_SUBPROTOCOL,
+    MsgPackWebSocket,
+    decode_message,
+    encode_message,
+    select_subprotocol,
+)
+from src.websocket.match_handler import MatchWebSocketHandler
+
+
+class FakeWebSocket:
+    """Connected client recording what the server accepted and sent."""
+
+    def __init__(self, offered: str | None = None) -> None:
+        self.application_state = WebSocketState.CONNECTED
+        self.headers = {"sec-websocket-protocol": offered} if offered else {}
+        self.subprotocol: str | None = None
+        self.text: list[dict] = []
+        self.binary: list[bytes] = []
+        self.closed = asyncio.Event()
+
+    async def accept(self, subprotocol: str | None = None) -> None:
+        self.subprotocol = subprotocol
+
+    async def close(self) -> None:
+        self.application_state = WebSocketState.DISCONNECTED
+        self.closed.set()
+
+    async def send_json(self, message: dict) -> None:
+        self.text.append(message)
+
+    async def send_bytes(self, data: bytes) -> None:
+        self.binary.append(data)
+
+    async def receive(self) -> dict:
+        await self.closed.wait()
+        return {"type": "websocket.disconnect", "code": 1000}
+
+    async def iter_json(self):
+        await self.closed.wait()
+        return
+        yield
+
+
+class TestCodec:
+    def test_round_trip(self):
+        message = {
+            "type": "match-patch",
+            "match_id": 67,
+            "seq": 2,
+            "ops": [{"op": "replace", "path": "/scoreboard_data/score_team_a", "value": 7}],
+            "custom": {"nested": [1, None, 2.5, "ü"]},
+        }
+
+        assert decode_message(encode_message(message)) == message
+
+    def test_known_keys_are_single_byte_codes(self):
+        assert len(MESSAGE_KEYS) < 128
+        assert len(set(MESSAGE_KEYS)) == len(MESSAGE_KEYS)
+        raw = msgpack.unpackb(encode_message({"type": "ping", "other": 1}), strict_map_key=False)
+
+        assert raw == {MESSAGE_KEYS.index("type"): "ping", "other": 1}
+
+    def test_non_string_keys_become_strings_like_json(self):
+        message = {"data": {1: "a", 2: {"type": "b"}}}
+
+        assert decode_message(encode_message(message)) == json.loads(json.dumps(message))
+
+    def test_smaller_than_json(self):
+        message = {
+            "type": "gameclock-update",
+            "match_id": 67,
+            "match_seq": 412,
+            "gameclock": {"id": 67, "gameclock": 711, "gameclock_status": "running"},
+        }
+
+        assert len(encode_message(message)) < len(json.dumps(message, separators=(",", ":"))) / 2
+
+    @pytest.mark.parametrize(
+        ("offered", "expected"),
+        [
+            (MSGPACK_SUBPROTOCOL, MSGPACK_SUBPROTOCOL),
+            (f"other, {MSGPACK_SUBPROTOCOL}", MSGPACK_SUBPROTOCOL),
+            ("other", None),
+            ("", None),
+        ],
+    )
+    def test_select_subprotocol(self, offered, expected):
+        assert select_subprotocol(offered) == expected
+
+
+@pytest.mark.asyncio
+class TestMsgPackWebSocket:
+    async def test_sends_binary_frames(self):
+        websocket = FakeWebSocket()
+
+        await MsgPackWebSocket(websocket).send_json({"type": "ping", "timestamp": 1.5})
+
+        assert websocket.text == []
+        assert [decode_message(frame) for frame in websocket.binary] == [
+            {"type": "ping", "timestamp": 1.5}
+        ]
+
+    async def test_receives_binary_and_text_until_disconnect(self):
+        websocket = MagicMock()
+        websocket.receive = AsyncMock(
+            side_effect=[
+                {"type": "websocket.receive", "bytes": encode_message({"type": "pong"})},
+                {"type": "websocket.receive", "text": '{"type": "resync"}'},
+                {"type": "websocket.disconnect", "code": 1001},
+            ]
+        )
+
+        received = [message async for message in MsgPackWebSocket(websocket).iter_json()]
+
+        assert received == [{"type": "pong"}, {"type": "resync"}]
+
+    async def test_receive_raises_on_disconnect(self):
+        websocket = FakeWebSocket()
+        websocket.closed.set()
+
+        with pytest.raises(WebSocketDisconnect):
+            await MsgPackWebSocket(websocket).receive_json()
+
+    async def test_delegates_everything_else(self):
+        websocket = FakeWebSocket()
+        wrapped = MsgPackWebSocket(websocket)
+
+        await wrapped.close()
+
+        assert wrapped.application_state == WebSocketState.DISCONNECTED
+
+
+@pytest.mark.asyncio
+class TestNegotiation:
+    @asynccontextmanager
+    async def _serve(self, websocket):
+        manager = ConnectionManager()
+        handler = MatchWebSocketHandler()
+        with (
+            patch("src.websocket.match_handler.connection_manager", manager),
+            patch("src.websocket.match_handler.ws_manager") as mock_ws_manager,
+            patch.object(handler, "send_initial_data", AsyncMock()),
+            patch.object(handler, "enable_match_clock_queues", AsyncMock()),
+        ):
+            mock_ws_manager.is_connected = True
+            task = asyncio.create_task(handler.handle_websocket_connection(websocket, "client", 1))
+            await asyncio.sleep(0.01)
+            yield manager
+            websocket.closed.set()
+            await asyncio.wait_for(task, timeout=1)
+
+    async def test_offering_client_gets_messagepack(self):
+        websocket = FakeWebSocket(offered=f"graphql-ws, {MSGPACK_SUBPROTOCOL}")
+
+        async with self._serve(websocket) as manager:
+            await manager.heartbeats.ping_all()
+            await manager.send_to_all({"type": "event-update", "events": []}, match_id=1)
+            await asyncio.sleep(0.01)
+
+        assert websocket.subprotocol == MSGPACK_SUBPROTOCOL
+        assert websocket.text == []
+        assert [decode_message(frame)["type"] for frame in websocket.binary] == [
+            "ping",
+            "event-update",
+        ]
+
+    async def test_json_client_unchanged(self):
+        websocket = FakeWebSocket()
+
+        async with self._serve(websocket) as manager:
+            await manager.heartbeats.ping_all()
+
+        assert websocket.subprotocol is None
+        assert websocket.binary == []
+        assert [message["type"] for message in websocket.text] == ["ping"]
+
+    async def test_initial_load_snapshot_is_encoded_for_messagepack(self):
+        snapshot = InitialLoadSnapshot(1, {"match": {"id": 1}, "events": []}, {"id": 1})
+        cache_service = MagicMock()
+        cache_service.get_or_build_initial_load = AsyncMock(return_value=snapshot)
+        websocket = FakeWebSocket()
+        websocket.send_text = AsyncMock()
+
+        with patch("src.websocket.match_handler.connection_manager", ConnectionManager()):
+            await MatchWebSocketHandler(cache_service).send_initial_data(
+                MsgPackWebSocket(websocket), "client", 1, match_seq=3
+            )
+
+        websocket.send_text.assert_not_called()
+        message = decode_message(websocket.binary[0])
+        assert message["type"] == "initial-load"
+        assert message["data"]["match"] == {"id": 1}
+        assert message["data"]["match_seq"] == 3
+
+
+class TestSmallFrameDeflate:
+    def test_small_frames_skip_compression(self):
+        server = SmallFrameDeflate(False, False, 12, 12, min_bytes=256)
+        client = PerMessageDeflate(False, False, 12, 12)
+        payloads = [b"x" * 100, b'{"type":"match-update"}' * 40, b"y" * 10, b"z" * 1000]
+
+        frames = [server.encode(Frame(BINARY, payload)) for payload in payloads]
+
+        assert [frame.rsv1 for frame in frames] == [False, True, False, True]
+        assert [client.decode(frame).data for frame in frames] == payloads
+
+    def test_fragmented_messages_are_compressed(self):
+        server = SmallFrameDeflate(False, False, 12, 12, min_bytes=256)
+
+        assert server.encode(Frame(TEXT, b"x" * 10, fin=False)).rsv1
+
+    def test_factory_negotiates_small_frame_extension(self):
+        factory = SmallFrameDeflateFactory(server_max_window_bits=12, min_bytes=64)
+
+        _, extension = factory.process_request_params([], [])
+
+        assert isinstance(extension, SmallFrameDeflate)
+        assert extension.min_bytes == 64
+        assert extension.local_max_window_bits == 12
+
+    @pytest.mark.asyncio
+    async def test_worker_protocol_offers_small_frame_deflate(self):
+        async def app(scope, receive, send):
+            pass
+
+        config = Config(app=app, ws_per_message_deflate=True)
+        config.load()
+
+        protocol = SmallFrameDeflateWebSocketProtocol(config, ServerState(), app_state={})
+
+        assert [type(factory) for factory in protocol.conn.available_extensions] == [
+            SmallFrameDeflateFactory
+        ]
@@ -0,0 +1,183 @@
+"""Benchmark: CPU and bytes on the wire per 1,000 match websocket messages.
+
+Compares JSON text frames with the MessagePack subprotocol, each with permessage-deflate on
+every frame (the previous worker setup) and with small frames left uncompressed. The message
+mix is a live match: mostly clock ticks, some match updates and a few event updates.
+Run with: pytest -m slow -s tests/test_websocket/test_binary_protocol_benchmark.py
+"""
+
+import json
+import time
+
+import pytest
+from websockets.extensions.permessage_deflate import PerMessageDeflate
+from websockets.frames import BINARY, TEXT, Frame
+
+from src.utils.websocket.deflate import SmallFrameDeflate
+from src.websocket.binary_protocol import decode_message, encode_message
+
+MESSAGES = 1000
+ROUNDS = 20
+
+
+def _scoreboard() -> dict:
+    flags = {
+        f"is_{name}": index % 2 == 0
+        for index, name in enumerate(
+            ["qtr", "time", "playclock", "downdistance", "tournament_logo", "main_sponsor", "flag"]
+        )
+    }
+    return {
+        "id": 67,
+        "match_id": 67,
+        **flags,
+        "team_a_game_color": "#c01010",
+        "team_b_game_color": "#1030c0",
+        "team_a_game_title": "Moscow Bears",
+        "team_b_game_title": "Saint Petersburg Griffins",
+        "scale_logo_a": 2.0,
+        "scale_logo_b": 2.0,
+        "language_code": "en",
+    }
+
+
+def _match_update(seq: int) -> dict:
+    return {
+        "type": "match-update",
+        "match_seq": seq,
+        "data": {
+            "match_id": 67,
+            "match": {"id": 67, "week": 3, "match_date": "2026-10-17T18:00:00", "team_a_id": 1},
+            "match_data": {
+                "id": 67,
+                "match_id": 67,
+                "score_team_a": 14 + seq % 7,
+                "score_team_b": 7,
+                "qtr": "2nd",
+                "down": "3rd",
+                "distance": "7",
+                "ball_on": 35,
+                "timeout_team_a": "●●○",
+                "timeout_team_b": "●●●",
+                "game_status": "in-progress",
+                "field_length": 100,
+            },
+            "scoreboard_data": _scoreboard(),
+            "teams_data": {
+                "team_a": {"id": 1, "title": "Moscow Bears", "team_color": "#c01010"},
+                "team_b": {"id": 2, "title": "Saint Petersburg Griffins", "team_color": "#1030c0"},
+            },
+        },
+    }
+
+
+def _message_mix() -> list[dict]:
+    messages: list[dict] = []
+    for seq in range(MESSAGES):
+        if seq % 25 == 0:
+            messages.append(
+                {
+                    "type": "event-update",
+                    "match_id": 67,
+                    "match_seq": seq,
+                    "events": [
+                        {"id": event, "event_qtr": 2, "play_type": "pass", "event_number": event}
+                        for event in range(20)
+                    ],
+                }
+            )
+        elif seq % 10 == 0:
+            messages.append(_match_update(seq))
+        else:
+            kind = "gameclock" if seq % 2 else "playclock"
+            messages.append(
+                {
+                    "type": f"{kind}-update",
+                    "match_id": 67,
+                    "match_seq": seq,
+                    kind: {
+                        "id": 67,
+                        "match_id": 67,
+                        kind: 720 - seq % 720,
+                        f"{kind}_status": "running",
+                        "started_at_ms": 1760724000000,
+                        "version": seq,
+                    },
+                }
+            )
+    return messages
+
+
+def _json(message: dict) -> bytes:
+    # As starlette's send_json encodes messages.
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def _frame_size(payload: int) -> int:
+    """Bytes of an unmasked server frame carrying payload bytes."""
+    return payload + (2 if payload < 126 else 4 if payload < 65536 else 10)
+
+
+def _run(messages, encode, decode, opcode, server, client) -> tuple[float, float, int]:
+    """Return (server ms, client ms) per MESSAGES messages and wire bytes of one round."""
+    wire = 0
+    server_cpu = client_cpu = 0.0
+    for _ in range(ROUNDS):
+        wire = 0
+        frames = []
+        start = time.process_time()
+        for message in messages:
+            frame = Frame(opcode, encode(message))
+            if server is not None:
+                frame = server.encode(frame)
+            frames.append(frame)
+            wire += _frame_size(len(frame.data))
+        server_cpu += time.process_time() - start
+
+        start = time.process_time()
+        for frame in frames:
+            if client is not None:
+                frame = client.decode(frame)
+            decode(frame.data)
+        client_cpu += time.process_time() - start
+    return server_cpu * 1000 / ROUNDS, client_cpu * 1000 / ROUNDS, wire
+
+
+@pytest.mark.slow
+def test_wire_format_cost():
+    messages = _message_mix()
+    encodings = {
+        "json": (_json, json.loads, TEXT),
+        "msgpack": (encode_message, decode_message, BINARY),
+    }
+
+    def deflate(small_frames: bool | None):
+        if small_frames is None:
+            return None, None
+        if small_frames:
+            server = SmallFrameDeflate(False, False, 12, 12, {"memLevel": 5}, min_bytes=256)
+        else:
+            server = PerMessageDeflate(False, False, 12, 12, {"memLevel": 5})
+        return server, PerMessageDeflate(False, False, 12, 12)
+
+    results = {}
+    print(f"\n{MESSAGES} match websocket messages:")
+    for name, (encode, decode, opcode) in encodings.items():
+        for label, small_frames in (
+            ("no deflate", None),
+            ("deflate every frame", False),
+            ("deflate >= 256 B", True),
+        ):
+            results[name, small_frames] = _run(
+                messages, encode, decode, opcode, *deflate(small_frames)
+            )
+            server_ms, client_ms, wire = results[name, small_frames]
+            print(
+                f"  {name:7s} {label:20s}: server {server_ms:6.2f}ms, "
+                f"client {client_ms:6.2f}ms, {wire:7d} bytes"
+            )
+
+    json_deflate = results["json", False]
+    msgpack_small_frames = results["msgpack", True]
+    assert msgpack_small_frames[0] < json_deflate[0]
+    assert results["msgpack", None][2] < results["json", None][2]
@@ -0,0 +1,160 @@
+"""Test the negotiated clock extrapolation protocol for match websockets."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from starlette.websockets import WebSocketState
+
+from src.utils.websocket.websocket_manager import ConnectionManager
+from src.websocket.clock_sync import (
+    CLOCK_SYNC_EXTRAPOLATE,
+    CLOCK_SYNC_LEGACY,
+    ClockTransitionFilter,
+    clock_state_message,
+    has_clock_state,
+    normalize_clock_sync_mode,
+    time_sync_message,
+)
+from src.websocket.match_handler import MatchWebSocketHandler
+
+GAMECLOCK_PAYLOAD = {
+    "id": 5,
+    "match_id": 1,
+    "version": 3,
+    "gameclock": 600,
+    "gameclock_max": 720,
+    "gameclock_status": "running",
+    "direction": "down",
+    "started_at_ms": 1_700_000_000_000,
+}
+
+
+def _connected_websocket() -> AsyncMock:
+    websocket = AsyncMock()
+    websocket.application_state = WebSocketState.CONNECTED
+    return websocket
+
+
+class TestClockSyncMessages:
+    def test_unknown_mode_falls_back_to_legacy(self):
+        assert normalize_clock_sync_mode(None) == CLOCK_SYNC_LEGACY
+        assert normalize_clock_sync_mode("bogus") == CLOCK_SYNC_LEGACY
+        assert normalize_clock_sync_mode(CLOCK_SYNC_EXTRAPOLATE) == CLOCK_SYNC_EXTRAPOLATE
+
+    def test_gameclock_state_carries_extrapolation_fields(self):
+        message = clock_state_message("gameclock", 1, GAMECLOCK_PAYLOAD, now_ms=123)
+
+        assert message == {
+            "type": "clock-state",
+            "clock": "gameclock",
+            "match_id": 1,
+            "id": 5,
+            "version": 3,
+            "status": "running",
+            "value": 600,
+            "started_at_ms": 1_700_000_000_000,
+            "direction": "down",
+            "max_value": 720,
+            "server_time_ms": 123,
+        }
+
+    def test_playclock_state_counts_down_without_max(self):
+        playclock = {"id": 2, "playclock": 40, "playclock_status": "stopped", "started_at_ms": None}
+
+        message = clock_state_message("playclock", 1, playclock)
+
+        assert message["direction"] == "down"
+        assert message["max_value"] is None
+        assert message["value"] == 40
+
+    def test_payload_without_started_at_is_incomplete(self):
+        assert has_clock_state("gameclock", GAMECLOCK_PAYLOAD)
+        assert not has_clock_state("playclock", {"playclock": 40, "playclock_status": "running"})
+
+    def test_transition_filter_drops_repeated_state(self):
+        transitions = ClockTransitionFilter()
+        running = clock_state_message("gameclock", 1, GAMECLOCK_PAYLOAD)
+        paused = clock_state_message(
+            "gameclock",
+            1,
+            {**GAMECLOCK_PAYLOAD, "gameclock_status": "paused", "started_at_ms": None},
+        )
+
+        assert transitions.is_transition(running)
+        assert not transitions.is_transition({**running, "server_time_ms": 1, "version": 4})
+        assert transitions.is_transition(paused)
+        assert transitions.is_transition(running)
+
+    def test_time_sync_echoes_client_time(self):
+        assert "client_time_ms" not in time_sync_message()
+        assert time_sync_message(42)["client_time_ms"] == 42
+
+
+@pytest.mark.asyncio
+class TestExtrapolatingConnection:
+    async def test_clock_updates_become_transition_only_clock_state(self):
+        handler = MatchWebSocketHandler()
+        websocket = _connected_websocket()
+        manager = ConnectionManager()
+        await manager.connect(websocket, "overlay", 1)
+        manager.set_clock_sync_mode("overlay", CLOCK_SYNC_EXTRAPOLATE)
+        sent: list[dict] = []
+
+        async def send_json(message):
+            sent.append(message)
+            if message["type"] == "match-update":
+                websocket.application_state = WebSocketState.DISCONNECTED
+
+        websocket.send_json = send_json
+        update = {"type": "gameclock-update", "match_id": 1, "gameclock": GAMECLOCK_PAYLOAD}
+        for message in (update, dict(update), {"type": "match-update", "match_id": 1}):
+            await manager.queues["overlay"].put(message)
+
+        with patch("src.websocket.match_handler.connection_manager", manager):
+            await handler.process_data_websocket(websocket, "overlay", 1)
+
+        assert [message["type"] for message in sent] == ["clock-state", "match-update"]
+        assert sent[0]["started_at_ms"] == GAMECLOCK_PAYLOAD["started_at_ms"]
+
+    async def test_incomplete_payload_is_completed_from_fetch(self):
+        handler = MatchWebSocketHandler()
+        websocket = _connected_websocket()
+        playclock = {"id": 2, "playclock": 25, "playclock_status": "running", "started_at_ms": 99}
+
+        with patch("src.helpers.fetch_helpers.fetch_playclock") as mock_fetch:
+            mock_fetch.return_value = {"playclock": playclock}
+            await handler.process_clock_state(
+                websocket,
+                1,
+                {"type": "playclock-update", "playclock": {"playclock": 25}},
+                ClockTransitionFilter(),
+            )
+
+        message = websocket.send_json.call_args[0][0]
+        assert message["type"] == "clock-state"
+        assert message["started_at_ms"] == 99
+
+    async def test_time_sync_request_gets_reply(self):
+        handler = MatchWebSocketHandler()
+        websocket = _connected_websocket()
+
+        async def iter_json():
+            yield {"type": "time-sync", "client_time_ms": 7}
+
+        websocket.iter_json = iter_json
+
+        with patch("src.websocket.match_handler.connection_manager"):
+            await handler.receive_messages(websocket, "overlay")
+
+        reply = websocket.send_json.call_args[0][0]
+        assert reply["type"] == "time-sync"
+        assert reply["client_time_ms"] == 7
+
+    async def test_disconnect_forgets_clock_sync_mode(self):
+        manager = ConnectionManager()
+        await manager.connect(_connected_websocket(), "overlay", 1)
+        manager.set_clock_sync_mode("overlay", CLOCK_SYNC_EXTRAPOLATE)
+
+        await manager.disconnect("overlay")
+
+        assert manager.get_clock_sync_mode("overlay") is None
@@ -0,0 +1,223 @@
+"""Test the shared websocket heartbeat scheduler."""
+
+import asyncio
+import time
+import tracemalloc
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from starlette.websockets import WebSocketState
+
+from src.utils.websocket.heartbeat import HeartbeatScheduler
+from src.utils.websocket.websocket_manager import ConnectionManager
+from src.websocket.clock_sync import CLOCK_SYNC_EXTRAPOLATE
+from src.websocket.match_handler import MatchWebSocketHandler
+
+
+class IdleWebSocket:
+    """Connected client that never sends anything."""
+
+    def __init__(self) -> None:
+        self.application_state = WebSocketState.CONNECTED
+        self.headers: dict[str, str] = {}
+        self.sent: list[dict] = []
+        self.closed = asyncio.Event()
+
+    async def accept(self, subprotocol: str | None = None) -> None:
+        pass
+
+    async def close(self) -> None:
+        self.application_state = WebSocketState.DISCONNECTED
+        self.closed.set()
+
+    async def send_json(self, message: dict) -> None:
+        self.sent.append(message)
+
+    async def iter_json(self):
+        await self.closed.wait()
+        return
+        yield
+
+
+@pytest.mark.asyncio
+class TestHeartbeatScheduler:
+    async def test_pings_every_socket_in_batches(self):
+        scheduler = HeartbeatScheduler(60, 30, batch_size=2)
+        websockets = [IdleWebSocket() for _ in range(5)]
+        for index, websocket in enumerate(websockets):
+            scheduler.register(f"client{index}", websocket)
+
+        await scheduler.ping_all()
+
+        assert [[m["type"] for m in websocket.sent] for websocket in websockets] == [["ping"]] * 5
+        assert not scheduler.unreachable
+
+    async def test_failed_sends_are_marked_unreachable(self):
+        scheduler = HeartbeatScheduler(60, 30, batch_size=10)
+        broken = IdleWebSocket()
+        broken.send_json = AsyncMock(side_effect=RuntimeError("websocket.send after close"))
+        closed = IdleWebSocket()
+        closed.application_state = WebSocketState.DISCONNECTED
+        for client_id, websocket in (
+            ("ok", IdleWebSocket()),
+            ("broken", broken),
+            ("closed", closed),
+        ):
+            scheduler.register(client_id, websocket)
+
+        await scheduler.ping_all()
+
+        assert scheduler.unreachable == {"broken", "closed"}
+
+    async def test_time_sync_only_for_enabled_clients(self):
+        scheduler = HeartbeatScheduler(60, 30, batch_size=10)
+        legacy, extrapolating = IdleWebSocket(), IdleWebSocket()
+        scheduler.register("legacy", legacy)
+        scheduler.register("extrapolating", extrapolating)
+        scheduler.enable_time_sync("extrapolating")
+
+        await scheduler.time_sync_all()
+
+        assert legacy.sent == []
+        assert [m["type"] for m in extrapolating.sent] == ["time-sync"]
+
+    async def test_run_sends_on_each_interval(self):
+        scheduler = HeartbeatScheduler(0.05, 0.02, batch_size=10)
+        websocket = IdleWebSocket()
+        scheduler.register("client", websocket)
+        scheduler.enable_time_sync("client")
+
+        task = asyncio.create_task(scheduler.run())
+        await asyncio.sleep(0.13)
+        task.cancel()
+
+        types = [m["type"] for m in websocket.sent]
+        assert types.count("ping") == 2
+        assert types.count("time-sync") >= 4
+
+
+@pytest.mark.asyncio
+class TestConnectionLiveness:
+    async def test_cleanup_disconnects_unreachable_clients(self):
+        manager = ConnectionManager()
+        reachable, unreachable = IdleWebSocket(), IdleWebSocket()
+        await manager.connect(reachable, "reachable", 1)
+        await manager.connect(unreachable, "unreachable", 1)
+        manager.heartbeats.unreachable.add("unreachable")
+
+        await manager.cleanup_stale_connections(timeout_seconds=90)
+
+        assert list(manager.active_connections) == ["reachable"]
+        assert unreachable.closed.is_set()
+        assert list(manager.heartbeats.sockets) == ["reachable"]
+        assert not manager.heartbeats.unreachable
+
+    @asynccontextmanager
+    async def _serve(self, manager, websocket, clock_sync=None):
+        handler = MatchWebSocketHandler()
+        with (
+            patch("src.websocket.match_handler.connection_manager", manager),
+            patch("src.websocket.match_handler.ws_manager") as mock_ws_manager,
+            patch.object(handler, "send_initial_data", AsyncMock()),
+            patch.object(handler, "enable_match_clock_queues", AsyncMock()),
+        ):
+            mock_ws_manager.is_connected = True
+            task = asyncio.create_task(
+                handler.handle_websocket_connection(websocket, "client", 1, clock_sync=clock_sync)
+            )
+            await asyncio.sleep(0.01)
+            yield task
+
+    async def test_connection_runs_one_background_task(self):
+        manager = ConnectionManager()
+        before = len(asyncio.all_tasks())
+
+        async with self._serve(manager, IdleWebSocket(), CLOCK_SYNC_EXTRAPOLATE) as task:
+            assert len(asyncio.all_tasks()) - before == 2  # the connection and its receive loop
+            assert manager.heartbeats.time_sync_clients == {"client"}
+            await manager.disconnect("client")
+            await asyncio.wait_for(task, timeout=1)
+
+    async def test_connection_ends_when_client_goes_away(self):
+        manager = ConnectionManager()
+        websocket = IdleWebSocket()
+        async with self._serve(manager, websocket) as task:
+            websocket.closed.set()
+            await asyncio.wait_for(task, timeout=1)
+
+        assert "client" not in manager.active_connections
+        assert "client" not in manager.heartbeats.sockets
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_idle_sockets_footprint():
+    """Tasks, memory and CPU of 5k idle match websockets on one worker.
+
+    Compares the shared scheduler with the previous shape, where every connection also ran
+    its own ping sleep loop. Intervals are shortened so a few seconds cover many rounds.
+    Run with: pytest -m slow -s tests/test_websocket/test_heartbeat.py
+    """
+    sockets = 5000
+    ping_interval = 0.2
+    window = 2.0
+
+    async def measure(per_socket_pings: bool) -> tuple[float, float, float]:
+        manager = ConnectionManager()
+        manager.heartbeats.ping_interval_seconds = ping_interval
+        handler = MatchWebSocketHandler()
+        websockets = [IdleWebSocket() for _ in range(sockets)]
+        extra: list[asyncio.Task] = []
+
+        async def ping_loop(websocket):
+            while True:
+                await asyncio.sleep(ping_interval)
+                await websocket.send_json({"type": "ping", "timestamp": time.time()})
+
+        before = len(asyncio.all_tasks())
+        tracemalloc.start()
+        with (
+            patch("src.websocket.match_handler.connection_manager", manager),
+            patch("src.websocket.match_handler.ws_manager") as mock_ws_manager,
+            patch.object(handler, "send_initial_data", AsyncMock()),
+            patch.object(handler, "enable_match_clock_queues", AsyncMock()),
+        ):
+            mock_ws_manager.is_connected = True
+            connections = [
+                asyncio.create_task(
+                    handler.handle_websocket_connection(websocket, f"client{index}", 1)
+                )
+                for index, websocket in enumerate(websockets)
+            ]
+            if per_socket_pings:
+                extra = [asyncio.create_task(ping_loop(websocket)) for websocket in websockets]
+            else:
+                extra = [asyncio.create_task(manager.heartbeats.run())]
+            await asyncio.sleep(0.5)
+            tasks_per_socket = (len(asyncio.all_tasks()) - before) / sockets
+            memory_per_socket = tracemalloc.get_traced_memory()[0] / sockets
+            tracemalloc.stop()
+
+            cpu_start = time.process_time()
+            await asyncio.sleep(window)
+            cpu_share = (time.process_time() - cpu_start) / window
+
+            for task in extra:
+                task.cancel()
+            for client_id in list(manager.active_connections):
+                await manager.disconnect(client_id)
+            await asyncio.gather(*connections, *extra, return_exceptions=True)
+        assert all(websocket.sent for websocket in websockets)
+        return tasks_per_socket, memory_per_socket, cpu_share
+
+    per_socket = await measure(per_socket_pings=True)
+    scheduler = await measure(per_socket_pings=False)
+
+    print(f"\n{sockets} idle sockets, ping every {ping_interval}s:")
+    for label, (tasks, memory, cpu) in (
+        ("per-socket ping", per_socket),
+        ("shared scheduler", scheduler),
+    ):
+        print(f"  {label:16s}: {tasks:4.2f} tasks/socket, {memory:7.0f} B/socket, CPU {cpu:5.1%}")
+    assert scheduler[0] < per_socket[0]
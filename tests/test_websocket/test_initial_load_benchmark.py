@@ -0,0 +1,76 @@
+"""Benchmark: kickoff thundering herd of clients joining one match.
+
+500 clients open a match websocket within 2 seconds. Compares DB queries and p99 join
+latency for composing initial-load per client against the shared per-match snapshot.
+Run with: pytest -m slow -s tests/test_websocket/test_initial_load_benchmark.py
+"""
+
+import asyncio
+import json
+import random
+from statistics import quantiles
+from time import perf_counter
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.core.query_stats import track_queries
+from src.matches.match_data_cache_service import MatchDataCacheService
+from src.utils.websocket.websocket_manager import ConnectionManager
+from src.websocket.match_handler import MatchWebSocketHandler
+from tests.test_db_services.test_gameclock_service import _create_match
+
+CLIENTS = 500
+JOIN_WINDOW_SECONDS = 2.0
+
+
+def _sent_match_status(websocket: AsyncMock) -> int | None:
+    if websocket.send_text.called:
+        message = json.loads(websocket.send_text.call_args[0][0])
+    else:
+        message = websocket.send_json.call_args[0][0]
+    return message["data"].get("status_code")
+
+
+async def _herd(handler: MatchWebSocketHandler, match_id: int) -> tuple[int, float]:
+    """Join CLIENTS clients at random offsets in the window; return (queries, p99 ms)."""
+    rng = random.Random(0)
+    latencies: list[float] = []
+    websockets = [AsyncMock() for _ in range(CLIENTS)]
+
+    async def join(index: int) -> None:
+        await asyncio.sleep(rng.uniform(0, JOIN_WINDOW_SECONDS))
+        start = perf_counter()
+        await handler.send_initial_data(websockets[index], f"client{index}", match_id)
+        latencies.append((perf_counter() - start) * 1000)
+
+    with (
+        patch("src.websocket.match_handler.connection_manager", ConnectionManager()),
+        track_queries("herd") as stats,
+    ):
+        await asyncio.gather(*(join(index) for index in range(CLIENTS)))
+    assert {_sent_match_status(websocket) for websocket in websockets} == {200}
+    return stats.count, quantiles(latencies, n=100)[-1]
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_kickoff_herd(test_db):
+    match = await _create_match(test_db)
+
+    with patch("src.helpers.fetch_helpers.db", test_db):
+        # The first load creates the match's scoreboard, clocks and stats rows, which
+        # already exist by kickoff.
+        with patch("src.websocket.match_handler.connection_manager", ConnectionManager()):
+            await MatchWebSocketHandler().send_initial_data(AsyncMock(), "warmup", match.id)
+        per_client_queries, per_client_p99 = await _herd(MatchWebSocketHandler(), match.id)
+    snapshot_queries, snapshot_p99 = await _herd(
+        MatchWebSocketHandler(cache_service=MatchDataCacheService(test_db)), match.id
+    )
+
+    print(
+        f"\n{CLIENTS} clients joining match {match.id} within {JOIN_WINDOW_SECONDS:.0f}s:"
+        f"\n  per-client initial-load: {per_client_queries:6d} queries, p99 {per_client_p99:8.2f}ms"
+        f"\n  shared snapshot:         {snapshot_queries:6d} queries, p99 {snapshot_p99:8.2f}ms"
+    )
+    assert snapshot_queries * 100 < per_client_queries
@@ -0,0 +1,217 @@
+"""Test delta (JSON Patch) delivery of match updates."""
+
+import copy
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from starlette.websockets import WebSocketState
+
+from src.utils.websocket.websocket_manager import ConnectionManager
+from src.websocket.match_handler import MatchWebSocketHandler
+from src.websocket.match_patches import (
+    MATCH_UPDATES_FULL,
+    MATCH_UPDATES_PATCH,
+    MatchPatchStream,
+    diff_match_documents,
+    is_match_document,
+    normalize_match_updates_mode,
+)
+
+
+def _document(score_a: int = 0, down: str = "1st", players: int = 40) -> dict:
+    return {
+        "match_id": 1,
+        "id": 1,
+        "status_code": 200,
+        "match": {"id": 1, "title": "Team A vs Team B", "tournament": {"id": 3, "title": "Cup"}},
+        "sponsors_data": {"match": {"main_sponsor": None, "sponsor_line": None}},
+        "scoreboard_data": {"id": 1, "score_team_a": score_a, "score_team_b": 0, "qtr": "1st"},
+        "teams_data": {"team_a": {"id": 1, "title": "Team A"}, "team_b": {"id": 2, "title": "B"}},
+        "match_data": {"id": 1, "down": down, "distance": "10", "ball_on": 25},
+        "players": [
+            {"id": index, "player_number": str(index), "full_name": f"Player {index}"}
+            for index in range(players)
+        ],
+        "events": [],
+    }
+
+
+def _pointer(path: str) -> list[str]:
+    return [token.replace("~1", "/").replace("~0", "~") for token in path.split("/")[1:]]
+
+
+def _apply(document, ops: list[dict]):
+    """Reference client: apply add/remove/replace operations."""
+    document = copy.deepcopy(document)
+    for op in ops:
+        tokens = _pointer(op["path"])
+        if not tokens:
+            document = copy.deepcopy(op["value"])
+            continue
+        parent = document
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        last = int(tokens[-1]) if isinstance(parent, list) else tokens[-1]
+        if op["op"] == "remove":
+            del parent[last]
+        else:
+            parent[last] = copy.deepcopy(op["value"])
+    return document
+
+
+def _connected_websocket() -> AsyncMock:
+    websocket = AsyncMock()
+    websocket.application_state = WebSocketState.CONNECTED
+    return websocket
+
+
+class TestMatchPatches:
+    def test_unknown_mode_falls_back_to_full(self):
+        assert normalize_match_updates_mode(None) == MATCH_UPDATES_FULL
+        assert normalize_match_updates_mode("bogus") == MATCH_UPDATES_FULL
+        assert normalize_match_updates_mode(MATCH_UPDATES_PATCH) == MATCH_UPDATES_PATCH
+
+    def test_score_change_is_one_replace(self):
+        ops = diff_match_documents(_document(), _document(score_a=7))
+
+        assert ops == [{"op": "replace", "path": "/scoreboard_data/score_team_a", "value": 7}]
+
+    def test_diff_round_trips(self):
+        previous = _document()
+        current = _document(score_a=3, down="2nd", players=38)
+        current["match"]["weather/notes~"] = "rain"
+        del current["sponsors_data"]
+        current["players"][0]["full_name"] = "Renamed"
+
+        assert _apply(previous, diff_match_documents(previous, current)) == current
+
+    def test_keys_are_escaped_as_json_pointers(self):
+        ops = diff_match_documents({"a/b": 1, "c~d": 1}, {"a/b": 2, "c~d": 2})
+
+        assert [op["path"] for op in ops] == ["/a~1b", "/c~0d"]
+
+    def test_trigger_row_is_not_a_document(self):
+        assert is_match_document(_document())
+        assert not is_match_document({"id": 1, "match_id": 1, "down": "2nd"})
+
+    def test_stream_numbers_snapshot_then_patches(self):
+        stream = MatchPatchStream()
+
+        first = stream.next_message(1, _document())
+        unchanged = stream.next_message(1, _document())
+        second = stream.next_message(1, _document(score_a=7))
+
+        assert (first["type"], first["seq"]) == ("match-update", 1)
+        assert unchanged is None
+        assert (second["type"], second["seq"]) == ("match-patch", 2)
+        assert _apply(first["data"], second["ops"]) == _document(score_a=7)
+
+
+@pytest.mark.asyncio
+class TestPatchConnection:
+    async def test_patch_client_gets_snapshot_then_patches(self):
+        handler = MatchWebSocketHandler()
+        websocket = _connected_websocket()
+        manager = ConnectionManager()
+        await manager.connect(websocket, "scorer", 1)
+        manager.set_match_updates_mode("scorer", MATCH_UPDATES_PATCH)
+        sent: list[dict] = []
+
+        async def send_json(message):
+            sent.append(message)
+            if message["type"] == "event-update":
+                websocket.application_state = WebSocketState.DISCONNECTED
+
+        websocket.send_json = send_json
+        for message in (
+            {"type": "initial-load", "data": _document()},
+            {"type": "match-update", "data": _document()},
+            {"type": "match-update", "data": _document(score_a=7)},
+            {"type": "match-update", "data": {"id": 1, "match_id": 1, "down": "2nd"}},
+            {"type": "match-resync"},
+            {"type": "event-update", "match_id": 1, "events": []},
+        ):
+            await manager.queues["scorer"].put(message)
+
+        with (
+            patch("src.websocket.match_handler.connection_manager", manager),
+            patch("src.helpers.fetch_helpers.fetch_with_scoreboard_data") as mock_fetch,
+        ):
+            mock_fetch.return_value = {"data": _document(score_a=7, down="2nd")}
+            await handler.process_data_websocket(websocket, "scorer", 1)
+
+        assert [(m["type"], m.get("seq")) for m in sent] == [
+            ("match-update", 1),
+            ("match-patch", 2),
+            ("match-patch", 3),
+            ("match-update", 4),
+            ("event-update", None),
+        ]
+        assert sent[2]["ops"] == [{"op": "replace", "path": "/match_data/down", "value": "2nd"}]
+        assert sent[3]["data"] == _document(score_a=7, down="2nd")
+
+    async def test_stale_initial_document_is_skipped(self):
+        handler = MatchWebSocketHandler()
+        websocket = _connected_websocket()
+        stream = MatchPatchStream()
+        stream.snapshot_message(1, _document(score_a=7))
+
+        await handler.process_match_patch(
+            websocket, 1, {"type": "initial-load", "data": _document()}, stream
+        )
+
+        websocket.send_json.assert_not_called()
+        assert stream.seq == 1
+
+    async def test_resync_request_is_queued_for_patch_clients_only(self):
+        handler = MatchWebSocketHandler()
+        manager = ConnectionManager()
+        for client_id, mode in (("patch", MATCH_UPDATES_PATCH), ("full", MATCH_UPDATES_FULL)):
+            websocket = _connected_websocket()
+
+            async def iter_json():
+                yield {"type": "resync"}
+
+            websocket.iter_json = iter_json
+            await manager.connect(websocket, client_id, 1)
+            manager.set_match_updates_mode(client_id, mode)
+            with patch("src.websocket.match_handler.connection_manager", manager):
+                await handler.receive_messages(websocket, client_id)
+
+        assert manager.queues["patch"].get_nowait() == {"type": "match-resync"}
+        assert manager.queues["full"].empty()
+
+
+@pytest.mark.slow
+def test_quarter_bytes_per_client():
+    """Simulate a 15-minute quarter with a scorer action every 5 seconds.
+
+    Run with: pytest -m slow -s tests/test_websocket/test_match_patches.py
+    """
+    quarter_seconds = 15 * 60
+    documents = [_document()]
+    for action in range(quarter_seconds // 5):
+        document = copy.deepcopy(documents[-1])
+        if action % 4 == 0:
+            document["scoreboard_data"]["score_team_a"] += 1
+        document["match_data"]["down"] = ("1st", "2nd", "3rd", "4th")[action % 4]
+        document["match_data"]["ball_on"] = (25 + action * 3) % 100
+        documents.append(document)
+
+    full_bytes = sum(
+        len(json.dumps({"type": "match-update", "data": document})) for document in documents
+    )
+    stream = MatchPatchStream()
+    patch_bytes = sum(
+        len(json.dumps(message))
+        for message in (stream.next_message(1, document) for document in documents)
+        if message is not None
+    )
+
+    print(
+        f"\n{len(documents) - 1} updates over a {quarter_seconds // 60}-minute quarter, per client:"
+        f"\n  full match-update: {full_bytes / quarter_seconds:8.1f} bytes/s"
+        f"\n  match-patch:       {patch_bytes / quarter_seconds:8.1f} bytes/s"
+    )
+    assert patch_bytes * 5 < full_bytes
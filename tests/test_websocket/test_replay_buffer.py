@@ -0,0 +1,140 @@
+"""Test resumable match websockets backed by the per-match replay buffer."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from starlette.websockets import WebSocketState
+
+from src.utils.websocket.replay_buffer import MatchReplayBuffer
+from src.utils.websocket.websocket_manager import ConnectionManager
+from src.websocket.match_handler import MatchWebSocketHandler
+
+
+def _event(index: int) -> dict:
+    return {"type": "event-update", "match_id": 1, "events": [index]}
+
+
+class TestMatchReplayBuffer:
+    def test_stamps_copies_with_increasing_seq(self):
+        buffer = MatchReplayBuffer(size=4)
+        message = _event(0)
+
+        stamped = [buffer.stamp(message), buffer.stamp(message)]
+
+        assert [m["match_seq"] for m in stamped] == [1, 2]
+        assert "match_seq" not in message
+
+    def test_replays_only_missed_messages(self):
+        buffer = MatchReplayBuffer(size=4)
+        for index in range(3):
+            buffer.stamp(_event(index))
+
+        assert [m["match_seq"] for m in buffer.missed_since(buffer.stream, 1)] == [2, 3]
+        assert buffer.missed_since(buffer.stream, 3) == []
+
+    def test_gap_not_covered_requires_reload(self):
+        buffer = MatchReplayBuffer(size=2)
+        for index in range(5):
+            buffer.stamp(_event(index))
+
+        assert buffer.missed_since(buffer.stream, 3) is not None
+        assert buffer.missed_since(buffer.stream, 2) is None
+        assert buffer.missed_since("other-worker", 4) is None
+        assert buffer.missed_since(buffer.stream, 6) is None
+        assert buffer.missed_since(buffer.stream, None) is None
+
+
+@pytest.mark.asyncio
+class TestConnectionManagerReplay:
+    async def test_broadcasts_are_stamped_for_watched_matches_only(self):
+        manager = ConnectionManager()
+        websocket = AsyncMock()
+        await manager.connect(websocket, "overlay", 1)
+
+        await manager.send_to_all(_event(0), match_id=1)
+        await manager.send_to_all(_event(0), match_id=2)
+
+        assert manager.queues["overlay"].get_nowait()["match_seq"] == 1
+        assert 2 not in manager.replay_buffers
+
+    async def test_idle_buffers_without_clients_are_evicted(self):
+        manager = ConnectionManager()
+        await manager.connect(AsyncMock(), "overlay", 1)
+        await manager.connect(AsyncMock(), "scorer", 2)
+        await manager.cleanup_connection_resources("overlay")
+        for buffer in manager.replay_buffers.values():
+            buffer.last_active = time.monotonic() - 600
+
+        manager.evict_idle_replay_buffers(retention_seconds=300)
+
+        assert list(manager.replay_buffers) == [2]
+
+
+@pytest.mark.asyncio
+class TestResume:
+    async def _connect(self, manager, stream, last_seq, stop_after: str) -> list[dict]:
+        handler = MatchWebSocketHandler()
+        websocket = AsyncMock()
+        websocket.application_state = WebSocketState.CONNECTED
+        websocket.headers = {}
+        sent: list[dict] = []
+
+        async def send_json(message):
+            sent.append(message)
+            if message["type"] == stop_after:
+                websocket.application_state = WebSocketState.DISCONNECTED
+
+        async def iter_json():
+            await asyncio.Event().wait()
+            yield {}
+
+        websocket.send_json = send_json
+        websocket.iter_json = iter_json
+
+        with (
+            patch("src.websocket.match_handler.connection_manager", manager),
+            patch("src.websocket.match_handler.ws_manager") as mock_ws_manager,
+            patch.object(handler, "send_initial_data", AsyncMock()) as send_initial_data,
+            patch.object(handler, "enable_match_clock_queues", AsyncMock()) as enable_queues,
+        ):
+            mock_ws_manager.is_connected = True
+
+            async def initial_data(websocket, client_id, match_id, match_seq):
+                await websocket.send_json({"type": "initial-load", "match_seq": match_seq})
+
+            send_initial_data.side_effect = initial_data
+            await handler.handle_websocket_connection(
+                websocket, "overlay", 1, stream=stream, last_seq=last_seq
+            )
+        self.reloaded = send_initial_data.await_count + enable_queues.await_count
+        return sent
+
+    async def test_reconnect_replays_missed_messages_without_reload(self):
+        manager = ConnectionManager()
+        buffer = manager.replay_buffer(1)
+        for index in range(3):
+            await manager.send_to_all(_event(index), match_id=1)
+
+        sent = await self._connect(manager, buffer.stream, 1, stop_after="event-update")
+
+        assert self.reloaded == 0
+        assert sent[0] == {
+            "type": "resumed",
+            "match_id": 1,
+            "stream": buffer.stream,
+            "match_seq": 3,
+            "replayed": 2,
+        }
+        assert [m["match_seq"] for m in sent[1:]] == [2]
+
+    async def test_uncovered_gap_falls_back_to_initial_load(self):
+        manager = ConnectionManager()
+        buffer = manager.replay_buffer(1)
+        await manager.send_to_all(_event(0), match_id=1)
+
+        sent = await self._connect(manager, "stale-stream", 0, stop_after="initial-load")
+
+        assert self.reloaded == 2
+        assert sent == [{"type": "initial-load", "match_seq": buffer.seq}]
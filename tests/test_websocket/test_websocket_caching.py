@@ -1,8 +1,10 @@
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from starlette.websockets import WebSocket, WebSocketState
 
+from src.utils.websocket.websocket_manager import ConnectionManager
 from src.websocket.match_handler import MatchWebSocketHandler
 
 
@@ -76,6 +78,52 @@ class TestWebSocketCaching:
             assert "statistics" in message["data"]
             assert "server_time_ms" in message["data"]
 
+    async def test_handler_with_cache_service_sends_shared_snapshot(self, cache_service):
+        handler = MatchWebSocketHandler(cache_service=cache_service)
+        manager = ConnectionManager()
+        websockets = [AsyncMock(spec=WebSocket) for _ in range(3)]
+        for index, websocket in enumerate(websockets):
+            await manager.connect(websocket, f"client{index}", 1)
+        mock_match_data = {"data": {"match_id": 1, "id": 1, "status_code": 200, "match": {}}}
+
+        with (
+            patch("src.websocket.match_handler.connection_manager", manager),
+            patch(
+                "src.helpers.fetch_helpers.fetch_with_scoreboard_data",
+                return_value=mock_match_data,
+            ) as fetch_match,
+            patch(
+                "src.helpers.fetch_helpers.fetch_gameclock",
+                return_value={"match_id": 1, "gameclock": {"id": 1}},
+            ),
+            patch(
+                "src.helpers.fetch_helpers.fetch_playclock",
+                return_value={"match_id": 1, "playclock": {"id": 1}},
+            ),
+            patch(
+                "src.helpers.fetch_helpers.fetch_event",
+                return_value={"match_id": 1, "status_code": 200, "events": []},
+            ),
+            patch(
+                "src.helpers.fetch_helpers.fetch_stats",
+                return_value={"match_id": 1, "statistics": {}},
+            ),
+        ):
+            for index, websocket in enumerate(websockets):
+                await handler.send_initial_data(websocket, f"client{index}", 1, match_seq=4)
+
+        assert fetch_match.call_count == 1
+        for index, websocket in enumerate(websockets):
+            websocket.send_json.assert_not_called()
+            message = json.loads(websocket.send_text.call_args[0][0])
+            assert message["type"] == "initial-load"
+            assert message["data"]["match"] == {}
+            assert message["data"]["gameclock"] == {"id": 1}
+            assert message["data"]["match_seq"] == 4
+            assert message["data"]["stream"] == manager.replay_buffer(1).stream
+            queued = manager.queues[f"client{index}"].get_nowait()
+            assert queued["data"] == message["data"]
+
     async def test_cache_service_caches_match_data(self, cache_service):
         mock_match_data = {
             "data": {
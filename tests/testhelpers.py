@@ -1,6 +1,10 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+
 from fastapi import HTTPException
 from keyring.errors import ExceptionInfo
 
+from src.core.query_stats import QueryStats, track_queries
 from src.seasons.schemas import SeasonSchemaCreate
 from src.sports.schemas import SportSchemaCreate
 from src.tournaments.schemas import TournamentSchemaCreate
@@ -142,3 +146,20 @@ def assert_all_files_converted(file_cases: list):
         converted = case["converted_filename"]
         assert_filename_converted(original, converted)
         assert converted == case.get("expected", converted)
+
+
+@contextmanager
+def assert_max_queries(max_queries: int) -> Iterator[QueryStats]:
+    """Fail if the wrapped block executes more than max_queries SQL statements.
+
+    Example:
+        with assert_max_queries(3):
+            response = await client.get("/api/matches/id/1/")
+    """
+    with track_queries("test") as stats:
+        yield stats
+    repeated = stats.repeated_statements()
+    assert stats.count <= max_queries, (
+        f"Expected at most {max_queries} queries, got {stats.count}. "
+        f"Repeated statements: {repeated[:3]}"
+    )